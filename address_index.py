@@ -0,0 +1,235 @@
+# ============================================================
+# Register Address-Space Index
+# ============================================================
+#
+# Every configured point that touches the bus - gauge/bar inputs, electrical
+# parameters, startup conditions, alarm relay coils and control outputs - as
+# an interval over (port, device, table, address). One interval tree per
+# (port, device, table) answers "what overlaps this range" in O(log n + k),
+# which gives save-time conflict checks and reverse lookup from a raw
+# register or coil to the tags that own it.
+
+from tag_access import (
+    BIT_TABLES, REGISTER_TYPE_TABLES, TABLE_COIL, TABLE_DISCRETE, TABLE_HOLDING, TABLE_INPUT,
+    reference_to_address, tag_from_condition, tag_from_param
+)
+
+ROLE_MEASUREMENT = "measurement"   # value shown on a gauge, bar or display
+ROLE_CONDITION = "condition"       # interlock / permissive read (may alias a measurement)
+ROLE_ALARM = "alarm"               # alarm relay coil (several alarms may share one)
+ROLE_CONTROL = "control"           # momentary or latched command coil
+
+WRITE_ROLES = (ROLE_ALARM, ROLE_CONTROL)
+
+_BAR_TABLES = {"input": TABLE_INPUT, "holding": TABLE_HOLDING, "coil": TABLE_COIL, "discrete": TABLE_DISCRETE}
+
+
+class AddressEntry:
+    """One configured claim on a range of addresses [start, end)"""
+    __slots__ = ("port", "device_id", "table", "start", "end", "owner", "group", "label", "role")
+
+    def __init__(self, device_id, table, start, count, owner, role, label="", group=None, port=""):
+        self.port = port
+        self.device_id = device_id
+        self.table = table
+        self.start = start
+        self.end = start + count
+        self.owner = owner
+        self.group = group or owner
+        self.label = label
+        self.role = role
+
+    def key(self):
+        return (self.port, self.device_id, self.table)
+
+    def describe(self):
+        span = str(self.start) if self.end - self.start == 1 else f"{self.start}-{self.end - 1}"
+        name = f"{self.label} ({self.owner})" if self.label else self.owner
+        return f"{name}: device {self.device_id} {self.table} {span} [{self.role}]"
+
+    def __repr__(self):
+        return f"AddressEntry({self.describe()})"
+
+
+def is_conflict(a, b):
+    """Whether two overlapping claims are a configuration error"""
+    if a.role in WRITE_ROLES and b.role in WRITE_ROLES:
+        if a.role != b.role:
+            return True          # an alarm relay driving a command coil (or the reverse)
+        # Alarms may share a relay; two commands of one control (raise/lower, start/stop) may not
+        return a.role == ROLE_CONTROL and a.group == b.group
+    if a.role == ROLE_MEASUREMENT and b.role == ROLE_MEASUREMENT:
+        return True
+    return False
+
+
+class _IntervalTree:
+    """Static interval tree over entries sorted by start; each node keeps its subtree's max end"""
+    def __init__(self, entries):
+        self.items = sorted(entries, key=lambda e: (e.start, e.end))
+        self.max_end = [0] * len(self.items)
+        self._build(0, len(self.items))
+
+    def _build(self, lo, hi):
+        if lo >= hi:
+            return 0
+        mid = (lo + hi) // 2
+        self.max_end[mid] = max(self.items[mid].end, self._build(lo, mid), self._build(mid + 1, hi))
+        return self.max_end[mid]
+
+    def query(self, start, end):
+        """Entries overlapping [start, end)"""
+        found = []
+        stack = [(0, len(self.items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_end[mid] <= start:
+                continue         # nothing in this subtree reaches the range
+            stack.append((lo, mid))
+            item = self.items[mid]
+            if item.start < end:
+                if item.end > start:
+                    found.append(item)
+                stack.append((mid + 1, hi))
+        return found
+
+
+class AddressIndex:
+    """Interval index over all configured entries, keyed by (port, device, table)"""
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+        groups = {}
+        for entry in self.entries:
+            groups.setdefault(entry.key(), []).append(entry)
+        self._trees = {key: _IntervalTree(group) for key, group in groups.items()}
+
+    def overlapping(self, device_id, table, start, end=None, port=""):
+        tree = self._trees.get((port, device_id, table))
+        if tree is None:
+            return []
+        return tree.query(start, start + 1 if end is None else end)
+
+    def owners(self, device_id, table, address, port=""):
+        """Reverse lookup: entries that claim one raw address"""
+        return self.overlapping(device_id, table, address, port=port)
+
+    def conflicts(self, owner_prefix=None):
+        """[(entry, entry)] pairs that overlap illegally, optionally only those involving owner_prefix.
+
+        owner_prefix selects a config section or point ("PressureGauges.3",
+        "ElectricalParameters.Voltage"), matching whole path components.
+        """
+        pairs = []
+        seen = set()
+        for entry in self.entries:
+            if owner_prefix is not None and entry.owner != owner_prefix \
+                    and not entry.owner.startswith(owner_prefix + "."):
+                continue
+            for other in self.overlapping(entry.device_id, entry.table, entry.start, entry.end, entry.port):
+                if other is entry or not is_conflict(entry, other):
+                    continue
+                pair = (min(id(entry), id(other)), max(id(entry), id(other)))
+                if pair not in seen:
+                    seen.add(pair)
+                    pairs.append((entry, other))
+        return pairs
+
+
+# ---------------- Building from the configuration ----------------
+def _add_tag(entries, tag, owner, role, label="", group=None, port=""):
+    if tag is not None:
+        entries.append(AddressEntry(tag.device_id, tag.table, tag.address, tag.count, owner, role,
+                                    label or tag.name, group, port))
+
+
+def _bar_entries(entries, bars, section, port):
+    for bar_id, bar in (bars or {}).items():
+        table = _BAR_TABLES.get(bar.get("type", "input"))
+        if table is None:
+            continue
+        address = bar.get("address", 0)
+        if table == TABLE_HOLDING and address >= 40001:
+            address = reference_to_address(TABLE_HOLDING, address)
+        entries.append(AddressEntry(bar.get("device_id", 1), table, address, 1, f"{section}.{bar_id}",
+                                    ROLE_MEASUREMENT, bar.get("label", ""), port=port))
+
+
+def _alarm_entry(entries, alarm, owner, label, port):
+    if alarm and alarm.get("enable_alarm", False) and "coil_address" in alarm:
+        entries.append(AddressEntry(alarm.get("device_id", 5), TABLE_COIL, alarm["coil_address"], 1,
+                                    owner, ROLE_ALARM, alarm.get("label", label), port=port))
+
+
+def entries_from_config(config, port=""):
+    """AddressEntry list for every bus point in a modbus_config dict (malformed points are skipped)"""
+    entries = []
+
+    _bar_entries(entries, config.get("CylinderHeadBars"), "CylinderHeadBars", port)
+    _bar_entries(entries, config.get("MainBearingBars"), "MainBearingBars", port)
+
+    _alarm_entry(entries, config.get("CylinderHead"), "CylinderHead", "Cylinder Head", port)
+    _alarm_entry(entries, config.get("MainBearing"), "MainBearing", "Main Bearing", port)
+    for section in ("PressureGauges", "EngineTemperatures"):
+        for index, gauge in (config.get(section) or {}).items():
+            _alarm_entry(entries, gauge, f"{section}.{index}", "", port)
+
+    for group, params in (config.get("ElectricalParameters") or {}).items():
+        for i, param in enumerate(params or []):
+            owner = f"ElectricalParameters.{group}.{i}"
+            label = param.get("label", f"{group} {i + 1}")
+            try:
+                _add_tag(entries, tag_from_param(param, group), owner, ROLE_MEASUREMENT, label, port=port)
+            except (ValueError, TypeError, KeyError):
+                pass
+            relay = param.get("relay_device_id", 5)
+            # Regulation coils are 1-based (0 = not used)
+            for key, role in (("alarm_coil", ROLE_ALARM), ("increase_coil", ROLE_CONTROL),
+                              ("decrease_coil", ROLE_CONTROL)):
+                coil = param.get(key) or 0
+                if coil > 0:
+                    entries.append(AddressEntry(relay, TABLE_COIL, coil - 1, 1, f"{owner}.{key}", role,
+                                                f"{label} {key.split('_')[0]}", owner, port))
+
+    power = config.get("ElectricalPower") or {}
+    for prefix, default_address in (("active", 30007), ("pf", 30008)):
+        table = power.get(f"{prefix}_register_type", "input")
+        if table not in (TABLE_INPUT, TABLE_HOLDING) or not power:
+            continue
+        try:
+            entries.append(AddressEntry(power.get(f"{prefix}_data_device_id", 1), table,
+                                        reference_to_address(table, power.get(f"{prefix}_address", default_address)),
+                                        2 if power.get(f"{prefix}_data_type") in ("int32", "uint32", "float32") else 1,
+                                        f"ElectricalPower.{prefix}", ROLE_MEASUREMENT, f"{prefix} power", port=port))
+        except ValueError:
+            pass
+
+    for name, condition in (config.get("StartupConditions") or {}).items():
+        if condition.get("register_type", "Input Register") in REGISTER_TYPE_TABLES:
+            try:
+                _add_tag(entries, tag_from_condition(condition, name), f"StartupConditions.{name}",
+                         ROLE_CONDITION, name, port=port)
+            except (ValueError, TypeError, KeyError):
+                pass
+
+    for section in ("EngineControl", "FrequencyControl", "VoltageControl"):
+        for command, control in (config.get(section) or {}).items():
+            if isinstance(control, dict) and control:
+                entries.append(AddressEntry(control.get("device_id", 1), TABLE_COIL, control.get("coil_address", 0), 1,
+                                            f"{section}.{command}", ROLE_CONTROL, f"{section} {command}", section, port))
+
+    cb = config.get("CBControl") or {}
+    if cb:
+        entries.append(AddressEntry(cb.get("cb_enable_device_id", 1), TABLE_COIL, cb.get("cb_enable_coil_address", 0), 1,
+                                    "CBControl.cb_enable", ROLE_CONTROL, "CB enable", "CBControl", port))
+        table = cb.get("breaker_check_register_type", TABLE_COIL)
+        if table in BIT_TABLES or table in (TABLE_INPUT, TABLE_HOLDING):
+            entries.append(AddressEntry(cb.get("breaker_check_device_id", 1), table, cb.get("breaker_check_address", 0), 1,
+                                        "CBControl.breaker_check", ROLE_CONDITION, "Breaker check", port=port))
+    return entries
+
+
+def index_from_config(config, port=""):
+    return AddressIndex(entries_from_config(config or {}, port))
@@ -0,0 +1,105 @@
+# ============================================================
+# Animation Clock
+# ============================================================
+#
+# Every animated widget used to run its own 16 ms QTimer - forty-odd timers
+# waking the GUI thread 60 times a second each, even with every needle at
+# rest. The clock is one frame timer shared by all of them. A widget wakes it
+# with its step function when something starts to move (a new value, a hover
+# change); the step is called once per frame and returns True while it still
+# needs frames. Settled widgets drop out, and the timer stops when none are
+# left, so a screen at rest has no animation wakeups at all. When only slow
+# steps remain (an alarm delay being watched) the timer sleeps until the
+# first one is due instead of ticking every frame. The frame rate and
+# whether values ease at all are set by the render policy (render_policy.py).
+
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+# Frame period (ms) - the rate the per-widget timers ran at, and the frame the
+# widgets' per-frame easing factors were tuned for
+FRAME_INTERVAL_MS = 16
+
+
+class AnimationClock(QObject):
+    """One frame timer stepping the widgets that are still animating.
+
+    Steps run on the GUI thread in the order they were woken. A step with an
+    interval (seconds) is only called once that much time has passed, for
+    slower effects like a status pulse. A step that raises - typically a
+    widget deleted while animating - is dropped. Steps take their easing
+    factors through ease() so they settle in the same time at any frame rate.
+    """
+    def __init__(self, interval_ms=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.frame_ms = interval_ms
+        self.frame = interval_ms / 1000.0
+        self.snap = False
+        self.ticks = 0
+        self._steps = {}       # step -> [interval, next due (monotonic)]
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+
+    def wake(self, step, interval=None):
+        """Call step() every frame (or every `interval` seconds) until it returns False"""
+        if step not in self._steps:
+            self._steps[step] = [interval or 0.0, 0.0]
+        if not self._timer.isActive() or self._timer.interval() > self.frame_ms:
+            self._timer.start(self.frame_ms)
+
+    def set_fps(self, fps):
+        self.frame_ms = max(FRAME_INTERVAL_MS, int(1000 / fps))
+        self.frame = self.frame_ms / 1000.0
+        if self._timer.isActive():
+            self._timer.setInterval(self.frame_ms)
+
+    def ease(self, factor):
+        """Per-frame easing factor at the current frame rate for one tuned at 60 fps (1.0 = snap)"""
+        if self.snap:
+            return 1.0
+        return 1.0 - (1.0 - factor) ** (self.frame_ms / FRAME_INTERVAL_MS)
+
+    def remove(self, step):
+        self._steps.pop(step, None)
+
+    def active(self):
+        """Number of steps still animating"""
+        return len(self._steps)
+
+    def _tick(self):
+        self.ticks += 1
+        now = time.monotonic()
+        for step, due in list(self._steps.items()):
+            if due[0]:
+                # Half a frame of slack so an interval is not rounded up a whole frame
+                if now < due[1] - self.frame / 2:
+                    continue
+                due[1] = now + due[0]
+            try:
+                keep = step()
+            except Exception as e:
+                print(f"Animation step {getattr(step, '__qualname__', step)} failed: {e}")
+                keep = False
+            if not keep:
+                self._steps.pop(step, None)
+        if not self._steps:
+            self._timer.stop()
+            return
+        # Only slow steps left (e.g. an alarm delay being watched): sleep until the first is due
+        if all(due[0] for due in self._steps.values()):
+            wait = min(due[1] for due in self._steps.values()) - time.monotonic()
+            self._timer.setInterval(max(self.frame_ms, int(wait * 1000)))
+        else:
+            self._timer.setInterval(self.frame_ms)
+
+
+_clock = None
+
+
+def animation_clock():
+    """The application-wide AnimationClock (created on first use, after the QApplication)"""
+    global _clock
+    if _clock is None:
+        _clock = AnimationClock()
+    return _clock
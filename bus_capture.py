@@ -0,0 +1,291 @@
+# ============================================================
+# Bus Traffic Recorder and Deterministic Replay
+# ============================================================
+#
+# CaptureClient wraps the live Modbus client and appends every request and
+# its response (or exception / missing response) to a compact binary file
+# with monotonic timestamps. ReplayClient plays such a file back to the HMI
+# as if it were the bus, at recorded speed, accelerated, or flat out.
+# The read planner's cost model is pinned while recording and saved in the
+# header, so a replay plans the same block reads the recording made.
+#
+# File layout (little endian):
+#   header  "ISBC" | version u8 | 3 pad | wall-clock start f64
+#   model   n u16 | n * (device u8 (255 = line default) | bits u8 | overhead f64 | per_item f64)
+#           (version 2 only)
+#   record  t f64 | latency f32 | device u8 | fc u8 | address u16 | count u16 |
+#           status u8 | exception u8 | n_request u16 | n_response u16 |
+#           request payload | response payload
+# Register payloads are u16 words; bit payloads are packed LSB first.
+
+import struct
+import threading
+import time
+
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from modbus_transport import (
+    BIT_FUNCTIONS, TransportProxy, TransportResponse, exception_code_of, response_values
+)
+
+CAPTURE_MAGIC = b"ISBC"
+CAPTURE_VERSION = 2
+CAPTURE_EXTENSION = ".isbc"
+
+# Shortest poll cycle a replay runs at (seconds), however fast it plays -
+# the poll loop runs on the GUI thread
+MIN_REPLAY_INTERVAL = 0.05
+
+STATUS_OK = 0
+STATUS_EXCEPTION = 1
+STATUS_NO_RESPONSE = 2
+
+_HEADER = struct.Struct("<4sB3xd")
+_RECORD = struct.Struct("<dfBBHHBBHH")
+_MODEL_COUNT = struct.Struct("<H")
+_MODEL_ENTRY = struct.Struct("<BBdd")
+_MODEL_DEFAULT = 0xFF
+
+
+def _pack_values(function_code, values):
+    if function_code in BIT_FUNCTIONS:
+        packed = bytearray((len(values) + 7) // 8)
+        for i, bit in enumerate(values):
+            if bit:
+                packed[i >> 3] |= 1 << (i & 7)
+        return bytes(packed)
+    return struct.pack(f"<{len(values)}H", *[v & 0xFFFF for v in values])
+
+
+def _unpack_values(function_code, data, offset, n):
+    if function_code in BIT_FUNCTIONS:
+        size = (n + 7) // 8
+        chunk = data[offset:offset + size]
+        return [(chunk[i >> 3] >> (i & 7)) & 1 for i in range(n)], offset + size
+    size = n * 2
+    return list(struct.unpack_from(f"<{n}H", data, offset)), offset + size
+
+
+class CaptureRecord:
+    """One recorded transaction"""
+    __slots__ = ("t", "latency", "device_id", "function_code", "address", "count",
+                 "status", "exception_code", "request", "response")
+
+    def __init__(self, t, latency, device_id, function_code, address, count,
+                 status, exception_code, request, response):
+        self.t = t
+        self.latency = latency
+        self.device_id = device_id
+        self.function_code = function_code
+        self.address = address
+        self.count = count
+        self.status = status
+        self.exception_code = exception_code
+        self.request = request
+        self.response = response
+
+    def matches(self, function_code, device_id, address, count):
+        return (self.function_code == function_code and self.device_id == device_id
+                and self.address == address and self.count == count)
+
+
+# ---------------- Recording ----------------
+class BusCaptureWriter:
+    """Appends transactions to a capture file; shared by every client of one capture session.
+
+    cost_model is the read planner snapshot ReadCostModel.freeze() returned,
+    kept pinned for as long as the recording runs.
+    """
+    def __init__(self, path, cost_model=None):
+        self.path = path
+        self.record_count = 0
+        self._start = time.monotonic()
+        self._file = open(path, "wb")
+        entries = sorted((cost_model or {}).items(), key=lambda item: (item[0][0] is None, item[0]))
+        header = _HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, time.time()) + _MODEL_COUNT.pack(len(entries))
+        for (device_id, bits), (overhead, per_item) in entries:
+            header += _MODEL_ENTRY.pack(_MODEL_DEFAULT if device_id is None else device_id, bits, overhead, per_item)
+        self._file.write(header)
+
+    def write(self, started, latency, device_id, function_code, address, count,
+              status, exception_code, request, response):
+        request = request or []
+        payload = _RECORD.pack(started - self._start, latency, device_id & 0xFF, function_code,
+                               address & 0xFFFF, count & 0xFFFF, status, exception_code & 0xFF,
+                               len(request), len(response))
+        self._file.write(payload + _pack_values(function_code, request) + _pack_values(function_code, response))
+        self.record_count += 1
+        if self.record_count % 64 == 0:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class CaptureClient(TransportProxy):
+    """Client proxy that records every transaction into a BusCaptureWriter.
+
+    It stays in the client chain for the whole connection; recording starts
+    and stops with set_writer(), so no other layer is rebuilt. With no writer
+    it just passes requests through.
+    """
+    def __init__(self, client, writer=None):
+        super().__init__(client)
+        self.writer = writer
+        self._lock = threading.Lock()
+
+    def set_writer(self, writer):
+        """Record into `writer` from the next transaction on (None stops); returns the previous writer.
+
+        Once this returns no transaction still in flight writes to the previous
+        writer, so the caller may close it.
+        """
+        with self._lock:
+            previous, self.writer = self.writer, writer
+        return previous
+
+    def _record(self, *record):
+        with self._lock:
+            if self.writer is not None:
+                self.writer.write(*record)
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        if self.writer is None:
+            return call()
+        started = time.monotonic()
+        try:
+            result = call()
+        except ModbusException:
+            self._record(started, time.monotonic() - started, device_id, function_code,
+                         address, count, STATUS_NO_RESPONSE, 0, values, [])
+            raise
+        latency = time.monotonic() - started
+        if result is None:
+            self._record(started, latency, device_id, function_code, address, count,
+                         STATUS_NO_RESPONSE, 0, values, [])
+        elif result.isError():
+            self._record(started, latency, device_id, function_code, address, count,
+                         STATUS_EXCEPTION, exception_code_of(result), values, [])
+        else:
+            self._record(started, latency, device_id, function_code, address, count,
+                         STATUS_OK, 0, values, response_values(function_code, result))
+        return result
+
+
+def capture_layer(client):
+    """The CaptureClient in a proxy chain, or None"""
+    while isinstance(client, TransportProxy):
+        if isinstance(client, CaptureClient):
+            return client
+        client = client.client
+    return None
+
+
+# ---------------- Replay ----------------
+def read_capture(path):
+    """Load a capture file; returns (wall-clock start, recorded cost model or None, [CaptureRecord])"""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, wall_start = _HEADER.unpack_from(data, 0)
+    if magic != CAPTURE_MAGIC or version not in (1, CAPTURE_VERSION):
+        raise ValueError(f"{path} is not a bus capture file")
+
+    cost_model = None
+    offset = _HEADER.size
+    if version >= 2:
+        (n,) = _MODEL_COUNT.unpack_from(data, offset)
+        offset += _MODEL_COUNT.size
+        cost_model = {}
+        for _ in range(n):
+            device_id, bits, overhead, per_item = _MODEL_ENTRY.unpack_from(data, offset)
+            offset += _MODEL_ENTRY.size
+            cost_model[(None if device_id == _MODEL_DEFAULT else device_id, bool(bits))] = (overhead, per_item)
+
+    records = []
+    while offset + _RECORD.size <= len(data):
+        (t, latency, device_id, function_code, address, count,
+         status, exception_code, n_request, n_response) = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        try:
+            request, offset = _unpack_values(function_code, data, offset, n_request)
+            response, offset = _unpack_values(function_code, data, offset, n_response)
+        except struct.error:
+            break  # Truncated tail from an unclean shutdown
+        records.append(CaptureRecord(t, latency, device_id, function_code, address, count,
+                                     status, exception_code, request, response))
+    return wall_start, cost_model or None, records
+
+
+class ReplayClient(TransportProxy):
+    """Stands in for the bus client and answers from a capture file.
+
+    Requests are matched in order against the recording, so the same poll
+    sequence reproduces the same responses. speed=1.0 keeps recorded timing
+    (including per-transaction latency), 10.0 plays ten times faster and 0
+    answers immediately. The client never waits itself: the poll loop asks
+    due_in() and skips its cycle until the next recorded transaction is due.
+    cost_model holds the planner coefficients the recording was made with
+    (None for captures from before they were saved).
+    """
+    lookahead = 512
+
+    def __init__(self, path, speed=1.0):
+        super().__init__(None)
+        self.path = path
+        self.speed = speed
+        self.records = []
+        self.cost_model = None
+        self._cursor = 0
+        self._origin = None
+
+    def __getattr__(self, name):
+        raise AttributeError(name)
+
+    @property
+    def finished(self):
+        return self._cursor >= len(self.records)
+
+    def due_in(self):
+        """Seconds until the next recorded transaction is due at the replay speed (0 or less: now)"""
+        if self.speed <= 0 or self._origin is None or self.finished:
+            return 0.0
+        record = self.records[self._cursor]
+        return self._origin + (record.t + record.latency) / self.speed - time.monotonic()
+
+    def connect(self):
+        try:
+            _, self.cost_model, self.records = read_capture(self.path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Cannot open bus capture {self.path}: {e}")
+            return False
+        self._cursor = 0
+        self._origin = None
+        return bool(self.records)
+
+    def close(self):
+        pass
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        # Match on the request target only, so a write whose value differs from
+        # the recording (e.g. an operator acknowledging earlier) still lines up
+        end = min(len(self.records), self._cursor + self.lookahead)
+        for index in range(self._cursor, end):
+            record = self.records[index]
+            if record.matches(function_code, device_id, address, count):
+                break
+        else:
+            raise ModbusIOException(f"no recorded response for fc={function_code} device={device_id} address={address}")
+        self._cursor = index + 1
+        if self._origin is None and self.speed > 0:
+            # Recorded time runs from the first transaction replayed
+            self._origin = time.monotonic() - record.t / self.speed
+
+        if record.status == STATUS_NO_RESPONSE:
+            raise ModbusIOException(f"recorded timeout for fc={function_code} device={device_id}")
+        if record.status == STATUS_EXCEPTION:
+            return TransportResponse(function_code | 0x80, exception_code=record.exception_code,
+                                     device_id=device_id)
+        if function_code in BIT_FUNCTIONS:
+            return TransportResponse(function_code, bits=[bool(b) for b in record.response], device_id=device_id)
+        return TransportResponse(function_code, registers=record.response, device_id=device_id)
@@ -0,0 +1,104 @@
+import os
+import tempfile
+
+from bus_capture import BusCaptureWriter, CaptureClient, ReplayClient, read_capture
+from modbus_transport import FC_READ_INPUT_REGISTERS, TransportResponse
+from tag_access import TABLE_INPUT, Tag, TagReader
+
+TAGS = [Tag(1, TABLE_INPUT, address) for address in (0, 30, 70, 75)]
+CYCLES = 40
+
+
+class FakeBus:
+    """Device 1 input registers answering instantly: register n holds n + the poll cycle"""
+    def __init__(self):
+        self.cycle = 0
+
+    def connect(self):
+        return True
+
+    def close(self):
+        pass
+
+    def read_input_registers(self, address, count=1, device_id=1, **kwargs):
+        return TransportResponse(FC_READ_INPUT_REGISTERS, device_id=device_id,
+                                 registers=[address + i + self.cycle for i in range(count)])
+
+
+def _poll(reader, bus=None):
+    values = []
+    for cycle in range(CYCLES):
+        if bus:
+            bus.cycle = cycle
+        reader.invalidate()
+        values.append(reader.read_many(TAGS))
+    return values
+
+
+def _fitted_reader():
+    """Reader whose model learned a slow fixed overhead - it bridges gaps the line defaults would not"""
+    reader = TagReader()
+    for count in range(5, 25):
+        reader.cost_model.observe(1, count, 0.080 + 0.0001 * count)
+    return reader
+
+
+def test_replay_reads_what_was_recorded():
+    fd, path = tempfile.mkstemp(suffix=".isbc")
+    os.close(fd)
+    try:
+        reader = _fitted_reader()
+        bus = FakeBus()
+        writer = BusCaptureWriter(path, reader.freeze_plans())
+        reader.set_client(CaptureClient(bus, writer))
+        recorded = _poll(reader, bus)
+        writer.close()
+        reader.thaw_plans()
+        reader.set_client(None)
+
+        assert recorded[-1] == [CYCLES - 1, 30 + CYCLES - 1, 70 + CYCLES - 1, 75 + CYCLES - 1]
+        # The instant answers did not refit the model mid-recording: one block per cycle throughout
+        _, cost_model, records = read_capture(path)
+        assert len(records) == CYCLES
+        assert cost_model[(1, False)] == reader.cost_model.coefficients(1)
+        for count in range(5, 25):
+            reader.cost_model.observe(1, count, 0.001)
+
+        # The same reader (model refitted since) and a fresh one (line defaults) both replay it
+        for replayer in (reader, TagReader()):
+            client = ReplayClient(path, speed=0)
+            assert client.connect()
+            replayer.set_client(client)
+            assert _poll(replayer) == recorded
+            assert client.finished
+            replayer.set_client(None)
+            assert not replayer.cost_model.frozen
+    finally:
+        os.remove(path)
+
+
+def test_capture_switches_writers_in_place():
+    fd, path = tempfile.mkstemp(suffix=".isbc")
+    os.close(fd)
+    try:
+        bus = FakeBus()
+        client = CaptureClient(bus)
+        client.read_input_registers(0, count=2, device_id=1)
+        writer = BusCaptureWriter(path)
+        assert client.set_writer(writer) is None
+        client.read_input_registers(4, count=2, device_id=1)
+        assert client.set_writer(None) is writer
+        writer.close()
+        # Idle again: passes through and never touches the closed writer
+        assert client.read_input_registers(8, count=1, device_id=1).registers == [8]
+        _, _, records = read_capture(path)
+        assert [(r.address, r.response) for r in records] == [(4, [4, 5])]
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
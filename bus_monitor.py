@@ -0,0 +1,169 @@
+# ============================================================
+# Live Bus Monitor
+# ============================================================
+#
+# MonitorClient copies every transaction (request, response or exception,
+# latency, device) into a fixed-size ring held in memory. The ring is
+# preallocated and never grows: the bus side overwrites the oldest slot and
+# the GUI copies out whatever it wants to show, without either side taking a
+# lock. Each slot carries its own sequence number, so a reader can tell a
+# record that was overwritten while it was copying and simply skip it.
+
+import time
+
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from bus_capture import STATUS_EXCEPTION, STATUS_NO_RESPONSE, STATUS_OK
+from modbus_transport import (
+    FC_READ_COILS, FC_READ_DISCRETE_INPUTS, FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS,
+    FC_READWRITE_REGISTERS, FC_WRITE_COIL, FC_WRITE_COILS, FC_WRITE_REGISTER, FC_WRITE_REGISTERS,
+    TransportProxy, exception_code_of, response_values
+)
+from tag_access import TABLE_COIL, TABLE_DISCRETE, TABLE_HOLDING, TABLE_INPUT
+
+# Transactions kept in memory (oldest are overwritten)
+MONITOR_CAPACITY = 4096
+
+# Values kept per request/response payload; longer payloads are cut off
+MAX_VALUES = 32
+
+STATUS_FRAME_ERROR = 3
+
+STATUS_TEXT = {
+    STATUS_OK: "OK",
+    STATUS_EXCEPTION: "Exception",
+    STATUS_NO_RESPONSE: "Timeout",
+    STATUS_FRAME_ERROR: "Frame error",
+}
+
+# Address table each function code works on (reverse lookup in the address index)
+FUNCTION_TABLES = {
+    FC_READ_COILS: TABLE_COIL,
+    FC_WRITE_COIL: TABLE_COIL,
+    FC_WRITE_COILS: TABLE_COIL,
+    FC_READ_DISCRETE_INPUTS: TABLE_DISCRETE,
+    FC_READ_HOLDING_REGISTERS: TABLE_HOLDING,
+    FC_WRITE_REGISTER: TABLE_HOLDING,
+    FC_WRITE_REGISTERS: TABLE_HOLDING,
+    FC_READWRITE_REGISTERS: TABLE_HOLDING,
+    FC_READ_INPUT_REGISTERS: TABLE_INPUT,
+}
+
+
+class MonitorRecord:
+    """One transaction as seen by the monitor"""
+    __slots__ = ("seq", "wall_time", "latency", "device_id", "function_code", "address", "count",
+                 "status", "exception_code", "request", "response", "truncated")
+
+    def __init__(self, seq, wall_time, latency, device_id, function_code, address, count,
+                 status, exception_code, request, response, truncated):
+        self.seq = seq
+        self.wall_time = wall_time
+        self.latency = latency
+        self.device_id = device_id
+        self.function_code = function_code
+        self.address = address
+        self.count = count
+        self.status = status
+        self.exception_code = exception_code
+        self.request = request
+        self.response = response
+        self.truncated = truncated
+
+
+class FrameRing:
+    """Fixed-capacity ring of MonitorRecords for one writer and any number of readers.
+
+    The writer stores a finished record into its slot and then advances
+    `total`; a reader only trusts a slot whose record has the sequence number
+    it expected, so it never needs the writer to stop.
+    """
+    def __init__(self, capacity=MONITOR_CAPACITY):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self.total = 0         # records ever written (next sequence number)
+        self._floor = 0        # sequences below this were cleared
+
+    def append(self, record):
+        self._slots[record.seq % self.capacity] = record
+        self.total = record.seq + 1
+
+    def next_seq(self):
+        return self.total
+
+    def __len__(self):
+        end = self.total
+        return end - max(self._floor, end - self.capacity)
+
+    def clear(self):
+        self._floor = self.total
+
+    def snapshot(self, since=0):
+        """Records with seq >= since still in the ring, oldest first"""
+        end = self.total
+        start = max(since, self._floor, end - self.capacity)
+        slots = self._slots
+        capacity = self.capacity
+        out = []
+        for seq in range(start, end):
+            record = slots[seq % capacity]
+            if record is not None and record.seq == seq:
+                out.append(record)
+        return out
+
+
+class MonitorClient(TransportProxy):
+    """Client proxy that mirrors every transaction into a FrameRing.
+
+    Sits inside SerializedClient, so only one thread appends at a time.
+    """
+    def __init__(self, client, ring):
+        super().__init__(client)
+        self.ring = ring
+
+    def _record(self, started, device_id, function_code, address, count, status, exception_code,
+                values, response):
+        request = tuple(values[:MAX_VALUES]) if values else ()
+        if function_code in (FC_READ_COILS, FC_READ_DISCRETE_INPUTS):
+            response = response[:count]   # bit responses are padded to whole bytes
+        truncated = bool(values) and len(values) > MAX_VALUES or len(response) > MAX_VALUES
+        ring = self.ring
+        ring.append(MonitorRecord(ring.next_seq(), time.time(), time.monotonic() - started,
+                                  device_id, function_code, address, count, status, exception_code,
+                                  request, tuple(response[:MAX_VALUES]), truncated))
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        started = time.monotonic()
+        try:
+            result = call()
+        except ModbusIOException:
+            self._record(started, device_id, function_code, address, count, STATUS_NO_RESPONSE, 0, values, [])
+            raise
+        except ModbusException:
+            self._record(started, device_id, function_code, address, count, STATUS_FRAME_ERROR, 0, values, [])
+            raise
+        if result is None:
+            self._record(started, device_id, function_code, address, count, STATUS_NO_RESPONSE, 0, values, [])
+        elif result.isError():
+            self._record(started, device_id, function_code, address, count, STATUS_EXCEPTION,
+                         exception_code_of(result), values, [])
+        else:
+            self._record(started, device_id, function_code, address, count, STATUS_OK, 0, values,
+                         response_values(function_code, result))
+        return result
+
+
+# ---------------- Presentation helpers ----------------
+def format_values(values, truncated=False):
+    if not values:
+        return ""
+    text = " ".join(str(v) for v in values)
+    return text + " …" if truncated and len(values) >= MAX_VALUES else text
+
+
+def record_owners(index, record):
+    """Configured points (AddressEntry) touched by a transaction"""
+    table = FUNCTION_TABLES.get(record.function_code)
+    if index is None or table is None:
+        return []
+    return index.overlapping(record.device_id, table, record.address, record.address + max(1, record.count))
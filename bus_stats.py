@@ -0,0 +1,270 @@
+# ============================================================
+# Bus Utilization and Transaction Latency Statistics
+# ============================================================
+#
+# BusStatsClient sits in the client proxy chain and feeds every transaction
+# into a BusStats collector. Per (device, function code) it keeps transaction,
+# byte, timeout and error counters plus a fixed-bucket latency histogram, so
+# recording costs a handful of integer adds and one bisect. Line utilization
+# is the time the RTU frames occupy the wire at the configured baud rate;
+# occupancy is the measured time the master spends blocked in transactions
+# (turnaround and timeouts included). Both are kept per second in a ring.
+
+import math
+import threading
+import time
+from bisect import bisect_left
+
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from modbus_transport import (
+    RTU_OVERHEAD, TransportProxy, base_client, exception_code_of, request_pdu_length, response_pdu_length
+)
+
+FUNCTION_NAMES = {
+    1: "Read Coils",
+    2: "Read Discrete Inputs",
+    3: "Read Holding Registers",
+    4: "Read Input Registers",
+    5: "Write Coil",
+    6: "Write Register",
+    15: "Write Coils",
+    16: "Write Registers",
+    23: "Read/Write Registers",
+}
+
+# Latency histogram: 0.5 ms .. ~6 s in 25% steps
+LATENCY_BUCKETS = [0.0005 * 1.25 ** i for i in range(43)]
+
+RING_SECONDS = 60
+
+
+def bits_per_char(bytesize=8, parity="N", stopbits=1):
+    """Serial character length in bits (start bit + data + parity + stop)"""
+    return 1 + bytesize + (0 if parity == "N" else 1) + stopbits
+
+
+class LatencyHistogram:
+    """Fixed log-spaced latency buckets; percentiles are bucket upper bounds"""
+    __slots__ = ("counts", "total", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        """Latency in seconds below which p percent of transactions completed"""
+        if not self.total:
+            return 0.0
+        rank = math.ceil(self.total * p / 100.0)
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    @property
+    def mean(self):
+        return self.sum / self.total if self.total else 0.0
+
+
+class LinkCounters:
+    """Counters for one (device, function code) pair"""
+    __slots__ = ("transactions", "request_bytes", "response_bytes", "timeouts",
+                 "exceptions", "frame_errors", "line_time", "latency")
+
+    def __init__(self):
+        self.transactions = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.timeouts = 0
+        self.exceptions = 0
+        self.frame_errors = 0
+        self.line_time = 0.0
+        self.latency = LatencyHistogram()
+
+    def merge(self, other):
+        self.transactions += other.transactions
+        self.request_bytes += other.request_bytes
+        self.response_bytes += other.response_bytes
+        self.timeouts += other.timeouts
+        self.exceptions += other.exceptions
+        self.frame_errors += other.frame_errors
+        self.line_time += other.line_time
+        self.latency.merge(other.latency)
+
+    @property
+    def errors(self):
+        return self.timeouts + self.exceptions + self.frame_errors
+
+    def as_dict(self):
+        return {
+            "transactions": self.transactions,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "timeouts": self.timeouts,
+            "exceptions": self.exceptions,
+            "frame_errors": self.frame_errors,
+            "line_time": self.line_time,
+            "latency_mean": self.latency.mean,
+            "latency_p50": self.latency.percentile(50),
+            "latency_p95": self.latency.percentile(95),
+            "latency_p99": self.latency.percentile(99),
+            "latency_max": self.latency.max,
+        }
+
+
+class BusStats:
+    """Collects per-device / per-function bus statistics for one serial line"""
+    def __init__(self, baudrate=9600, bytesize=8, parity="N", stopbits=1):
+        self.lock = threading.Lock()
+        self.set_line(baudrate, bytesize, parity, stopbits)
+        self.reset()
+
+    def set_line(self, baudrate, bytesize=8, parity="N", stopbits=1):
+        self.baudrate = baudrate
+        self.char_time = bits_per_char(bytesize, parity, stopbits) / float(baudrate)
+        # Modbus RTU: 3.5 character silent interval before every frame
+        self.frame_gap = 3.5 * self.char_time
+
+    def reset(self):
+        with self.lock:
+            self.links = {}
+            self.started = time.monotonic()
+            self._ring_second = [0] * RING_SECONDS
+            self._ring_line = [0.0] * RING_SECONDS
+            self._ring_busy = [0.0] * RING_SECONDS
+
+    # -------- Recording --------
+    def record(self, device_id, function_code, count, values, started, latency,
+               timeout=False, exception_code=0, frame_error=False, attempts=1):
+        """Account one transaction; `attempts` is how often the client sent the request before giving up"""
+        request_bytes = request_pdu_length(function_code, count, values) + RTU_OVERHEAD
+        if timeout or frame_error:
+            request_bytes *= attempts
+            response_bytes = 0
+            frames = attempts
+        else:
+            response_bytes = response_pdu_length(function_code, count, exception_code != 0) + RTU_OVERHEAD
+            frames = 2
+        line_time = (request_bytes + response_bytes) * self.char_time + self.frame_gap * frames
+
+        with self.lock:
+            key = (device_id, function_code)
+            link = self.links.get(key)
+            if link is None:
+                link = self.links[key] = LinkCounters()
+            link.transactions += 1
+            link.request_bytes += request_bytes
+            link.response_bytes += response_bytes
+            link.line_time += line_time
+            if timeout:
+                link.timeouts += 1
+            elif frame_error:
+                link.frame_errors += 1
+            else:
+                if exception_code:
+                    link.exceptions += 1
+                link.latency.add(latency)
+
+            second = int(started)
+            slot = second % RING_SECONDS
+            if self._ring_second[slot] != second:
+                self._ring_second[slot] = second
+                self._ring_line[slot] = 0.0
+                self._ring_busy[slot] = 0.0
+            self._ring_line[slot] += line_time
+            self._ring_busy[slot] += latency
+
+    # -------- Queries --------
+    def _window(self, ring, window):
+        window = max(1, min(window, RING_SECONDS - 1))
+        now = int(time.monotonic())
+        total = 0.0
+        with self.lock:
+            # Only completed seconds count, so a partial current second doesn't skew the ratio
+            for second in range(now - window, now):
+                slot = second % RING_SECONDS
+                if self._ring_second[slot] == second:
+                    total += ring[slot]
+        return total / window
+
+    def utilization(self, window=10):
+        """Fraction of the last `window` seconds the wire carried frames (0..1)"""
+        return self._window(self._ring_line, window)
+
+    def occupancy(self, window=10):
+        """Fraction of the last `window` seconds the master was blocked in transactions"""
+        return self._window(self._ring_busy, window)
+
+    def counters(self, device_id=None, function_code=None):
+        """Aggregated LinkCounters, optionally filtered by device and/or function code"""
+        total = LinkCounters()
+        with self.lock:
+            for (dev, fc), link in self.links.items():
+                if (device_id is None or dev == device_id) and (function_code is None or fc == function_code):
+                    total.merge(link)
+        return total
+
+    def rows(self):
+        """[(device_id, function_code, counters dict)] sorted by device then function"""
+        with self.lock:
+            items = sorted(self.links.items())
+            return [(dev, fc, link.as_dict()) for (dev, fc), link in items]
+
+    def snapshot(self, window=10):
+        return {
+            "uptime": time.monotonic() - self.started,
+            "baudrate": self.baudrate,
+            "utilization": self.utilization(window),
+            "occupancy": self.occupancy(window),
+            "total": self.counters().as_dict(),
+            "links": self.rows(),
+        }
+
+
+class BusStatsClient(TransportProxy):
+    """Client proxy that times every transaction into a BusStats collector"""
+    def __init__(self, client, stats):
+        super().__init__(client)
+        self.stats = stats
+        # pymodbus resends an unanswered request `retries` times before raising
+        self.attempts = (getattr(base_client(client), "retries", 0) or 0) + 1
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        started = time.monotonic()
+        try:
+            result = call()
+        except ModbusIOException:
+            self.stats.record(device_id, function_code, count, values, started,
+                              time.monotonic() - started, timeout=True, attempts=self.attempts)
+            raise
+        except ModbusException:
+            self.stats.record(device_id, function_code, count, values, started,
+                              time.monotonic() - started, frame_error=True)
+            raise
+        latency = time.monotonic() - started
+        if result is None:
+            self.stats.record(device_id, function_code, count, values, started, latency,
+                              timeout=True, attempts=self.attempts)
+        else:
+            self.stats.record(device_id, function_code, count, values, started, latency,
+                              exception_code=exception_code_of(result))
+        return result
@@ -0,0 +1,198 @@
+# ============================================================
+# Coil Pulse Engine
+# ============================================================
+#
+# Momentary outputs (raise/lower, start/stop) are written ON by the caller and
+# switched OFF by a worker thread at a monotonic deadline, so a busy GUI thread
+# can no longer stretch a pulse. Each coil carries at most one pulse at a time;
+# a pulse can name an interlocked partner (e.g. the decrease coil of an
+# increase pulse) which is dropped before the new coil is energised. Edges on
+# the same device that fall due together go out as one write_coils request per
+# contiguous address run.
+
+import heapq
+import itertools
+import threading
+import time
+
+# OFF edges due within this many seconds of each other are written together
+MERGE_WINDOW = 0.002
+
+# An OFF edge that fails is retried this often, RETRY_DELAY seconds apart
+OFF_RETRIES = 3
+RETRY_DELAY = 0.05
+
+
+def contiguous_runs(addresses):
+    """Split addresses into (start, count) runs of consecutive values"""
+    runs = []
+    for address in sorted(set(addresses)):
+        if runs and runs[-1][0] + runs[-1][1] == address:
+            runs[-1][1] += 1
+        else:
+            runs.append([address, 1])
+    return [(start, count) for start, count in runs]
+
+
+def write_coil_runs(client, device_id, addresses, value):
+    """Write the same value to `addresses` on one device; returns the addresses acknowledged.
+
+    Consecutive coils share one write_coils (FC15) request, single ones use write_coil (FC5).
+    """
+    written = set()
+    for start, count in contiguous_runs(addresses):
+        try:
+            if count == 1:
+                result = client.write_coil(start, value, device_id=device_id)
+            else:
+                result = client.write_coils(start, [value] * count, device_id=device_id)
+        except Exception as e:
+            print(f"Coil write failed: device {device_id} coils {start}+{count}: {e}")
+            continue
+        if result is not None and not result.isError():
+            written.update(range(start, start + count))
+        else:
+            print(f"Coil write rejected: device {device_id} coils {start}+{count}: {result}")
+    return written
+
+
+class CoilPulseEngine:
+    """Schedules coil pulses with monotonic timing on a worker thread.
+
+    Addresses are zero-based protocol offsets. The client must tolerate calls
+    from the worker thread (HMIWindow hands out a SerializedClient).
+    """
+    def __init__(self, client=None, merge_window=MERGE_WINDOW):
+        self.client = client
+        self.merge_window = merge_window
+        self._cond = threading.Condition()
+        self._heap = []        # (deadline, token, device_id, address, retries_left)
+        self._active = {}      # (device_id, address) -> token of the pulse holding the coil
+        self._tokens = itertools.count(1)
+        self._thread = None
+
+    def set_client(self, client):
+        """Switch clients; coils still held by a pulse are released on the old client first"""
+        self.release_all()
+        with self._cond:
+            self.client = client
+
+    def is_active(self, device_id, address):
+        with self._cond:
+            return (device_id, address) in self._active
+
+    # -------- Public API --------
+    def pulse(self, device_id, address, duration_ms, interlock=None):
+        """Energise one coil for duration_ms; False if the coil is busy or the ON write failed"""
+        return self.pulse_many([(device_id, address, duration_ms, interlock)])[0]
+
+    def pulse_many(self, pulses):
+        """Start several (device_id, address, duration_ms, interlock) pulses at once.
+
+        ON edges on one device are merged like OFF edges. `interlock` is a
+        (device_id, address) that must never be ON together with this coil.
+        Returns one success flag per pulse.
+        """
+        results = [False] * len(pulses)
+        client = self.client
+        if not client:
+            return results
+
+        starting = {}
+        dropping = {}
+        with self._cond:
+            for index, (device_id, address, duration_ms, interlock) in enumerate(pulses):
+                if (device_id, address) in self._active or address in starting.get(device_id, {}):
+                    print(f"Pulse ignored: coil {address} on device {device_id} is already pulsing")
+                    continue
+                if interlock is not None and tuple(interlock) in self._active:
+                    # Break before make: the partner's pulse ends now, its queued OFF edge goes stale
+                    partner = tuple(interlock)
+                    del self._active[partner]
+                    dropping.setdefault(partner[0], set()).add(partner[1])
+                # Reserve the coil while its ON edge is in flight
+                self._active[(device_id, address)] = 0
+                starting.setdefault(device_id, {})[address] = (index, duration_ms, interlock)
+
+        stuck = set()
+        for device_id, addresses in dropping.items():
+            released = write_coil_runs(client, device_id, addresses, False)
+            for address in addresses - released:
+                # Partner may still be ON: keep retrying its OFF edge and don't energise this side
+                stuck.add((device_id, address))
+                self._schedule(time.monotonic(), device_id, address, OFF_RETRIES)
+
+        for device_id, entries in starting.items():
+            allowed = [address for address, entry in entries.items()
+                       if entry[2] is None or tuple(entry[2]) not in stuck]
+            written = write_coil_runs(client, device_id, allowed, True)
+            for address, (index, duration_ms, _) in entries.items():
+                if address in written:
+                    self._schedule(time.monotonic() + duration_ms / 1000.0, device_id, address, OFF_RETRIES)
+                    results[index] = True
+                else:
+                    with self._cond:
+                        if self._active.get((device_id, address)) == 0:
+                            del self._active[(device_id, address)]
+        return results
+
+    def release_all(self):
+        """Write OFF to every coil still held by a pulse (disconnect / shutdown)"""
+        with self._cond:
+            held = list(self._active)
+            self._active.clear()
+            self._heap.clear()
+            client = self.client
+        if not client:
+            return
+        devices = {}
+        for device_id, address in held:
+            devices.setdefault(device_id, set()).add(address)
+        for device_id, addresses in devices.items():
+            write_coil_runs(client, device_id, addresses, False)
+
+    # -------- Worker --------
+    def _schedule(self, deadline, device_id, address, retries):
+        with self._cond:
+            token = next(self._tokens)
+            self._active[(device_id, address)] = token
+            heapq.heappush(self._heap, (deadline, token, device_id, address, retries))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="coil-pulses", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _take_due(self):
+        """Block until OFF edges are due; returns them grouped by device"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now:
+                    break
+                self._cond.wait(self._heap[0][0] - now if self._heap else None)
+
+            due = {}
+            horizon = time.monotonic() + self.merge_window
+            while self._heap and self._heap[0][0] <= horizon:
+                deadline, token, device_id, address, retries = heapq.heappop(self._heap)
+                if self._active.get((device_id, address)) == token:
+                    due.setdefault(device_id, []).append((address, token, retries))
+            return due, self.client
+
+    def _run(self):
+        while True:
+            due, client = self._take_due()
+            for device_id, edges in due.items():
+                released = write_coil_runs(client, device_id, [a for a, _, _ in edges], False) if client else set()
+                with self._cond:
+                    for address, token, retries in edges:
+                        key = (device_id, address)
+                        if self._active.get(key) != token:
+                            continue
+                        if address in released or retries <= 0:
+                            del self._active[key]
+                            if address not in released:
+                                print(f"Pulse OFF failed: coil {address} on device {device_id} may still be ON")
+                        else:
+                            heapq.heappush(self._heap, (time.monotonic() + RETRY_DELAY, token,
+                                                        device_id, address, retries - 1))
@@ -0,0 +1,223 @@
+# ============================================================
+# Connection Supervisor
+# ============================================================
+#
+# Opening the port and probing the stations used to happen on the GUI
+# thread, once a second, ending in a modal "Connection Lost" box. The
+# supervisor owns that lifecycle on a worker thread instead: it retries with
+# exponential backoff and jitter, retries at once when a serial adapter
+# (re)appears under /dev/serial/by-id (or in the COM port list elsewhere),
+# and reports progress through a callback. LinkWatch tells the poll cycle
+# whether anything on the line answered, so a dead link is told apart from a
+# single failing station.
+
+import os
+import random
+import threading
+import time
+
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from modbus_transport import TransportProxy
+
+try:
+    from serial.tools import list_ports
+except ImportError:
+    list_ports = None
+
+BY_ID_DIR = "/dev/serial/by-id"
+
+# Retry delays: BACKOFF_INITIAL * 2^n capped at BACKOFF_MAX, +/- BACKOFF_JITTER
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 30.0
+BACKOFF_JITTER = 0.25
+
+# How often the port list is scanned for hot-plugged adapters while waiting
+HOTPLUG_POLL = 1.0
+
+STATE_IDLE = "idle"
+STATE_CONNECTING = "connecting"
+STATE_CONNECTED = "connected"
+
+
+def backoff_delay(attempt, initial=BACKOFF_INITIAL, maximum=BACKOFF_MAX, jitter=BACKOFF_JITTER):
+    """Seconds to wait before retry `attempt` (1-based)"""
+    delay = min(maximum, initial * (2 ** max(0, attempt - 1)))
+    return delay * random.uniform(1.0 - jitter, 1.0 + jitter)
+
+
+def available_ports():
+    """Set of serial device names currently present (by-id links where the OS provides them)"""
+    try:
+        return {os.path.join(BY_ID_DIR, name) for name in os.listdir(BY_ID_DIR)}
+    except OSError:
+        pass
+    if list_ports is None:
+        return set()
+    try:
+        return {port.device for port in list_ports.comports()}
+    except Exception:
+        return set()
+
+
+def stable_port(port):
+    """The /dev/serial/by-id link for `port` if there is one, so a re-enumerated adapter is found again"""
+    if not port:
+        return port
+    try:
+        target = os.path.realpath(port)
+        for name in os.listdir(BY_ID_DIR):
+            path = os.path.join(BY_ID_DIR, name)
+            if os.path.realpath(path) == target:
+                return path
+    except OSError:
+        pass
+    return port
+
+
+class LinkWatch:
+    """Counts answered and unanswered transactions across every client of a connection"""
+    def __init__(self):
+        self.answered = 0
+        self.unanswered = 0
+
+    def mark(self):
+        return self.answered, self.unanswered
+
+    def silent_since(self, mark):
+        """True when requests went out since `mark` and none of them got any answer"""
+        return self.answered == mark[0] and self.unanswered > mark[1]
+
+
+class LinkWatchClient(TransportProxy):
+    """Client proxy feeding a LinkWatch; exception responses and garbled frames count as answers"""
+    def __init__(self, client, watch):
+        super().__init__(client)
+        self.watch = watch
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        try:
+            result = call()
+        except ModbusIOException:
+            self.watch.unanswered += 1
+            raise
+        except ModbusException:
+            self.watch.answered += 1
+            raise
+        if result is None:
+            self.watch.unanswered += 1
+        else:
+            self.watch.answered += 1
+        return result
+
+
+class ConnectionSupervisor:
+    """Background (re)connection with backoff, jitter and hot-plug detection.
+
+    factory(port) builds an unconnected client, probe(client) returns a truthy
+    result when the stations answer. on_event(kind, data) is called from the
+    worker thread with ("connected", (client, probe_result, session)) or
+    ("retry", (attempt, delay, reason)); the GUI must marshal it to its own thread
+    and only adopt a client whose session is still current().
+    """
+    def __init__(self, factory, probe, on_event):
+        self.factory = factory
+        self.probe = probe
+        self.on_event = on_event
+        self.state = STATE_IDLE
+        self.port = None
+        self._cond = threading.Condition()
+        self._session = 0      # bumped by start/stop so a stale attempt can tell it was cancelled
+        self._wake = False
+        self._thread = None
+
+    def start(self, port):
+        """Begin connecting to `port` (None for ports the factory picks itself)"""
+        with self._cond:
+            self.port = stable_port(port)
+            self.state = STATE_CONNECTING
+            self._session += 1
+            self._wake = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="connection-supervisor", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self):
+        """Give up on the port; an attempt in progress is discarded when it returns"""
+        with self._cond:
+            self.state = STATE_IDLE
+            self._session += 1
+            self._cond.notify()
+
+    def current(self, session):
+        with self._cond:
+            return self._session == session and self.state == STATE_CONNECTED
+
+    # -------- Worker --------
+    def _wait(self, session, delay):
+        """Sleep up to `delay`, returning early on start(), stop() or a new serial adapter"""
+        deadline = time.monotonic() + delay
+        known = available_ports()
+        while True:
+            with self._cond:
+                if self._session != session or self._wake:
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._cond.wait(min(remaining, HOTPLUG_POLL))
+                if self._session != session or self._wake:
+                    return
+            present = available_ports()
+            if present - known:
+                print(f"Serial adapter appeared: {', '.join(sorted(present - known))} - retrying now")
+                return
+            known = present
+
+    def _run(self):
+        attempt = 0
+        while True:
+            with self._cond:
+                while self.state != STATE_CONNECTING:
+                    attempt = 0
+                    self._cond.wait()
+                self._wake = False
+                session = self._session
+                port = self.port
+
+            client = None
+            result = None
+            reason = ""
+            try:
+                client = self.factory(port)
+                if client.connect():
+                    result = self.probe(client)
+                    if not result:
+                        reason = "no station answered"
+                else:
+                    reason = f"cannot open {port}" if port else "cannot connect"
+            except Exception as e:
+                reason = str(e)
+
+            with self._cond:
+                current = self._session == session and self.state == STATE_CONNECTING
+                if current and result:
+                    self.state = STATE_CONNECTED
+            if current and result:
+                attempt = 0
+                self.on_event("connected", (client, result, session))
+                continue
+            if client is not None:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+            if not current:
+                continue
+
+            attempt += 1
+            delay = backoff_delay(attempt)
+            print(f"Connection attempt {attempt} failed ({reason}) - next try in {delay:.1f} s")
+            self.on_event("retry", (attempt, delay, reason))
+            self._wait(session, delay)
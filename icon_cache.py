@@ -0,0 +1,77 @@
+# ============================================================
+# Icon Cache
+# ============================================================
+#
+# The images in imgs/ are 512 px PNGs shown at 16-28 px. Loading one from
+# disk and smooth-scaling it is far more work than drawing it, and several
+# widgets did both on every paint or status poll. icon_pixmap() hands out
+# each (image, size, pixel ratio) once, scaled, from QPixmapCache; icon()
+# shares one QIcon per image. preload_icons() reads every image at startup
+# so the first poll does not touch the disk. QPixmapCache may evict entries
+# under memory pressure - they are simply rebuilt on the next request.
+
+import os
+import sys
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication, QIcon, QPixmap, QPixmapCache
+
+ICON_DIR = "imgs"
+
+_icons = {}
+
+
+def icon_file(name):
+    """Path of an image in imgs/ (inside the bundle when frozen)"""
+    base_path = getattr(sys, "_MEIPASS", os.path.abspath(os.path.dirname(__file__)))
+    return os.path.join(base_path, ICON_DIR, name)
+
+
+def _source(name):
+    key = f"icon:{name}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(icon_file(name))
+        if pixmap.isNull():
+            print(f"Icon {name} could not be loaded")
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def icon_pixmap(name, size, dpr=None):
+    """imgs/<name> scaled to fit size x size logical pixels at device pixel ratio `dpr`
+    (default: the primary screen's); a null pixmap if the image is missing"""
+    if dpr is None:
+        app = QGuiApplication.instance()
+        dpr = app.devicePixelRatio() if app is not None else 1.0
+    key = f"icon:{name}:{size}:{dpr:g}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        source = _source(name)
+        if source.isNull():
+            return source
+        side = max(1, round(size * dpr))
+        pixmap = source.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def icon(name):
+    """Shared QIcon for imgs/<name>"""
+    cached = _icons.get(name)
+    if cached is None:
+        cached = _icons[name] = QIcon(icon_file(name))
+    return cached
+
+
+def preload_icons():
+    """Read every image in imgs/ into the cache (call once the QApplication exists)"""
+    try:
+        names = sorted(n for n in os.listdir(icon_file("")) if n.lower().endswith(".png"))
+    except OSError as e:
+        print(f"Icons not preloaded: {e}")
+        return
+    for name in names:
+        _source(name)
+        icon(name)
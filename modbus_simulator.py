@@ -0,0 +1,521 @@
+# ============================================================
+# Local Modbus Device Simulator for Test Mode and Benchmarks
+# ============================================================
+#
+# Serves the station layout that HMIWindow.read_data expects from a
+# pymodbus server, over localhost TCP and/or a pty pair, so the real
+# acquisition, scaling and alarm-coil paths can run without hardware.
+#
+#   Station 1  input registers 0-7    pressures (raw 4-20mA counts)
+#              coils 0-15             startup condition / engine control bits
+#   Station 2  input registers 0-15   cylinder head temperatures (x10)
+#   Station 3  input registers 0-11   2 cylinder head + 10 main bearing temps (x10)
+#   Station 4  holding registers 0-15 engine temperatures (x10)
+#   Station 5  input registers 0-11   electrical parameters (30001-30012)
+#              coils 0-63             relay outputs (alarm / regulation coils)
+#
+# RtuTrafficGenerator plays another bus master's poll cycle (requests and
+# the stations' responses) onto a pty, for the HMI's listen-only mode.
+#
+# The pty endpoints (--pty, --foreign-master) need POSIX pseudo-terminals;
+# on Windows only the TCP server is available.
+#
+# Usage:
+#   python modbus_simulator.py --tcp-port 5020 --pty --latency 15 --jitter 5 --dropout 0.02
+#   python modbus_simulator.py --tcp-port 0 --foreign-master
+
+import argparse
+import asyncio
+import os
+import random
+import threading
+import time
+
+from pymodbus.constants import ExcCodes
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.exceptions import NoSuchIdException
+from pymodbus.server import ModbusSerialServer, ModbusTcpServer
+
+from bus_stats import bits_per_char
+from rtu_transport import frame, request_pdu, response_pdu, silent_interval
+
+SIMULATOR_HOST = "127.0.0.1"
+SIMULATOR_TCP_PORT = 5020
+
+# Raw counts at 4mA / 20mA and full scale (bar) per pressure channel.
+# Mirrors the calibration in EnginePressuresTab.update_pressures.
+PRESSURE_CALIBRATION = [
+    (397, 1998, 15),  # Fuel Oil Pressure Inlet
+    (320, 1600, 10),  # Lube Oil Pressure Inlet
+    (320, 1600, 10),  # LT Water Pressure
+    (320, 1600, 10),  # HT Water Pressure
+    (320, 1600, 10),  # Charge Air Pressure
+    (397, 1999, 30),  # Starting Air Pressure
+    (320, 1600, 10),  # Lube Oil Differential Pressure
+    (398, 2000, 5),   # Crank Case Pressure
+]
+
+# Startup-condition coils on station 1 in their "condition met" state
+# (see create_default_modbus_config StartupConditions / EngineControl).
+STATION1_DEFAULT_COILS = [0, 1, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0]
+
+
+# ---------------- Process Model ----------------
+class RandomWalkChannel:
+    """Value that wanders inside one of several normal/warning/critical bands"""
+    def __init__(self, bands, weights, step):
+        self.bands = bands
+        self.step = step
+        self.band = random.choices(range(len(bands)), weights=weights)[0]
+        low, high = bands[self.band]
+        self.value = random.randint(low, high)
+
+    def advance(self):
+        low, high = self.bands[self.band]
+        self.value = max(low, min(high, self.value + random.randint(-self.step, self.step)))
+        return self.value
+
+
+class PlantModel:
+    """Register image for stations 1-5, advanced once per update interval"""
+    def __init__(self):
+        # Cylinder head: normal <400°C, warning 400-600°C, critical >600°C
+        self.cylinder_temps = [
+            RandomWalkChannel([(2500, 4200), (3800, 6200), (5800, 7200)], [60, 25, 15], 15)
+            for _ in range(18)
+        ]
+        # Main bearing: normal <150°C, warning 150-250°C, critical >250°C
+        self.bearing_temps = [
+            RandomWalkChannel([(600, 1600), (1400, 2600), (2400, 3200)], [70, 20, 10], 8)
+            for _ in range(10)
+        ]
+        # Engine temperatures: 50-250°C
+        self.engine_temps = [
+            RandomWalkChannel([(400, 1900), (1700, 2300), (2100, 2600)], [65, 20, 15], 8)
+            for _ in range(16)
+        ]
+        # Pressures in bar x10, encoded to raw counts on read
+        pressure_bands = [
+            [(15, 85), (85, 115), (115, 150)],
+            [(35, 85), (20, 40), (5, 25)],     # Lube oil: low pressure is the alarm
+            [(15, 65), (65, 85), (85, 100)],
+            [(15, 65), (65, 85), (85, 100)],
+            [(15, 65), (65, 85), (85, 100)],
+            [(70, 210), (210, 250), (250, 300)],
+            [(15, 65), (65, 85), (85, 100)],
+            [(8, 32), (32, 42), (42, 50)],
+        ]
+        self.pressures = [RandomWalkChannel(bands, [60, 20, 20], 4) for bands in pressure_bands]
+        # Electrical: L-L voltages, phase currents, kW, PF x1000, kVAR, Hz, bus V, bus Hz
+        voltage_bands = [(380, 420), (370, 384), (416, 430), (340, 374), (426, 460)]
+        voltage_weights = [65, 10, 10, 8, 7]
+        self.electrical = (
+            [RandomWalkChannel(voltage_bands, voltage_weights, 8) for _ in range(3)]
+            + [RandomWalkChannel([(20, 60), (61, 80), (81, 100)], [65, 20, 15], 8) for _ in range(3)]
+            + [
+                RandomWalkChannel([(200, 600), (601, 800), (801, 1000)], [65, 20, 15], 8),
+                RandomWalkChannel([(920, 990), (880, 919), (800, 879)], [65, 20, 15], 8),
+                RandomWalkChannel([(50, 200), (201, 350), (351, 500)], [65, 20, 15], 8),
+                RandomWalkChannel([(49, 51)], [1], 1),
+                RandomWalkChannel([(395, 405)], [1], 2),
+                RandomWalkChannel([(49, 51)], [1], 1),
+            ]
+        )
+
+        self.tables = {
+            1: {"c": list(STATION1_DEFAULT_COILS), "d": [0] * 16, "h": [0] * 16, "i": [0] * 8},
+            2: {"c": [0] * 16, "d": [0] * 16, "h": [0] * 16, "i": [0] * 16},
+            3: {"c": [0] * 16, "d": [0] * 16, "h": [0] * 16, "i": [0] * 12},
+            4: {"c": [0] * 16, "d": [0] * 16, "h": [0] * 16, "i": [0] * 16},
+            5: {"c": [0] * 64, "d": [0] * 16, "h": [0] * 16, "i": [0] * 12},
+        }
+        self.step()
+
+    def device_ids(self):
+        return list(self.tables.keys())
+
+    def step(self):
+        """Advance every channel one random-walk step and refresh the register image"""
+        raw_pressures = []
+        for channel, (raw_4ma, raw_20ma, full_scale) in zip(self.pressures, PRESSURE_CALIBRATION):
+            bar = channel.advance() / 10.0
+            raw_pressures.append(int(raw_4ma + (bar / full_scale) * (raw_20ma - raw_4ma)))
+        cylinder = [c.advance() for c in self.cylinder_temps]
+        bearing = [c.advance() for c in self.bearing_temps]
+
+        self.tables[1]["i"][:] = raw_pressures
+        self.tables[2]["i"][:] = cylinder[:16]
+        self.tables[3]["i"][:] = cylinder[16:18] + bearing
+        self.tables[4]["h"][:] = [c.advance() for c in self.engine_temps]
+        self.tables[5]["i"][:] = [c.advance() for c in self.electrical]
+
+    def get_values(self, device_id, table, address, count):
+        values = self.tables[device_id][table]
+        if address < 0 or address + count > len(values):
+            return ExcCodes.ILLEGAL_ADDRESS
+        block = values[address:address + count]
+        if table in ("c", "d"):
+            return [bool(v) for v in block]
+        return block
+
+    def set_values(self, device_id, table, address, values):
+        target = self.tables[device_id][table]
+        if address < 0 or address + len(values) > len(target):
+            return ExcCodes.ILLEGAL_ADDRESS
+        target[address:address + len(values)] = [int(v) for v in values]
+        return None
+
+
+# ---------------- Link Model ----------------
+class LinkModel:
+    """Per-transaction latency, jitter and dropout applied before the device answers"""
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, dropout=0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.dropout = dropout
+
+    async def transact(self, device_id):
+        delay = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000.0)
+        if self.dropout > 0 and random.random() < self.dropout:
+            # Unknown-device path with ignore_missing_devices: server stays silent
+            raise NoSuchIdException(f"simulated dropout on device {device_id}")
+
+
+class SimulatorContext(ModbusServerContext):
+    """Server context that answers straight from a PlantModel.
+
+    The stock context copies its data blocks into the server at start-up,
+    so values could not change afterwards; this one reads the live image.
+    """
+    _table_for_function = {1: "c", 5: "c", 15: "c", 2: "d", 4: "i",
+                           3: "h", 6: "h", 16: "h", 22: "h", 23: "h"}
+    _read_functions = (1, 2, 3, 4)
+
+    def __init__(self, plant, link):  # pylint: disable=super-init-not-called
+        self.plant = plant
+        self.link = link
+        self.simdevices = []
+        self.old_simulator = True
+
+    def device_ids(self):
+        return self.plant.device_ids()
+
+    def _table(self, device_id, func_code):
+        if device_id not in self.plant.tables:
+            raise NoSuchIdException(f"device_id {device_id} is not simulated")
+        table = self._table_for_function.get(func_code)
+        if table is None:
+            return None
+        return table
+
+    async def async_getValues(self, device_id, func_code, address, count=1):
+        table = self._table(device_id, func_code)
+        if table is None:
+            return ExcCodes.ILLEGAL_FUNCTION
+        # Writes already paid the link cost in async_setValues
+        if func_code in self._read_functions:
+            await self.link.transact(device_id)
+        return self.plant.get_values(device_id, table, address, count)
+
+    async def async_setValues(self, device_id, func_code, address, values):
+        table = self._table(device_id, func_code)
+        if table is None:
+            return ExcCodes.ILLEGAL_FUNCTION
+        await self.link.transact(device_id)
+        return self.plant.set_values(device_id, table, address, values)
+
+
+# ---------------- PTY Pair ----------------
+PTY_SUPPORTED = os.name == "posix"
+
+
+def _require_pty(what):
+    if not PTY_SUPPORTED:
+        raise RuntimeError(f"{what} needs pseudo-terminals, which are only available on Linux/macOS")
+
+
+class PtyPair:
+    """Two linked pseudo-terminals, like `socat pty pty`, bridged by a thread"""
+    def __init__(self):
+        _require_pty("RTU over a pty pair")
+        import tty  # POSIX only (needs termios)
+        self._server_master, server_slave = os.openpty()
+        self._client_master, client_slave = os.openpty()
+        for fd in (server_slave, client_slave):
+            tty.setraw(fd)
+        self.server_port = os.ttyname(server_slave)
+        self.client_port = os.ttyname(client_slave)
+        # Keep slave fds open so the masters never see EOF between reopens
+        self._slaves = (server_slave, client_slave)
+        self._running = True
+        self._thread = threading.Thread(target=self._bridge, name="PtyBridge", daemon=True)
+        self._thread.start()
+
+    def _bridge(self):
+        import select
+        peers = {self._server_master: self._client_master,
+                 self._client_master: self._server_master}
+        while self._running:
+            readable, _, _ = select.select(list(peers), [], [], 0.1)
+            for fd in readable:
+                try:
+                    data = os.read(fd, 4096)
+                except OSError:
+                    continue
+                if data:
+                    os.write(peers[fd], data)
+
+    def close(self):
+        self._running = False
+        self._thread.join(timeout=1)
+        for fd in (self._server_master, self._client_master) + self._slaves:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+# ---------------- Foreign Master Traffic ----------------
+# Poll cycle of the PLC the HMI listens to: (device, function, address, count).
+# Covers every station the HMI reads, plus the relay coils it would drive itself.
+FOREIGN_POLL_CYCLE = [
+    (1, 4, 0, 8),
+    (1, 1, 0, 16),
+    (2, 4, 0, 16),
+    (3, 4, 0, 12),
+    (4, 3, 0, 16),
+    (5, 4, 0, 12),
+    (5, 15, 0, 16),
+]
+
+_FUNCTION_TABLES = {1: "c", 2: "d", 3: "h", 4: "i", 15: "c", 16: "h"}
+
+
+class RtuTrafficGenerator:
+    """Writes another master's RTU traffic to a pty: each request, then the station's response.
+
+    `port` is the device a listen-only client opens. Frames are spaced by their
+    line time at `baudrate`, the stations answer after `turnaround` seconds and
+    stay silent with probability `dropout`. Responses come from `plant`
+    (a PlantModel of its own, advanced once per cycle, when none is given).
+    """
+    def __init__(self, plant=None, baudrate=9600, cycle=None, interval=0.5, turnaround=0.005,
+                 dropout=0.0, slave_timeout=0.1):
+        self.own_plant = plant is None
+        self.plant = plant or PlantModel()
+        self.cycle = list(cycle or FOREIGN_POLL_CYCLE)
+        self.interval = interval
+        self.turnaround = turnaround
+        self.dropout = dropout
+        self.slave_timeout = slave_timeout
+        self.char_time = bits_per_char() / float(baudrate)
+        self.gap = silent_interval(baudrate)[1]
+        _require_pty("Foreign master traffic")
+        import tty  # POSIX only (needs termios)
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self.port = os.ttyname(self._slave)
+        self.cycles = 0
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="RtuTrafficGenerator", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _send(self, data):
+        try:
+            os.write(self._master, data)
+        except (BlockingIOError, OSError):
+            pass                   # nobody listening - the line just carries it
+        time.sleep(len(data) * self.char_time + self.gap)
+
+    def _transaction(self, device_id, function_code, address, count):
+        table = _FUNCTION_TABLES[function_code]
+        values = self.plant.tables[device_id][table][address:address + count]
+        if function_code in (15, 16):
+            request = request_pdu(function_code, address, values=values)
+            response = response_pdu(function_code, address, count)
+        else:
+            request = request_pdu(function_code, address, count)
+            response = response_pdu(function_code, values=values)
+        self._send(frame(device_id, request))
+        if self.dropout > 0 and random.random() < self.dropout:
+            time.sleep(self.slave_timeout)
+            return
+        time.sleep(self.turnaround)
+        self._send(frame(device_id, response))
+
+    def _run(self):
+        while self._running:
+            started = time.monotonic()
+            if self.own_plant:
+                self.plant.step()
+            for device_id, function_code, address, count in self.cycle:
+                if not self._running:
+                    return
+                self._transaction(device_id, function_code, address, count)
+            self.cycles += 1
+            time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+# ---------------- Simulator ----------------
+class ModbusSimulator:
+    """Runs the simulated stations in a background asyncio thread"""
+    def __init__(self, tcp_port=SIMULATOR_TCP_PORT, use_pty=False, baudrate=9600,
+                 latency_ms=0.0, jitter_ms=0.0, dropout=0.0, update_interval=1.0,
+                 host=SIMULATOR_HOST):
+        self.host = host
+        self.tcp_port = tcp_port
+        self.use_pty = use_pty
+        self.baudrate = baudrate
+        self.update_interval = update_interval
+        self.plant = PlantModel()
+        self.link = LinkModel(latency_ms, jitter_ms, dropout)
+        self.context = SimulatorContext(self.plant, self.link)
+        self.pty = None
+        self._loop = None
+        self._stop_event = None
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = None
+
+    @property
+    def error(self):
+        """Why the last start() failed (None when it did not)"""
+        return self._error
+
+    @property
+    def client_port(self):
+        """Serial device the application should open when serving over a pty"""
+        return self.pty.client_port if self.pty else None
+
+    def start(self, timeout=5.0):
+        """Start serving; returns True once all endpoints are listening"""
+        if self.use_pty:
+            try:
+                self.pty = PtyPair()
+            except (RuntimeError, OSError) as e:
+                self._error = e
+                print(f"Modbus simulator failed to start: {e}")
+                return False
+        self._thread = threading.Thread(target=self._run, name="ModbusSimulator", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout) or self._error:
+            if self._error is None:
+                self._error = f"not listening after {timeout:.0f} s"
+            print(f"Modbus simulator failed to start: {self._error}")
+            self.stop()
+            return False
+        return True
+
+    def stop(self):
+        if self._loop and self._stop_event:
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                pass    # the loop already ended (e.g. a server failed to start)
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self.pty:
+            self.pty.close()
+            self.pty = None
+
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        servers = []
+        if self.tcp_port:
+            server = ModbusTcpServer(self.context, address=(self.host, self.tcp_port),
+                                     ignore_missing_devices=True, broadcast_enable=True)
+            await server.serve_forever(background=True)
+            servers.append(server)
+        if self.pty:
+            server = ModbusSerialServer(self.context, port=self.pty.server_port,
+                                        baudrate=self.baudrate, ignore_missing_devices=True,
+                                        broadcast_enable=True)
+            await server.serve_forever(background=True)
+            servers.append(server)
+        self._ready.set()
+
+        try:
+            while not self._stop_event.is_set():
+                self.plant.step()
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), self.update_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for server in servers:
+                await server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IntelliScada Modbus station simulator")
+    parser.add_argument("--host", default=SIMULATOR_HOST)
+    parser.add_argument("--tcp-port", type=int, default=SIMULATOR_TCP_PORT,
+                        help="Modbus TCP port (0 disables TCP)")
+    parser.add_argument("--pty", action="store_true", help="also serve RTU over a pty pair")
+    parser.add_argument("--baudrate", type=int, default=9600)
+    parser.add_argument("--latency", type=float, default=0.0, help="per-transaction latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="latency jitter, +/- (ms)")
+    parser.add_argument("--dropout", type=float, default=0.0, help="probability of no response (0-1)")
+    parser.add_argument("--interval", type=float, default=1.0, help="process update interval (s)")
+    parser.add_argument("--foreign-master", action="store_true",
+                        help="also play a PLC's poll cycle onto a pty for listen-only mode")
+    args = parser.parse_args()
+    if (args.pty or args.foreign_master) and not PTY_SUPPORTED:
+        parser.error("--pty and --foreign-master need pseudo-terminals, which are only available on Linux/macOS")
+
+    simulator = ModbusSimulator(tcp_port=args.tcp_port, use_pty=args.pty, baudrate=args.baudrate,
+                                latency_ms=args.latency, jitter_ms=args.jitter,
+                                dropout=args.dropout, update_interval=args.interval,
+                                host=args.host)
+    if not simulator.start():
+        return 1
+    if args.tcp_port:
+        print(f"Modbus TCP simulator listening on {args.host}:{args.tcp_port}")
+    if simulator.client_port:
+        print(f"Modbus RTU simulator on {simulator.client_port} ({args.baudrate} baud)")
+    generator = None
+    if args.foreign_master:
+        generator = RtuTrafficGenerator(simulator.plant, baudrate=args.baudrate, dropout=args.dropout)
+        generator.start()
+        print(f"Foreign master traffic on {generator.port} - open it in LISTEN ONLY mode")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if generator:
+            generator.stop()
+        simulator.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+# ============================================================
+# Modbus Transport Helpers
+# ============================================================
+#
+# Shared building blocks for anything that sits between the HMI and the
+# pymodbus client: a proxy base class that funnels every request through a
+# single transact() hook, a lock so several threads can share one client, and
+# a minimal response object for transports that synthesize replies instead of
+# receiving them from a device.
+
+import threading
+
+# Function codes used by the HMI
+FC_READ_COILS = 1
+FC_READ_DISCRETE_INPUTS = 2
+FC_READ_HOLDING_REGISTERS = 3
+FC_READ_INPUT_REGISTERS = 4
+FC_WRITE_COIL = 5
+FC_WRITE_REGISTER = 6
+FC_WRITE_COILS = 15
+FC_WRITE_REGISTERS = 16
+FC_READWRITE_REGISTERS = 23
+
+BIT_FUNCTIONS = (FC_READ_COILS, FC_READ_DISCRETE_INPUTS, FC_WRITE_COIL, FC_WRITE_COILS)
+READ_FUNCTIONS = (FC_READ_COILS, FC_READ_DISCRETE_INPUTS,
+                  FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS)
+
+# RTU framing overhead around the PDU: unit id + 16-bit CRC
+RTU_OVERHEAD = 3
+
+
+def request_pdu_length(function_code, count, values=None):
+    """Byte length of a request PDU (function code included)"""
+    if function_code == FC_WRITE_COILS:
+        return 6 + (count + 7) // 8
+    if function_code == FC_WRITE_REGISTERS:
+        return 6 + 2 * count
+    if function_code == FC_READWRITE_REGISTERS:
+        return 10 + 2 * len(values or [])
+    return 5
+
+
+def response_pdu_length(function_code, count, is_exception=False):
+    """Byte length of the response PDU a request of `count` items produces"""
+    if is_exception:
+        return 2
+    if function_code in (FC_READ_COILS, FC_READ_DISCRETE_INPUTS):
+        return 2 + (count + 7) // 8
+    if function_code in (FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS, FC_READWRITE_REGISTERS):
+        return 2 + 2 * count
+    return 5
+
+
+class TransportResponse:
+    """Response with the pymodbus attributes the HMI relies on (registers, bits, isError)"""
+    def __init__(self, function_code, registers=None, bits=None, exception_code=0, device_id=0):
+        self.function_code = function_code
+        self.registers = list(registers) if registers is not None else []
+        self.bits = list(bits) if bits is not None else []
+        self.exception_code = exception_code
+        self.dev_id = device_id
+
+    def isError(self):
+        return self.exception_code != 0
+
+    def __repr__(self):
+        if self.isError():
+            return f"TransportResponse(fc={self.function_code}, exception={self.exception_code})"
+        return f"TransportResponse(fc={self.function_code}, registers={self.registers}, bits={self.bits})"
+
+
+def response_values(function_code, response):
+    """Extract the data words/bits carried by a pymodbus response"""
+    if response is None or response.isError():
+        return []
+    if function_code in BIT_FUNCTIONS:
+        return [1 if b else 0 for b in getattr(response, "bits", [])]
+    return list(getattr(response, "registers", []))
+
+
+def exception_code_of(response):
+    """Modbus exception code of an error response (0 when the response is good)"""
+    if response is None or not response.isError():
+        return 0
+    return getattr(response, "exception_code", 0) or 0xFF
+
+
+def base_client(client):
+    """Strip TransportProxy layers down to the client that actually talks to the bus"""
+    while isinstance(client, TransportProxy) and client.client is not None:
+        client = client.client
+    return client
+
+
+class TransportProxy:
+    """Wraps a pymodbus sync client and routes every request through transact().
+
+    Subclasses override transact() to observe or alter traffic; proxies can be
+    stacked since each one exposes the same client API it wraps. Attributes not
+    defined here fall through to the wrapped client.
+    """
+    def __init__(self, client):
+        self.client = client
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def connect(self):
+        return self.client.connect()
+
+    def close(self):
+        return self.client.close()
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        """Perform one request; `call` issues it on the wrapped client"""
+        return call()
+
+    # -------- Reads --------
+    def read_coils(self, address, count=1, device_id=1, **kwargs):
+        return self.transact(FC_READ_COILS, device_id, address, count, None,
+                             lambda: self.client.read_coils(address, count=count, device_id=device_id, **kwargs))
+
+    def read_discrete_inputs(self, address, count=1, device_id=1, **kwargs):
+        return self.transact(FC_READ_DISCRETE_INPUTS, device_id, address, count, None,
+                             lambda: self.client.read_discrete_inputs(address, count=count, device_id=device_id, **kwargs))
+
+    def read_holding_registers(self, address, count=1, device_id=1, **kwargs):
+        return self.transact(FC_READ_HOLDING_REGISTERS, device_id, address, count, None,
+                             lambda: self.client.read_holding_registers(address, count=count, device_id=device_id, **kwargs))
+
+    def read_input_registers(self, address, count=1, device_id=1, **kwargs):
+        return self.transact(FC_READ_INPUT_REGISTERS, device_id, address, count, None,
+                             lambda: self.client.read_input_registers(address, count=count, device_id=device_id, **kwargs))
+
+    # -------- Writes --------
+    def write_coil(self, address, value, device_id=1, **kwargs):
+        return self.transact(FC_WRITE_COIL, device_id, address, 1, [1 if value else 0],
+                             lambda: self.client.write_coil(address, value, device_id=device_id, **kwargs))
+
+    def write_register(self, address, value, device_id=1, **kwargs):
+        return self.transact(FC_WRITE_REGISTER, device_id, address, 1, [value],
+                             lambda: self.client.write_register(address, value, device_id=device_id, **kwargs))
+
+    def write_coils(self, address, values, device_id=1, **kwargs):
+        return self.transact(FC_WRITE_COILS, device_id, address, len(values), [1 if v else 0 for v in values],
+                             lambda: self.client.write_coils(address, values, device_id=device_id, **kwargs))
+
+    def write_registers(self, address, values, device_id=1, **kwargs):
+        return self.transact(FC_WRITE_REGISTERS, device_id, address, len(values), list(values),
+                             lambda: self.client.write_registers(address, values, device_id=device_id, **kwargs))
+
+    def readwrite_registers(self, read_address=0, read_count=0, write_address=0, values=None, device_id=1, **kwargs):
+        values = list(values or [])
+        return self.transact(FC_READWRITE_REGISTERS, device_id, read_address, read_count, values,
+                             lambda: self.client.readwrite_registers(read_address=read_address, read_count=read_count,
+                                                                     write_address=write_address, values=values,
+                                                                     device_id=device_id, **kwargs))
+
+
+class SerializedClient(TransportProxy):
+    """Outermost proxy: one transaction on the bus at a time, whichever thread issues it.
+
+    The GUI poll and the coil pulse worker share the same half-duplex line; the
+    lock is held per transaction only, so neither side waits longer than one
+    request/response exchange.
+    """
+    def __init__(self, client):
+        super().__init__(client)
+        self.lock = threading.RLock()
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        with self.lock:
+            return call()
+
+    def close(self):
+        with self.lock:
+            return self.client.close()
@@ -0,0 +1,143 @@
+# ============================================================
+# Offscreen Paint Benchmark
+# ============================================================
+#
+# Renders the bar tabs, the circular gauges and the electrical displays into
+# a QImage with the offscreen platform and reports milliseconds per frame and
+# the Qt paint objects (QColor, QPen, QFont, gradients, QBrush) constructed
+# per frame. Values move between frames so the value-dependent parts paint
+# as they would live. "partial" rows render only the region a moving bar or
+# dial repaints. Run it before and after a render change:
+#   python paint_benchmark.py --frames 300
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import importlib.util
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QImage, QRegion
+from PyQt5.QtCore import Qt
+
+module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ui-displayer.py')
+spec = importlib.util.spec_from_file_location('uidisp', module_path)
+ui = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ui)
+
+# Paint objects counted per frame (those the paint code builds through the module namespace)
+COUNTED_TYPES = ("QColor", "QPen", "QFont", "QLinearGradient", "QRadialGradient", "QConicalGradient", "QBrush")
+
+_counts = {}
+
+
+def _counting(base):
+    class Counted(base):
+        def __init__(self, *args):
+            _counts[base.__name__] = _counts.get(base.__name__, 0) + 1
+            super().__init__(*args)
+    Counted.__name__ = base.__name__
+    return Counted
+
+
+def count_allocations():
+    """Swap the module's Qt paint classes for counting subclasses"""
+    for name in COUNTED_TYPES:
+        if hasattr(ui, name):
+            setattr(ui, name, _counting(getattr(ui, name)))
+
+
+def measure(widget, frames, step, region=None):
+    """(ms per frame, objects per frame) for `frames` renders, calling step(i) before each"""
+    image = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+    source = region if region is not None else QRegion()
+    for i in range(5):
+        step(i)
+        widget.render(image, sourceRegion=source)
+    _counts.clear()
+    started = time.perf_counter()
+    for i in range(frames):
+        step(i)
+        image.fill(Qt.transparent)
+        widget.render(image, sourceRegion=source)
+    elapsed = time.perf_counter() - started
+    return elapsed / frames * 1000.0, sum(_counts.values()) / frames
+
+
+def bar_tab_targets(tab, name, width, height):
+    tab.resize(width, height)
+    if hasattr(tab, "relayout"):
+        tab.relayout()
+    bar_ids = list(tab.bars_config)
+
+    def step_all(i):
+        for n, bar_id in enumerate(bar_ids):
+            tab.current_temperatures[bar_id] = 1500 + (237 * n + 40 * i) % 4000
+
+    def step_one(i):
+        tab.current_temperatures[bar_ids[0]] = 1500 + (40 * i) % 4000
+
+    targets = [(f"{name} full", tab, step_all, None)]
+    layout = getattr(tab, "bar_layout", None)
+    if bar_ids and layout and layout.get("bars") and "dirty" in layout["bars"][0]:
+        step_all(0)
+        targets.append((f"{name} one bar (partial)", tab, step_one, QRegion(layout["bars"][0]["dirty"])))
+    return targets
+
+
+def gauge_targets(gauge, name, vmax):
+    gauge.resize(280, 300)
+
+    def step(i):
+        gauge.current_value = vmax * (0.2 + 0.6 * (i % 100) / 100)
+
+    targets = [(f"{name} full", gauge, step, None)]
+    if hasattr(ui, "dial_value_rect"):
+        targets.append((f"{name} value (partial)", gauge, step,
+                        QRegion(ui.dial_value_rect(gauge.width(), gauge.height()))))
+    return targets
+
+
+def display_target(display, name, vmax):
+    display.resize(300, 130)
+
+    def step(i):
+        display.current_value = vmax * (i % 100) / 100
+
+    return [(f"{name} full", display, step, None)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offscreen paint timings of the HMI widgets")
+    parser.add_argument("--frames", type=int, default=300, help="renders per widget (default 300)")
+    parser.add_argument("--width", type=int, default=1280, help="bar tab width (default 1280)")
+    parser.add_argument("--height", type=int, default=560, help="bar tab height (default 560)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    count_allocations()
+    w = ui.HMIWindow()
+    w.show()
+    app.processEvents()
+
+    targets = []
+    targets += bar_tab_targets(w.cylinder_tab, "CylinderHeadTab", args.width, args.height)
+    targets += bar_tab_targets(w.bearing_tab, "MainBearingTab", args.width, args.height)
+    targets += gauge_targets(ui.CircularPressureGauge("FUEL OIL", 10), "Pressure gauge", 10)
+    targets += gauge_targets(ui.CircularTemperatureGauge("EXH T1", 600), "Temperature gauge", 600)
+    targets += display_target(ui.ModernVoltageDisplay("L1-L2", "L1", "L2"), "Voltage display", 500)
+    targets += display_target(ui.ModernCurrentDisplay("L1", "L1", "L2"), "Current display", 100)
+    targets += display_target(ui.ModernPowerDisplay("Active Power", "kW"), "Power display", 1000)
+
+    print(f"{'widget':34s} {'ms/frame':>9s} {'objs/frame':>11s}")
+    for name, widget, step, region in targets:
+        ms, objects = measure(widget, args.frames, step, region)
+        print(f"{name:34s} {ms:9.3f} {objects:11.1f}")
+
+    w.close()
+
+if __name__ == "__main__":
+    main()
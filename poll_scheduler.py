@@ -0,0 +1,144 @@
+# ============================================================
+# View-Driven Poll Scheduler
+# ============================================================
+#
+# Not every point needs the same refresh rate. Each poll group (a station,
+# a set of electrical parameters, a page's own points) is put in one of
+# three tiers on every poll tick:
+#   visible - shown on the current page: polled at the fast interval
+#   guard   - off screen but feeding alarms or control: the base interval,
+#             as fast as before, so alarm and regulation timing is unchanged
+#   idle    - off screen, display only: backs off to SLOW_INTERVAL
+# The bus time idle groups give up is handed to the visible ones. The fast
+# interval is sized so total bus load stays at what polling every group
+# once per base interval cost, and never drops below FAST_FLOOR.
+
+import time
+
+# Fastest a visible group is polled, and the poll tick (seconds)
+FAST_FLOOR = 0.25
+
+# Off-screen, display-only groups are refreshed this often (seconds)
+SLOW_INTERVAL = 5.0
+
+# Weight of the newest measurement in a group's cost estimate
+COST_ALPHA = 0.2
+
+TIER_VISIBLE = "visible"
+TIER_GUARD = "guard"
+TIER_IDLE = "idle"
+
+
+class PollGroup:
+    """One unit of polling with its tier tests and measured bus time per poll"""
+    __slots__ = ("name", "visible", "guard", "base_interval", "tier", "cost", "last_poll")
+
+    def __init__(self, name, visible=None, guard=None, base_interval=None):
+        self.name = name
+        self.visible = visible
+        self.guard = guard
+        self.base_interval = base_interval
+        self.tier = TIER_GUARD
+        self.cost = 0.0
+        self.last_poll = None
+
+    def classify(self):
+        if self.visible is not None and self.visible():
+            return TIER_VISIBLE
+        if self.guard is None and self.visible is None or self.guard is not None and self.guard():
+            return TIER_GUARD
+        return TIER_IDLE
+
+
+class PollScheduler:
+    """Decides per poll tick which groups are due.
+
+    visible and guard are callables evaluated once per cycle; a group with
+    neither is always polled at the base interval. A group may have its own
+    base interval (a page with its own refresh timer). With adaptive=False (e.g.
+    during a replay, which must issue the recorded requests in order) every
+    group is due on every tick of the base interval.
+    """
+    def __init__(self, base_interval=1.0, fast_floor=FAST_FLOOR, slow_interval=SLOW_INTERVAL):
+        self.groups = {}
+        self.fast_floor = fast_floor
+        self.slow_interval = slow_interval
+        self.set_rate(base_interval)
+
+    def set_rate(self, base_interval, adaptive=True):
+        self.base_interval = base_interval
+        self.adaptive = adaptive
+        self.fast_interval = base_interval
+
+    def add(self, name, visible=None, guard=None, base_interval=None):
+        self.groups[name] = PollGroup(name, visible, guard, base_interval)
+
+    def base_of(self, group):
+        return group.base_interval or self.base_interval
+
+    def reset(self):
+        """Forget poll times so every group is read on the next cycle"""
+        for group in self.groups.values():
+            group.last_poll = None
+
+    def tick_interval(self):
+        """How often the poll loop should run (seconds)"""
+        if not self.adaptive:
+            return self.base_interval
+        return min(self.fast_floor, self.base_interval)
+
+    # -------- Per tick --------
+    def begin_cycle(self):
+        """Re-tier every group and size the fast interval to the bus budget"""
+        if not self.adaptive:
+            return
+        visible_cost = 0.0
+        spare = 0.0     # bus seconds per second left for the visible groups
+        for group in self.groups.values():
+            try:
+                group.tier = group.classify()
+            except Exception as e:
+                print(f"Poll group {group.name}: tier test failed: {e}")
+                group.tier = TIER_GUARD
+            if group.tier == TIER_VISIBLE:
+                visible_cost += group.cost
+                spare += group.cost / self.base_of(group)
+            elif group.tier == TIER_IDLE:
+                spare += group.cost / self.base_of(group) - group.cost / self.slow_interval
+        # Keep the old load: visible groups get their own base-rate share plus what the idle ones gave up
+        fast = visible_cost / spare if visible_cost > 0 and spare > 0 else self.base_interval
+        self.fast_interval = max(self.tick_interval(), min(self.base_interval, fast))
+
+    def interval(self, name):
+        group = self.groups[name]
+        base = self.base_of(group)
+        if not self.adaptive:
+            return base
+        if group.tier == TIER_VISIBLE:
+            return min(base, self.fast_interval)
+        return base if group.tier == TIER_GUARD else max(base, self.slow_interval)
+
+    def due(self, name, now=None):
+        group = self.groups[name]
+        if not self.adaptive or group.last_poll is None:
+            return True
+        now = time.monotonic() if now is None else now
+        # Half a tick of slack so a group is not pushed a whole tick past its interval
+        return now - group.last_poll >= self.interval(name) - self.tick_interval() / 2
+
+    def polled(self, name, seconds=None):
+        """Mark a group polled now; `seconds` is the bus time it took (None keeps the estimate)"""
+        group = self.groups[name]
+        group.last_poll = time.monotonic()
+        if seconds is not None:
+            group.cost = seconds if group.cost == 0.0 else group.cost + COST_ALPHA * (seconds - group.cost)
+
+    def cost(self, name):
+        return self.groups[name].cost
+
+    def tiers(self):
+        """{tier: [group names]} as of the last cycle"""
+        out = {TIER_VISIBLE: [], TIER_GUARD: [], TIER_IDLE: []}
+        for group in self.groups.values():
+            out[group.tier].append(group.name)
+        return out
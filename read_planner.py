@@ -0,0 +1,168 @@
+# ============================================================
+# Read Planner and Transaction Cost Model
+# ============================================================
+#
+# Choosing which addresses to read together is a trade-off: every request
+# pays a fixed cost (request frame, turnaround, response header, inter-frame
+# gaps) and every extra register or bit read to bridge a gap costs wire time.
+# ReadCostModel keeps a per-device linear model seconds = overhead + items *
+# per_item, seeded from the serial line parameters and refitted from measured
+# reads. plan_reads() then finds the cheapest set of blocks covering the
+# wanted spans with a small dynamic program instead of a fixed gap threshold.
+
+from bus_stats import bits_per_char
+
+# Model refits that move a coefficient by more than this trigger a re-plan
+REPLAN_TOLERANCE = 0.10
+
+# Weight of the newest sample in the exponentially weighted fit
+FIT_ALPHA = 0.05
+
+# Samples needed before measured coefficients replace the line defaults
+MIN_SAMPLES = 8
+
+
+class _DeviceFit:
+    """Exponentially weighted least-squares fit of latency against request size"""
+    __slots__ = ("samples", "w", "sx", "sy", "sxx", "sxy")
+
+    def __init__(self):
+        self.samples = 0
+        self.w = self.sx = self.sy = self.sxx = self.sxy = 0.0
+
+    def add(self, x, y):
+        keep = 1.0 - FIT_ALPHA
+        self.w = self.w * keep + 1.0
+        self.sx = self.sx * keep + x
+        self.sy = self.sy * keep + y
+        self.sxx = self.sxx * keep + x * x
+        self.sxy = self.sxy * keep + x * y
+        self.samples += 1
+
+    def solve(self, default_per_item):
+        """(overhead, per_item); falls back to the default slope when sizes never varied"""
+        mean_x = self.sx / self.w
+        mean_y = self.sy / self.w
+        var_x = self.sxx / self.w - mean_x * mean_x
+        per_item = default_per_item
+        if var_x > 1.0:
+            per_item = max(0.0, (self.sxy / self.w - mean_x * mean_y) / var_x)
+        return max(0.0, mean_y - per_item * mean_x), per_item
+
+
+class ReadCostModel:
+    """Per-device estimate of what a read of n registers (or bits) costs in seconds.
+
+    freeze() pins the coefficients (recording or replaying bus traffic needs the
+    same plans throughout); measured reads are ignored until thaw().
+    """
+    def __init__(self, baudrate=9600, turnaround=0.010):
+        self.turnaround = turnaround
+        self.version = 0
+        self._fits = {}
+        self._planned = {}
+        self._frozen = None
+        self.set_line(baudrate)
+
+    def set_line(self, baudrate, bytesize=8, parity="N", stopbits=1):
+        self.char_time = bits_per_char(bytesize, parity, stopbits) / float(baudrate)
+        # Request 8 bytes, response header + CRC 5 bytes, 3.5 char gap before each frame
+        self.default_overhead = (8 + 5 + 7) * self.char_time + self.turnaround
+        self.version += 1
+
+    def default_per_item(self, bits):
+        return self.char_time / 8.0 if bits else 2.0 * self.char_time
+
+    def coefficients(self, device_id, bits=False):
+        """(overhead, per_item) in seconds for one device and register kind"""
+        if self._frozen is not None:
+            return self._frozen.get((device_id, bits)) or self._frozen[(None, bits)]
+        fit = self._fits.get((device_id, bits))
+        if fit is None or fit.samples < MIN_SAMPLES:
+            return self.default_overhead, self.default_per_item(bits)
+        return fit.solve(self.default_per_item(bits))
+
+    def cost(self, device_id, count, bits=False):
+        overhead, per_item = self.coefficients(device_id, bits)
+        return overhead + per_item * count
+
+    def observe(self, device_id, count, seconds, bits=False):
+        """Feed one successful read; bumps `version` when the plan inputs moved noticeably"""
+        if self._frozen is not None:
+            return
+        key = (device_id, bits)
+        fit = self._fits.get(key)
+        if fit is None:
+            fit = self._fits[key] = _DeviceFit()
+        fit.add(count, seconds)
+        if fit.samples < MIN_SAMPLES:
+            return
+        current = self.coefficients(device_id, bits)
+        planned = self._planned.get(key)
+        if planned is None or any(abs(c - p) > REPLAN_TOLERANCE * max(p, 1e-6) for c, p in zip(current, planned)):
+            self._planned[key] = current
+            self.version += 1
+
+    @property
+    def frozen(self):
+        return self._frozen is not None
+
+    def snapshot(self):
+        """{(device_id, bits): (overhead, per_item)} in use now; device None holds the line defaults"""
+        if self._frozen is not None:
+            return dict(self._frozen)
+        table = {(None, bits): (self.default_overhead, self.default_per_item(bits)) for bits in (False, True)}
+        for device_id, bits in self._fits:
+            table[(device_id, bits)] = self.coefficients(device_id, bits)
+        return table
+
+    def freeze(self, coefficients=None):
+        """Pin the coefficients (the current ones unless a snapshot is given); returns what was pinned"""
+        pinned = self.snapshot()
+        if coefficients:
+            # Devices the snapshot leaves out fall back to this line's defaults
+            pinned = {key: value for key, value in pinned.items() if key[0] is None}
+            pinned.update(coefficients)
+        self._frozen = pinned
+        self.version += 1
+        return dict(self._frozen)
+
+    def thaw(self):
+        """Back to the fitted coefficients"""
+        if self._frozen is not None:
+            self._frozen = None
+            self.version += 1
+
+
+def plan_reads(spans, overhead, per_item, limit, rejected=()):
+    """Cheapest blocks covering sorted (start, end) spans; returns ([(start, end)], estimated seconds).
+
+    A block costs overhead + per_item * (end - start) and may not exceed
+    `limit` items or contain a range in `rejected` (blocks the device refused).
+    A single span wider than `limit` is still read as a block of its own.
+    """
+    n = len(spans)
+    best = [0.0] + [float("inf")] * n
+    cut = [0] * (n + 1)
+    for j in range(1, n + 1):
+        end = 0
+        for i in range(j - 1, -1, -1):
+            start = spans[i][0]
+            end = max(end, spans[i][1])
+            if end - start > limit and i < j - 1:
+                break
+            if i < j - 1 and any(start <= r_start and r_end <= end for r_start, r_end in rejected):
+                continue
+            cost = best[i] + overhead + per_item * (end - start)
+            if cost < best[j]:
+                best[j] = cost
+                cut[j] = i
+
+    blocks = []
+    j = n
+    while j > 0:
+        i = cut[j]
+        blocks.append((spans[i][0], max(span[1] for span in spans[i:j])))
+        j = i
+    blocks.reverse()
+    return blocks, best[n]
@@ -0,0 +1,25 @@
+from read_planner import plan_reads
+
+
+def test_merges_close_spans():
+    blocks, cost = plan_reads([(0, 2), (3, 5), (300, 302)], 1.0, 0.01, 125)
+    assert blocks == [(0, 5), (300, 302)]
+    assert cost < float("inf")
+
+
+def test_oversized_span_is_its_own_block():
+    blocks, cost = plan_reads([(0, 2), (10, 12), (100, 300), (400, 402)], 1.0, 0.01, 125)
+    assert blocks == [(0, 12), (100, 300), (400, 402)]
+    assert cost < float("inf")
+
+
+def test_rejected_range_splits_block():
+    blocks, _ = plan_reads([(0, 2), (3, 5)], 1.0, 0.01, 125, rejected=[(2, 3)])
+    assert blocks == [(0, 2), (3, 5)]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,152 @@
+# ============================================================
+# Relay Output Image
+# ============================================================
+#
+# Alarm logic no longer talks to the relay devices directly. Gauges, bar tabs
+# and the electrical tab set bits in an output image (per relay device); the
+# poll cycle flushes the coils that changed as write_coils (FC15) blocks and
+# reads them back to verify. Several alarm sources may drive the same coil -
+# it is ON while any of them asks for it. A slow periodic read-back also
+# catches relays that lost their outputs (power cycle, manual override).
+
+import time
+
+from coil_pulses import contiguous_runs
+
+# Longest coil span read back in one request
+MAX_VERIFY_SPAN = 2000
+
+
+class RelayOutputImage:
+    """Desired coil states of one relay device and what was last confirmed on it"""
+    def __init__(self, device_id):
+        self.device_id = device_id
+        self.sources = {}      # address -> {source: bool}
+        self.confirmed = {}    # address -> value read back from the device (missing = unknown)
+
+    def desired(self, address):
+        return any(self.sources.get(address, {}).values())
+
+    def addresses(self):
+        return sorted(self.sources)
+
+    def dirty(self):
+        """Addresses whose desired value is not confirmed on the device"""
+        return [a for a in self.addresses() if self.confirmed.get(a) != self.desired(a)]
+
+
+class RelayOutputs:
+    """Output images for all relay devices, flushed once per poll cycle.
+
+    Addresses are zero-based coil offsets. `source` is any hashable identifying
+    the alarm that drives the coil (usually the widget itself).
+    """
+    def __init__(self, client=None, verify_interval=10.0):
+        self.client = client
+        self.verify_interval = verify_interval
+        self.images = {}
+        self._claims = {}      # source -> (device_id, address)
+        self._last_verify = 0.0
+
+    def set_client(self, client):
+        self.client = client
+        # A new connection knows nothing about the relays: rewrite the image on the next flush
+        for image in self.images.values():
+            image.confirmed.clear()
+
+    # -------- Alarm side --------
+    def set(self, device_id, address, value, source):
+        """Drive a coil from `source`; a source moved to another coil releases the old one"""
+        claim = self._claims.get(source)
+        if claim is not None and claim != (device_id, address):
+            self.release(source)
+        self._claims[source] = (device_id, address)
+        image = self.images.get(device_id)
+        if image is None:
+            image = self.images[device_id] = RelayOutputImage(device_id)
+        image.sources.setdefault(address, {})[source] = bool(value)
+
+    def release(self, source):
+        """Withdraw a source's contribution (its coil drops unless another source holds it)"""
+        claim = self._claims.pop(source, None)
+        if claim is None:
+            return
+        device_id, address = claim
+        contributions = self.images[device_id].sources.get(address, {})
+        contributions.pop(source, None)
+        if not contributions:
+            # Keep the address in the image so the OFF state still gets written
+            self.images[device_id].sources[address] = {}
+
+    def state(self, device_id, address):
+        image = self.images.get(device_id)
+        return image.desired(address) if image else False
+
+    # -------- Acquisition side --------
+    def flush(self):
+        """Write changed coils and verify them; returns the number of coils still unconfirmed"""
+        if not self.client:
+            return 0
+        now = time.monotonic()
+        verify_all = now - self._last_verify >= self.verify_interval
+        if verify_all:
+            self._last_verify = now
+
+        pending = 0
+        for image in self.images.values():
+            dirty = image.dirty()
+            if not dirty and not verify_all:
+                continue
+            written = self._write(image, dirty)
+            self._read_back(image, written if not verify_all else image.addresses())
+            pending += len(image.dirty())
+        return pending
+
+    def _write(self, image, dirty):
+        """FC15 per contiguous run of owned coils, spanning only the changed part of the run"""
+        written = []
+        dirty = set(dirty)
+        for start, count in contiguous_runs(image.addresses()):
+            changed = [a for a in range(start, start + count) if a in dirty]
+            if not changed:
+                continue
+            first, last = changed[0], changed[-1]
+            values = [image.desired(a) for a in range(first, last + 1)]
+            try:
+                result = self.client.write_coils(first, values, device_id=image.device_id)
+            except Exception as e:
+                print(f"Relay device {image.device_id}: write coils {first}+{len(values)} failed: {e}")
+                continue
+            if result is None or result.isError():
+                print(f"Relay device {image.device_id}: write coils {first}+{len(values)} rejected: {result}")
+                continue
+            written.extend(range(first, last + 1))
+        return written
+
+    def _read_back(self, image, addresses):
+        """Read the coils back and record what the device actually holds"""
+        if not addresses:
+            return
+        start = min(addresses)
+        count = max(addresses) - start + 1
+        if count > MAX_VERIFY_SPAN:
+            count = MAX_VERIFY_SPAN
+        try:
+            result = self.client.read_coils(start, count=count, device_id=image.device_id)
+        except Exception as e:
+            print(f"Relay device {image.device_id}: read-back failed: {e}")
+            result = None
+        if result is None or result.isError():
+            for address in addresses:
+                image.confirmed.pop(address, None)
+            return
+        bits = result.bits
+        for address in addresses:
+            index = address - start
+            if index >= len(bits):
+                continue
+            actual = bool(bits[index])
+            image.confirmed[address] = actual
+            if actual != image.desired(address):
+                print(f"Relay device {image.device_id}: coil {address} reads {'ON' if actual else 'OFF'}, "
+                      f"expected {'ON' if image.desired(address) else 'OFF'} - rewriting")
@@ -0,0 +1,183 @@
+# ============================================================
+# Render Policy
+# ============================================================
+#
+# How much drawing the HMI may do. The panel PCs run it full screen around
+# the clock on fanless hardware, so the frame rate of the animation clock is
+# set here rather than by each widget:
+#   fps          - target frame rate while someone is using the panel
+#   snap         - no easing: values jump straight to each new reading
+#   inactive_fps - cap while the window does not have focus
+#   idle_fps     - cap once there has been no mouse, touch or key input for
+#                  idle_after seconds
+# Whichever cap is lowest applies; any input restores the full rate at once.
+# Widgets scale their per-frame easing with AnimationClock.ease(), so a lower
+# frame rate keeps the same settling time, just in fewer steps. The settings
+# live in the RenderPolicy object of modbus_config.dat.
+#
+# PaintStats measures what the widgets actually repaint: how often, how much
+# of their area (they repaint only the regions that changed) and how long
+# each paint takes, shown on the settings page.
+
+import functools
+import time
+
+from PyQt5.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt5.QtWidgets import QApplication
+
+FPS_CHOICES = (60, 30, 10)
+
+DEFAULT_POLICY = {
+    "fps": 60,
+    "snap": False,
+    "inactive_fps": 10,
+    "idle_fps": 10,
+    "idle_after": 300,
+}
+
+# Events that count as someone using the panel
+INPUT_EVENTS = frozenset((
+    QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.KeyPress, QEvent.Wheel,
+    QEvent.TouchBegin, QEvent.TouchUpdate,
+))
+
+
+def policy_from_config(config_data):
+    """RenderPolicy settings from the saved configuration, defaults filled in"""
+    policy = dict(DEFAULT_POLICY)
+    saved = (config_data or {}).get("RenderPolicy")
+    if isinstance(saved, dict):
+        policy.update({k: saved[k] for k in DEFAULT_POLICY if k in saved})
+    return policy
+
+
+class RenderGovernor(QObject):
+    """Applies a render policy to an AnimationClock.
+
+    Watches application focus and user input through an application event
+    filter and sets the clock's frame rate to the lowest cap that applies.
+    """
+    def __init__(self, clock, policy=None, parent=None):
+        super().__init__(parent)
+        self.clock = clock
+        self.policy = dict(DEFAULT_POLICY)
+        self.active = True
+        self.idle = False
+        self._last_input = time.monotonic()
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._check_idle)
+        app = QApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+            app.applicationStateChanged.connect(self._state_changed)
+            self.active = app.applicationState() == Qt.ApplicationActive
+        self.apply(policy or DEFAULT_POLICY)
+
+    def apply(self, policy):
+        """Adopt new settings (e.g. from the settings page) and re-rate the clock"""
+        self.policy = dict(DEFAULT_POLICY)
+        self.policy.update(policy)
+        self.clock.snap = bool(self.policy["snap"])
+        self._idle_timer.start(int(self.policy["idle_after"] * 1000))
+        self._update_rate()
+
+    def fps(self):
+        """Frame rate in force now"""
+        fps = self.policy["fps"]
+        if not self.active:
+            fps = min(fps, self.policy["inactive_fps"])
+        if self.idle:
+            fps = min(fps, self.policy["idle_fps"])
+        return max(1, int(fps))
+
+    def summary(self):
+        reasons = [r for r, on in (("unfocused", not self.active), ("idle", self.idle)) if on]
+        text = f"{self.fps()} fps"
+        if reasons:
+            text += f" ({', '.join(reasons)})"
+        return text + (", no easing" if self.clock.snap else "")
+
+    def _update_rate(self):
+        self.clock.set_fps(self.fps())
+
+    def _state_changed(self, state):
+        self.active = state == Qt.ApplicationActive
+        self._update_rate()
+
+    def _check_idle(self):
+        remaining = self._last_input + self.policy["idle_after"] - time.monotonic()
+        if remaining > 0:
+            self._idle_timer.start(int(remaining * 1000) + 1)
+            return
+        self.idle = True
+        self._update_rate()
+
+    def eventFilter(self, obj, event):
+        if event.type() in INPUT_EVENTS:
+            # Only note the time; the idle timer checks it when it fires
+            self._last_input = time.monotonic()
+            if self.idle:
+                self.idle = False
+                self._idle_timer.start(int(self.policy["idle_after"] * 1000))
+                self._update_rate()
+        return False
+
+
+# ---------------- Paint Instrumentation ----------------
+class PaintStats:
+    """Paint count, repainted area and paint time per widget class since the last snapshot"""
+    def __init__(self):
+        self._started = time.monotonic()
+        self._classes = {}    # name -> [paints, repainted px, widget px, seconds]
+
+    def record(self, name, area, widget_area, seconds):
+        entry = self._classes.get(name)
+        if entry is None:
+            entry = self._classes[name] = [0, 0, 0, 0.0]
+        entry[0] += 1
+        entry[1] += area
+        entry[2] += widget_area
+        entry[3] += seconds
+
+    def snapshot(self):
+        """{name: (paints/s, share of widget area repainted, ms per paint)} and start a new period"""
+        now = time.monotonic()
+        period = max(now - self._started, 1e-3)
+        out = {}
+        for name, (paints, area, widget_area, seconds) in self._classes.items():
+            out[name] = (paints / period, area / widget_area if widget_area else 0.0, seconds * 1000.0 / paints)
+        self._classes = {}
+        self._started = now
+        return out
+
+    @staticmethod
+    def summary(snapshot):
+        if not snapshot:
+            return "no repaints"
+        paints = sum(rate for rate, _, _ in snapshot.values())
+        busiest = max(snapshot.items(), key=lambda item: item[1][0] * item[1][2])
+        name, (rate, share, ms) = busiest
+        return (f"{paints:.0f} paints/s; busiest {name}: {rate:.0f}/s, "
+                f"{share * 100:.0f}% of its area, {ms:.2f} ms")
+
+
+_paint_stats = PaintStats()
+
+
+def paint_stats():
+    return _paint_stats
+
+
+def timed_paint(paint_event):
+    """paintEvent decorator: records the repainted area and the time the paint took"""
+    @functools.wraps(paint_event)
+    def wrapper(self, event):
+        start = time.perf_counter()
+        try:
+            return paint_event(self, event)
+        finally:
+            area = sum(r.width() * r.height() for r in event.region().rects())
+            _paint_stats.record(type(self).__name__, area, self.width() * self.height(),
+                                time.perf_counter() - start)
+    return wrapper
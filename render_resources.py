@@ -0,0 +1,162 @@
+# ============================================================
+# Render Resources
+# ============================================================
+#
+# The paint routines used to build every QColor, QPen, QFont and gradient
+# they draw with on every frame - a bar tab repaint created a few hundred
+# of them, most identical to the previous frame's. The registry builds each
+# one once per key and hands out the same object afterwards:
+#   color(r, g, b, a)                      - QColor
+#   darker(color, f) / lighter(color, f)   - shade of a QColor
+#   pen(color, width, cap)                 - QPen of a solid colour (a QColor
+#                                            or an (r, g, b[, a]) tuple)
+#   font(family, size, weight)             - QFont (point size)
+#   linear(x1, y1, x2, y2, stops)          - QLinearGradient; stops are
+#                                            ((position, rgba), ...)
+# The key is everything the object is built from, so sizes scaled to the
+# widget simply become new keys. Objects are shared: draw with them, never
+# modify them. The registry empties itself when the palette, the fonts or a
+# screen's DPI change, and when it grows past MAX_ENTRIES (e.g. after many
+# resizes), and is rebuilt on demand.
+#
+# Text is the other per-frame cost: drawText lays out and shapes its string
+# on every call. Fixed strings (scale numbers, titles, bar captions, units)
+# go through draw_static_text(), which draws a QStaticText prepared once per
+# string and font object, aligned exactly as drawText would place it. Pass
+# the same QFont object each frame (a layout or registry font). Readouts
+# whose value changes keep drawText: Qt already caches the rendered glyphs,
+# and shaping a few digits costs no more than assembling a glyph run from
+# Python would.
+
+from PyQt5.QtCore import QObject, QPointF, Qt
+from PyQt5.QtGui import (QColor, QFont, QFontMetricsF, QGuiApplication, QLinearGradient, QPen,
+                         QStaticText, QTransform)
+
+MAX_ENTRIES = 4096
+
+ALIGN_RIGHT = int(Qt.AlignRight)
+ALIGN_HCENTER = int(Qt.AlignHCenter)
+ALIGN_BOTTOM = int(Qt.AlignBottom)
+ALIGN_VCENTER = int(Qt.AlignVCenter)
+
+
+class RenderResources(QObject):
+    """Paint resources built once per key and shared by all paintEvents"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = {}
+        self.builds = 0
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.paletteChanged.connect(self.clear)
+            app.fontDatabaseChanged.connect(self.clear)
+            app.screenAdded.connect(self._watch_screen)
+            for screen in app.screens():
+                self._watch_screen(screen)
+
+    def _watch_screen(self, screen):
+        screen.logicalDotsPerInchChanged.connect(self.clear)
+        screen.physicalDotsPerInchChanged.connect(self.clear)
+
+    def clear(self, *args):
+        self._cache.clear()
+
+    def get(self, key, build):
+        """The object for `key`, built by build() the first time it is asked for"""
+        value = self._cache.get(key)
+        if value is None:
+            if len(self._cache) >= MAX_ENTRIES:
+                self._cache.clear()
+            value = self._cache[key] = build()
+            self.builds += 1
+        return value
+
+    def color(self, r, g, b, a=255):
+        return self.get(("color", r, g, b, a), lambda: QColor(r, g, b, a))
+
+    def darker(self, color, factor):
+        return self.get(("darker", color.rgba(), factor), lambda: color.darker(factor))
+
+    def lighter(self, color, factor):
+        return self.get(("lighter", color.rgba(), factor), lambda: color.lighter(factor))
+
+    def pen(self, color, width, cap=Qt.SquareCap):
+        is_color = isinstance(color, QColor)
+
+        def build():
+            pen = QPen(QColor(color) if is_color else QColor(*color), width)
+            pen.setCapStyle(cap)
+            return pen
+        return self.get(("pen", color.rgba() if is_color else color, width, cap), build)
+
+    def font(self, family, size, weight=QFont.Normal):
+        return self.get(("font", family, size, weight), lambda: QFont(family, size, weight))
+
+    def linear(self, x1, y1, x2, y2, stops):
+        def build():
+            gradient = QLinearGradient(x1, y1, x2, y2)
+            for position, rgba in stops:
+                gradient.setColorAt(position, QColor(*rgba))
+            return gradient
+        return self.get(("linear", x1, y1, x2, y2, stops), build)
+
+    def static_texts(self, font):
+        """The StaticTexts of a QFont object"""
+        # The entry keeps its font alive, so the id is not reused while it is cached
+        return self.get(("static", id(font)), lambda: StaticTexts(font))
+
+
+_resources = None
+
+
+def render_resources():
+    """The application-wide RenderResources (created on first use, after the QApplication)"""
+    global _resources
+    if _resources is None:
+        _resources = RenderResources()
+    return _resources
+
+
+# ---------------- Text ----------------
+def draw_static_text(painter, font, where, text, flags=Qt.AlignCenter):
+    """drawText for fixed strings, in `font` and the painter's pen.
+
+    `where` is a rect the text is aligned in by `flags`, or a QPointF on
+    the baseline like drawText(point, text)."""
+    render_resources().static_texts(font).draw(painter, where, text, flags)
+
+
+class StaticTexts:
+    """The prepared QStaticTexts of one QFont"""
+    def __init__(self, font):
+        self.font = font
+        self.metrics = QFontMetricsF(font)
+        self.height = self.metrics.height()
+        self.ascent = self.metrics.ascent()
+        self.texts = {}        # text -> (QStaticText, advance)
+
+    def draw(self, painter, where, text, flags):
+        entry = self.texts.get(text)
+        if entry is None:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.setPerformanceHint(QStaticText.AggressiveCaching)
+            static.prepare(QTransform(), self.font)
+            entry = self.texts[text] = (static, self.metrics.horizontalAdvance(text))
+        static, width = entry
+        if isinstance(where, QPointF):
+            x, y = where.x(), where.y() - self.ascent
+        else:
+            # Aligned the way drawText aligns a single line (plain ints: this runs every frame)
+            flags = int(flags)
+            x, y = where.x(), where.y()
+            if flags & ALIGN_RIGHT:
+                x += where.width() - width
+            elif flags & ALIGN_HCENTER:
+                x += (where.width() - width) / 2
+            if flags & ALIGN_BOTTOM:
+                y += where.height() - self.height
+            elif flags & ALIGN_VCENTER:
+                y += (where.height() - self.height) / 2
+        painter.setFont(self.font)
+        painter.drawStaticText(QPointF(x, y), static)
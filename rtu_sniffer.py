@@ -0,0 +1,421 @@
+# ============================================================
+# Passive RTU Listener (Listen-Only Mode)
+# ============================================================
+#
+# Where another master (usually a PLC) owns the RS-485 line the HMI must
+# not transmit. SnifferClient opens the port, never writes to it, and rebuilds
+# the traffic on a reader thread. RtuFramer cuts the byte stream into frames
+# by the length each function code implies and the CRC; a silent gap throws
+# away a partial frame, so it resynchronises after noise. Each request is
+# paired with its response. Answered reads and acknowledged writes go into a
+# ProcessImage keyed by (device, table, address), and the HMI's own reads are
+# answered from that image - polling, tags and alarms work unchanged with no
+# added bus load. Values not refreshed within max_age count as no response.
+
+import struct
+import threading
+import time
+
+import serial
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from bus_capture import STATUS_EXCEPTION, STATUS_NO_RESPONSE, STATUS_OK
+from bus_monitor import FUNCTION_TABLES, MAX_VALUES, MonitorRecord
+from modbus_transport import (
+    FC_READ_COILS, FC_READ_DISCRETE_INPUTS, FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS,
+    FC_READWRITE_REGISTERS, FC_WRITE_COIL, FC_WRITE_COILS, FC_WRITE_REGISTER, FC_WRITE_REGISTERS,
+    READ_FUNCTIONS, RTU_OVERHEAD, TransportProxy, TransportResponse, response_pdu_length
+)
+from rtu_transport import crc16, silent_interval
+from tag_access import TABLE_HOLDING
+
+# Image values older than this are answered as "no response" (seconds)
+IMAGE_MAX_AGE = 5.0
+
+# How long connect() listens for one full poll cycle of the other master (seconds)
+SETTLE_TIMEOUT = 5.0
+
+# Silence that ends a partial frame. USB adapters deliver bytes in bursts, so this
+# is well above t3.5 - the CRC, not the gap, decides where a frame ends (seconds)
+RESYNC_GAP = 0.05
+
+BROADCAST_ID = 0
+
+_REGISTER_READS = (FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS, FC_READWRITE_REGISTERS)
+_BIT_READS = (FC_READ_COILS, FC_READ_DISCRETE_INPUTS)
+
+
+def _unpack_bits(data, count):
+    return [(data[i >> 3] >> (i & 7)) & 1 for i in range(count)]
+
+
+# ---------------- Frames ----------------
+class RtuRequest:
+    """A master request seen on the line, decoded"""
+    __slots__ = ("device_id", "function_code", "address", "count", "values", "write_address", "stamp")
+
+    def __init__(self, device_id, function_code, address, count, values, write_address, stamp):
+        self.device_id = device_id
+        self.function_code = function_code
+        self.address = address
+        self.count = count
+        self.values = values
+        self.write_address = write_address
+        self.stamp = stamp
+
+    @property
+    def response_length(self):
+        return RTU_OVERHEAD + response_pdu_length(self.function_code, self.count)
+
+    def key(self):
+        return (self.device_id, self.function_code, self.address, self.count)
+
+
+class RtuResponse:
+    """A slave response: its PDU (function code first) and arrival time"""
+    __slots__ = ("device_id", "function_code", "pdu", "stamp")
+
+    def __init__(self, raw, stamp):
+        self.device_id = raw[0]
+        self.function_code = raw[1]
+        self.pdu = bytes(raw[1:-2])
+        self.stamp = stamp
+
+    @property
+    def exception_code(self):
+        return self.pdu[1] if self.function_code & 0x80 else 0
+
+
+def parse_request(raw, stamp):
+    """RtuRequest from a CRC-checked request frame, None if its PDU is malformed"""
+    device_id, function_code = raw[0], raw[1]
+    pdu = raw[2:-2]
+    try:
+        if function_code in READ_FUNCTIONS:
+            address, count = struct.unpack_from(">HH", pdu)
+            return RtuRequest(device_id, function_code, address, count, [], 0, stamp)
+        if function_code == FC_WRITE_COIL:
+            address, value = struct.unpack_from(">HH", pdu)
+            return RtuRequest(device_id, function_code, address, 1, [1 if value == 0xFF00 else 0], 0, stamp)
+        if function_code == FC_WRITE_REGISTER:
+            address, value = struct.unpack_from(">HH", pdu)
+            return RtuRequest(device_id, function_code, address, 1, [value], 0, stamp)
+        if function_code == FC_WRITE_COILS:
+            address, count, _ = struct.unpack_from(">HHB", pdu)
+            return RtuRequest(device_id, function_code, address, count, _unpack_bits(pdu[5:], count), 0, stamp)
+        if function_code == FC_WRITE_REGISTERS:
+            address, count, _ = struct.unpack_from(">HHB", pdu)
+            return RtuRequest(device_id, function_code, address, count,
+                              list(struct.unpack_from(f">{count}H", pdu, 5)), 0, stamp)
+        if function_code == FC_READWRITE_REGISTERS:
+            address, count, write_address, write_count, _ = struct.unpack_from(">HHHHB", pdu)
+            return RtuRequest(device_id, function_code, address, count,
+                              list(struct.unpack_from(f">{write_count}H", pdu, 9)), write_address, stamp)
+    except (struct.error, IndexError):
+        return None
+    return None
+
+
+def decode_transaction(request, response):
+    """[(table, address, values)] a completed transaction tells about the slave's data"""
+    if response is None or response.function_code & 0x80:
+        return []
+    fc = request.function_code
+    pdu = response.pdu
+    try:
+        if fc in _BIT_READS:
+            return [(FUNCTION_TABLES[fc], request.address, _unpack_bits(pdu[2:], request.count))]
+        if fc in _REGISTER_READS:
+            registers = list(struct.unpack_from(f">{request.count}H", pdu, 2))
+            if fc == FC_READWRITE_REGISTERS:
+                # The write is carried out before the read, so the read values land last
+                return [(TABLE_HOLDING, request.write_address, request.values),
+                        (TABLE_HOLDING, request.address, registers)]
+            return [(FUNCTION_TABLES[fc], request.address, registers)]
+    except (struct.error, IndexError):
+        return []
+    if fc in (FC_WRITE_COIL, FC_WRITE_REGISTER, FC_WRITE_COILS, FC_WRITE_REGISTERS):
+        return [(FUNCTION_TABLES[fc], request.address, request.values)]
+    return []
+
+
+class RtuFramer:
+    """Splits a captured RTU byte stream into frames and pairs requests with responses.
+
+    feed() returns the transactions it completed as (request, response) pairs;
+    response is None when the slave never answered or the request was a broadcast.
+    """
+    def __init__(self, resync_gap=RESYNC_GAP):
+        self.resync_gap = resync_gap
+        self.buffer = bytearray()
+        self.last_stamp = 0.0
+        self.pending = None        # request still waiting for its response
+        self.frame_errors = 0
+        self._resyncing = False
+
+    def feed(self, data, stamp):
+        done = []
+        self.idle(stamp)
+        self.buffer += data
+        self.last_stamp = stamp
+        self._parse(stamp, done)
+        return done
+
+    def idle(self, stamp):
+        """Called when the line is quiet: a partial frame older than the resync gap is noise"""
+        if self.buffer and stamp - self.last_stamp > self.resync_gap:
+            self.buffer.clear()
+            self._error()
+
+    def _error(self):
+        if not self._resyncing:
+            self.frame_errors += 1
+            self._resyncing = True
+
+    def _lengths(self, buf):
+        """Candidate (frame length, is_response) for the frame at the start of buf"""
+        device_id, fc = buf[0], buf[1]
+        pending = self.pending
+        out = []
+        if pending is not None and pending.device_id == device_id and pending.function_code == fc & 0x7F:
+            if fc & 0x80:
+                out.append((5, True))
+            elif fc not in _BIT_READS + _REGISTER_READS or buf[2] == pending.response_length - 5:
+                out.append((pending.response_length, True))
+        if fc & 0x80:
+            return out or [(5, True)]
+        if fc in READ_FUNCTIONS or fc in (FC_WRITE_COIL, FC_WRITE_REGISTER):
+            out.append((8, False))
+        elif fc in (FC_WRITE_COILS, FC_WRITE_REGISTERS):
+            out.append((9 + buf[6], False) if len(buf) > 6 else (7, False))
+        elif fc == FC_READWRITE_REGISTERS:
+            out.append((13 + buf[10], False) if len(buf) > 10 else (11, False))
+        if fc in _BIT_READS + _REGISTER_READS:
+            out.append((5 + buf[2], True))      # response to a request we missed
+        return out
+
+    def _parse(self, stamp, done):
+        buf = self.buffer
+        while len(buf) >= 4:
+            need_more = False
+            for length, is_response in self._lengths(buf):
+                if length > len(buf):
+                    need_more = True
+                    continue
+                if crc16(buf[:length - 2]) == buf[length - 2] | buf[length - 1] << 8:
+                    raw = bytes(buf[:length])
+                    del buf[:length]
+                    self._resyncing = False
+                    self._frame(raw, is_response, stamp, done)
+                    break
+            else:
+                if need_more:
+                    return
+                # Nothing fits with a good CRC - slide one byte and look for the next frame start
+                del buf[0]
+                self._error()
+
+    def _frame(self, raw, is_response, stamp, done):
+        if is_response:
+            pending = self.pending
+            if pending is not None and pending.device_id == raw[0] and pending.function_code == raw[1] & 0x7F:
+                self.pending = None
+                done.append((pending, RtuResponse(raw, stamp)))
+            return                  # a response to a request we did not see
+        request = parse_request(raw, stamp)
+        if request is None:
+            self._error()
+            return
+        if self.pending is not None:
+            done.append((self.pending, None))
+            self.pending = None
+        if request.device_id == BROADCAST_ID:
+            done.append((request, None))
+        else:
+            self.pending = request
+
+
+# ---------------- Process Image ----------------
+class ProcessImage:
+    """Last value seen on the line per (device, table, address), with the time it was seen"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tables = {}           # (device_id, table) -> {address: (value, stamp)}
+
+    def store(self, device_id, table, address, values, stamp):
+        with self.lock:
+            cells = self.tables.setdefault((device_id, table), {})
+            for offset, value in enumerate(values):
+                cells[address + offset] = (value, stamp)
+
+    def read(self, device_id, table, address, count, oldest=0.0):
+        """Values at address..address+count-1, or None unless every one was seen since `oldest`"""
+        with self.lock:
+            cells = self.tables.get((device_id, table))
+            if cells is None:
+                return None
+            values = []
+            for addr in range(address, address + count):
+                cell = cells.get(addr)
+                if cell is None or cell[1] < oldest:
+                    return None
+                values.append(cell[0])
+            return values
+
+    def coverage(self, index, roles):
+        """(seen, total) configured points with one of `roles` that have appeared on the line"""
+        seen = total = 0
+        for entry in index.entries:
+            if entry.role not in roles:
+                continue
+            total += 1
+            if self.read(entry.device_id, entry.table, entry.start, entry.end - entry.start) is not None:
+                seen += 1
+        return seen, total
+
+
+# ---------------- Client ----------------
+class SnifferClient(TransportProxy):
+    """Listen-only stand-in for the bus client.
+
+    connect() opens the port and waits until the other master has run one
+    full poll cycle (or SETTLE_TIMEOUT passed with some traffic heard). Reads
+    are answered from the process image; writes are refused and nothing is
+    ever sent. The transactions heard go to `stats` (BusStats) and `ring`
+    (FrameRing) when given, so the diagnostics show the other master's traffic.
+    """
+    listen_only = True
+
+    def __init__(self, port, baudrate=9600, bytesize=8, parity="N", stopbits=1,
+                 max_age=IMAGE_MAX_AGE, settle=SETTLE_TIMEOUT, stats=None, ring=None):
+        super().__init__(None)
+        self.port = port
+        self.baudrate = baudrate
+        self.bytesize = bytesize
+        self.parity = parity
+        self.stopbits = stopbits
+        self.max_age = max_age
+        self.settle = settle
+        self.stats = stats
+        self.ring = ring
+        self.image = ProcessImage()
+        self.framer = RtuFramer(max(RESYNC_GAP, silent_interval(baudrate, bytesize, parity, stopbits)[1]))
+        self.transactions = 0
+        self.serial = None
+        self._running = False
+        self._thread = None
+        self._cycle = set()
+        self._settled = threading.Event()
+
+    def __getattr__(self, name):
+        raise AttributeError(name)
+
+    @property
+    def connected(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def connect(self):
+        if self.connected:
+            return True
+        try:
+            self.serial = serial.Serial(self.port, baudrate=self.baudrate, bytesize=self.bytesize,
+                                        parity=self.parity, stopbits=self.stopbits, timeout=RESYNC_GAP)
+        except (serial.SerialException, ValueError) as e:
+            print(f"RTU listener: cannot open {self.port}: {e}")
+            self.serial = None
+            return False
+        self._running = True
+        self._thread = threading.Thread(target=self._listen, name="rtu-listener", daemon=True)
+        self._thread.start()
+        # Let the other master finish a cycle so the first reads find the whole image
+        self._settled.wait(self.settle)
+        if not self.transactions:
+            print(f"RTU listener: no Modbus traffic heard on {self.port}")
+            self.close()
+            return False
+        print(f"RTU listener: {self.transactions} transactions heard on {self.port} "
+              f"({len(self._cycle)} distinct requests per cycle)")
+        return True
+
+    def close(self):
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+        self._thread = None
+        if self.serial is not None:
+            try:
+                self.serial.close()
+            except serial.SerialException:
+                pass
+            self.serial = None
+
+    def transact(self, function_code, device_id, address, count, values, call):
+        if function_code not in READ_FUNCTIONS:
+            raise ModbusException(f"Listen-only: FC {function_code} to device {device_id} not sent")
+        if not self.connected:
+            raise ModbusIOException(f"Listen-only: {self.port} is not being read")
+        data = self.image.read(device_id, FUNCTION_TABLES[function_code], address, count,
+                               time.monotonic() - self.max_age)
+        if data is None:
+            raise ModbusIOException(f"Listen-only: device {device_id} FC {function_code} {address}+{count} "
+                                    f"not seen on the line in the last {self.max_age:g} s")
+        if function_code in _BIT_READS:
+            return TransportResponse(function_code, bits=[bool(v) for v in data], device_id=device_id)
+        return TransportResponse(function_code, registers=data, device_id=device_id)
+
+    # -------- Reader thread --------
+    def _listen(self):
+        framer = self.framer
+        while self._running:
+            try:
+                data = self.serial.read(self.serial.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError, AttributeError) as e:
+                if self._running:
+                    print(f"RTU listener: reading {self.port} failed: {e}")
+                break
+            now = time.monotonic()
+            if not data:
+                framer.idle(now)
+                continue
+            for request, response in framer.feed(data, now):
+                try:
+                    self._observe(request, response)
+                except Exception as e:
+                    print(f"RTU listener: cannot decode FC {request.function_code} "
+                          f"from device {request.device_id}: {e}")
+        self._running = False
+
+    def _observe(self, request, response):
+        self.transactions += 1
+        decoded = decode_transaction(request, response)
+        for table, address, values in decoded:
+            self.image.store(request.device_id, table, address, values, response.stamp)
+
+        # A request seen twice means the other master has been round its whole cycle
+        key = request.key()
+        if key in self._cycle:
+            self._settled.set()
+        elif not self._settled.is_set():
+            self._cycle.add(key)
+
+        broadcast = request.device_id == BROADCAST_ID
+        exception_code = response.exception_code if response is not None else 0
+        latency = response.stamp - request.stamp if response is not None else 0.0
+        if self.stats is not None:
+            self.stats.record(request.device_id, request.function_code, request.count, request.values,
+                              request.stamp, latency, timeout=response is None and not broadcast,
+                              exception_code=exception_code)
+        if self.ring is not None:
+            if response is None:
+                status = STATUS_OK if broadcast else STATUS_NO_RESPONSE
+            else:
+                status = STATUS_EXCEPTION if exception_code else STATUS_OK
+            # Read data is the last decoded block (after the write part of FC23); writes show no response values
+            result = decoded[-1][2] if decoded and request.function_code in _BIT_READS + _REGISTER_READS else []
+            sent = request.values
+            ring = self.ring
+            ring.append(MonitorRecord(ring.next_seq(), time.time() - (time.monotonic() - request.stamp),
+                                      latency, request.device_id, request.function_code, request.address,
+                                      request.count, status, exception_code, tuple(sent[:MAX_VALUES]),
+                                      tuple(result[:MAX_VALUES]),
+                                      len(sent) > MAX_VALUES or len(result) > MAX_VALUES))
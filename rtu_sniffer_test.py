@@ -0,0 +1,102 @@
+import os
+import random
+import select
+import time
+
+from bus_monitor import FUNCTION_TABLES
+from modbus_simulator import FOREIGN_POLL_CYCLE, PTY_SUPPORTED, PlantModel, RtuTrafficGenerator, _FUNCTION_TABLES
+from rtu_sniffer import RtuFramer, decode_transaction
+from rtu_transport import frame, request_pdu, response_pdu
+
+
+def _expected(plant, device_id, function_code, address, count):
+    """What decode_transaction should report for one answered poll of the cycle"""
+    values = plant.tables[device_id][_FUNCTION_TABLES[function_code]][address:address + count]
+    return [(FUNCTION_TABLES[function_code], address, values)]
+
+
+def _check(plant, pairs):
+    """Every pair is the next poll of the cycle; answered ones decode to the plant's values"""
+    for n, (request, response) in enumerate(pairs):
+        poll = FOREIGN_POLL_CYCLE[n % len(FOREIGN_POLL_CYCLE)]
+        assert request.key() == poll, (n, request.key(), poll)
+        if response is not None:
+            assert decode_transaction(request, response) == _expected(plant, *poll), (n, poll)
+        else:
+            assert decode_transaction(request, response) == []
+
+
+def test_framer_pairs_a_cycle_with_dropped_responses_and_noise():
+    plant = PlantModel()
+    stream = []
+    for n, (device_id, function_code, address, count) in enumerate(FOREIGN_POLL_CYCLE):
+        values = plant.tables[device_id][_FUNCTION_TABLES[function_code]][address:address + count]
+        if function_code in (15, 16):
+            request = request_pdu(function_code, address, values=values)
+            response = response_pdu(function_code, address, count)
+        else:
+            request = request_pdu(function_code, address, count)
+            response = response_pdu(function_code, values=values)
+        stream.append(frame(device_id, request))
+        if n % 3 == 1:
+            continue                    # the station stays silent
+        if n == 3:
+            stream.append(b"\x00\xff")  # line noise ahead of the response
+        stream.append(frame(device_id, response))
+    # The next cycle's first request closes the last transaction
+    device_id, function_code, address, count = FOREIGN_POLL_CYCLE[0]
+    stream.append(frame(device_id, request_pdu(function_code, address, count)))
+
+    framer = RtuFramer()
+    pairs = []
+    data = b"".join(stream)
+    # Bytes arrive in uneven bursts, as they do from a USB adapter
+    for i in range(0, len(data), 7):
+        pairs += framer.feed(data[i:i + 7], 0.001 * i)
+    assert len(pairs) == len(FOREIGN_POLL_CYCLE)
+    _check(plant, pairs)
+    assert [n for n, (_, response) in enumerate(pairs) if response is None] == [1, 4]
+    assert framer.frame_errors == 1
+
+
+def test_framer_follows_the_traffic_generator_with_dropouts():
+    if not PTY_SUPPORTED:
+        return
+    random.seed(39)
+    # Own plant, never stepped, so every cycle carries the same values
+    plant = PlantModel()
+    generator = RtuTrafficGenerator(plant=plant, baudrate=115200, interval=0.0,
+                                    dropout=0.3, slave_timeout=0.02)
+    fd = os.open(generator.port, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+    framer = RtuFramer()
+    pairs = []
+    wanted = 4 * len(FOREIGN_POLL_CYCLE)
+    generator.start()
+    try:
+        deadline = time.monotonic() + 10.0
+        while len(pairs) < wanted and time.monotonic() < deadline:
+            ready, _, _ = select.select([fd], [], [], 0.05)
+            stamp = time.monotonic()
+            if not ready:
+                framer.idle(stamp)
+                continue
+            try:
+                pairs += framer.feed(os.read(fd, 4096), stamp)
+            except BlockingIOError:
+                pass
+    finally:
+        generator.stop()
+        os.close(fd)
+
+    assert len(pairs) >= wanted, len(pairs)
+    _check(plant, pairs)
+    dropped = sum(1 for _, response in pairs if response is None)
+    assert 0 < dropped < len(pairs), dropped
+    assert framer.frame_errors == 0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
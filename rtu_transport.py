@@ -0,0 +1,257 @@
+# ============================================================
+# Low-Latency Modbus RTU Transport
+# ============================================================
+#
+# A small RTU master over pyserial for the serial link, in place of the
+# pymodbus serial client. The frame timing comes from the line settings:
+# the 3.5 character silent interval before each request is computed from
+# the baud rate (fixed at 1.75 ms above 19200 baud, as the RTU spec allows),
+# and every response is read by its exact expected length for the function
+# code, so a good transaction never waits for a read timeout. The CRC is
+# table driven. Responses are TransportResponse objects with the registers /
+# bits / isError() the HMI uses from pymodbus responses.
+
+import struct
+import time
+
+import serial
+from pymodbus.exceptions import ModbusException, ModbusIOException
+
+from bus_stats import bits_per_char
+from modbus_transport import (
+    FC_READ_COILS, FC_READ_DISCRETE_INPUTS, FC_READ_HOLDING_REGISTERS,
+    FC_READ_INPUT_REGISTERS, FC_READWRITE_REGISTERS, FC_WRITE_COIL, FC_WRITE_COILS,
+    FC_WRITE_REGISTER, FC_WRITE_REGISTERS, RTU_OVERHEAD, TransportResponse, response_pdu_length
+)
+
+# Above this rate the spec fixes t1.5 / t3.5 instead of scaling them
+FIXED_TIMING_BAUDRATE = 19200
+
+# Extra allowance per response for USB adapters and OS scheduling (seconds)
+LATENCY_MARGIN = 0.020
+
+
+# ---------------- CRC ----------------
+def _crc_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _crc_table()
+
+
+def crc16(data):
+    """Modbus CRC-16 (poly 0xA001, init 0xFFFF) of a byte string"""
+    crc = 0xFFFF
+    table = _CRC_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def frame(device_id, pdu):
+    """RTU frame: unit id + PDU + CRC (low byte first)"""
+    body = bytes((device_id & 0xFF,)) + pdu
+    return body + struct.pack("<H", crc16(body))
+
+
+# ---------------- Timing ----------------
+def silent_interval(baudrate, bytesize=8, parity="N", stopbits=1):
+    """(t1.5, t3.5) in seconds for a serial line"""
+    if baudrate > FIXED_TIMING_BAUDRATE:
+        return 0.00075, 0.00175
+    char_time = bits_per_char(bytesize, parity, stopbits) / float(baudrate)
+    return 1.5 * char_time, 3.5 * char_time
+
+
+# ---------------- PDUs ----------------
+def _pack_bits(values):
+    packed = bytearray((len(values) + 7) // 8)
+    for i, bit in enumerate(values):
+        if bit:
+            packed[i >> 3] |= 1 << (i & 7)
+    return bytes(packed)
+
+
+def _unpack_bits(data):
+    return [bool((byte >> i) & 1) for byte in data for i in range(8)]
+
+
+def request_pdu(function_code, address, count=0, values=None, write_address=0):
+    if function_code in (FC_READ_COILS, FC_READ_DISCRETE_INPUTS,
+                         FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS):
+        return struct.pack(">BHH", function_code, address, count)
+    if function_code == FC_WRITE_COIL:
+        return struct.pack(">BHH", function_code, address, 0xFF00 if values[0] else 0x0000)
+    if function_code == FC_WRITE_REGISTER:
+        return struct.pack(">BHH", function_code, address, values[0] & 0xFFFF)
+    if function_code == FC_WRITE_COILS:
+        data = _pack_bits(values)
+        return struct.pack(">BHHB", function_code, address, len(values), len(data)) + data
+    if function_code == FC_WRITE_REGISTERS:
+        return struct.pack(f">BHHB{len(values)}H", function_code, address, len(values),
+                           2 * len(values), *[v & 0xFFFF for v in values])
+    if function_code == FC_READWRITE_REGISTERS:
+        return struct.pack(f">BHHHHB{len(values)}H", function_code, address, count, write_address,
+                           len(values), 2 * len(values), *[v & 0xFFFF for v in values])
+    raise ValueError(f"Unsupported function code {function_code}")
+
+
+def response_pdu(function_code, address=0, count=0, values=None):
+    """Slave side of request_pdu: read data, or the echo a write is acknowledged with"""
+    if function_code in (FC_READ_COILS, FC_READ_DISCRETE_INPUTS):
+        data = _pack_bits(values)
+        return struct.pack(">BB", function_code, len(data)) + data
+    if function_code in (FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS, FC_READWRITE_REGISTERS):
+        return struct.pack(f">BB{len(values)}H", function_code, 2 * len(values), *[v & 0xFFFF for v in values])
+    if function_code in (FC_WRITE_COIL, FC_WRITE_REGISTER):
+        return request_pdu(function_code, address, values=values)
+    if function_code in (FC_WRITE_COILS, FC_WRITE_REGISTERS):
+        return struct.pack(">BHH", function_code, address, count)
+    raise ValueError(f"Unsupported function code {function_code}")
+
+
+class RtuClient:
+    """Modbus RTU master with spec timing and exact-length reads.
+
+    Implements the subset of the pymodbus sync client API the HMI calls, with
+    the same keyword names (device_id=, count=). No response raises
+    ModbusIOException after `retries` resends; a corrupt or mismatched reply
+    raises ModbusException.
+    """
+    def __init__(self, port, baudrate=9600, bytesize=8, parity="N", stopbits=1, timeout=0.2, retries=0):
+        self.port = port
+        self.baudrate = baudrate
+        self.bytesize = bytesize
+        self.parity = parity
+        self.stopbits = stopbits
+        self.timeout = timeout
+        self.retries = retries
+        self.char_time = bits_per_char(bytesize, parity, stopbits) / float(baudrate)
+        self.t1_5, self.t3_5 = silent_interval(baudrate, bytesize, parity, stopbits)
+        self.serial = None
+        self._idle_since = 0.0   # monotonic time the line last went quiet
+
+    @property
+    def connected(self):
+        return self.serial is not None and self.serial.is_open
+
+    def connect(self):
+        if self.connected:
+            return True
+        try:
+            self.serial = serial.Serial(self.port, baudrate=self.baudrate, bytesize=self.bytesize,
+                                        parity=self.parity, stopbits=self.stopbits, timeout=self.timeout)
+        except (serial.SerialException, ValueError) as e:
+            print(f"RTU transport: cannot open {self.port}: {e}")
+            self.serial = None
+            return False
+        self._idle_since = time.monotonic()
+        return True
+
+    def close(self):
+        if self.serial is not None:
+            try:
+                self.serial.close()
+            except serial.SerialException:
+                pass
+            self.serial = None
+
+    # -------- Transaction --------
+    def _transmit(self, request):
+        # Hold the line silent for t3.5 since the last byte either way
+        wait = self._idle_since + self.t3_5 - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self.serial.reset_input_buffer()
+        self.serial.write(request)
+        self.serial.flush()
+
+    def _read(self, size, timeout):
+        self.serial.timeout = timeout
+        return self.serial.read(size)
+
+    def _receive(self, device_id, function_code, expected):
+        """Read one response of `expected` bytes (5 if it is an exception); None on silence"""
+        # First 3 bytes: unit id, function code (bit 7 = exception), byte count / exception code
+        head = self._read(3, self.timeout + 3 * self.char_time)
+        if not head:
+            return None
+        if len(head) < 3:
+            self._idle_since = time.monotonic()
+            raise ModbusException(f"RTU: truncated response from device {device_id}")
+        size = 5 if head[1] & 0x80 else expected
+        rest_time = (size - 3) * self.char_time * 1.5 + self.t3_5 + LATENCY_MARGIN
+        data = head + self._read(size - 3, rest_time)
+        self._idle_since = time.monotonic()
+        if len(data) < size:
+            raise ModbusException(f"RTU: short response from device {device_id} ({len(data)}/{size} bytes)")
+        if crc16(data[:-2]) != struct.unpack_from("<H", data, size - 2)[0]:
+            raise ModbusException(f"RTU: CRC error in response from device {device_id}")
+        if data[0] != device_id or data[1] & 0x7F != function_code:
+            raise ModbusException(f"RTU: unexpected response {data[:2].hex()} to device {device_id} FC {function_code}")
+        return data
+
+    def execute(self, function_code, device_id, pdu, count):
+        if not self.connected:
+            raise ModbusIOException(f"RTU: {self.port} is not open")
+        request = frame(device_id, pdu)
+        expected = RTU_OVERHEAD + response_pdu_length(function_code, count)
+        for _ in range(self.retries + 1):
+            self._transmit(request)
+            data = self._receive(device_id, function_code, expected)
+            if data is not None:
+                break
+            self._idle_since = time.monotonic()
+        else:
+            raise ModbusIOException(f"RTU: no response from device {device_id} FC {function_code}")
+
+        if data[1] & 0x80:
+            return TransportResponse(function_code, exception_code=data[2], device_id=device_id)
+        if function_code in (FC_READ_COILS, FC_READ_DISCRETE_INPUTS):
+            return TransportResponse(function_code, bits=_unpack_bits(data[3:-2]), device_id=device_id)
+        if function_code in (FC_READ_HOLDING_REGISTERS, FC_READ_INPUT_REGISTERS, FC_READWRITE_REGISTERS):
+            words = struct.unpack_from(f">{count}H", data, 3)
+            return TransportResponse(function_code, registers=words, device_id=device_id)
+        # Write responses echo address and quantity/value - nothing the HMI uses
+        return TransportResponse(function_code, device_id=device_id)
+
+    # -------- Client API --------
+    def read_coils(self, address, count=1, device_id=1, **kwargs):
+        return self.execute(FC_READ_COILS, device_id, request_pdu(FC_READ_COILS, address, count), count)
+
+    def read_discrete_inputs(self, address, count=1, device_id=1, **kwargs):
+        return self.execute(FC_READ_DISCRETE_INPUTS, device_id,
+                            request_pdu(FC_READ_DISCRETE_INPUTS, address, count), count)
+
+    def read_holding_registers(self, address, count=1, device_id=1, **kwargs):
+        return self.execute(FC_READ_HOLDING_REGISTERS, device_id,
+                            request_pdu(FC_READ_HOLDING_REGISTERS, address, count), count)
+
+    def read_input_registers(self, address, count=1, device_id=1, **kwargs):
+        return self.execute(FC_READ_INPUT_REGISTERS, device_id,
+                            request_pdu(FC_READ_INPUT_REGISTERS, address, count), count)
+
+    def write_coil(self, address, value, device_id=1, **kwargs):
+        return self.execute(FC_WRITE_COIL, device_id, request_pdu(FC_WRITE_COIL, address, 1, [value]), 1)
+
+    def write_register(self, address, value, device_id=1, **kwargs):
+        return self.execute(FC_WRITE_REGISTER, device_id, request_pdu(FC_WRITE_REGISTER, address, 1, [value]), 1)
+
+    def write_coils(self, address, values, device_id=1, **kwargs):
+        return self.execute(FC_WRITE_COILS, device_id, request_pdu(FC_WRITE_COILS, address, values=list(values)),
+                            len(values))
+
+    def write_registers(self, address, values, device_id=1, **kwargs):
+        return self.execute(FC_WRITE_REGISTERS, device_id,
+                            request_pdu(FC_WRITE_REGISTERS, address, values=list(values)), len(values))
+
+    def readwrite_registers(self, read_address=0, read_count=0, write_address=0, values=None, device_id=1, **kwargs):
+        return self.execute(FC_READWRITE_REGISTERS, device_id,
+                            request_pdu(FC_READWRITE_REGISTERS, read_address, read_count, list(values or []),
+                                        write_address), read_count)
@@ -161,6 +161,18 @@ STATUS_ERROR_STYLE = """
     outline: none;
 """
 
+# Status label - partial connection / test mode - amber notice
+STATUS_NOTICE_STYLE = """
+    color: rgb(255, 180, 0);
+    font-size: 13px;
+    font-weight: 600;
+    letter-spacing: 0.5px;
+    padding: 8px 16px;
+    background: rgba(255, 180, 0, 0.1);
+    border: 1px solid rgba(255, 180, 0, 0.3);
+    border-radius: 6px;
+"""
+
 # Content stack (stacked widget) style - Deep Navy Theme (matching sample-ui.py)
 CONTENT_STACK_STYLE = """
     QStackedWidget {
@@ -360,3 +372,78 @@ TAB_HEADING_STYLE = """
     font-size: 18px;
     font-weight: bold;
 """
+
+
+# ============================================================
+# State-Driven Styles
+# ============================================================
+# Widgets whose look follows live data get one stylesheet holding all their
+# states as [state="..."] blocks, set once when they are built. Updates then
+# call set_style_state(), which changes the "state" property and re-polishes
+# the widget only when the state actually changes - setStyleSheet on every
+# data cycle re-parses the sheet and re-polishes the widget each time.
+
+def state_style(base, states, selector="QLabel"):
+    """One stylesheet for every state of a widget: `base` plus a [state="..."] block per state"""
+    blocks = [f"{selector} {{{base}}}"]
+    blocks += [f'{selector}[state="{state}"] {{{style}}}' for state, style in states.items()]
+    return "\n".join(blocks)
+
+
+def set_style_state(widget, state):
+    """Switch a widget built with a state_style() sheet to `state`; True if it changed"""
+    if widget.property("state") == state:
+        return False
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+    return True
+
+
+# Connection status in the top bar
+STATUS_LABEL_STYLE = state_style(STATUS_DISCONNECTED_STYLE, {
+    "connected": STATUS_CONNECTED_STYLE,
+    "reconnecting": STATUS_RECONNECTING_STYLE,
+    "error": STATUS_ERROR_STYLE,
+    "disconnected": STATUS_DISCONNECTED_STYLE,
+    "notice": STATUS_NOTICE_STYLE,
+})
+
+# Report page value boxes: grey until the first reading, then coloured by the
+# reading's state at the smaller data size
+REPORT_READOUT_BASE = "color: rgb(100, 100, 100); font-family: 'Courier New'; font-size: 20px; font-weight: bold;"
+REPORT_READOUT_STYLE = state_style(REPORT_READOUT_BASE, {
+    "nodata": "color: rgb(100, 100, 100); font-size: 15px;",
+    "low": "color: rgb(100, 255, 255); font-size: 15px;",
+    "normal": "color: rgb(100, 255, 100); font-size: 15px;",
+    "warning": "color: rgb(255, 255, 100); font-size: 15px;",
+    "alarm": "color: rgb(255, 100, 100); font-size: 15px;",
+})
+
+# Report page status boxes
+REPORT_CONNECTION_STYLE = state_style(
+    "color: rgb(255, 100, 100); font-family: 'Courier New'; font-size: 20px; font-weight: bold;", {
+        "connected": "color: rgb(100, 255, 100);",
+        "disconnected": "color: rgb(255, 100, 100);",
+    })
+
+# Startup page breaker check: indicator lamp and status text
+BREAKER_INDICATOR_STYLE = state_style("""
+    background: rgb(200, 50, 50);
+    border: 2px solid rgb(220, 70, 70);
+    border-radius: 20px;
+""", {
+    "active": "background: rgb(0, 180, 80); border: 2px solid rgb(0, 200, 100);",
+    "fault": "background: rgb(200, 50, 50); border: 2px solid rgb(220, 70, 70);",
+})
+BREAKER_TEXT_STYLE = state_style("""
+    color: rgb(200, 50, 50);
+    font-size: 24px;
+    font-weight: bold;
+    font-family: 'Segoe UI';
+    background: transparent;
+    border: none;
+""", {
+    "active": "color: rgb(0, 200, 100);",
+    "fault": "color: rgb(200, 50, 50);",
+})
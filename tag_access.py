@@ -0,0 +1,382 @@
+# ============================================================
+# Tag Access Layer
+# ============================================================
+#
+# One place that turns configured Modbus points into values: address
+# decoding (Modicon reference numbers or zero-based offsets), data types,
+# scaling, and batched reads. TagReader.read_many() groups the requested tags
+# per device and register table, lets the read planner pick the cheapest block
+# reads for them and keeps each block's raw bytes for the rest of the poll
+# cycle, so every tab reading the same point shares one bus transaction. Values
+# are decoded straight out of the block buffer with precompiled struct formats.
+
+import struct
+import time
+from array import array
+
+from bus_capture import ReplayClient
+from modbus_transport import base_client
+from read_planner import ReadCostModel, plan_reads
+
+TABLE_COIL = "coil"
+TABLE_DISCRETE = "discrete"
+TABLE_INPUT = "input"
+TABLE_HOLDING = "holding"
+
+BIT_TABLES = (TABLE_COIL, TABLE_DISCRETE)
+
+# Register type names used by the startup / control configuration dialogs
+REGISTER_TYPE_TABLES = {
+    "Coil": TABLE_COIL,
+    "Discrete Input": TABLE_DISCRETE,
+    "Input Register": TABLE_INPUT,
+    "Holding Register": TABLE_HOLDING,
+}
+
+# Register data types: struct code and number of 16-bit registers
+DATA_TYPES = {
+    "int16": ("h", 1),
+    "uint16": ("H", 1),
+    "int32": ("i", 2),
+    "uint32": ("I", 2),
+    "float32": ("f", 2),
+}
+
+BYTE_ORDERS = ("big", "little")
+WORD_ORDERS = ("big", "little")
+
+# Config keys describing how a register value is encoded
+TAG_FORMAT_KEYS = ("data_type", "byte_order", "word_order", "scale", "offset")
+
+# Scale of a plain integer register per point group when the point has no "scale"
+# key: electrical parameters hold engineering units, ElectricalPower 0.1 kW / 0.01 PF
+GROUP_SCALES = {
+    "Voltage": 1.0,
+    "Current": 1.0,
+    "Power": 1.0,
+    "Frequency": 1.0,
+    "BusVoltage": 1.0,
+    "BusFrequency": 1.0,
+    "ElectricalPower.active": 0.1,
+    "ElectricalPower.pf": 0.01,
+}
+
+# Modicon reference ranges: (5-digit base, 6-digit base) per table
+_REFERENCE_BASES = {
+    TABLE_COIL: (1, 1),
+    TABLE_DISCRETE: (10001, 100001),
+    TABLE_INPUT: (30001, 300001),
+    TABLE_HOLDING: (40001, 400001),
+}
+
+# Largest request the protocol allows per table
+_MAX_BLOCK = {
+    TABLE_COIL: 2000,
+    TABLE_DISCRETE: 2000,
+    TABLE_INPUT: 125,
+    TABLE_HOLDING: 125,
+}
+
+
+def reference_to_address(table, reference):
+    """Zero-based protocol address for a Modicon reference number (e.g. 40001 -> 0, 400001 -> 0)"""
+    short_base, long_base = _REFERENCE_BASES[table]
+    if table == TABLE_COIL:
+        address = reference - 1
+    elif reference >= long_base:
+        address = reference - long_base
+    elif reference >= short_base:
+        address = reference - short_base
+    else:
+        raise ValueError(f"invalid {table} address {reference}")
+    if address < 0 or address > 65535:
+        raise ValueError(f"{table} address {reference} out of range")
+    return address
+
+
+def _swap_bytes(data):
+    """Copy of a big-endian register buffer with the two bytes of every register swapped"""
+    words = array("H", data)
+    words.byteswap()
+    return words.tobytes()
+
+
+class Tag:
+    """A single configured point: where it lives on the bus, how it is encoded and how to scale it.
+
+    Registers arrive big-endian (byte order "big", Modbus standard). For 32-bit
+    types word order "big" means the first register holds the high word; the
+    four combinations cover ABCD, CDAB, BADC and DCBA devices.
+    """
+    __slots__ = ("device_id", "table", "address", "count", "data_type", "byte_order", "word_order",
+                 "scale", "offset", "name", "_struct", "_swapped")
+
+    def __init__(self, device_id, table, address, scale=1.0, offset=0.0, name="",
+                 data_type="uint16", byte_order="big", word_order="big"):
+        if table not in _REFERENCE_BASES:
+            raise ValueError(f"unknown register table {table!r}")
+        if data_type not in DATA_TYPES:
+            raise ValueError(f"unknown data type {data_type!r}")
+        if byte_order not in BYTE_ORDERS or word_order not in WORD_ORDERS:
+            raise ValueError(f"invalid byte/word order {byte_order}/{word_order}")
+        self.device_id = device_id
+        self.table = table
+        self.address = address
+        self.data_type = data_type
+        self.byte_order = byte_order
+        self.word_order = word_order
+        self.scale = scale
+        self.offset = offset
+        self.name = name
+
+        if table in BIT_TABLES:
+            self.count = 1
+            self._struct = struct.Struct("B")
+            self._swapped = False
+        else:
+            code, self.count = DATA_TYPES[data_type]
+            words_swapped = word_order == "little" and self.count > 1
+            # Every byte/word order is either the raw buffer or the per-register
+            # byte-swapped buffer, read big or little endian
+            self._swapped = (byte_order == "little") != words_swapped
+            self._struct = struct.Struct(("<" if words_swapped else ">") + code)
+
+    def key(self):
+        return (self.device_id, self.table)
+
+    def decode_from(self, block, start):
+        """Value of this tag from a cached block whose first address is `start`"""
+        if self.table in BIT_TABLES:
+            return block.data[self.address - start]
+        data = block.swapped() if self._swapped else block.data
+        raw = self._struct.unpack_from(data, (self.address - start) * 2)[0]
+        return raw * self.scale + self.offset
+
+    def __repr__(self):
+        return f"Tag({self.name or '?'} dev={self.device_id} {self.table}@{self.address} {self.data_type})"
+
+
+def _tag_format(config, default_scale):
+    """Data type, orders, scale and offset from a config dict"""
+    data_type = config.get("data_type", "uint16")
+    scale = config.get("scale")
+    if scale is None:
+        # Legacy fixed scalings (0.1, 0.01) describe integer registers; float registers carry units
+        scale = 1.0 if data_type == "float32" else default_scale
+    return {
+        "data_type": data_type,
+        "byte_order": config.get("byte_order", "big"),
+        "word_order": config.get("word_order", "big"),
+        "scale": scale,
+        "offset": config.get("offset", 0.0),
+    }
+
+
+def tag_from_param(param, group=""):
+    """Tag for an electrical-style parameter ({"address": 30001, "type": "input", "device_id": 5}).
+
+    Optional keys data_type/byte_order/word_order/scale/offset describe the
+    encoding; without a scale key the point's group (GROUP_SCALES) decides, so
+    every page reading the point decodes the same value.
+    """
+    table = param.get("type")
+    return Tag(param.get("device_id"), table, reference_to_address(table, param.get("address")),
+               name=param.get("label", ""), **_tag_format(param, GROUP_SCALES.get(group, 1.0)))
+
+
+def tag_from_condition(config, name=""):
+    """Tag for a startup-style point (zero-based address, "Input Register" etc., registers in 0.1 units)"""
+    table = REGISTER_TYPE_TABLES[config.get("register_type", "Input Register")]
+    return Tag(config.get("device_id", 1), table, config.get("address", 0), name=name,
+               **_tag_format(config, 1.0 if table in BIT_TABLES else 0.1))
+
+
+class _Block:
+    """Raw result of one block read (data is None when the read failed)"""
+    __slots__ = ("start", "end", "stamp", "data", "_swapped")
+
+    def __init__(self, start, count, stamp, data):
+        self.start = start
+        self.end = start + count
+        self.stamp = stamp
+        self.data = data
+        self._swapped = None
+
+    def swapped(self):
+        if self._swapped is None:
+            self._swapped = _swap_bytes(self.data)
+        return self._swapped
+
+
+class TagReader:
+    """Reads tags through the active Modbus client with planned block reads and a per-cycle cache.
+
+    max_age bounds how long a cached block is served. cost_model prices
+    requests per device; block_limits caps the request size per device
+    ({device_id: items}) for slaves that accept less than the protocol maximum.
+    A recording pins the plans (freeze_plans) and a replay client brings the
+    cost model it was recorded with, so both issue the same block reads.
+    """
+    def __init__(self, client=None, max_age=0.5, cost_model=None):
+        self.client = client
+        self.max_age = max_age
+        self.cost_model = cost_model or ReadCostModel()
+        self.block_limits = {}
+        self._blocks = {}
+        self._plans = {}
+        self._rejected = {}
+        self._replaying = False
+        # Planner estimate vs. measured time of the reads since the last invalidate()
+        self.cycle = {"requests": 0, "estimate": 0.0, "actual": 0.0}
+        self.last_cycle = dict(self.cycle)
+
+    def set_client(self, client):
+        self.client = client
+        self._blocks.clear()
+        self._plans.clear()
+        self._rejected.clear()
+        # A replay only answers the reads that were recorded: plan with the recorded model, never refit
+        bus = base_client(client)
+        if isinstance(bus, ReplayClient):
+            self.cost_model.freeze(bus.cost_model)
+            self._replaying = True
+        elif self._replaying:
+            self.cost_model.thaw()
+            self._replaying = False
+
+    def freeze_plans(self):
+        """Start planning from scratch with pinned coefficients; returns the snapshot a recording saves"""
+        self._plans.clear()
+        self._rejected.clear()
+        return self.cost_model.freeze()
+
+    def thaw_plans(self):
+        self.cost_model.thaw()
+
+    def set_block_limit(self, device_id, items):
+        self.block_limits[device_id] = items
+        self._plans.clear()
+
+    def invalidate(self):
+        """Forget cached values - called at the start of each poll cycle"""
+        self._blocks.clear()
+        if self.cycle["requests"]:
+            self.last_cycle = self.cycle
+            self.cycle = {"requests": 0, "estimate": 0.0, "actual": 0.0}
+
+    # -------- Public API --------
+    def read(self, tag, max_age=None):
+        return self.read_many([tag], max_age)[0]
+
+    def read_many(self, tags, max_age=None):
+        """Values for `tags` in order; None for tags that could not be read (or are None).
+
+        max_age overrides the reader default, e.g. 0 for a fast interlock check
+        that must always go to the bus.
+        """
+        if not self.client:
+            return [None] * len(tags)
+
+        max_age = self.max_age if max_age is None else max_age
+        oldest = time.monotonic() - max_age
+        missing = {}
+        for tag in tags:
+            if tag is not None and self._find(tag, oldest) is None:
+                missing.setdefault(tag.key(), set()).add((tag.address, tag.address + tag.count))
+
+        for (device_id, table), spans in missing.items():
+            spans = sorted(spans)
+            for start, end in self._plan(device_id, table, spans):
+                self._read_block(device_id, table, start, end, spans)
+
+        values = []
+        for tag in tags:
+            block = self._find(tag, oldest) if tag is not None else None
+            if block is None or block.data is None:
+                values.append(None)
+            else:
+                values.append(tag.decode_from(block, block.start))
+        return values
+
+    # -------- Cache --------
+    def _find(self, tag, oldest):
+        """Newest fresh block covering the tag's registers"""
+        for block in reversed(self._blocks.get(tag.key(), ())):
+            if block.stamp < oldest:
+                break
+            if block.start <= tag.address and tag.address + tag.count <= block.end:
+                return block
+        return None
+
+    def _store(self, device_id, table, start, end, data):
+        stamp = time.monotonic()
+        blocks = self._blocks.setdefault((device_id, table), [])
+        # Blocks are appended in time order; drop the ones no default read would serve
+        while blocks and blocks[0].stamp < stamp - self.max_age:
+            blocks.pop(0)
+        blocks.append(_Block(start, end - start, stamp, data))
+
+    # -------- Block planning --------
+    def _plan(self, device_id, table, spans):
+        """Cheapest block reads covering sorted (start, end) spans, cached until the cost model moves.
+
+        A multi-register value is never split across two requests.
+        """
+        key = (device_id, table, tuple(spans))
+        plan = self._plans.get(key)
+        if plan is not None and plan[0] == self.cost_model.version:
+            return plan[1]
+        bits = table in BIT_TABLES
+        overhead, per_item = self.cost_model.coefficients(device_id, bits)
+        limit = min(_MAX_BLOCK[table], self.block_limits.get(device_id, _MAX_BLOCK[table]))
+        blocks, _ = plan_reads(spans, overhead, per_item, limit, self._rejected.get((device_id, table), ()))
+        if len(self._plans) > 256:
+            self._plans.clear()
+        self._plans[key] = (self.cost_model.version, blocks)
+        return blocks
+
+    def _request(self, device_id, table, start, count):
+        if table == TABLE_INPUT:
+            return self.client.read_input_registers(address=start, count=count, device_id=device_id)
+        if table == TABLE_HOLDING:
+            return self.client.read_holding_registers(address=start, count=count, device_id=device_id)
+        if table == TABLE_COIL:
+            return self.client.read_coils(address=start, count=count, device_id=device_id)
+        return self.client.read_discrete_inputs(address=start, count=count, device_id=device_id)
+
+    def _read_block(self, device_id, table, start, end, spans):
+        count = end - start
+        bits = table in BIT_TABLES
+        started = time.monotonic()
+        try:
+            result = self._request(device_id, table, start, count)
+        except Exception as e:
+            print(f"Tag read failed: device {device_id} {table} {start}+{count}: {e}")
+            result = None
+        elapsed = time.monotonic() - started
+        self.cycle["requests"] += 1
+        self.cycle["estimate"] += self.cost_model.cost(device_id, count, bits)
+        self.cycle["actual"] += elapsed
+
+        if result is not None and not result.isError():
+            self.cost_model.observe(device_id, count, elapsed, bits)
+            if table in BIT_TABLES:
+                data = bytes(1 if bit else 0 for bit in result.bits[:count])
+            else:
+                data = struct.pack(f">{len(result.registers[:count])}H", *result.registers[:count])
+                count = len(data) // 2
+            self._store(device_id, table, start, start + min(count, end - start), data)
+            return
+
+        inner = [span for span in spans if start <= span[0] and span[1] <= end]
+        if result is not None and len(inner) > 1:
+            # Exception response for a coalesced block: a gap address is probably
+            # unmapped on this device, so fall back to the spans actually wanted
+            # and keep the planner from bridging this range again
+            self._rejected.setdefault((device_id, table), set()).add((start, end))
+            self._plans.clear()
+            for span_start, span_end in inner:
+                self._read_block(device_id, table, span_start, span_end, [(span_start, span_end)])
+            return
+
+        self._store(device_id, table, start, end, None)
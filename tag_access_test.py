@@ -0,0 +1,98 @@
+import struct
+
+from tag_access import TABLE_HOLDING, TABLE_INPUT, Tag, _Block, tag_from_condition, tag_from_param
+
+# (byte_order, word_order) -> register layout of the big-endian bytes ABCD
+ORDERS = {
+    ("big", "big"): "ABCD",
+    ("big", "little"): "CDAB",
+    ("little", "big"): "BADC",
+    ("little", "little"): "DCBA",
+}
+
+
+def _registers(data, layout):
+    """16-bit registers carrying the 4 bytes of `data` (ABCD) in `layout` order"""
+    ordered = bytes(data["ABCD".index(letter)] for letter in layout)
+    return list(struct.unpack(">2H", ordered))
+
+
+def _decode(tag, registers, start=0):
+    block = _Block(start, len(registers), 0.0, struct.pack(f">{len(registers)}H", *registers))
+    return tag.decode_from(block, block.start)
+
+
+def test_32_bit_orders():
+    cases = [
+        ("int32", struct.pack(">i", -123456789), -123456789),
+        ("uint32", struct.pack(">I", 0x12345678), 0x12345678),
+        ("float32", struct.pack(">f", -1234.5), -1234.5),
+    ]
+    for data_type, data, expected in cases:
+        for (byte_order, word_order), layout in ORDERS.items():
+            tag = Tag(1, TABLE_HOLDING, 0, data_type=data_type, byte_order=byte_order, word_order=word_order)
+            assert _decode(tag, _registers(data, layout)) == expected, (data_type, layout)
+
+
+def test_16_bit_types_and_block_offset():
+    cases = [
+        ("int16", "big", 0xFFFE, -2),
+        ("uint16", "big", 0xFFFE, 65534),
+        ("int16", "little", 0x8001, 384),
+        ("uint16", "little", 0x3412, 0x1234),
+    ]
+    for data_type, byte_order, register, expected in cases:
+        tag = Tag(1, TABLE_INPUT, 12, data_type=data_type, byte_order=byte_order)
+        # The tag sits at address 12 inside a block read from address 10
+        assert _decode(tag, [0, 0, register, 0], start=10) == expected, (data_type, byte_order)
+
+
+def test_scale_and_offset():
+    cases = [
+        ({}, 400, 400),
+        ({"scale": 0.1}, 4000, 400.0),
+        ({"scale": 0.1, "offset": -40.0}, 1000, 60.0),
+        ({"data_type": "int16", "scale": 0.5, "offset": 1.0}, 0xFFFC, -1.0),
+    ]
+    for keys, register, expected in cases:
+        tag = tag_from_param(dict({"address": 30001, "type": TABLE_INPUT, "device_id": 5}, **keys))
+        assert abs(_decode(tag, [register]) - expected) < 1e-9, keys
+
+
+def test_float_registers_ignore_legacy_scale():
+    # Startup conditions default to 0.1 units, but a float register already carries them
+    data = struct.pack(">f", 2.5)
+    plain = tag_from_condition({"address": 0, "register_type": "Input Register"})
+    floating = tag_from_condition({"address": 0, "register_type": "Input Register", "data_type": "float32"})
+    assert _decode(plain, [25]) == 2.5
+    assert _decode(floating, _registers(data, "ABCD")) == 2.5
+
+
+def test_one_point_decodes_the_same_on_every_page():
+    param = {"address": 30001, "type": TABLE_INPUT, "device_id": 5}
+    # Electrical page, report and startup page all name the point's group
+    for group in ("Voltage", "Frequency", "BusVoltage", "BusFrequency"):
+        assert _decode(tag_from_param(param, group), [400]) == 400
+
+
+def test_group_scale_and_explicit_scale():
+    param = {"address": 30001, "type": TABLE_INPUT, "device_id": 1}
+    assert tag_from_param(param, "ElectricalPower.active").scale == 0.1
+    assert tag_from_param(param, "ElectricalPower.pf").scale == 0.01
+    assert _decode(tag_from_param(dict(param, scale=0.1), "Voltage"), [4000]) == 400.0
+
+
+def test_invalid_encodings_are_rejected():
+    for kwargs in ({"data_type": "int64"}, {"byte_order": "middle"}, {"word_order": "mixed"}):
+        try:
+            Tag(1, TABLE_HOLDING, 0, **kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {kwargs}")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
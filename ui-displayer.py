@@ -5,10 +5,13 @@ from PyQt5.QtWidgets import (
     QPushButton, QComboBox, QMessageBox, QStackedWidget, QGridLayout,
     QLineEdit, QSpinBox, QDoubleSpinBox, QGroupBox, QFormLayout, QScrollArea,
     QTabWidget, QInputDialog, QDialog, QTableWidget, QTableWidgetItem, QHeaderView,
-    QSplashScreen, QCheckBox
+    QSplashScreen, QCheckBox, QFileDialog, QTableView
+)
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QLinearGradient, QRadialGradient, QConicalGradient, QPixmap, QIcon, QRegion
+from PyQt5.QtCore import (
+    Qt, QTimer, QRect, QRectF, QPointF, QEvent, QThread, pyqtSignal, QSize, QObject,
+    QAbstractTableModel, QModelIndex
 )
-from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QLinearGradient, QRadialGradient, QConicalGradient, QPixmap, QIcon
-from PyQt5.QtCore import Qt, QTimer, QRect, QRectF, QPointF, QEvent, QThread, pyqtSignal, QSize, QObject
 import math
 import random
 import json
@@ -22,8 +25,28 @@ from datetime import datetime
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from pymodbus.client import ModbusSerialClient
+from pymodbus.client import ModbusSerialClient, ModbusTcpClient
 from styles import *
+from modbus_simulator import ModbusSimulator, SIMULATOR_HOST, SIMULATOR_TCP_PORT
+from bus_capture import (BusCaptureWriter, CaptureClient, ReplayClient, CAPTURE_EXTENSION, MIN_REPLAY_INTERVAL,
+                         STATUS_EXCEPTION, STATUS_NO_RESPONSE, capture_layer)
+from bus_monitor import FrameRing, MonitorClient, STATUS_FRAME_ERROR, STATUS_TEXT, format_values, record_owners
+from bus_stats import BusStats, BusStatsClient, FUNCTION_NAMES
+from modbus_transport import SerializedClient, base_client
+from rtu_transport import RtuClient
+from rtu_sniffer import SnifferClient
+from connection_supervisor import ConnectionSupervisor, LinkWatch, LinkWatchClient, STATE_IDLE
+from poll_scheduler import PollScheduler, TIER_IDLE, TIER_VISIBLE
+from animation_clock import animation_clock
+from icon_cache import icon, icon_pixmap, preload_icons
+from render_resources import draw_static_text, render_resources
+from render_policy import FPS_CHOICES, PaintStats, RenderGovernor, paint_stats, policy_from_config, timed_paint
+from coil_pulses import CoilPulseEngine
+from relay_outputs import RelayOutputs
+from address_index import ROLE_CONDITION, ROLE_MEASUREMENT, index_from_config
+from tag_access import (
+    DATA_TYPES, TAG_FORMAT_KEYS, Tag, TagReader, TABLE_HOLDING, reference_to_address, tag_from_condition, tag_from_param
+)
 
 def resource_path(relative_path):
     try:
@@ -92,14 +115,19 @@ class CircularGaugeWidget(QWidget):
         self.setMinimumSize(180, 180)
         self.glow_phase = 0
         
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_value)
-        self.animation_timer.start(30)
+        # The glow never rests while shown - stepped by the shared animation clock every 30 ms
+        
+    def showEvent(self, event):
+        animation_clock().wake(self.animate_value, 0.030)
+        super().showEvent(event)
         
     def set_value(self, value):
         self.target_value = max(self.min_val, min(self.max_val, value))
         
     def animate_value(self):
+        if not self.isVisible():
+            self.current_value = self.target_value
+            return False
         if abs(self.current_value - self.target_value) < 0.5:
             self.current_value = self.target_value
         else:
@@ -108,6 +136,7 @@ class CircularGaugeWidget(QWidget):
         if self.glow_phase > math.pi * 2:
             self.glow_phase = 0
         self.update()
+        return True
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -175,18 +204,23 @@ class AnimatedStatusIndicator(QWidget):
         self.status = "normal"
         self.pulse_phase = 0
         
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)
+        # Continuous pulse while shown - stepped by the shared animation clock every 50 ms
+        
+    def showEvent(self, event):
+        animation_clock().wake(self.update_animation, 0.050)
+        super().showEvent(event)
         
     def set_status(self, status):
         self.status = status
         
     def update_animation(self):
+        if not self.isVisible():
+            return False
         self.pulse_phase += 0.1
         if self.pulse_phase > math.pi * 2:
             self.pulse_phase = 0
         self.update()
+        return True
         
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -367,6 +401,11 @@ class AlarmBus(QObject):
 ALARM_BUS = AlarmBus()
 
 
+class ConnectionEvents(QObject):
+    """Carries connection supervisor callbacks from its worker thread to the GUI thread"""
+    event = pyqtSignal(str, object)
+
+
 def add_alarm_to_history(gauge_name, gauge_type, alarm_type, value, limit, unit):
     """Add an alarm event to the history"""
     try:
@@ -450,8 +489,39 @@ def clear_alarm_from_history(gauge_name, alarm_type):
         print(f"Error clearing alarm from history: {e}")
 
 
+# An alarm waiting out its delay is re-checked this often (seconds)
+ALARM_CHECK_INTERVAL = 0.1
+
+
+def watch_alarm(widget):
+    """Check a widget's alarm on its latest values now, on screen or not, and keep
+    re-checking it on the animation clock while the alarm delay is running"""
+    if widget.alarm_step():
+        animation_clock().wake(widget.alarm_step, ALARM_CHECK_INTERVAL)
+
+
 # ============== Industry-Specific Configuration Management ==============
 
+def confirm_address_conflicts(parent, config_data, owner_prefix):
+    """Warn about overlapping registers/coils involving owner_prefix; True when it is fine to save"""
+    try:
+        conflicts = index_from_config(config_data).conflicts(owner_prefix)
+    except Exception as e:
+        print(f"Address conflict check failed: {e}")
+        return True
+    if not conflicts:
+        return True
+    
+    lines = [f"• {a.describe()}\n   overlaps {b.describe()}" for a, b in conflicts[:6]]
+    if len(conflicts) > 6:
+        lines.append(f"... and {len(conflicts) - 6} more")
+    reply = QMessageBox.warning(
+        parent, "Address Conflict",
+        "These points claim the same device address:\n\n" + "\n".join(lines) + "\n\nSave anyway?",
+        QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+    return reply == QMessageBox.Yes
+
+
 def get_industry_default_configurations():
     """Get default gauge visibility configurations for different industries"""
     return {
@@ -1721,6 +1791,9 @@ class CylinderHeadConfigDialog(QDialog):
                 "enable_alarm": self.enable_alarm_check.isChecked()
             }
             
+            if not confirm_address_conflicts(self, config_data, "CylinderHead"):
+                return
+            
             # Save back to encrypted file
             if save_encrypted_config(config_data, "modbus_config.dat"):
                 QMessageBox.information(self, "Success", "Configuration saved successfully!")
@@ -2033,6 +2106,9 @@ class MainBearingConfigDialog(QDialog):
                 "enable_alarm": self.enable_alarm_check.isChecked()
             }
             
+            if not confirm_address_conflicts(self, config_data, "MainBearing"):
+                return
+            
             # Save back to encrypted file
             if save_encrypted_config(config_data, "modbus_config.dat"):
                 QMessageBox.information(self, "Success", "Configuration saved successfully!")
@@ -2391,6 +2467,12 @@ class PressureGaugeConfigDialog(QDialog):
                 "enable_alarm": self.enable_alarm_check.isChecked()
             }
             
+            # Check the alarm coil against the runtime configuration
+            candidate = load_encrypted_config("modbus_config.dat") or {}
+            candidate.setdefault("PressureGauges", {})[str(self.gauge_index)] = config_data["PressureGauges"][str(self.gauge_index)]
+            if not confirm_address_conflicts(self, candidate, f"PressureGauges.{self.gauge_index}"):
+                return
+            
             # Save back to file
             with open(config_path, 'w') as f:
                 json.dump(config_data, f, indent=4)
@@ -2726,6 +2808,12 @@ class TemperatureGaugeConfigDialog(QDialog):
                 "enable_alarm": self.enable_alarm_check.isChecked()
             }
             
+            # Check the alarm coil against the runtime configuration
+            candidate = load_encrypted_config("modbus_config.dat") or {}
+            candidate.setdefault("EngineTemperatures", {})[str(self.gauge_index)] = config_data["EngineTemperatures"][str(self.gauge_index)]
+            if not confirm_address_conflicts(self, candidate, f"EngineTemperatures.{self.gauge_index}"):
+                return
+            
             # Save back to file
             with open(config_path, 'w') as f:
                 json.dump(config_data, f, indent=4)
@@ -2779,6 +2867,7 @@ class CylinderHeadTab(QWidget):
         
         # Modbus client reference (will be set by HMIWindow)
         self.modbus_client = None
+        self.relay_outputs = None
         
         # Alarm state tracking
         self.alarm_active = False
@@ -2790,6 +2879,10 @@ class CylinderHeadTab(QWidget):
         
         # Storage for clickable areas
         self.bar_rects = {}  # Store bar rectangles for click detection
+        self.remove_buttons = {}
+        
+        # Paint geometry - rebuilt by relayout() on resize, page and bar changes, only read by paintEvent
+        self.bar_layout = None
         
         # Pagination state
         self.bars_per_page = 18  # Maximum 18 bars per page (9 left + 9 right)
@@ -2800,13 +2893,10 @@ class CylinderHeadTab(QWidget):
         # UI Elements
         self.setup_ui()
         
-        # Initialize pagination controls
-        self.update_pagination_controls()
+        # Initialize pagination controls and layout
+        self.relayout()
         
-        # Animation timer - 60 FPS for ultra-smooth animation
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_bars)
-        self.animation_timer.start(16)  # 16ms = ~60 fps
+        # Bars are stepped by the shared animation clock while they move (~60 fps)
     
     def setup_ui(self):
         """Setup UI elements including buttons"""
@@ -2814,7 +2904,7 @@ class CylinderHeadTab(QWidget):
         self.settings_btn = QPushButton(self)
         self.settings_btn.setFixedSize(36, 36)
         self.settings_btn.setCursor(Qt.PointingHandCursor)
-        self.settings_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.settings_btn.setIcon(icon("setting.png"))
         self.settings_btn.setIconSize(QSize(18, 18))
         self.settings_btn.setStyleSheet(MS_SETTINGS_BUTTON_STYLE)
         self.settings_btn.clicked.connect(self.open_settings)
@@ -2881,44 +2971,8 @@ class CylinderHeadTab(QWidget):
         # Position add button on the right side
         self.add_btn.move(self.width() - 40, (self.height() - 200) // 2)
         
-        # Position pagination buttons and labels
-        width = self.width()
-        height = self.height()
-        
-        # Calculate section positions (similar to paintEvent calculations)
-        scale_factor = min(width / 1280, height / 500)
-        scale_width = max(50, int(width * 0.055))
-        gap_between_scale_and_bars = max(20, int(width * 0.031))
-        section_gap = max(30, int(width * 0.039))
-        spacing = max(30, int(width * 0.048))
-        
-        # Calculate section widths (based on current page)
-        current_left_bars = self.get_current_page_bars('left')
-        current_right_bars = self.get_current_page_bars('right')
-        left_section_width = len(current_left_bars) * spacing
-        right_section_width = len(current_right_bars) * spacing
-        total_bars_width = left_section_width + section_gap + right_section_width
-        total_content_width = scale_width + gap_between_scale_and_bars + total_bars_width
-        
-        # Center the content
-        offset_x = max(20, (width - total_content_width) // 2)
-        scale_left = offset_x + 40
-        left_section_start = scale_left + gap_between_scale_and_bars
-        right_section_start = left_section_start + left_section_width + section_gap
-        
-        # Position left section pagination controls
-        left_center = left_section_start + left_section_width // 2
-        self.left_prev_btn.move(left_center - 70, height - 40)
-        self.left_next_btn.move(left_center + 10, height - 40)
-        self.left_page_label.move(left_center - 25, height - 60)
-        self.left_page_label.setFixedSize(50, 15)
-        
-        # Position right section pagination controls
-        right_center = right_section_start + right_section_width // 2
-        self.right_prev_btn.move(right_center - 70, height - 40)
-        self.right_next_btn.move(right_center + 10, height - 40)
-        self.right_page_label.move(right_center - 25, height - 60)
-        self.right_page_label.setFixedSize(50, 15)
+        # Paint geometry and pagination controls follow the new size
+        self.relayout()
     
     def load_bars_config(self):
         """Load bar configurations from encrypted file"""
@@ -3064,8 +3118,8 @@ class CylinderHeadTab(QWidget):
         # Save configuration
         self.save_bars_config()
         
-        # Trigger repaint
-        self.update()
+        # Lay out the new bar and repaint
+        self.relayout()
         
         print(f"Added new temperature bar to {section} section: {new_bar}")
     
@@ -3104,11 +3158,8 @@ class CylinderHeadTab(QWidget):
             # Save configuration
             self.save_bars_config()
             
-            # Update pagination controls
-            self.update_pagination_controls()
-            
-            # Trigger repaint
-            self.update()
+            # Update pagination controls, layout and repaint
+            self.relayout()
             
             print(f"Removed temperature bar: {bar['label']}")
     
@@ -3130,16 +3181,15 @@ class CylinderHeadTab(QWidget):
             # Get updated configuration from dialog
             updated_config = dialog.get_config()
             self.bars_config[bar_id] = updated_config
-            # Save configuration and update display
+            # Save configuration and update display (the bar may have moved section)
             self.save_bars_config()
-            self.update()
+            self.relayout()
     
     def prev_left_page(self):
         """Navigate to previous page for left section"""
         if self.left_current_page > 0:
             self.left_current_page -= 1
-            self.update_pagination_controls()
-            self.update()
+            self.relayout()
     
     def next_left_page(self):
         """Navigate to next page for left section"""
@@ -3147,15 +3197,13 @@ class CylinderHeadTab(QWidget):
         max_pages = (len(left_bars) + 8) // 9  # 9 bars per page for left section
         if self.left_current_page < max_pages - 1:
             self.left_current_page += 1
-            self.update_pagination_controls()
-            self.update()
+            self.relayout()
     
     def prev_right_page(self):
         """Navigate to previous page for right section"""
         if self.right_current_page > 0:
             self.right_current_page -= 1
-            self.update_pagination_controls()
-            self.update()
+            self.relayout()
     
     def next_right_page(self):
         """Navigate to next page for right section"""
@@ -3163,8 +3211,7 @@ class CylinderHeadTab(QWidget):
         max_pages = (len(right_bars) + 8) // 9  # 9 bars per page for right section
         if self.right_current_page < max_pages - 1:
             self.right_current_page += 1
-            self.update_pagination_controls()
-            self.update()
+            self.relayout()
     
     def update_pagination_controls(self):
         """Update pagination button states and labels"""
@@ -3304,6 +3351,7 @@ class CylinderHeadTab(QWidget):
             self.alarm_delay = self.config.get("alarm_delay", 5)
             self.enable_alarm = self.config.get("enable_alarm", True)
             self.alarm_start_time = None  # Reset delay timer on config change
+            watch_alarm(self)
             print(f"Configuration updated: Low={self.low_limit}°C, High={self.high_limit}°C, Device={self.relay_device_id}, Coil={self.coil_address}, Delay={self.alarm_delay}s")
     
     def set_developer_mode(self, enabled):
@@ -3319,19 +3367,26 @@ class CylinderHeadTab(QWidget):
             return self.parent_window.developer_mode_active
         return False
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for coil writing"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and the relay output image the alarm coil is driven through"""
         self.modbus_client = client
+        self.relay_outputs = relay_outputs
+        watch_alarm(self)
+    
+    def alarm_step(self):
+        """Check the alarm; True while an alarm condition is still waiting out its delay"""
+        self.check_and_write_alarm()
+        return self.alarm_start_time is not None and not self.last_alarm_state
     
     def check_and_write_alarm(self):
         """Check temperatures and write to coil if alarm conditions are met (with delay)"""
-        if not self.enable_alarm or not self.modbus_client:
+        if not self.enable_alarm or not self.modbus_client or not self.relay_outputs:
             return
         
         # Check if any temperature is out of range
         alarm_condition_met = False
         alarm_details = []
-        for bar_id, temp in self.current_temperatures.items():
+        for bar_id, temp in self.target_temperatures.items():
             actual_temp = temp / 10.0
             bar = self.bars_config.get(bar_id, {})
             label = bar.get('label', f'T{bar_id}')
@@ -3368,32 +3423,23 @@ class CylinderHeadTab(QWidget):
         
         # Only write coil if state has changed
         if alarm_condition_met != self.last_alarm_state:
-            try:
-                result = self.modbus_client.write_coil(
-                    address=self.coil_address,
-                    value=alarm_condition_met,
-                    device_id=self.relay_device_id
-                )
-                if result and not result.isError():
-                    status = "ON" if alarm_condition_met else "OFF"
-                    print(f"\n{'='*60}")
-                    print(f"🚨 CYLINDER HEAD ALARM: COIL WRITE SUCCESSFUL")
-                    print(f"{'='*60}")
-                    print(f"  Device ID: {self.relay_device_id}")
-                    print(f"  Coil Address: {self.coil_address}")
-                    print(f"  Coil Value: {status}")
-                    print(f"  Delay: {self.alarm_delay}s (elapsed)")
-                    if alarm_condition_met:
-                        print(f"  Alarm Reason(s):")
-                        for detail in alarm_details:
-                            print(f"    - {detail}")
-                    print(f"{'='*60}\n")
-                    self.last_alarm_state = alarm_condition_met
-                    self.alarm_active = alarm_condition_met
-                else:
-                    print(f"⚠️ Failed to write coil to Device {self.relay_device_id}, Address {self.coil_address} (Device may not be connected): {result}")
-            except Exception as e:
-                print(f"⚠️ Cylinder Head: Cannot write alarm coil (Relay device not connected or communication error): {e}")
+            # Relay output image - the poll cycle writes it to the device and verifies it
+            self.relay_outputs.set(self.relay_device_id, self.coil_address, alarm_condition_met, self)
+            status = "ON" if alarm_condition_met else "OFF"
+            print(f"\n{'='*60}")
+            print(f"🚨 CYLINDER HEAD ALARM: RELAY OUTPUT SET")
+            print(f"{'='*60}")
+            print(f"  Device ID: {self.relay_device_id}")
+            print(f"  Coil Address: {self.coil_address}")
+            print(f"  Coil Value: {status}")
+            print(f"  Delay: {self.alarm_delay}s (elapsed)")
+            if alarm_condition_met:
+                print(f"  Alarm Reason(s):")
+                for detail in alarm_details:
+                    print(f"    - {detail}")
+            print(f"{'='*60}\n")
+            self.last_alarm_state = alarm_condition_met
+            self.alarm_active = alarm_condition_met
         else:
             self.alarm_active = alarm_condition_met
 
@@ -3405,6 +3451,7 @@ class CylinderHeadTab(QWidget):
             if i < len(bar_ids):
                 bar_id = bar_ids[i]
                 self.target_temperatures[bar_id] = value
+        self.values_changed()
     
     def read_individual_bar_data(self, bar_id, bar_config):
         """Read Modbus data for an individual bar"""
@@ -3419,7 +3466,7 @@ class CylinderHeadTab(QWidget):
             if reg_type == 'input':
                 result = self.modbus_client.read_input_registers(address=address, count=1, device_id=device_id)
             elif reg_type == 'holding':
-                addr_to_use = address if address < 40001 else self.calc_holding_offset(address)
+                addr_to_use = address if address < 40001 else reference_to_address(TABLE_HOLDING, address)
                 result = self.modbus_client.read_holding_registers(address=addr_to_use, count=1, device_id=device_id)
             else:
                 print(f"Unsupported register type: {reg_type}")
@@ -3440,17 +3487,39 @@ class CylinderHeadTab(QWidget):
         for bar_id, bar_config in self.bars_config.items():
             value = self.read_individual_bar_data(bar_id, bar_config)
             self.target_temperatures[bar_id] = value
+        self.values_changed()
+    
+    def values_changed(self):
+        """New target temperatures: check the alarm and animate the bars if they are on screen"""
+        watch_alarm(self)
+        if self.isVisible():
+            animation_clock().wake(self.animate_bars)
+        else:
+            self.snap_bars()
+    
+    def snap_bars(self):
+        """Jump every bar and hover effect to its end state (used off screen)"""
+        self.current_temperatures.update(self.target_temperatures)
+        for bar_id in self.bars_config:
+            self.hover_opacity[bar_id] = 1.0 if self.hovered_bar == bar_id else 0.0
+            self.remove_button_hover_opacity[bar_id] = 1.0 if self.hovered_remove_button == bar_id else 0.0
     
     def set_thresholds(self, thresholds):
         """Update temperature thresholds for color logic"""
         self.thresholds = thresholds
     
     def animate_bars(self):
+        if not self.isVisible():
+            # Hidden page: no frames, the bars are shown at their latest values
+            self.snap_bars()
+            return False
+        
         # Smooth easing animation - NO BOUNCE, pure smooth motion
-        easing_factor = 0.08  # Lower = slower, smoother (0.08 = ~2 seconds to reach target)
+        easing_factor = animation_clock().ease(0.08)  # Lower = slower, smoother (0.08 = ~2 seconds to reach target)
         threshold = 0.05      # Snap to target when very close
         
         needs_update = False
+        dirty = set()
         
         for bar_id in self.bars_config:
             target = self.target_temperatures.get(bar_id, 0)
@@ -3465,11 +3534,12 @@ class CylinderHeadTab(QWidget):
             else:
                 # Exponential easing - smooth approach with NO overshoot or bounce
                 # Move a fraction of the remaining distance each frame
-                self.current_temperatures[bar_id] += distance * easing_factor
+                self.current_temperatures[bar_id] = current + distance * easing_factor
+                dirty.add(bar_id)
                 needs_update = True
         
         # Animate hover effects with smooth transitions
-        hover_easing = 0.15  # Faster easing for hover effects
+        hover_easing = animation_clock().ease(0.15)  # Faster easing for hover effects
         for bar_id in self.bars_config:
             # Animate bar hover effects
             target_opacity = 1.0 if self.hovered_bar == bar_id else 0.0
@@ -3484,6 +3554,7 @@ class CylinderHeadTab(QWidget):
             else:
                 # Smooth opacity transition
                 self.hover_opacity[bar_id] += opacity_distance * hover_easing
+                dirty.add(bar_id)
                 needs_update = True
             
             # Animate remove button hover effects
@@ -3499,19 +3570,16 @@ class CylinderHeadTab(QWidget):
             else:
                 # Smooth opacity transition for remove button
                 self.remove_button_hover_opacity[bar_id] += remove_opacity_distance * hover_easing
+                dirty.add(bar_id)
                 needs_update = True
         
-        # Check alarm conditions and write coil
-        self.check_and_write_alarm()
-        
-        # Only trigger repaint if values are still changing
+        # Only repaint the bars that are still changing
         if needs_update:
-            self.update()
+            self.update_bars(dirty)
+        return needs_update
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.TextAntialiasing)
+    def compute_bar_layout(self):
+        """Paint geometry for the current size, bar configuration and section pages"""
         width = self.width()
         height = self.height()
 
@@ -3529,24 +3597,144 @@ class CylinderHeadTab(QWidget):
         section_gap = max(30, int(width * 0.039))  # ~3.9% of width
         
         # Calculate total content width for both sections (based on current page)
-        current_left_bars = self.get_current_page_bars('left')
-        current_right_bars = self.get_current_page_bars('right')
-        left_section_width = len(current_left_bars) * spacing
-        right_section_width = len(current_right_bars) * spacing
+        left_bars = self.get_current_page_bars('left')
+        right_bars = self.get_current_page_bars('right')
+        left_section_width = len(left_bars) * spacing
+        right_section_width = len(right_bars) * spacing
         total_bars_width = left_section_width + section_gap + right_section_width
         total_content_width = scale_width + gap_between_scale_and_bars + total_bars_width
         
         # Center the content
         offset_x = max(20, (width - total_content_width) // 2)
         scale_left = offset_x + 40
+        left_section_start = scale_left + gap_between_scale_and_bars
+        right_section_start = left_section_start + left_section_width + section_gap
+        
+        # Scale ticks: (value, y, major) and the label box of each
+        text_width = max(40, int(48 * scale_factor))
+        text_height = max(18, int(22 * scale_factor))
+        ticks = []
+        for temp in range(0, 701, 100):
+            y = int(scale_bottom - (temp / 700) * scale_height)
+            ticks.append((f"{temp}", y, temp % 200 == 0,
+                          QRect(scale_left - text_width - 10, y - text_height // 2, text_width, text_height)))
+        
+        # Section labels
+        label_width = max(180, int(250 * scale_factor))
+        label_height = max(25, int(30 * scale_factor))
+        label_offset = max(35, int(50 * scale_factor))
+        left_label_center = left_section_start + left_section_width // 2
+        right_label_center = right_section_start + right_section_width // 2
+        
+        # Bars of the current pages with their container, caption and remove button boxes
+        caption_y_offset = max(12, int(15 * scale_factor))
+        caption_height = max(16, int(20 * scale_factor))
+        temp_y_offset = max(30, int(38 * scale_factor))
+        temp_height = max(18, int(22 * scale_factor))
+        temp_width_extra = max(12, int(15 * scale_factor))
+        remove_btn_size = max(16, int(20 * scale_factor))
+        glow_margin = 2 * max(2, int(2 * scale_factor)) + 2
+        bars = []
+        for start, section_bars in ((left_section_start, left_bars), (right_section_start, right_bars)):
+            for i, (bar_id, bar) in enumerate(section_bars):
+                bar_x = start + i * spacing
+                bars.append({
+                    "id": bar_id,
+                    "config": bar,
+                    "x": bar_x,
+                    "container": QRect(int(bar_x), int(scale_top), bar_width, int(scale_height)),
+                    "caption": QRect(int(bar_x), scale_bottom + caption_y_offset, bar_width, caption_height),
+                    "value": QRect(int(bar_x - temp_width_extra), scale_bottom + temp_y_offset,
+                                   bar_width + temp_width_extra * 2, temp_height),
+                    "remove": QRect(int(bar_x + bar_width - remove_btn_size), int(scale_top),
+                                    remove_btn_size, remove_btn_size),
+                })
+        # Everything one bar paints that changes with its value or hover: bar + glow, readout
+        for bar in bars:
+            bar["dirty"] = bar["container"].adjusted(
+                -glow_margin, -glow_margin, glow_margin, glow_margin).united(bar["value"]).united(bar["remove"])
+        
+        return {
+            "scale_factor": scale_factor,
+            "scale_top": scale_top,
+            "scale_bottom": scale_bottom,
+            "scale_height": scale_height,
+            "scale_left": scale_left,
+            "grid_right": scale_left + gap_between_scale_and_bars + total_bars_width,
+            "bar_width": bar_width,
+            "left_center": left_label_center,
+            "right_center": right_label_center,
+            "ticks": ticks,
+            "tick_font": QFont("Segoe UI", max(9, int(11 * scale_factor)), QFont.Normal),
+            "title_font": QFont("Segoe UI", max(11, int(13 * scale_factor)), QFont.Bold),
+            "caption_font": QFont("Segoe UI", max(8, int(10 * scale_factor)), QFont.Normal),
+            "value_font": QFont("Consolas", max(9, int(11 * scale_factor)), QFont.Bold),
+            "left_label": QRect(left_label_center - label_width // 2, scale_top - label_offset, label_width, label_height),
+            "right_label": QRect(right_label_center - label_width // 2, scale_top - label_offset, label_width, label_height),
+            "bars": bars,
+        }
+    
+    def relayout(self):
+        """Recompute the paint layout and click areas - on resize, page change and bar configuration change"""
+        self.update_pagination_controls()
+        layout = self.bar_layout = self.compute_bar_layout()
+        real_bars = [bar for bar in layout["bars"] if not bar["config"].get('is_placeholder', False)]
+        self.bar_rects = {bar["id"]: bar["container"] for bar in real_bars}
+        self.remove_buttons = {bar["id"]: bar["remove"] for bar in real_bars}
+        invalidate_dial_layer(self)
+        
+        # Position pagination controls under each section
+        height = self.height()
+        left_center = layout["left_center"]
+        self.left_prev_btn.move(left_center - 70, height - 40)
+        self.left_next_btn.move(left_center + 10, height - 40)
+        self.left_page_label.move(left_center - 25, height - 60)
+        self.left_page_label.setFixedSize(50, 15)
+        right_center = layout["right_center"]
+        self.right_prev_btn.move(right_center - 70, height - 40)
+        self.right_next_btn.move(right_center + 10, height - 40)
+        self.right_page_label.move(right_center - 25, height - 60)
+        self.right_page_label.setFixedSize(50, 15)
+        self.update()
+
+    def update_bars(self, bar_ids):
+        """Repaint only the given bars (value, hover or alarm colour changed)"""
+        region = QRegion()
+        for bar in self.bar_layout["bars"]:
+            if bar["id"] in bar_ids:
+                region = region.united(bar["dirty"])
+        if not region.isEmpty():
+            self.update(region)
+
+    @timed_paint
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        layout = self.bar_layout
+        
+        # Scale, grid and section labels come from a pixmap rebuilt by relayout()
+        painter.drawPixmap(0, 0, cached_dial_layer(self, (), self.paint_static_layer))
+        
+        # ---- Draw Temperature Bars (those in the repainted region) ----
+        dirty = event.region()
+        for bar in layout["bars"]:
+            if dirty.intersects(bar["dirty"]):
+                self._draw_temperature_bar(painter, layout, bar)
+    
+    def paint_static_layer(self, painter):
+        """Grid, scale with its ticks and labels, section titles - everything that does not follow the values"""
+        layout = self.bar_layout
+        scale_factor = layout["scale_factor"]
+        scale_left = layout["scale_left"]
+        scale_top = layout["scale_top"]
+        scale_bottom = layout["scale_bottom"]
         
         # ---- Draw horizontal grid lines with hi-tech styling ----
         line_width = max(1, int(scale_factor * 1))
         painter.setPen(QPen(QColor(50, 60, 75, 60), line_width))
-        for temp in range(0, 701, 100):
-            y = scale_bottom - (temp / 700) * scale_height
-            painter.drawLine(scale_left, int(y), 
-                           scale_left + gap_between_scale_and_bars + total_bars_width, int(y))
+        for _, y, _, _ in layout["ticks"]:
+            painter.drawLine(scale_left, y, layout["grid_right"], y)
 
         # ---- Draw Scale (Left) - Simple professional design ----
         # Single color, clean professional scale
@@ -3557,88 +3745,48 @@ class CylinderHeadTab(QWidget):
         painter.drawLine(scale_left, scale_top, scale_left, scale_bottom)
 
         # Draw tick marks and labels - Simple professional styling
-        font_size = max(9, int(11 * scale_factor))
-        painter.setFont(QFont("Segoe UI", font_size, QFont.Normal))
-        for temp in range(0, 701, 100):
-            y = scale_bottom - (temp / 700) * scale_height
-            
-            # Simple single color for all ticks and text
-            tick_color = QColor(100, 120, 140)
-            text_color = QColor(150, 165, 180)
-            
+        tick_color = QColor(100, 120, 140)
+        text_color = QColor(150, 165, 180)
+        tick_length_major = max(10, int(12 * scale_factor))
+        tick_length_minor = max(6, int(8 * scale_factor))
+        tick_width = max(2, int(2 * scale_factor))
+        major_pen = QPen(tick_color, tick_width)
+        minor_pen = QPen(tick_color.darker(120), tick_width - 1)
+        minor_text_color = QColor(120, 135, 150)
+        for text, y, major, text_rect in layout["ticks"]:
             # Professional tick marks
-            tick_length_major = max(10, int(12 * scale_factor))
-            tick_length_minor = max(6, int(8 * scale_factor))
-            tick_width = max(2, int(2 * scale_factor))
-            
-            if temp % 200 == 0:
-                painter.setPen(QPen(tick_color, tick_width))
-                painter.drawLine(scale_left - tick_length_major, int(y), scale_left + tick_length_major, int(y))
+            if major:
+                painter.setPen(major_pen)
+                painter.drawLine(scale_left - tick_length_major, y, scale_left + tick_length_major, y)
                 painter.setPen(text_color)
             else:
-                painter.setPen(QPen(tick_color.darker(120), tick_width - 1))
-                painter.drawLine(scale_left - tick_length_minor, int(y), scale_left + tick_length_minor, int(y))
-                painter.setPen(QColor(120, 135, 150))
-            
-            text_width = max(40, int(48 * scale_factor))
-            text_height = max(18, int(22 * scale_factor))
-            painter.drawText(scale_left - text_width - 10, int(y) - text_height // 2, text_width, text_height, Qt.AlignRight | Qt.AlignVCenter, f"{temp}")
+                painter.setPen(minor_pen)
+                painter.drawLine(scale_left - tick_length_minor, y, scale_left + tick_length_minor, y)
+                painter.setPen(minor_text_color)
+            draw_static_text(painter, layout["tick_font"], text_rect, text, Qt.AlignRight | Qt.AlignVCenter)
 
         # ---- Draw Section Labels with hi-tech styling ----
-        title_font_size = max(11, int(13 * scale_factor))
-        painter.setFont(QFont("Segoe UI", title_font_size, QFont.Bold))
         painter.setPen(QColor(180, 190, 200))
-        
-        # Left section label
-        left_section_start = scale_left + gap_between_scale_and_bars
-        left_label_center = left_section_start + left_section_width // 2
-        label_width = max(180, int(250 * scale_factor))
-        label_height = max(25, int(30 * scale_factor))
-        label_offset = max(35, int(50 * scale_factor))
-        painter.drawText(left_label_center - label_width // 2, scale_top - label_offset, label_width, label_height, Qt.AlignCenter, "CYLINDER HEAD LEFT")
-        
-        # Right section label
-        right_section_start = left_section_start + left_section_width + section_gap
-        right_label_center = right_section_start + right_section_width // 2
-        painter.drawText(right_label_center - label_width // 2, scale_top - label_offset, label_width, label_height, Qt.AlignCenter, "CYLINDER HEAD RIGHT")
-        
-        # ---- Draw Temperature Bars ----
-        max_bar_height = scale_height
-
-        # Get bars for current page of each section
-        left_bars = self.get_current_page_bars('left')
-        right_bars = self.get_current_page_bars('right')
-        
-        # Update pagination controls
-        self.update_pagination_controls()
-        
-        # Draw left section bars
-        for i, (bar_id, bar) in enumerate(left_bars):
-            bar_x = left_section_start + i * spacing
-            self._draw_temperature_bar(painter, bar, bar_id, bar_x, scale_top, scale_bottom, 
-                                     bar_width, max_bar_height, scale_factor)
-        
-        # Draw right section bars
-        for i, (bar_id, bar) in enumerate(right_bars):
-            bar_x = right_section_start + i * spacing
-            self._draw_temperature_bar(painter, bar, bar_id, bar_x, scale_top, scale_bottom, 
-                                     bar_width, max_bar_height, scale_factor)
+        draw_static_text(painter, layout["title_font"], layout["left_label"], "CYLINDER HEAD LEFT")
+        draw_static_text(painter, layout["title_font"], layout["right_label"], "CYLINDER HEAD RIGHT")
     
-    def _draw_temperature_bar(self, painter, bar_config, bar_id, bar_x, scale_top, scale_bottom, 
-                             bar_width, max_bar_height, scale_factor):
+    def _draw_temperature_bar(self, painter, layout, bar):
         """Helper method to draw a single temperature bar"""
+        bar_config, bar_id, bar_x = bar["config"], bar["id"], bar["x"]
+        scale_top, scale_bottom = layout["scale_top"], layout["scale_bottom"]
+        bar_width, max_bar_height = layout["bar_width"], layout["scale_height"]
+        scale_factor = layout["scale_factor"]
+        container_rect = bar["container"]
+        res = render_resources()
         # Check if this is a placeholder bar
         is_placeholder = bar_config.get('is_placeholder', False)
         
         if is_placeholder:
             # Draw only a faint background container for placeholder
-            container_rect = QRect(int(bar_x), int(scale_top), bar_width, int(max_bar_height))
-            bg_gradient = QLinearGradient(bar_x, scale_top, bar_x, scale_bottom)
-            bg_gradient.setColorAt(0, QColor(40, 45, 52, 40))
-            bg_gradient.setColorAt(1, QColor(35, 40, 47, 40))
-            painter.setBrush(bg_gradient)
+            painter.setBrush(res.linear(bar_x, scale_top, bar_x, scale_bottom,
+                                        ((0, (40, 45, 52, 40)), (1, (35, 40, 47, 40)))))
             border_width = max(1, int(1 * scale_factor))
-            painter.setPen(QPen(QColor(50, 60, 70, 60), border_width))
+            painter.setPen(res.pen((50, 60, 70, 60), border_width))
             painter.drawRect(container_rect)
             return  # Don't draw anything else for placeholders
         
@@ -3657,37 +3805,32 @@ class CylinderHeadTab(QWidget):
         # Vibrant Red = Too Hot (> high_limit)
         if actual_temp <= 0:
             # No data - use dark gray
-            color = QColor(60, 70, 85)
+            rgb = (60, 70, 85)
         elif actual_temp < self.low_limit:
             # Too cold - Vibrant futuristic yellow
-            color = QColor(255, 220, 0)
+            rgb = (255, 220, 0)
         elif actual_temp <= self.high_limit:
             # Normal - Vibrant futuristic green
-            color = QColor(0, 255, 100)
+            rgb = (0, 255, 100)
         else:
             # Too hot - Vibrant futuristic red
-            color = QColor(255, 40, 80)
+            rgb = (255, 40, 80)
+        color = res.color(*rgb)
 
         # Draw background container with hi-tech styling
-        container_rect = QRect(int(bar_x), int(scale_top), bar_width, int(max_bar_height))
-        
-        # Store bar rectangle for click detection (only for real bars)
-        self.bar_rects[bar_id] = container_rect
-        
-        bg_gradient = QLinearGradient(bar_x, scale_top, bar_x, scale_bottom)
-        bg_gradient.setColorAt(0, QColor(40, 45, 52, 120))
-        bg_gradient.setColorAt(1, QColor(35, 40, 47, 120))
-        painter.setBrush(bg_gradient)
+        painter.setBrush(res.linear(bar_x, scale_top, bar_x, scale_bottom,
+                                    ((0, (40, 45, 52, 120)), (1, (35, 40, 47, 120)))))
         border_width = max(1, int(2 * scale_factor))
-        painter.setPen(QPen(QColor(55, 65, 75), border_width))
+        painter.setPen(res.pen((55, 65, 75), border_width))
         painter.drawRect(container_rect)
 
         # Draw filled bar with gradient
         bar_padding = max(1, int(2 * scale_factor))
         if bar_height > bar_padding:
             bar_rect = QRectF(bar_x + bar_padding, bar_y + bar_padding, bar_width - bar_padding * 2, bar_height - bar_padding)
+            # The gradient follows the bar top, so only its colours come from the registry
             bar_gradient = QLinearGradient(bar_x, bar_y, bar_x, scale_bottom)
-            bar_gradient.setColorAt(0, color.lighter(110))
+            bar_gradient.setColorAt(0, res.lighter(color, 110))
             bar_gradient.setColorAt(1, color)
             painter.setBrush(bar_gradient)
             painter.setPen(Qt.NoPen)
@@ -3697,8 +3840,7 @@ class CylinderHeadTab(QWidget):
             max_glow = max(2, int(2 * scale_factor))
             for glow_offset in range(max_glow, 0, -1):
                 glow_alpha = 15 * (max_glow + 1 - glow_offset)
-                glow_color = QColor(color.red(), color.green(), color.blue(), glow_alpha)
-                painter.setPen(QPen(glow_color, glow_offset))
+                painter.setPen(res.pen(rgb + (glow_alpha,), glow_offset))
                 painter.setBrush(Qt.NoBrush)
                 glow_rect = QRectF(bar_x - glow_offset, bar_y - glow_offset, 
                                   bar_width + glow_offset * 2, bar_height + glow_offset * 2)
@@ -3709,58 +3851,39 @@ class CylinderHeadTab(QWidget):
         if hover_opacity > 0.01:
             # Create subtle cyan highlight overlay
             hover_alpha = int(30 * hover_opacity)
-            hover_color = QColor(0, 150, 200, hover_alpha)
             
             # Draw hover background overlay
-            painter.setBrush(hover_color)
+            painter.setBrush(res.color(0, 150, 200, hover_alpha))
             painter.setPen(Qt.NoPen)
             painter.drawRect(container_rect)
             
             # Draw subtle border highlight
             border_alpha = int(80 * hover_opacity)
-            border_color = QColor(0, 170, 220, border_alpha)
             border_width = max(2, int(2 * scale_factor))
-            painter.setPen(QPen(border_color, border_width))
+            painter.setPen(res.pen((0, 170, 220, border_alpha), border_width))
             painter.setBrush(Qt.NoBrush)
             painter.drawRect(container_rect)
 
         # Draw label below bar with hi-tech styling
-        painter.setPen(QColor(120, 140, 160))
-        label_font_size = max(8, int(10 * scale_factor))
-        painter.setFont(QFont("Segoe UI", label_font_size, QFont.Normal))
-        label_y_offset = max(12, int(15 * scale_factor))
-        label_height = max(16, int(20 * scale_factor))
-        painter.drawText(int(bar_x), scale_bottom + label_y_offset, bar_width, label_height, 
-                        Qt.AlignCenter, bar_config['label'])
+        painter.setPen(res.color(120, 140, 160))
+        draw_static_text(painter, layout["caption_font"], bar["caption"], bar_config['label'])
 
         # Draw digital temperature display with hi-tech monospace font
         painter.setPen(color)
-        temp_font_size = max(9, int(11 * scale_factor))
-        painter.setFont(QFont("Consolas", temp_font_size, QFont.Bold))
-        temp_y_offset = max(30, int(38 * scale_factor))
-        temp_height = max(18, int(22 * scale_factor))
-        temp_width_extra = max(12, int(15 * scale_factor))
-        painter.drawText(int(bar_x - temp_width_extra), scale_bottom + temp_y_offset, 
-                        bar_width + temp_width_extra * 2, temp_height, Qt.AlignCenter, f"{actual_temp:.1f}°C")
+        painter.setFont(layout["value_font"])
+        painter.drawText(bar["value"], Qt.AlignCenter, f"{actual_temp:.1f}°C")
         
         # Draw remove button in developer mode only
         if self.is_developer_mode_active():
-            remove_btn_size = max(16, int(20 * scale_factor))
-            # Position at the sharp top-right corner of the bar
-            remove_btn_x = bar_x + bar_width - remove_btn_size
-            remove_btn_y = scale_top
-            
-            # Store button position for click detection
-            if not hasattr(self, 'remove_buttons'):
-                self.remove_buttons = {}
-            self.remove_buttons[bar_id] = QRect(int(remove_btn_x), int(remove_btn_y), remove_btn_size, remove_btn_size)
+            # Sharp top-right corner of the bar
+            remove_btn_x, remove_btn_y = bar["remove"].x(), bar["remove"].y()
+            remove_btn_size = bar["remove"].width()
             
             # Load and draw the remove image
             try:
-                remove_pixmap = QPixmap(resource_path("imgs/remove.png"))
-                if not remove_pixmap.isNull():
-                    # Scale the image to fit the button size
-                    scaled_pixmap = remove_pixmap.scaled(remove_btn_size, remove_btn_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                # Scaled to fit the button size once, from the icon cache
+                scaled_pixmap = icon_pixmap("remove.png", remove_btn_size, self.devicePixelRatioF())
+                if not scaled_pixmap.isNull():
                     
                     # Check if this button is being hovered (for hover effect)
                     hover_opacity = getattr(self, 'remove_button_hover_opacity', {}).get(bar_id, 0.0)
@@ -3768,7 +3891,7 @@ class CylinderHeadTab(QWidget):
                     # Draw hover background if hovering
                     if hover_opacity > 0.01:
                         hover_alpha = int(100 * hover_opacity)
-                        painter.setBrush(QColor(255, 255, 255, hover_alpha))
+                        painter.setBrush(res.color(255, 255, 255, hover_alpha))
                         painter.setPen(Qt.NoPen)
                         painter.drawRect(int(remove_btn_x), int(remove_btn_y), remove_btn_size, remove_btn_size)
                     
@@ -3822,9 +3945,11 @@ class CylinderHeadTab(QWidget):
         # Update hover states if they changed
         if self.hovered_bar != hovered_bar:
             self.hovered_bar = hovered_bar
+            animation_clock().wake(self.animate_bars)
         
         if self.hovered_remove_button != hovered_remove_button:
             self.hovered_remove_button = hovered_remove_button
+            animation_clock().wake(self.animate_bars)
         
         # Set cursor based on what's being hovered
         if self.is_developer_mode_active() and (hovered_bar or hovered_remove_button):
@@ -3876,6 +4001,7 @@ class MainBearingTab(QWidget):
         
         # Modbus client reference (will be set by HMIWindow)
         self.modbus_client = None
+        self.relay_outputs = None
         
         # Alarm state tracking
         self.alarm_active = False
@@ -3884,6 +4010,10 @@ class MainBearingTab(QWidget):
         
         # Storage for clickable areas
         self.bar_rects = {}
+        self.remove_buttons = {}
+        
+        # Paint geometry - rebuilt by relayout() on resize, page and bar changes, only read by paintEvent
+        self.bar_layout = None
         
         # Pagination state (10 bars per page)
         self.bars_per_page = 10
@@ -3892,13 +4022,10 @@ class MainBearingTab(QWidget):
         # UI Elements
         self.setup_ui()
         
-        # Initialize pagination controls
-        self.update_pagination_controls()
+        # Initialize pagination controls and layout
+        self.relayout()
         
-        # Animation timer - 60 FPS for ultra-smooth animation
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_bars)
-        self.animation_timer.start(16)  # 16ms = ~60 fps
+        # Bars are stepped by the shared animation clock while they move (~60 fps)
     
     def setup_ui(self):
         """Setup UI elements including buttons"""
@@ -3961,6 +4088,9 @@ class MainBearingTab(QWidget):
         self.next_btn.move(center_x + button_spacing - 15, height - 50)
         self.page_label.move(center_x - 25, height - 50)
         self.page_label.setFixedSize(50, 30)
+        
+        # Paint geometry follows the new size
+        self.relayout()
     
     def load_config(self):
         """Load configuration from encrypted file"""
@@ -4044,6 +4174,7 @@ class MainBearingTab(QWidget):
             self.alarm_delay = self.config.get("alarm_delay", 5)
             self.enable_alarm = self.config.get("enable_alarm", True)
             self.alarm_start_time = None  # Reset delay timer on config change
+            watch_alarm(self)
             print(f"Main Bearing Configuration updated: Low={self.low_limit}°C, High={self.high_limit}°C, Device={self.relay_device_id}, Coil={self.coil_address}, Delay={self.alarm_delay}s")
     
     def set_developer_mode(self, enabled):
@@ -4089,9 +4220,8 @@ class MainBearingTab(QWidget):
             self.target_temperatures[str(next_id)] = 0
             self.velocities[str(next_id)] = 0.0
             
-            # Update pagination
-            self.update_pagination_controls()
-            self.update()
+            # Update pagination and layout
+            self.relayout()
             
             QMessageBox.information(self, "Bar Added", 
                                    f"New bearing bar '{config['label']}' added successfully!")
@@ -4126,9 +4256,8 @@ class MainBearingTab(QWidget):
             if bar_id in self.velocities:
                 del self.velocities[bar_id]
             
-            # Update pagination
-            self.update_pagination_controls()
-            self.update()
+            # Update pagination and layout
+            self.relayout()
             
             QMessageBox.information(self, "Bar Removed", 
                                    f"Bearing bar '{label}' removed successfully!")
@@ -4148,7 +4277,7 @@ class MainBearingTab(QWidget):
             config = dialog.get_config()
             self.bars_config[bar_id] = config
             self.save_bars_config()
-            self.update()
+            self.relayout()
             
             QMessageBox.information(self, "Configuration Saved", 
                                    f"Configuration for bearing bar '{config['label']}' saved successfully!")
@@ -4177,8 +4306,7 @@ class MainBearingTab(QWidget):
         """Go to previous page"""
         if self.current_page > 0:
             self.current_page -= 1
-            self.update_pagination_controls()
-            self.update()
+            self.relayout()
     
     def next_page(self):
         """Go to next page"""
@@ -4186,8 +4314,7 @@ class MainBearingTab(QWidget):
         total_pages = (total_bars + self.bars_per_page - 1) // self.bars_per_page
         if self.current_page < total_pages - 1:
             self.current_page += 1
-            self.update_pagination_controls()
-            self.update()
+            self.relayout()
     
     def get_visible_bars(self):
         """Get bars for current page"""
@@ -4233,9 +4360,11 @@ class MainBearingTab(QWidget):
         # Update hover states if they changed
         if self.hovered_bar != hovered_bar:
             self.hovered_bar = hovered_bar
+            animation_clock().wake(self.animate_bars)
         
         if self.hovered_remove_button != hovered_remove_button:
             self.hovered_remove_button = hovered_remove_button
+            animation_clock().wake(self.animate_bars)
         
         # Set cursor based on what's being hovered
         if self.is_developer_mode_active() and (hovered_bar or hovered_remove_button):
@@ -4245,19 +4374,26 @@ class MainBearingTab(QWidget):
         
         super().mouseMoveEvent(event)
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for coil writing"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and the relay output image the alarm coil is driven through"""
         self.modbus_client = client
+        self.relay_outputs = relay_outputs
+        watch_alarm(self)
+    
+    def alarm_step(self):
+        """Check the alarm; True while an alarm condition is still waiting out its delay"""
+        self.check_and_write_alarm()
+        return self.alarm_start_time is not None and not self.last_alarm_state
     
     def check_and_write_alarm(self):
         """Check temperatures and write to coil if alarm conditions are met (with delay)"""
-        if not self.enable_alarm or not self.modbus_client:
+        if not self.enable_alarm or not self.modbus_client or not self.relay_outputs:
             return
         
         # Check if any temperature is out of range
         alarm_condition_met = False
         alarm_details = []
-        for bar_id, temp in self.current_temperatures.items():
+        for bar_id, temp in self.target_temperatures.items():
             actual_temp = temp / 10.0
             bar = self.bars_config.get(bar_id, {})
             label = bar.get('label', f'B{bar_id}')
@@ -4294,32 +4430,23 @@ class MainBearingTab(QWidget):
         
         # Only write coil if state has changed
         if alarm_condition_met != self.last_alarm_state:
-            try:
-                result = self.modbus_client.write_coil(
-                    address=self.coil_address,
-                    value=alarm_condition_met,
-                    device_id=self.relay_device_id
-                )
-                if result and not result.isError():
-                    status = "ON" if alarm_condition_met else "OFF"
-                    print(f"\n{'='*60}")
-                    print(f"🚨 MAIN BEARING ALARM: COIL WRITE SUCCESSFUL")
-                    print(f"{'='*60}")
-                    print(f"  Device ID: {self.relay_device_id}")
-                    print(f"  Coil Address: {self.coil_address}")
-                    print(f"  Coil Value: {status}")
-                    print(f"  Delay: {self.alarm_delay}s (elapsed)")
-                    if alarm_condition_met:
-                        print(f"  Alarm Reason(s):")
-                        for detail in alarm_details:
-                            print(f"    - {detail}")
-                    print(f"{'='*60}\n")
-                    self.last_alarm_state = alarm_condition_met
-                    self.alarm_active = alarm_condition_met
-                else:
-                    print(f"⚠️ Failed to write coil to Device {self.relay_device_id}, Address {self.coil_address} (Device may not be connected): {result}")
-            except Exception as e:
-                print(f"⚠️ Main Bearing: Cannot write alarm coil (Relay device not connected or communication error): {e}")
+            # Relay output image - the poll cycle writes it to the device and verifies it
+            self.relay_outputs.set(self.relay_device_id, self.coil_address, alarm_condition_met, self)
+            status = "ON" if alarm_condition_met else "OFF"
+            print(f"\n{'='*60}")
+            print(f"🚨 MAIN BEARING ALARM: RELAY OUTPUT SET")
+            print(f"{'='*60}")
+            print(f"  Device ID: {self.relay_device_id}")
+            print(f"  Coil Address: {self.coil_address}")
+            print(f"  Coil Value: {status}")
+            print(f"  Delay: {self.alarm_delay}s (elapsed)")
+            if alarm_condition_met:
+                print(f"  Alarm Reason(s):")
+                for detail in alarm_details:
+                    print(f"    - {detail}")
+            print(f"{'='*60}\n")
+            self.last_alarm_state = alarm_condition_met
+            self.alarm_active = alarm_condition_met
         else:
             self.alarm_active = alarm_condition_met
 
@@ -4331,6 +4458,22 @@ class MainBearingTab(QWidget):
                 self.target_temperatures[bar_id] = values[i]
             else:
                 self.target_temperatures[bar_id] = 0
+        self.values_changed()
+    
+    def values_changed(self):
+        """New target temperatures: check the alarm and animate the bars if they are on screen"""
+        watch_alarm(self)
+        if self.isVisible():
+            animation_clock().wake(self.animate_bars)
+        else:
+            self.snap_bars()
+    
+    def snap_bars(self):
+        """Jump every bar and hover effect to its end state (used off screen)"""
+        self.current_temperatures.update(self.target_temperatures)
+        for bar_id in self.bars_config:
+            self.hover_opacity[bar_id] = 1.0 if self.hovered_bar == bar_id else 0.0
+            self.remove_button_hover_opacity[bar_id] = 1.0 if self.hovered_remove_button == bar_id else 0.0
     
     def set_thresholds(self, thresholds):
         """Update temperature thresholds for color logic"""
@@ -4338,10 +4481,15 @@ class MainBearingTab(QWidget):
     
     def animate_bars(self):
         """Smooth easing animation"""
-        easing_factor = 0.08
+        if not self.isVisible():
+            self.snap_bars()
+            return False
+        
+        easing_factor = animation_clock().ease(0.08)
         threshold = 0.05
         
         needs_update = False
+        dirty = set()
         
         for bar_id in self.bars_config.keys():
             target = self.target_temperatures.get(bar_id, 0)
@@ -4352,11 +4500,12 @@ class MainBearingTab(QWidget):
             if abs(distance) < threshold:
                 self.current_temperatures[bar_id] = target
             else:
-                self.current_temperatures[bar_id] += distance * easing_factor
+                self.current_temperatures[bar_id] = current + distance * easing_factor
+                dirty.add(bar_id)
                 needs_update = True
         
         # Animate hover effects with smooth transitions
-        hover_easing = 0.15  # Faster easing for hover effects
+        hover_easing = animation_clock().ease(0.15)  # Faster easing for hover effects
         for bar_id in self.bars_config:
             # Animate bar hover effects
             target_opacity = 1.0 if self.hovered_bar == bar_id else 0.0
@@ -4371,6 +4520,7 @@ class MainBearingTab(QWidget):
             else:
                 # Smooth opacity transition
                 self.hover_opacity[bar_id] += opacity_distance * hover_easing
+                dirty.add(bar_id)
                 needs_update = True
             
             # Animate remove button hover effects
@@ -4386,18 +4536,15 @@ class MainBearingTab(QWidget):
             else:
                 # Smooth opacity transition for remove button
                 self.remove_button_hover_opacity[bar_id] += remove_opacity_distance * hover_easing
+                dirty.add(bar_id)
                 needs_update = True
         
-        # Check alarm conditions
-        self.check_and_write_alarm()
-        
         if needs_update:
-            self.update()
+            self.update_bars(dirty)
+        return needs_update
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.TextAntialiasing)
+    def compute_bar_layout(self):
+        """Paint geometry for the current size, bar configuration and page"""
         width = self.width()
         height = self.height()
 
@@ -4413,136 +4560,214 @@ class MainBearingTab(QWidget):
         scale_width = max(50, int(width * 0.055))  # ~5.5% of width
         gap_between_scale_and_bars = max(20, int(width * 0.031))  # ~3.1% of width
         
-        # Get visible bars for current page
+        # Visible bars for current page
         visible_bars = self.get_visible_bars()
-        num_visible = len(visible_bars)
-        
-        if num_visible == 0:
-            # No bars to display
-            painter.setPen(QColor(150, 170, 190))
-            painter.setFont(QFont("Inter", 14))
-            painter.drawText(0, 0, width, height, Qt.AlignCenter, "No bearing bars configured")
-            return
         
         # Calculate total content width
-        total_bars_width = num_visible * spacing
+        total_bars_width = len(visible_bars) * spacing
         total_content_width = scale_width + gap_between_scale_and_bars + total_bars_width
         
         # Center the content
         offset_x = max(20, (width - total_content_width) // 2)
         scale_left = offset_x + 40
+        bars_start = scale_left + gap_between_scale_and_bars
         
-        # ---- Draw horizontal grid lines ----
-        line_width = max(1, int(scale_factor * 1))
-        painter.setPen(QPen(QColor(30, 40, 55, 80), line_width))
+        # Scale ticks every 50°C: (text, y, major, tick color, label box)
+        text_width = max(35, int(42 * scale_factor))
+        text_height = max(16, int(20 * scale_factor))
+        ticks = []
         for temp in range(0, 301, 50):
-            y = scale_bottom - (temp / 300) * scale_height
-            painter.drawLine(scale_left, int(y), 
-                           scale_left + gap_between_scale_and_bars + total_bars_width, int(y))
-
-        # ---- Draw Scale (Left) with gradient ----
+            y = int(scale_bottom - (temp / 300) * scale_height)
+            if temp < 100:
+                tick_color = QColor(0, 180, 255, 180)
+            elif temp < 200:
+                tick_color = QColor(0, 255, 180, 180)
+            else:
+                tick_color = QColor(255, 180, 0, 180)
+            ticks.append((f"{temp}", y, temp % 100 == 0, tick_color,
+                          QRect(scale_left - text_width - 8, y - text_height // 2, text_width, text_height)))
+        
+        # Scale line gradient
         scale_gradient = QLinearGradient(scale_left, scale_bottom, scale_left, scale_top)
         scale_gradient.setColorAt(0, QColor(0, 180, 255))      # Blue at bottom (0°C)
         scale_gradient.setColorAt(0.667, QColor(0, 255, 180))  # Green at ~200°C
         scale_gradient.setColorAt(1, QColor(255, 180, 0))      # Amber at 300°C
         
+        # Section label, centered over the bars
+        label_center = bars_start + total_bars_width // 2
+        label_width = max(250, int(350 * scale_factor))  # Increased width to prevent cutoff
+        label_height = max(25, int(30 * scale_factor))
+        label_offset = max(35, int(50 * scale_factor))
+        
+        # Bars with their container, caption, value and remove button boxes
+        caption_y_offset = max(12, int(15 * scale_factor))
+        caption_height = max(16, int(20 * scale_factor))
+        temp_y_offset = max(30, int(38 * scale_factor))
+        temp_height = max(18, int(22 * scale_factor))
+        temp_width_extra = max(12, int(15 * scale_factor))
+        remove_btn_size = max(16, int(20 * scale_factor))
+        glow_margin = 2 * max(2, int(3 * scale_factor)) + 2
+        bars = []
+        for i, (bar_id, bar_config) in enumerate(visible_bars):
+            bar_x = bars_start + i * spacing
+            bars.append({
+                "id": bar_id,
+                "config": bar_config,
+                "label": bar_config.get('label', f'B{bar_id}'),
+                "x": bar_x,
+                "container": QRect(int(bar_x), int(scale_top), bar_width, int(scale_height)),
+                "caption": QRect(int(bar_x), scale_bottom + caption_y_offset, bar_width, caption_height),
+                "value": QRect(int(bar_x - temp_width_extra), scale_bottom + temp_y_offset,
+                               bar_width + temp_width_extra * 2, temp_height),
+                "remove": QRect(int(bar_x + bar_width - remove_btn_size), int(scale_top),
+                                remove_btn_size, remove_btn_size),
+            })
+        # Everything one bar paints that changes with its value or hover: bar + glow, readout
+        for bar in bars:
+            bar["dirty"] = bar["container"].adjusted(
+                -glow_margin, -glow_margin, glow_margin, glow_margin).united(bar["value"]).united(bar["remove"])
+        
+        return {
+            "scale_factor": scale_factor,
+            "scale_top": scale_top,
+            "scale_bottom": scale_bottom,
+            "scale_height": scale_height,
+            "scale_left": scale_left,
+            "grid_right": scale_left + gap_between_scale_and_bars + total_bars_width,
+            "bar_width": bar_width,
+            "ticks": ticks,
+            "scale_gradient": scale_gradient,
+            "tick_font": QFont("Inter", max(8, int(10 * scale_factor)), QFont.Medium),
+            "title_font": QFont("Segoe UI", max(10, int(13 * scale_factor)), QFont.Bold),
+            "caption_font": QFont("Inter", max(7, int(9 * scale_factor)), QFont.Medium),
+            "value_font": QFont("JetBrains Mono", max(8, int(10 * scale_factor)), QFont.Bold),
+            "title": QRect(label_center - label_width // 2, scale_top - label_offset, label_width, label_height),
+            "bars": bars,
+        }
+    
+    def relayout(self):
+        """Recompute the paint layout and click areas - on resize, page change and bar configuration change"""
+        self.update_pagination_controls()
+        layout = self.bar_layout = self.compute_bar_layout()
+        self.bar_rects = {bar["id"]: bar["container"] for bar in layout["bars"]}
+        self.remove_buttons = {bar["id"]: bar["remove"] for bar in layout["bars"]}
+        invalidate_dial_layer(self)
+        self.update()
+
+    def update_bars(self, bar_ids):
+        """Repaint only the given bars (value, hover or alarm colour changed)"""
+        region = QRegion()
+        for bar in self.bar_layout["bars"]:
+            if bar["id"] in bar_ids:
+                region = region.united(bar["dirty"])
+        if not region.isEmpty():
+            self.update(region)
+
+    def paint_static_layer(self, painter):
+        """Grid, gradient scale with its ticks and labels, title - everything that does not follow the values"""
+        layout = self.bar_layout
+        scale_factor = layout["scale_factor"]
+        scale_left = layout["scale_left"]
+        scale_top = layout["scale_top"]
+        scale_bottom = layout["scale_bottom"]
+        
+        # ---- Draw horizontal grid lines ----
+        line_width = max(1, int(scale_factor * 1))
+        painter.setPen(QPen(QColor(30, 40, 55, 80), line_width))
+        for _, y, _, _, _ in layout["ticks"]:
+            painter.drawLine(scale_left, y, layout["grid_right"], y)
+
+        # ---- Draw Scale (Left) with gradient ----
         scale_line_width = max(2, int(scale_factor * 3))
-        pen = QPen(scale_gradient, scale_line_width)
+        pen = QPen(layout["scale_gradient"], scale_line_width)
         painter.setPen(pen)
         painter.drawLine(scale_left, scale_top, scale_left, scale_bottom)
 
         # Draw tick marks and labels (every 50°C)
-        font_size = max(8, int(10 * scale_factor))
-        painter.setFont(QFont("Inter", font_size, QFont.Medium))
-        for temp in range(0, 301, 50):
-            y = scale_bottom - (temp / 300) * scale_height
-            
-            # Determine tick color based on temperature
-            if temp < 100:
-                tick_color = QColor(0, 180, 255, 180)
-            elif temp < 200:
-                tick_color = QColor(0, 255, 180, 180)
-            else:
-                tick_color = QColor(255, 180, 0, 180)
-            
+        tick_length_major = max(8, int(10 * scale_factor))
+        tick_length_minor = max(4, int(6 * scale_factor))
+        tick_width_major = max(1, int(2 * scale_factor))
+        tick_width_minor = max(1, int(1 * scale_factor))
+        for text, y, major, tick_color, text_rect in layout["ticks"]:
             # Highlight major ticks (every 100°C)
-            tick_length_major = max(8, int(10 * scale_factor))
-            tick_length_minor = max(4, int(6 * scale_factor))
-            tick_width_major = max(1, int(2 * scale_factor))
-            tick_width_minor = max(1, int(1 * scale_factor))
-            
-            if temp % 100 == 0:
+            if major:
                 painter.setPen(QPen(tick_color, tick_width_major))
-                painter.drawLine(scale_left - tick_length_major, int(y), scale_left + tick_length_major, int(y))
+                painter.drawLine(scale_left - tick_length_major, y, scale_left + tick_length_major, y)
                 painter.setPen(QColor(200, 220, 240))
             else:
                 painter.setPen(QPen(tick_color, tick_width_minor))
-                painter.drawLine(scale_left - tick_length_minor, int(y), scale_left + tick_length_minor, int(y))
+                painter.drawLine(scale_left - tick_length_minor, y, scale_left + tick_length_minor, y)
                 painter.setPen(QColor(150, 170, 190))
-            
-            text_width = max(35, int(42 * scale_factor))
-            text_height = max(16, int(20 * scale_factor))
-            painter.drawText(scale_left - text_width - 8, int(y) - text_height // 2, text_width, text_height, Qt.AlignRight | Qt.AlignVCenter, f"{temp}")
+            draw_static_text(painter, layout["tick_font"], text_rect, text, Qt.AlignRight | Qt.AlignVCenter)
 
         # ---- Draw Section Label ----
-        title_font_size = max(10, int(14 * scale_factor))
-        painter.setFont(QFont("Inter", title_font_size, QFont.Bold))
         painter.setPen(QColor(255, 255, 255))
+        draw_static_text(painter, layout["title_font"], layout["title"], "MAIN BEARING TEMPERATURE")
+
+    @timed_paint
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        layout = self.bar_layout
         
-        # Center label
-        bars_start = scale_left + gap_between_scale_and_bars
-        label_center = bars_start + total_bars_width // 2
-        label_width = max(250, int(350 * scale_factor))  # Increased width to prevent cutoff
-        label_height = max(25, int(30 * scale_factor))
-        label_offset = max(35, int(50 * scale_factor))
-        painter.setFont(QFont("Segoe UI", max(10, int(13 * scale_factor)), QFont.Bold))
-        painter.drawText(label_center - label_width // 2, scale_top - label_offset, label_width, label_height, Qt.AlignCenter, "MAIN BEARING TEMPERATURE")
+        if not layout["bars"]:
+            # No bars to display
+            painter.setPen(QColor(150, 170, 190))
+            message_font = render_resources().font("Inter", 14)
+            draw_static_text(painter, message_font, self.rect(), "No bearing bars configured")
+            return
         
-        # ---- Draw Temperature Bars ----
-        max_bar_height = scale_height
+        scale_factor = layout["scale_factor"]
+        scale_top = layout["scale_top"]
+        scale_bottom = layout["scale_bottom"]
+        bar_width = layout["bar_width"]
+        max_bar_height = layout["scale_height"]
         
-        # Clear bar rects and remove buttons for click detection
-        self.bar_rects = {}
-        self.remove_buttons = {}
-
-        for i, (bar_id, bar_config) in enumerate(visible_bars):
-            bar_x = bars_start + i * spacing
+        # Scale, grid and title come from a pixmap rebuilt by relayout()
+        painter.drawPixmap(0, 0, cached_dial_layer(self, (), self.paint_static_layer))
+        
+        # ---- Draw Temperature Bars (those in the repainted region) ----
+        res = render_resources()
+        dirty = event.region()
+        for bar in layout["bars"]:
+            if not dirty.intersects(bar["dirty"]):
+                continue
+            bar_id = bar["id"]
+            bar_x = bar["x"]
+            container_rect = bar["container"]
             
             temp = self.current_temperatures.get(bar_id, 0)
             actual_temp = temp / 10  # Convert to decimal
             clamped_temp = min(actual_temp, 300)
             bar_height = (clamped_temp / 300) * max_bar_height
             bar_y = scale_bottom - bar_height
-            
-            # Store bar rectangle for click detection
-            self.bar_rects[bar_id] = QRect(int(bar_x), int(scale_top), bar_width, int(max_bar_height))
 
             # Determine color based on 3-color temperature logic
             if actual_temp <= 0:
-                color = QColor(50, 60, 75)
+                rgb = (50, 60, 75)
             elif actual_temp < self.low_limit:
-                color = QColor(255, 200, 0)
+                rgb = (255, 200, 0)
             elif actual_temp <= self.high_limit:
-                color = QColor(0, 255, 180)
+                rgb = (0, 255, 180)
             else:
-                color = QColor(255, 60, 100)
+                rgb = (255, 60, 100)
+            color = res.color(*rgb)
 
             # Draw background container with subtle gradient
-            container_rect = QRect(int(bar_x), int(scale_top), bar_width, int(max_bar_height))
-            bg_gradient = QLinearGradient(bar_x, scale_top, bar_x, scale_bottom)
-            bg_gradient.setColorAt(0, QColor(20, 30, 45, 100))
-            bg_gradient.setColorAt(1, QColor(15, 20, 35, 100))
-            painter.setBrush(bg_gradient)
+            painter.setBrush(res.linear(bar_x, scale_top, bar_x, scale_bottom,
+                                        ((0, (20, 30, 45, 100)), (1, (15, 20, 35, 100)))))
             border_width = max(1, int(1.5 * scale_factor))
-            painter.setPen(QPen(QColor(40, 60, 80), border_width))
+            painter.setPen(res.pen((40, 60, 80), border_width))
             painter.drawRect(container_rect)
 
             # Draw filled bar with gradient
             bar_padding = max(1, int(2 * scale_factor))
             if bar_height > bar_padding:
                 bar_rect = QRectF(bar_x + bar_padding, bar_y + bar_padding, bar_width - bar_padding * 2, bar_height - bar_padding)
+                # The gradient follows the bar top, so only its colours come from the registry
                 bar_gradient = QLinearGradient(bar_x, bar_y, bar_x, scale_bottom)
-                bar_gradient.setColorAt(0, color.lighter(110))
+                bar_gradient.setColorAt(0, res.lighter(color, 110))
                 bar_gradient.setColorAt(1, color)
                 painter.setBrush(bar_gradient)
                 painter.setPen(Qt.NoPen)
@@ -4552,8 +4777,7 @@ class MainBearingTab(QWidget):
                 max_glow = max(2, int(3 * scale_factor))
                 for glow_offset in range(max_glow, 0, -1):
                     glow_alpha = 20 * (max_glow + 1 - glow_offset)
-                    glow_color = QColor(color.red(), color.green(), color.blue(), glow_alpha)
-                    painter.setPen(QPen(glow_color, glow_offset))
+                    painter.setPen(res.pen(rgb + (glow_alpha,), glow_offset))
                     painter.setBrush(Qt.NoBrush)
                     glow_rect = QRectF(bar_x - glow_offset, bar_y - glow_offset, 
                                       bar_width + glow_offset * 2, bar_height + glow_offset * 2)
@@ -4564,46 +4788,35 @@ class MainBearingTab(QWidget):
             if hover_opacity > 0.01:  # Only draw if there's visible hover effect
                 # Create subtle highlight overlay on the container
                 hover_alpha = int(25 * hover_opacity)  # Max 25 alpha for subtle effect
-                hover_color = QColor(100, 150, 255, hover_alpha)  # Soft blue highlight
                 
-                # Draw hover background overlay
-                painter.setBrush(hover_color)
+                # Draw hover background overlay (soft blue highlight)
+                painter.setBrush(res.color(100, 150, 255, hover_alpha))
                 painter.setPen(Qt.NoPen)
                 painter.drawRect(container_rect)
                 
                 # Draw subtle border highlight
                 border_alpha = int(60 * hover_opacity)  # Max 60 alpha for border
-                border_color = QColor(120, 170, 255, border_alpha)  # Slightly brighter blue
                 border_width = max(1, int(1.5 * scale_factor))
-                painter.setPen(QPen(border_color, border_width))
+                # Slightly brighter blue
+                painter.setPen(res.pen((120, 170, 255, border_alpha), border_width))
                 painter.setBrush(Qt.NoBrush)
                 painter.drawRect(container_rect)
 
             # Draw label below bar
-            label = bar_config.get('label', f'B{bar_id}')
-            painter.setPen(QColor(140, 160, 190))
-            label_font_size = max(7, int(9 * scale_factor))
-            painter.setFont(QFont("Inter", label_font_size, QFont.Medium))
-            label_y_offset = max(12, int(15 * scale_factor))
-            label_height = max(16, int(20 * scale_factor))
-            painter.drawText(int(bar_x), scale_bottom + label_y_offset, bar_width, label_height, Qt.AlignCenter, label)
+            painter.setPen(res.color(140, 160, 190))
+            draw_static_text(painter, layout["caption_font"], bar["caption"], bar["label"])
             
             # Draw remove button in developer mode only
             if self.is_developer_mode_active():
-                remove_btn_size = max(16, int(20 * scale_factor))
-                # Position at the sharp top-right corner of the bar
-                remove_btn_x = bar_x + bar_width - remove_btn_size
-                remove_btn_y = scale_top
-                
-                # Store button rect for click detection
-                self.remove_buttons[bar_id] = QRect(int(remove_btn_x), int(remove_btn_y), remove_btn_size, remove_btn_size)
+                # Sharp top-right corner of the bar
+                remove_btn_x, remove_btn_y = bar["remove"].x(), bar["remove"].y()
+                remove_btn_size = bar["remove"].width()
                 
                 # Load and draw the remove image
                 try:
-                    remove_pixmap = QPixmap(resource_path("imgs/remove.png"))
-                    if not remove_pixmap.isNull():
-                        # Scale the image to fit the button size
-                        scaled_pixmap = remove_pixmap.scaled(remove_btn_size, remove_btn_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    # Scaled to fit the button size once, from the icon cache
+                    scaled_pixmap = icon_pixmap("remove.png", remove_btn_size, self.devicePixelRatioF())
+                    if not scaled_pixmap.isNull():
                         
                         # Check if this button is being hovered (for hover effect)
                         hover_opacity = getattr(self, 'remove_button_hover_opacity', {}).get(bar_id, 0.0)
@@ -4611,7 +4824,7 @@ class MainBearingTab(QWidget):
                         # Draw hover background if hovering
                         if hover_opacity > 0.01:
                             hover_alpha = int(100 * hover_opacity)
-                            painter.setBrush(QColor(255, 255, 255, hover_alpha))
+                            painter.setBrush(res.color(255, 255, 255, hover_alpha))
                             painter.setPen(Qt.NoPen)
                             painter.drawRect(int(remove_btn_x), int(remove_btn_y), remove_btn_size, remove_btn_size)
                         
@@ -4646,12 +4859,8 @@ class MainBearingTab(QWidget):
 
             # Draw digital temperature display below label with color matching bar
             painter.setPen(color)
-            temp_font_size = max(8, int(10 * scale_factor))
-            painter.setFont(QFont("JetBrains Mono", temp_font_size, QFont.Bold))
-            temp_y_offset = max(30, int(38 * scale_factor))
-            temp_height = max(18, int(22 * scale_factor))
-            temp_width_extra = max(12, int(15 * scale_factor))
-            painter.drawText(int(bar_x - temp_width_extra), scale_bottom + temp_y_offset, bar_width + temp_width_extra * 2, temp_height, Qt.AlignCenter, f"{actual_temp:.1f}°C")
+            painter.setFont(layout["value_font"])
+            painter.drawText(bar["value"], Qt.AlignCenter, f"{actual_temp:.1f}°C")
 
         painter.end()
     
@@ -4683,6 +4892,7 @@ class MainBearingTab(QWidget):
         # Update hover state if it changed
         if self.hovered_bar != hovered_bar:
             self.hovered_bar = hovered_bar
+            animation_clock().wake(self.animate_bars)
             # Set cursor to pointer when hovering over bars in developer mode
             if self.is_developer_mode_active() and hovered_bar:
                 self.setCursor(Qt.PointingHandCursor)
@@ -4738,19 +4948,103 @@ class GaugePlaceholder(QWidget):
         painter.setBrush(QBrush(QColor(80, 100, 130, 40)))
         painter.drawEllipse(center_x - 4, center_y - 4, 8, 8)
 
-# ---------------- Circular Pressure Gauge Widget ----------------
-class CircularPressureGauge(QWidget):
-    def __init__(self, label, max_value=10, reverse_colors=False, gauge_index=0, parent_window=None):
-        super().__init__()
-        self.label = label
-        self.parent_window = parent_window
-        self.max_value = max_value
-        self.reverse_colors = reverse_colors  # For gauges where low values are dangerous (like oil pressure)
-        self.gauge_index = gauge_index
-        self.current_value = 0.0
-        self.target_value = 0.0
-        self.setMinimumSize(220, 250)
-        self.setCursor(Qt.PointingHandCursor)  # Show clickable cursor
+# ---------------- Dial Static Layer ----------------
+def dial_geometry(width, height):
+    """(scale_factor, center_x, center_y, radius) of a circular gauge; reference size 280x300"""
+    scale_factor = min(width / 280, height / 300)
+    label_space = max(30, int(50 * scale_factor))
+    gauge_size = min(width, height - label_space)
+    center_x = width / 2
+    center_y = (height - label_space) / 2 + max(10, int(15 * scale_factor))
+    radius = gauge_size / 2 - max(10, int(15 * scale_factor))
+    return scale_factor, center_x, center_y, radius
+
+
+def paint_dial_face(painter, width, height, label):
+    """Glow, background, outer ring and the gauge name shared by the circular gauges"""
+    scale_factor, center_x, center_y, radius = dial_geometry(width, height)
+    
+    # Draw subtle outer glow (minimal)
+    glow_layers = max(2, int(3 * scale_factor))
+    for i in range(glow_layers):
+        alpha = 15 - i * 5
+        painter.setPen(QPen(QColor(0, 180, 255, alpha), 1))
+        painter.setBrush(Qt.NoBrush)
+        glow_offset = max(6, int(8 * scale_factor))
+        painter.drawEllipse(QPointF(center_x, center_y), radius + glow_offset + i, radius + glow_offset + i)
+    
+    # Draw main gauge background - clean and simple
+    bg_gradient = QRadialGradient(center_x, center_y, radius)
+    bg_gradient.setColorAt(0, QColor(18, 25, 38))
+    bg_gradient.setColorAt(1, QColor(25, 35, 50))
+    painter.setBrush(bg_gradient)
+    border_width = max(1, int(2 * scale_factor))
+    painter.setPen(QPen(QColor(40, 60, 85), border_width))
+    painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
+    
+    # Draw clean outer ring
+    ring_width = max(1, int(1.5 * scale_factor))
+    ring_inset = max(3, int(5 * scale_factor))
+    painter.setPen(QPen(QColor(50, 75, 105), ring_width))
+    painter.setBrush(Qt.NoBrush)
+    painter.drawEllipse(QPointF(center_x, center_y), radius - ring_inset, radius - ring_inset)
+    
+    # Gauge label at bottom - clean
+    label_font_size = max(10, int(13 * scale_factor))
+    label_font = render_resources().font("Segoe UI", label_font_size, QFont.Medium)
+    painter.setPen(QColor(160, 185, 210))
+    label_y = height - max(28, int(38 * scale_factor))
+    label_height = max(26, int(34 * scale_factor))
+    draw_static_text(painter, label_font, QRectF(5, label_y, width - 10, label_height), label)
+
+
+def cached_dial_layer(widget, key, draw):
+    """The widget's static layers as a QPixmap at its device pixel ratio.
+
+    draw(painter) paints them in widget coordinates. It runs again only when the
+    size, the pixel ratio or `key` changes, or after invalidate_dial_layer().
+    """
+    dpr = widget.devicePixelRatioF()
+    key = (widget.width(), widget.height(), dpr) + tuple(key)
+    if getattr(widget, "_dial_key", None) != key:
+        pixmap = QPixmap(max(1, round(widget.width() * dpr)), max(1, round(widget.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        draw(painter)
+        painter.end()
+        widget._dial_layer = pixmap
+        widget._dial_key = key
+    return widget._dial_layer
+
+
+def dial_value_rect(width, height):
+    """Box around what a circular gauge repaints when its value moves: arc, needle, readout"""
+    scale_factor, center_x, center_y, radius = dial_geometry(width, height)
+    reach = radius - max(8, int(12 * scale_factor)) + max(5, int(8 * scale_factor)) / 2 + 2
+    return QRectF(center_x - reach, center_y - reach, 2 * reach, 2 * reach).toAlignedRect()
+
+
+def invalidate_dial_layer(widget):
+    """Drop a cached static layer (palette/style change)"""
+    widget._dial_key = None
+
+
+# ---------------- Circular Pressure Gauge Widget ----------------
+class CircularPressureGauge(QWidget):
+    def __init__(self, label, max_value=10, reverse_colors=False, gauge_index=0, parent_window=None):
+        super().__init__()
+        self.label = label
+        self.parent_window = parent_window
+        self.max_value = max_value
+        self.reverse_colors = reverse_colors  # For gauges where low values are dangerous (like oil pressure)
+        self.gauge_index = gauge_index
+        self.current_value = 0.0
+        self.target_value = 0.0
+        self.setMinimumSize(220, 250)
+        self.setCursor(Qt.PointingHandCursor)  # Show clickable cursor
         
         # Load configuration from JSON
         self.config = self.load_config()
@@ -4765,16 +5059,14 @@ class CircularPressureGauge(QWidget):
         
         # Modbus client reference (will be set by EnginePressuresTab)
         self.modbus_client = None
+        self.relay_outputs = None
         
         # Alarm state tracking
         self.alarm_active = False
         self.last_alarm_state = None
         self.alarm_start_time = None  # Track when alarm condition first occurred
         
-        # Animation timer
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_value)
-        self.animation_timer.start(16)  # 60 FPS
+        # Needle steps are driven by the shared animation clock while it moves
     
     def load_config(self):
         """Load configuration from modbus_config.json"""
@@ -4823,6 +5115,7 @@ class CircularPressureGauge(QWidget):
                 self.alarm_delay = self.config.get("alarm_delay", 5)
                 self.enable_alarm = self.config.get("enable_alarm", True)
                 self.alarm_start_time = None  # Reset delay timer on config change
+                watch_alarm(self)
                 new_label = self.config.get("label", self.label)
                 if new_label != self.label:
                     self.label = new_label
@@ -4830,26 +5123,33 @@ class CircularPressureGauge(QWidget):
                 self.update()  # Trigger repaint to show new label
                 print(f"{self.label} Configuration updated: Low={self.low_limit} bar, High={self.high_limit} bar, Device={self.relay_device_id}, Coil={self.coil_address}, Delay={self.alarm_delay}s")
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for coil writing"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and the relay output image the alarm coil is driven through"""
         self.modbus_client = client
+        self.relay_outputs = relay_outputs
+        watch_alarm(self)
+    
+    def alarm_step(self):
+        """Check the alarm; True while an alarm condition is still waiting out its delay"""
+        self.check_and_write_alarm()
+        return self.alarm_start_time is not None and not self.last_alarm_state
     
     def check_and_write_alarm(self):
         """Check pressure and write to coil if alarm conditions are met (with delay)"""
-        if not self.enable_alarm or not self.modbus_client:
+        if not self.enable_alarm or not self.modbus_client or not self.relay_outputs:
             return
         
         # Check if pressure is out of range
         alarm_condition_met = False
         alarm_reason = ""
         
-        if self.current_value > 0:  # Only check if we have valid data
-            if self.current_value < self.low_limit:
+        if self.target_value > 0:  # Only check if we have valid data
+            if self.target_value < self.low_limit:
                 alarm_condition_met = True
-                alarm_reason = f"{self.current_value:.1f} bar (LOW, limit={self.low_limit} bar)"
-            elif self.current_value > self.high_limit:
+                alarm_reason = f"{self.target_value:.1f} bar (LOW, limit={self.low_limit} bar)"
+            elif self.target_value > self.high_limit:
                 alarm_condition_met = True
-                alarm_reason = f"{self.current_value:.1f} bar (HIGH, limit={self.high_limit} bar)"
+                alarm_reason = f"{self.target_value:.1f} bar (HIGH, limit={self.high_limit} bar)"
         
         # Alarm delay logic
         if alarm_condition_met:
@@ -4875,44 +5175,40 @@ class CircularPressureGauge(QWidget):
         
         # Only write coil if state has changed
         if alarm_condition_met != self.last_alarm_state:
-            try:
-                result = self.modbus_client.write_coil(
-                    address=self.coil_address,
-                    value=alarm_condition_met,
-                    device_id=self.relay_device_id
-                )
-                if result and not result.isError():
-                    status = "ON" if alarm_condition_met else "OFF"
-                    print(f"\n{'='*60}")
-                    print(f"🚨 {self.label.upper()} ALARM: COIL WRITE SUCCESSFUL")
-                    print(f"{'='*60}")
-                    print(f"  Device ID: {self.relay_device_id}")
-                    print(f"  Coil Address: {self.coil_address}")
-                    print(f"  Coil Value: {status}")
-                    print(f"  Delay: {self.alarm_delay}s (elapsed)")
-                    if alarm_condition_met:
-                        print(f"  Alarm Reason: {alarm_reason}")
-                    print(f"{'='*60}\n")
-                    self.last_alarm_state = alarm_condition_met
-                    self.alarm_active = alarm_condition_met
-                    
-                    # Record alarm in history
-                    if alarm_condition_met:
-                        alarm_type = "LOW" if self.current_value < self.low_limit else "HIGH"
-                        limit = self.low_limit if alarm_type == "LOW" else self.high_limit
-                        add_alarm_to_history(self.label, "Pressure", alarm_type, 
-                                           round(self.current_value, 2), limit, "bar")
-                    else:
-                        clear_alarm_from_history(self.label, "")
-                else:
-                    print(f"⚠️ Failed to write coil to Device {self.relay_device_id}, Address {self.coil_address} (Device may not be connected): {result}")
-            except Exception as e:
-                print(f"⚠️ {self.label}: Cannot write alarm coil (Relay device not connected or communication error): {e}")
+            # Relay output image - the poll cycle writes it to the device and verifies it
+            self.relay_outputs.set(self.relay_device_id, self.coil_address, alarm_condition_met, self)
+            status = "ON" if alarm_condition_met else "OFF"
+            print(f"\n{'='*60}")
+            print(f"🚨 {self.label.upper()} ALARM: RELAY OUTPUT SET")
+            print(f"{'='*60}")
+            print(f"  Device ID: {self.relay_device_id}")
+            print(f"  Coil Address: {self.coil_address}")
+            print(f"  Coil Value: {status}")
+            print(f"  Delay: {self.alarm_delay}s (elapsed)")
+            if alarm_condition_met:
+                print(f"  Alarm Reason: {alarm_reason}")
+            print(f"{'='*60}\n")
+            self.last_alarm_state = alarm_condition_met
+            self.alarm_active = alarm_condition_met
+            
+            # Record alarm in history
+            if alarm_condition_met:
+                alarm_type = "LOW" if self.target_value < self.low_limit else "HIGH"
+                limit = self.low_limit if alarm_type == "LOW" else self.high_limit
+                add_alarm_to_history(self.label, "Pressure", alarm_type, 
+                                   round(self.target_value, 2), limit, "bar")
+            else:
+                clear_alarm_from_history(self.label, "")
         else:
             self.alarm_active = alarm_condition_met
     
     def set_value(self, value):
         self.target_value = max(0, min(value, self.max_value))
+        watch_alarm(self)
+        if self.isVisible():
+            animation_clock().wake(self.animate_value)
+        else:
+            self.current_value = self.target_value
     
     def set_thresholds(self, thresholds):
         """Update pressure thresholds for color logic"""
@@ -4920,134 +5216,30 @@ class CircularPressureGauge(QWidget):
     
     def animate_value(self):
         # Smooth easing with realistic damping
-        easing_factor = 0.12  # Faster response for gauges
+        easing_factor = animation_clock().ease(0.12)  # Faster response for gauges
         threshold = 0.005
         
         distance = self.target_value - self.current_value
         
-        if abs(distance) < threshold:
+        # Off screen the needle jumps to its value and is drawn there when shown
+        if abs(distance) < threshold or not self.isVisible():
             self.current_value = self.target_value
-        else:
-            # Exponential easing for smooth, natural movement
-            self.current_value += distance * easing_factor
-            self.update()  # Trigger repaint for smooth animation
-        
-        # Check alarm conditions and write coil
-        self.check_and_write_alarm()
+            return False
+        # Exponential easing for smooth, natural movement
+        self.current_value += distance * easing_factor
+        self.update(dial_value_rect(self.width(), self.height()))  # Only the dial's moving parts
+        return True
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.TextAntialiasing)
-        
+    def paint_static_layer(self, painter):
+        """Dial face, tick marks with their values and the unit - everything that does not follow the value"""
         width = self.width()
         height = self.height()
-        
-        # Calculate responsive dimensions
-        scale_factor = min(width / 280, height / 300)  # Base reference: 280x300
-        
-        # Calculate gauge dimensions
-        label_space = max(30, int(50 * scale_factor))
-        gauge_size = min(width, height - label_space)
-        center_x = width / 2
-        center_y = (height - label_space) / 2 + max(10, int(15 * scale_factor))
-        radius = gauge_size / 2 - max(10, int(15 * scale_factor))
-        
-        # Draw subtle outer glow (minimal)
-        glow_layers = max(2, int(3 * scale_factor))
-        for i in range(glow_layers):
-            alpha = 15 - i * 5
-            painter.setPen(QPen(QColor(0, 180, 255, alpha), 1))
-            painter.setBrush(Qt.NoBrush)
-            glow_offset = max(6, int(8 * scale_factor))
-            painter.drawEllipse(QPointF(center_x, center_y), radius + glow_offset + i, radius + glow_offset + i)
-        
-        # Draw main gauge background - clean and simple
-        bg_gradient = QRadialGradient(center_x, center_y, radius)
-        bg_gradient.setColorAt(0, QColor(18, 25, 38))
-        bg_gradient.setColorAt(1, QColor(25, 35, 50))
-        painter.setBrush(bg_gradient)
-        border_width = max(1, int(2 * scale_factor))
-        painter.setPen(QPen(QColor(40, 60, 85), border_width))
-        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
-        
-        # Draw clean outer ring
-        ring_width = max(1, int(1.5 * scale_factor))
-        ring_inset = max(3, int(5 * scale_factor))
-        painter.setPen(QPen(QColor(50, 75, 105), ring_width))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(QPointF(center_x, center_y), radius - ring_inset, radius - ring_inset)
-        
-        # Calculate value ratio for coloring
-        value_ratio = self.current_value / self.max_value
-        
-        # Determine color based on 3-color logic
-        # Special logic for gauges 0, 1, and 5: Red=Low (critical), Green=Normal, Yellow=High (warning)
-        # Other gauges: Yellow=Low (warning), Green=Normal, Red=High (critical)
-        if self.current_value <= 0:
-            # No data - use dark gray with subtle blue tint
-            arc_color = QColor(50, 60, 75)
-            needle_color = QColor(50, 60, 75)
-        elif self.gauge_index in [0, 1, 5]:
-            # Fuel Oil (0), Lube Oil (1), Starting Air (5) - Low pressure is CRITICAL (RED)
-            if self.current_value < self.low_limit:
-                # Too low - CRITICAL RED (low pressure is dangerous!)
-                arc_color = QColor(255, 60, 100)  # #FF3C64 - Critical red
-                needle_color = QColor(255, 60, 100)
-            elif self.current_value <= self.high_limit:
-                # Normal - Tech Green
-                arc_color = QColor(0, 255, 180)  # #00FFB4 - Vibrant tech green
-                needle_color = QColor(0, 255, 180)
-            else:
-                # Too high - Warning Yellow
-                arc_color = QColor(255, 200, 0)  # #FFC800 - Warning yellow
-                needle_color = QColor(255, 200, 0)
-        else:
-            # Standard gauges - Low is warning, High is critical
-            if self.current_value < self.low_limit:
-                # Too low - Warning Yellow
-                arc_color = QColor(255, 200, 0)  # #FFC800 - Warning yellow/gold
-                needle_color = QColor(255, 200, 0)
-            elif self.current_value <= self.high_limit:
-                # Normal - Tech Green
-                arc_color = QColor(0, 255, 180)  # #00FFB4 - Vibrant tech green
-                needle_color = QColor(0, 255, 180)
-            else:
-                # Too high - Critical Red
-                arc_color = QColor(255, 60, 100)  # #FF3C64 - Hot red with energy
-                needle_color = QColor(255, 60, 100)
-        
-        # Draw progress arc (clean single arc)
-        start_angle = 225 * 16
-        span_per_unit = -270 * 16 / self.max_value
-        current_span = int(span_per_unit * self.current_value)
-        
-        arc_inset = max(8, int(12 * scale_factor))
-        arc_width_bg = max(4, int(6 * scale_factor))
-        arc_width_dark = max(5, int(8 * scale_factor))
-        arc_width_main = max(3, int(5 * scale_factor))
-        
-        if self.current_value > 0:
-            # Subtle background arc
-            painter.setPen(QPen(QColor(30, 45, 65), arc_width_bg))
-            painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
-                           int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
-                           start_angle, -270 * 16)
-            
-            # Active arc with subtle glow
-            painter.setPen(QPen(arc_color.darker(120), arc_width_dark))
-            painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
-                           int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
-                           start_angle, current_span)
-            
-            painter.setPen(QPen(arc_color, arc_width_main))
-            painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
-                           int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
-                           start_angle, current_span)
+        paint_dial_face(painter, width, height, self.label)
+        scale_factor, center_x, center_y, radius = dial_geometry(width, height)
         
         # Draw tick marks - dynamic based on max_value
         tick_font_size = max(11, int(14 * scale_factor))
-        painter.setFont(QFont("Segoe UI", tick_font_size, QFont.Normal))
+        tick_font = render_resources().font("Segoe UI", tick_font_size, QFont.Normal)
         
         # Calculate appropriate tick interval based on max_value and gauge type
         def get_tick_interval(max_val, gauge_idx):
@@ -5114,8 +5306,96 @@ class CircularPressureGauge(QWidget):
             else:
                 label_text = f"{tick_value:.1f}"
             
-            painter.drawText(int(label_x - label_size // 2), int(label_y - label_height // 2), 
-                           label_size, label_height, Qt.AlignCenter, label_text)
+            draw_static_text(painter, tick_font, QRectF(int(label_x - label_size // 2), int(label_y - label_height // 2),
+                                                        label_size, label_height), label_text)
+        
+        # Unit label
+        unit_font_size = max(10, int(13 * scale_factor))  # Increased from 7/9 to 10/13
+        unit_font = render_resources().font("Segoe UI", unit_font_size, QFont.Normal)
+        painter.setPen(QColor(120, 150, 180))
+        unit_y_offset = max(50, int(65 * scale_factor))  # Adjusted offset
+        unit_width = max(55, int(70 * scale_factor))  # Increased width
+        unit_height = max(18, int(24 * scale_factor))  # Increased height
+        draw_static_text(painter, unit_font, QRectF(int(center_x - unit_width // 2), int(center_y + unit_y_offset), unit_width, unit_height), "bar")
+    
+    def changeEvent(self, event):
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange, QEvent.FontChange):
+            invalidate_dial_layer(self)
+        super().changeEvent(event)
+    
+    @timed_paint
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        
+        # Static layers come from a pixmap rebuilt only on resize or a range/limit/label change
+        painter.drawPixmap(0, 0, cached_dial_layer(
+            self, (self.max_value, self.low_limit, self.high_limit, self.label), self.paint_static_layer))
+        scale_factor, center_x, center_y, radius = dial_geometry(self.width(), self.height())
+        res = render_resources()
+        
+        # Calculate value ratio for coloring
+        value_ratio = self.current_value / self.max_value
+        
+        # Determine color based on 3-color logic
+        # Special logic for gauges 0, 1, and 5: Red=Low (critical), Green=Normal, Yellow=High (warning)
+        # Other gauges: Yellow=Low (warning), Green=Normal, Red=High (critical)
+        if self.current_value <= 0:
+            # No data - use dark gray with subtle blue tint
+            rgb = (50, 60, 75)
+        elif self.gauge_index in [0, 1, 5]:
+            # Fuel Oil (0), Lube Oil (1), Starting Air (5) - Low pressure is CRITICAL (RED)
+            if self.current_value < self.low_limit:
+                # Too low - CRITICAL RED (low pressure is dangerous!)
+                rgb = (255, 60, 100)  # #FF3C64 - Critical red
+            elif self.current_value <= self.high_limit:
+                # Normal - Tech Green
+                rgb = (0, 255, 180)  # #00FFB4 - Vibrant tech green
+            else:
+                # Too high - Warning Yellow
+                rgb = (255, 200, 0)  # #FFC800 - Warning yellow
+        else:
+            # Standard gauges - Low is warning, High is critical
+            if self.current_value < self.low_limit:
+                # Too low - Warning Yellow
+                rgb = (255, 200, 0)  # #FFC800 - Warning yellow/gold
+            elif self.current_value <= self.high_limit:
+                # Normal - Tech Green
+                rgb = (0, 255, 180)  # #00FFB4 - Vibrant tech green
+            else:
+                # Too high - Critical Red
+                rgb = (255, 60, 100)  # #FF3C64 - Hot red with energy
+        
+        arc_color = needle_color = res.color(*rgb)
+        
+        # Draw progress arc (clean single arc)
+        start_angle = 225 * 16
+        span_per_unit = -270 * 16 / self.max_value
+        current_span = int(span_per_unit * self.current_value)
+        
+        arc_inset = max(8, int(12 * scale_factor))
+        arc_width_bg = max(4, int(6 * scale_factor))
+        arc_width_dark = max(5, int(8 * scale_factor))
+        arc_width_main = max(3, int(5 * scale_factor))
+        
+        if self.current_value > 0:
+            # Subtle background arc
+            painter.setPen(res.pen((30, 45, 65), arc_width_bg))
+            painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
+                           int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
+                           start_angle, -270 * 16)
+            
+            # Active arc with subtle glow
+            painter.setPen(res.pen(res.darker(arc_color, 120), arc_width_dark))
+            painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
+                           int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
+                           start_angle, current_span)
+            
+            painter.setPen(res.pen(rgb, arc_width_main))
+            painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
+                           int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
+                           start_angle, current_span)
         
         # Calculate needle angle
         needle_angle_deg = 225 - (270 * value_ratio)
@@ -5131,12 +5411,12 @@ class CircularPressureGauge(QWidget):
         needle_glow_layers = max(3, int(4 * scale_factor))
         for glow_size in range(needle_glow_layers, 0, -1):
             glow_alpha = 20 + (needle_glow_layers - glow_size) * 15
-            painter.setPen(QPen(QColor(needle_color.red(), needle_color.green(), needle_color.blue(), glow_alpha), glow_size))
+            painter.setPen(res.pen(rgb + (glow_alpha,), glow_size))
             painter.drawLine(int(center_x), int(center_y), int(needle_end_x), int(needle_end_y))
         
         # Main needle
         needle_width = max(1.5, int(2.5 * scale_factor))
-        painter.setPen(QPen(needle_color, needle_width))
+        painter.setPen(res.pen(rgb, needle_width))
         painter.drawLine(int(center_x), int(center_y), int(needle_end_x), int(needle_end_y))
         
         # Center hub - clean and simple
@@ -5144,8 +5424,8 @@ class CircularPressureGauge(QWidget):
         hub_inner_radius = max(2, int(3 * scale_factor))
         hub_border_width = max(1, int(2 * scale_factor))
         
-        painter.setBrush(QColor(20, 30, 45))
-        painter.setPen(QPen(needle_color, hub_border_width))
+        painter.setBrush(res.color(20, 30, 45))
+        painter.setPen(res.pen(rgb, hub_border_width))
         painter.drawEllipse(QPointF(center_x, center_y), hub_outer_radius, hub_outer_radius)
         
         painter.setBrush(needle_color)
@@ -5154,8 +5434,8 @@ class CircularPressureGauge(QWidget):
         
         # Digital value display - clean typography
         value_font_size = max(18, int(24 * scale_factor))  # Increased from 12/16 to 18/24
-        painter.setFont(QFont("Segoe UI", value_font_size, QFont.Bold))  # Changed to Bold
-        painter.setPen(QColor(220, 235, 250))
+        painter.setFont(res.font("Segoe UI", value_font_size, QFont.Bold))  # Changed to Bold
+        painter.setPen(res.color(220, 235, 250))
         # Show 2 decimal places for 5 bar gauge (index 7), 1 decimal for others
         if self.gauge_index == 7 and self.max_value == 5:
             value_text = f"{self.current_value:.2f}"
@@ -5166,23 +5446,6 @@ class CircularPressureGauge(QWidget):
         value_height = max(28, int(35 * scale_factor))  # Increased height
         painter.drawText(int(center_x - value_width // 2), int(center_y + value_y_offset), value_width, value_height, Qt.AlignCenter, value_text)
         
-        # Unit label
-        unit_font_size = max(10, int(13 * scale_factor))  # Increased from 7/9 to 10/13
-        painter.setFont(QFont("Segoe UI", unit_font_size, QFont.Normal))
-        painter.setPen(QColor(120, 150, 180))
-        unit_y_offset = max(50, int(65 * scale_factor))  # Adjusted offset
-        unit_width = max(55, int(70 * scale_factor))  # Increased width
-        unit_height = max(18, int(24 * scale_factor))  # Increased height
-        painter.drawText(int(center_x - unit_width // 2), int(center_y + unit_y_offset), unit_width, unit_height, Qt.AlignCenter, "bar")
-        
-        # Gauge label at bottom - clean
-        label_font_size = max(10, int(13 * scale_factor))  # Increased from 7/9 to 10/13
-        painter.setFont(QFont("Segoe UI", label_font_size, QFont.Medium))  # Changed to Medium weight
-        painter.setPen(QColor(160, 185, 210))
-        label_y = height - max(28, int(38 * scale_factor))  # Adjusted offset
-        label_height = max(26, int(34 * scale_factor))  # Increased height
-        painter.drawText(5, label_y, width - 10, label_height, Qt.AlignCenter, self.label)
-        
         painter.end()
 
 
@@ -5210,16 +5473,14 @@ class CircularTemperatureGauge(QWidget):
         
         # Modbus client reference (will be set by EngineTemperaturesTab)
         self.modbus_client = None
+        self.relay_outputs = None
         
         # Alarm state tracking
         self.alarm_active = False
         self.last_alarm_state = None
         self.alarm_start_time = None  # Track when alarm condition first occurred
         
-        # Animation timer for smooth value transitions
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_value)
-        self.animation_timer.start(16)  # 60 FPS
+        # Value transitions are driven by the shared animation clock while it moves
         
         # Default thresholds (can be overridden)
         self.thresholds = {"warning": self.low_limit, "critical": self.high_limit}
@@ -5227,6 +5488,11 @@ class CircularTemperatureGauge(QWidget):
     def set_value(self, value):
         """Set target temperature value"""
         self.target_value = max(0, min(self.max_value, value))
+        watch_alarm(self)
+        if self.isVisible():
+            animation_clock().wake(self.animate_value)
+        else:
+            self.current_value = self.target_value
     
     def set_thresholds(self, thresholds):
         """Update temperature thresholds for color logic"""
@@ -5234,19 +5500,17 @@ class CircularTemperatureGauge(QWidget):
     
     def animate_value(self):
         """Smooth animation towards target value"""
-        easing_factor = 0.08
+        easing_factor = animation_clock().ease(0.08)
         threshold = 0.1
         
         distance = self.target_value - self.current_value
         
-        if abs(distance) < threshold:
+        if abs(distance) < threshold or not self.isVisible():
             self.current_value = self.target_value
-        else:
-            self.current_value += distance * easing_factor
-            self.update()
-        
-        # Check and write alarm state
-        self.check_and_write_alarm()
+            return False
+        self.current_value += distance * easing_factor
+        self.update(dial_value_rect(self.width(), self.height()))
+        return True
     
     def get_color_for_value(self, value):
         """Get color based on temperature value and thresholds"""
@@ -5259,65 +5523,43 @@ class CircularTemperatureGauge(QWidget):
         # Green = Normal (between low_limit and high_limit)
         # Red = Too Hot (above high_limit)
         
+        res = render_resources()
         if value <= 0:
             # No data - Dark gray
-            return QColor(50, 60, 75)
+            return res.color(50, 60, 75)
         elif value < low_limit:
             # Too Cold - Warning Yellow
-            return QColor(255, 200, 0)  # #FFC800 - Bright warning yellow
+            return res.color(255, 200, 0)  # #FFC800 - Bright warning yellow
         elif value <= high_limit:
             # Normal Range - Tech Green
-            return QColor(0, 255, 180)  # #00FFB4 - Vibrant tech green
+            return res.color(0, 255, 180)  # #00FFB4 - Vibrant tech green
         else:
             # Too Hot - Critical Red
-            return QColor(255, 60, 100)  # #FF3C64 - Hot red with energy
+            return res.color(255, 60, 100)  # #FF3C64 - Hot red with energy
+    
+    def changeEvent(self, event):
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange, QEvent.FontChange):
+            invalidate_dial_layer(self)
+        super().changeEvent(event)
     
+    def paint_static_layer(self, painter):
+        """Dial face and label - everything that does not follow the value"""
+        paint_dial_face(painter, self.width(), self.height(), self.label)
+    
+    @timed_paint
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.TextAntialiasing)
         
-        width = self.width()
-        height = self.height()
-        
-        # Calculate responsive dimensions (matching pressure gauge)
-        scale_factor = min(width / 280, height / 300)  # Base reference: 280x300
-        
-        # Calculate gauge dimensions
-        label_space = max(30, int(50 * scale_factor))
-        gauge_size = min(width, height - label_space)
-        center_x = width / 2
-        center_y = (height - label_space) / 2 + max(10, int(15 * scale_factor))
-        radius = gauge_size / 2 - max(10, int(15 * scale_factor))
+        # Static layers come from a pixmap rebuilt only on resize or a range/label change
+        painter.drawPixmap(0, 0, cached_dial_layer(self, (self.max_value, self.label), self.paint_static_layer))
+        scale_factor, center_x, center_y, radius = dial_geometry(self.width(), self.height())
         
         # Get color based on current temperature
+        res = render_resources()
         gauge_color = self.get_color_for_value(self.current_value)
         
-        # Draw subtle outer glow (minimal) - matching pressure gauge
-        glow_layers = max(2, int(3 * scale_factor))
-        for i in range(glow_layers):
-            alpha = 15 - i * 5
-            painter.setPen(QPen(QColor(0, 180, 255, alpha), 1))
-            painter.setBrush(Qt.NoBrush)
-            glow_offset = max(6, int(8 * scale_factor))
-            painter.drawEllipse(QPointF(center_x, center_y), radius + glow_offset + i, radius + glow_offset + i)
-        
-        # Draw main gauge background - clean and simple (matching pressure gauge)
-        bg_gradient = QRadialGradient(center_x, center_y, radius)
-        bg_gradient.setColorAt(0, QColor(18, 25, 38))
-        bg_gradient.setColorAt(1, QColor(25, 35, 50))
-        painter.setBrush(bg_gradient)
-        border_width = max(1, int(2 * scale_factor))
-        painter.setPen(QPen(QColor(40, 60, 85), border_width))
-        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
-        
-        # Draw clean outer ring (matching pressure gauge)
-        ring_width = max(1, int(1.5 * scale_factor))
-        ring_inset = max(3, int(5 * scale_factor))
-        painter.setPen(QPen(QColor(50, 75, 105), ring_width))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(QPointF(center_x, center_y), radius - ring_inset, radius - ring_inset)
-        
         # Calculate value ratio for coloring
         value_ratio = self.current_value / self.max_value
         
@@ -5333,39 +5575,31 @@ class CircularTemperatureGauge(QWidget):
         
         if self.current_value > 0:
             # Subtle background arc
-            painter.setPen(QPen(QColor(30, 45, 65), arc_width_bg))
+            painter.setPen(res.pen((30, 45, 65), arc_width_bg))
             painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
                            int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
                            start_angle, -270 * 16)
             
             # Active arc with subtle glow
-            painter.setPen(QPen(gauge_color.darker(120), arc_width_dark))
+            painter.setPen(res.pen(res.darker(gauge_color, 120), arc_width_dark))
             painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
                            int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
                            start_angle, current_span)
             
-            painter.setPen(QPen(gauge_color, arc_width_main))
+            painter.setPen(res.pen(gauge_color, arc_width_main))
             painter.drawArc(int(center_x - radius + arc_inset), int(center_y - radius + arc_inset),
                            int((radius - arc_inset) * 2), int((radius - arc_inset) * 2),
                            start_angle, current_span)
         
         # Digital temperature value display with °C in center
         value_font_size = max(20, int(26 * scale_factor))  # Slightly decreased for better proportion
-        painter.setFont(QFont("Segoe UI", value_font_size, QFont.Bold))
-        painter.setPen(QColor(220, 235, 250))
+        painter.setFont(res.font("Segoe UI", value_font_size, QFont.Bold))
+        painter.setPen(res.color(220, 235, 250))
         temp_text = f"{self.current_value:.0f}°C"
         value_width = max(110, int(130 * scale_factor))
         value_height = max(30, int(36 * scale_factor))
         painter.drawText(int(center_x - value_width // 2), int(center_y - value_height // 2), value_width, value_height, Qt.AlignCenter, temp_text)
         
-        # Gauge label at bottom - clean (matching pressure gauge)
-        label_font_size = max(10, int(13 * scale_factor))
-        painter.setFont(QFont("Segoe UI", label_font_size, QFont.Medium))
-        painter.setPen(QColor(160, 185, 210))
-        label_y = height - max(28, int(38 * scale_factor))
-        label_height = max(26, int(34 * scale_factor))
-        painter.drawText(5, label_y, width - 10, label_height, Qt.AlignCenter, self.label)
-        
         painter.end()
     
     def load_config(self):
@@ -5410,6 +5644,7 @@ class CircularTemperatureGauge(QWidget):
                 self.alarm_delay = self.config.get("alarm_delay", 5)
                 self.enable_alarm = self.config.get("enable_alarm", True)
                 self.alarm_start_time = None  # Reset delay timer on config change
+                watch_alarm(self)
                 # Update thresholds
                 self.thresholds = {"warning": self.low_limit, "critical": self.high_limit}
                 # Update label if it was changed
@@ -5420,25 +5655,32 @@ class CircularTemperatureGauge(QWidget):
                 self.update()  # Trigger repaint to show new label
                 print(f"{self.label} Configuration updated: Low={self.low_limit}°C, High={self.high_limit}°C, Device={self.relay_device_id}, Coil={self.coil_address}, Delay={self.alarm_delay}s")
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for coil writing"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and the relay output image the alarm coil is driven through"""
         self.modbus_client = client
+        self.relay_outputs = relay_outputs
+        watch_alarm(self)
+    
+    def alarm_step(self):
+        """Check the alarm; True while an alarm condition is still waiting out its delay"""
+        self.check_and_write_alarm()
+        return self.alarm_start_time is not None and not self.last_alarm_state
     
     def check_and_write_alarm(self):
         """Check temperature and write to coil if alarm conditions are met (with delay)"""
-        if not self.enable_alarm or not self.modbus_client:
+        if not self.enable_alarm or not self.modbus_client or not self.relay_outputs:
             return
         
         # Determine if alarm condition is met
         alarm_condition_met = False
         alarm_reason = ""
-        if self.current_value > 0:  # Only check if we have valid data
-            if self.current_value < self.low_limit:
+        if self.target_value > 0:  # Only check if we have valid data
+            if self.target_value < self.low_limit:
                 alarm_condition_met = True
-                alarm_reason = f"{self.current_value:.1f}°C (LOW, limit={self.low_limit}°C)"
-            elif self.current_value > self.high_limit:
+                alarm_reason = f"{self.target_value:.1f}°C (LOW, limit={self.low_limit}°C)"
+            elif self.target_value > self.high_limit:
                 alarm_condition_met = True
-                alarm_reason = f"{self.current_value:.1f}°C (HIGH, limit={self.high_limit}°C)"
+                alarm_reason = f"{self.target_value:.1f}°C (HIGH, limit={self.high_limit}°C)"
         
         # Alarm delay logic
         if alarm_condition_met:
@@ -5464,38 +5706,29 @@ class CircularTemperatureGauge(QWidget):
         
         # Only write if state changed
         if alarm_condition_met != self.last_alarm_state:
-            try:
-                result = self.modbus_client.write_coil(
-                    address=self.coil_address,
-                    value=alarm_condition_met,
-                    device_id=self.relay_device_id
-                )
-                if result and not result.isError():
-                    self.last_alarm_state = alarm_condition_met
-                    self.alarm_active = alarm_condition_met
-                    status = "ON" if alarm_condition_met else "OFF"
-                    print(f"\n{'='*60}")
-                    print(f"🚨 {self.label.upper()} ALARM: {status}")
-                    print(f"{'='*60}")
-                    print(f"  Device ID: {self.relay_device_id}")
-                    print(f"  Coil Address: {self.coil_address}")
-                    print(f"  Delay: {self.alarm_delay}s (elapsed)")
-                    if alarm_condition_met:
-                        print(f"  Alarm Reason: {alarm_reason}")
-                    print(f"{'='*60}\n")
-                    
-                    # Record alarm in history
-                    if alarm_condition_met:
-                        alarm_type = "LOW" if self.current_value < self.low_limit else "HIGH"
-                        limit = self.low_limit if alarm_type == "LOW" else self.high_limit
-                        add_alarm_to_history(self.label, "Temperature", alarm_type, 
-                                           round(self.current_value, 1), limit, "°C")
-                    else:
-                        clear_alarm_from_history(self.label, "")
-                else:
-                    print(f"⚠️ Failed to write coil for {self.label} (Device may not be connected): {result}")
-            except Exception as e:
-                print(f"⚠️ {self.label}: Cannot write alarm coil (Relay device not connected or communication error): {e}")
+            # Relay output image - the poll cycle writes it to the device and verifies it
+            self.relay_outputs.set(self.relay_device_id, self.coil_address, alarm_condition_met, self)
+            self.last_alarm_state = alarm_condition_met
+            self.alarm_active = alarm_condition_met
+            status = "ON" if alarm_condition_met else "OFF"
+            print(f"\n{'='*60}")
+            print(f"🚨 {self.label.upper()} ALARM: {status}")
+            print(f"{'='*60}")
+            print(f"  Device ID: {self.relay_device_id}")
+            print(f"  Coil Address: {self.coil_address}")
+            print(f"  Delay: {self.alarm_delay}s (elapsed)")
+            if alarm_condition_met:
+                print(f"  Alarm Reason: {alarm_reason}")
+            print(f"{'='*60}\n")
+            
+            # Record alarm in history
+            if alarm_condition_met:
+                alarm_type = "LOW" if self.target_value < self.low_limit else "HIGH"
+                limit = self.low_limit if alarm_type == "LOW" else self.high_limit
+                add_alarm_to_history(self.label, "Temperature", alarm_type, 
+                                   round(self.target_value, 1), limit, "°C")
+            else:
+                clear_alarm_from_history(self.label, "")
 
 
 # ---------------- Cylinder Head Bar Configuration Dialog ----------------
@@ -5790,6 +6023,15 @@ class CylinderHeadBarConfigDialog(QDialog):
             "device_id": self.device_id_spin.value(),
             "section": self.section_combo.currentText()
         }
+    
+    def accept(self):
+        """Check the bar's register against the rest of the configuration before closing"""
+        bars = dict(getattr(self.parent(), "bars_config", None) or {})
+        bars[str(self.bar_index)] = self.get_config()
+        config_data = load_encrypted_config("modbus_config.dat") or {}
+        config_data["CylinderHeadBars"] = bars
+        if confirm_address_conflicts(self, config_data, f"CylinderHeadBars.{self.bar_index}"):
+            super().accept()
 
 
 # ---------------- Main Bearing Bar Configuration Dialog ----------------
@@ -6045,6 +6287,15 @@ class MainBearingBarConfigDialog(QDialog):
             "address": self.address_spin.value(),
             "device_id": self.device_id_spin.value()
         }
+    
+    def accept(self):
+        """Check the bar's register against the rest of the configuration before closing"""
+        bars = dict(getattr(self.parent(), "bars_config", None) or {})
+        bars[str(self.bar_index)] = self.get_config()
+        config_data = load_encrypted_config("modbus_config.dat") or {}
+        config_data["MainBearingBars"] = bars
+        if confirm_address_conflicts(self, config_data, f"MainBearingBars.{self.bar_index}"):
+            super().accept()
 
 
 # ---------------- Gauge Visibility Settings Dialog ----------------
@@ -6439,10 +6690,10 @@ class EnginePressuresTab(QWidget):
         self.row1_layout.setSpacing(spacing)
         self.row2_layout.setSpacing(spacing)
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for all pressure gauges"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and relay output image for all pressure gauges"""
         for gauge in self.gauges:
-            gauge.set_modbus_client(client)
+            gauge.set_modbus_client(client, relay_outputs)
     
     def update_pressures(self, values, is_test_mode=False):
         """Update pressure values from Modbus data or test mode"""
@@ -8035,11 +8286,11 @@ class EngineTemperaturesTab(QWidget):
             for gauge in section_gauges:
                 gauge.set_thresholds(thresholds)
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for all gauges"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and relay output image for all gauges"""
         for section_gauges in self.temp_gauges:
             for gauge in section_gauges:
-                gauge.set_modbus_client(client)
+                gauge.set_modbus_client(client, relay_outputs)
     
     def show_settings_dialog(self):
         """Show the gauge visibility settings dialog"""
@@ -8155,6 +8406,25 @@ class EngineTemperaturesTab(QWidget):
         return False
 
 
+# ---------------- Electrical Display Frame ----------------
+def paint_display_frame(painter, width, height, color):
+    """Container and status-coloured accent border shared by the electrical value displays"""
+    res = render_resources()
+    painter.setBrush(res.linear(0, 0, 0, height, ((0, (20, 25, 35)), (1, (15, 18, 25)))))
+    painter.setPen(res.pen((40, 50, 65), 2))
+    painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
+
+    def accent_pen():
+        accent_gradient = QLinearGradient(0, 0, width, 0)
+        accent_gradient.setColorAt(0, color.darker(150))
+        accent_gradient.setColorAt(0.5, color)
+        accent_gradient.setColorAt(1, color.darker(150))
+        return QPen(accent_gradient, 3)
+    painter.setPen(res.get(("display-accent", width, color.rgba()), accent_pen))
+    painter.setBrush(Qt.NoBrush)
+    painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
+
+
 # ---------------- Modern Voltage Display Widget ----------------
 class ModernVoltageDisplay(QWidget):
     def __init__(self, label, phase_from, phase_to, max_value=500):
@@ -8168,41 +8438,43 @@ class ModernVoltageDisplay(QWidget):
         self.setMinimumSize(280, 120)
         self.setMaximumSize(320, 140)
         
-        # Animation timer
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_value)
-        self.animation_timer.start(16)  # 60 FPS
+        # Value transitions are driven by the shared animation clock while it moves
         
         # Default thresholds for voltage (typically 380-420V for 3-phase)
         self.thresholds = {"low": 350, "nominal_low": 380, "nominal_high": 420, "high": 450}
     
     def set_value(self, value):
         self.target_value = max(0, min(value, self.max_value))
+        if self.isVisible():
+            animation_clock().wake(self.animate_value)
+        else:
+            self.current_value = self.target_value
     
     def animate_value(self):
-        easing_factor = 0.08
+        easing_factor = animation_clock().ease(0.08)
         threshold = 0.1
         
         distance = self.target_value - self.current_value
         
-        if abs(distance) < threshold:
+        if abs(distance) < threshold or not self.isVisible():
             self.current_value = self.target_value
-        else:
-            self.current_value += distance * easing_factor
-            self.update()
+            return False
+        self.current_value += distance * easing_factor
+        self.update()
+        return True
     
     def get_voltage_color(self, value):
         """Get color based on voltage level - electrical engineering standards"""
         if value < self.thresholds["low"]:
-            return QColor(255, 80, 80)  # Red - Under voltage
+            return render_resources().color(255, 80, 80)  # Red - Under voltage
         elif value < self.thresholds["nominal_low"]:
-            return QColor(255, 180, 0)  # Amber - Low voltage
+            return render_resources().color(255, 180, 0)  # Amber - Low voltage
         elif value <= self.thresholds["nominal_high"]:
-            return QColor(0, 255, 150)  # Green - Normal voltage
+            return render_resources().color(0, 255, 150)  # Green - Normal voltage
         elif value <= self.thresholds["high"]:
-            return QColor(255, 180, 0)  # Amber - High voltage
+            return render_resources().color(255, 180, 0)  # Amber - High voltage
         else:
-            return QColor(255, 80, 80)  # Red - Over voltage
+            return render_resources().color(255, 80, 80)  # Red - Over voltage
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -8211,40 +8483,25 @@ class ModernVoltageDisplay(QWidget):
         
         width = self.width()
         height = self.height()
+        res = render_resources()
         
         # Get voltage color
         voltage_color = self.get_voltage_color(self.current_value)
         
-        # Draw main container with clean industrial styling
-        container_gradient = QLinearGradient(0, 0, 0, height)
-        container_gradient.setColorAt(0, QColor(20, 25, 35))
-        container_gradient.setColorAt(1, QColor(15, 18, 25))
-        
-        painter.setBrush(container_gradient)
-        painter.setPen(QPen(QColor(40, 50, 65), 2))
-        painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
-        
-        # Draw accent border based on voltage status
-        accent_gradient = QLinearGradient(0, 0, width, 0)
-        accent_gradient.setColorAt(0, voltage_color.darker(150))
-        accent_gradient.setColorAt(0.5, voltage_color)
-        accent_gradient.setColorAt(1, voltage_color.darker(150))
-        
-        painter.setPen(QPen(accent_gradient, 3))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
+        # Container and accent border based on voltage status
+        paint_display_frame(painter, width, height, voltage_color)
         
         # Draw phase indicator in top-left
         phase_font_size = 11
-        painter.setFont(QFont("Segoe UI", phase_font_size, QFont.Bold))
-        painter.setPen(QColor(120, 140, 160))
+        phase_font = res.font("Segoe UI", phase_font_size, QFont.Bold)
+        painter.setPen(res.color(120, 140, 160))
         
         phase_text = f"{self.phase_from}-{self.phase_to}"
-        painter.drawText(15, 25, phase_text)
+        draw_static_text(painter, phase_font, QPointF(15, 25), phase_text)
         
         # Draw main voltage value - large and centered
         value_font_size = 36
-        painter.setFont(QFont("JetBrains Mono", value_font_size, QFont.Bold))
+        painter.setFont(res.font("JetBrains Mono", value_font_size, QFont.Bold))
         painter.setPen(voltage_color)
         
         voltage_text = f"{self.current_value:.1f}"
@@ -8253,20 +8510,20 @@ class ModernVoltageDisplay(QWidget):
         
         # Draw unit in top-right
         unit_font_size = 18
-        painter.setFont(QFont("Segoe UI", unit_font_size, QFont.Bold))
-        painter.setPen(QColor(180, 200, 220))
+        unit_font = res.font("Segoe UI", unit_font_size, QFont.Bold)
+        painter.setPen(res.color(180, 200, 220))
         
         unit_rect = QRectF(width - 65, height * 0.25, 50, height * 0.3)
-        painter.drawText(unit_rect, Qt.AlignCenter, "V")
+        draw_static_text(painter, unit_font, unit_rect, "V")
         
         # Draw label at bottom (positioned above progress bar)
         label_font_size = 9
-        painter.setFont(QFont("Segoe UI", label_font_size, QFont.Medium))
-        painter.setPen(QColor(140, 160, 180))
+        label_font = res.font("Segoe UI", label_font_size, QFont.Medium)
+        painter.setPen(res.color(140, 160, 180))
         
         label_y = height - 35  # Position label higher to avoid overlap
         label_rect = QRectF(15, label_y, width - 30, 12)
-        painter.drawText(label_rect, Qt.AlignLeft | Qt.AlignVCenter, self.label.upper())
+        draw_static_text(painter, label_font, label_rect, self.label.upper(), Qt.AlignLeft | Qt.AlignVCenter)
         
         # Draw status bar at bottom with proper spacing
         status_height = 6
@@ -8274,7 +8531,7 @@ class ModernVoltageDisplay(QWidget):
         status_width = width - 30
         
         # Background bar
-        painter.setBrush(QColor(30, 35, 45))
+        painter.setBrush(res.color(30, 35, 45))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(15, status_y, status_width, status_height, 3, 3)
         
@@ -8284,7 +8541,7 @@ class ModernVoltageDisplay(QWidget):
         
         if fill_width > 0:
             status_gradient = QLinearGradient(15, status_y, 15 + fill_width, status_y)
-            status_gradient.setColorAt(0, voltage_color.darker(120))
+            status_gradient.setColorAt(0, res.darker(voltage_color, 120))
             status_gradient.setColorAt(1, voltage_color)
             
             painter.setBrush(status_gradient)
@@ -8306,39 +8563,41 @@ class ModernCurrentDisplay(QWidget):
         self.setMinimumSize(280, 120)
         self.setMaximumSize(320, 140)
         
-        # Animation timer
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_value)
-        self.animation_timer.start(16)  # 60 FPS
+        # Value transitions are driven by the shared animation clock while it moves
         
         # Default thresholds for current
         self.thresholds = {"normal": 70, "warning": 85, "critical": 95}
     
     def set_value(self, value):
         self.target_value = max(0, min(value, self.max_value))
+        if self.isVisible():
+            animation_clock().wake(self.animate_value)
+        else:
+            self.current_value = self.target_value
     
     def animate_value(self):
-        easing_factor = 0.08
+        easing_factor = animation_clock().ease(0.08)
         threshold = 0.1
         
         distance = self.target_value - self.current_value
         
-        if abs(distance) < threshold:
+        if abs(distance) < threshold or not self.isVisible():
             self.current_value = self.target_value
-        else:
-            self.current_value += distance * easing_factor
-            self.update()
+            return False
+        self.current_value += distance * easing_factor
+        self.update()
+        return True
     
     def get_current_color(self, value):
         """Get color based on current level"""
         percentage = (value / self.max_value) * 100
         
         if percentage <= self.thresholds["normal"]:
-            return QColor(0, 255, 150)  # Green - Normal
+            return render_resources().color(0, 255, 150)  # Green - Normal
         elif percentage <= self.thresholds["warning"]:
-            return QColor(255, 180, 0)  # Amber - Warning
+            return render_resources().color(255, 180, 0)  # Amber - Warning
         else:
-            return QColor(255, 80, 80)  # Red - Critical
+            return render_resources().color(255, 80, 80)  # Red - Critical
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -8347,40 +8606,25 @@ class ModernCurrentDisplay(QWidget):
         
         width = self.width()
         height = self.height()
+        res = render_resources()
         
         # Get current color
         current_color = self.get_current_color(self.current_value)
         
-        # Draw main container with clean industrial styling
-        container_gradient = QLinearGradient(0, 0, 0, height)
-        container_gradient.setColorAt(0, QColor(20, 25, 35))
-        container_gradient.setColorAt(1, QColor(15, 18, 25))
-        
-        painter.setBrush(container_gradient)
-        painter.setPen(QPen(QColor(40, 50, 65), 2))
-        painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
-        
-        # Draw accent border based on current status
-        accent_gradient = QLinearGradient(0, 0, width, 0)
-        accent_gradient.setColorAt(0, current_color.darker(150))
-        accent_gradient.setColorAt(0.5, current_color)
-        accent_gradient.setColorAt(1, current_color.darker(150))
-        
-        painter.setPen(QPen(accent_gradient, 3))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
+        # Container and accent border based on current status
+        paint_display_frame(painter, width, height, current_color)
         
         # Draw phase indicator in top-left
         phase_font_size = 11
-        painter.setFont(QFont("Segoe UI", phase_font_size, QFont.Bold))
-        painter.setPen(QColor(120, 140, 160))
+        phase_font = res.font("Segoe UI", phase_font_size, QFont.Bold)
+        painter.setPen(res.color(120, 140, 160))
         
         phase_text = self.label  # Use the label directly (L1, L2, L3)
-        painter.drawText(15, 25, phase_text)
+        draw_static_text(painter, phase_font, QPointF(15, 25), phase_text)
         
         # Draw main current value - large and centered
         value_font_size = 36
-        painter.setFont(QFont("JetBrains Mono", value_font_size, QFont.Bold))
+        painter.setFont(res.font("JetBrains Mono", value_font_size, QFont.Bold))
         painter.setPen(current_color)
         
         current_text = f"{self.current_value:.1f}"
@@ -8389,11 +8633,11 @@ class ModernCurrentDisplay(QWidget):
         
         # Draw unit in top-right
         unit_font_size = 18
-        painter.setFont(QFont("Segoe UI", unit_font_size, QFont.Bold))
-        painter.setPen(QColor(180, 200, 220))
+        unit_font = res.font("Segoe UI", unit_font_size, QFont.Bold)
+        painter.setPen(res.color(180, 200, 220))
         
         unit_rect = QRectF(width - 65, height * 0.25, 50, height * 0.3)
-        painter.drawText(unit_rect, Qt.AlignCenter, "A")
+        draw_static_text(painter, unit_font, unit_rect, "A")
         
         # Draw status bar at bottom with proper spacing
         status_height = 6
@@ -8401,7 +8645,7 @@ class ModernCurrentDisplay(QWidget):
         status_width = width - 30
         
         # Background bar
-        painter.setBrush(QColor(30, 35, 45))
+        painter.setBrush(res.color(30, 35, 45))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(15, status_y, status_width, status_height, 3, 3)
         
@@ -8411,7 +8655,7 @@ class ModernCurrentDisplay(QWidget):
         
         if fill_width > 0:
             status_gradient = QLinearGradient(15, status_y, 15 + fill_width, status_y)
-            status_gradient.setColorAt(0, current_color.darker(120))
+            status_gradient.setColorAt(0, res.darker(current_color, 120))
             status_gradient.setColorAt(1, current_color)
             
             painter.setBrush(status_gradient)
@@ -8433,10 +8677,7 @@ class ModernPowerDisplay(QWidget):
         self.setMinimumSize(280, 120)
         self.setMaximumSize(320, 140)
         
-        # Animation timer
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.animate_value)
-        self.animation_timer.start(16)  # 60 FPS
+        # Value transitions are driven by the shared animation clock while it moves
         
         # Color thresholds based on parameter type
         if "Power Factor" in label:
@@ -8448,39 +8689,44 @@ class ModernPowerDisplay(QWidget):
     
     def set_value(self, value):
         self.target_value = max(0, min(value, self.max_value))
+        if self.isVisible():
+            animation_clock().wake(self.animate_value)
+        else:
+            self.current_value = self.target_value
     
     def animate_value(self):
-        easing_factor = 0.08
+        easing_factor = animation_clock().ease(0.08)
         threshold = 0.01
         
         distance = self.target_value - self.current_value
         
-        if abs(distance) < threshold:
+        if abs(distance) < threshold or not self.isVisible():
             self.current_value = self.target_value
-        else:
-            self.current_value += distance * easing_factor
-            self.update()
+            return False
+        self.current_value += distance * easing_factor
+        self.update()
+        return True
     
     def get_value_color(self, value):
         """Get color based on parameter type and value"""
         if "Power Factor" in self.label:
             if value >= self.thresholds["excellent"]:
-                return QColor(0, 255, 150)  # Green - Excellent
+                return render_resources().color(0, 255, 150)  # Green - Excellent
             elif value >= self.thresholds["good"]:
-                return QColor(100, 255, 100)  # Light Green - Good
+                return render_resources().color(100, 255, 100)  # Light Green - Good
             elif value >= self.thresholds["poor"]:
-                return QColor(255, 180, 0)  # Amber - Fair
+                return render_resources().color(255, 180, 0)  # Amber - Fair
             else:
-                return QColor(255, 80, 80)  # Red - Poor
+                return render_resources().color(255, 80, 80)  # Red - Poor
         else:
             # For KW and KVAR
             percentage = (value / self.max_value) * 100
             if percentage <= self.thresholds["normal"]:
-                return QColor(0, 255, 150)  # Green - Normal
+                return render_resources().color(0, 255, 150)  # Green - Normal
             elif percentage <= self.thresholds["warning"]:
-                return QColor(255, 180, 0)  # Amber - Warning
+                return render_resources().color(255, 180, 0)  # Amber - Warning
             else:
-                return QColor(255, 80, 80)  # Red - Critical
+                return render_resources().color(255, 80, 80)  # Red - Critical
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -8489,39 +8735,24 @@ class ModernPowerDisplay(QWidget):
         
         width = self.width()
         height = self.height()
+        res = render_resources()
         
         # Get value color
         value_color = self.get_value_color(self.current_value)
         
-        # Draw main container with clean industrial styling
-        container_gradient = QLinearGradient(0, 0, 0, height)
-        container_gradient.setColorAt(0, QColor(20, 25, 35))
-        container_gradient.setColorAt(1, QColor(15, 18, 25))
-        
-        painter.setBrush(container_gradient)
-        painter.setPen(QPen(QColor(40, 50, 65), 2))
-        painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
-        
-        # Draw accent border based on value status
-        accent_gradient = QLinearGradient(0, 0, width, 0)
-        accent_gradient.setColorAt(0, value_color.darker(150))
-        accent_gradient.setColorAt(0.5, value_color)
-        accent_gradient.setColorAt(1, value_color.darker(150))
-        
-        painter.setPen(QPen(accent_gradient, 3))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(2, 2, width - 4, height - 4, 8, 8)
+        # Container and accent border based on value status
+        paint_display_frame(painter, width, height, value_color)
         
         # Draw label in top-left
         label_font_size = 11
-        painter.setFont(QFont("Segoe UI", label_font_size, QFont.Bold))
-        painter.setPen(QColor(120, 140, 160))
+        label_font = res.font("Segoe UI", label_font_size, QFont.Bold)
+        painter.setPen(res.color(120, 140, 160))
         
-        painter.drawText(15, 25, self.label.upper())
+        draw_static_text(painter, label_font, QPointF(15, 25), self.label.upper())
         
         # Draw main value - large and centered
         value_font_size = 36
-        painter.setFont(QFont("JetBrains Mono", value_font_size, QFont.Bold))
+        painter.setFont(res.font("JetBrains Mono", value_font_size, QFont.Bold))
         painter.setPen(value_color)
         
         if self.decimal_places == 0:
@@ -8535,11 +8766,11 @@ class ModernPowerDisplay(QWidget):
         # Draw unit in top-right (if exists)
         if self.unit:
             unit_font_size = 18
-            painter.setFont(QFont("Segoe UI", unit_font_size, QFont.Bold))
-            painter.setPen(QColor(180, 200, 220))
+            unit_font = res.font("Segoe UI", unit_font_size, QFont.Bold)
+            painter.setPen(res.color(180, 200, 220))
             
             unit_rect = QRectF(width - 80, height * 0.25, 65, height * 0.3)
-            painter.drawText(unit_rect, Qt.AlignCenter, self.unit)
+            draw_static_text(painter, unit_font, unit_rect, self.unit)
         
         # Draw status bar at bottom
         status_height = 8
@@ -8547,7 +8778,7 @@ class ModernPowerDisplay(QWidget):
         status_width = width - 30
         
         # Background bar
-        painter.setBrush(QColor(30, 35, 45))
+        painter.setBrush(res.color(30, 35, 45))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(15, status_y, status_width, status_height, 4, 4)
         
@@ -8562,7 +8793,7 @@ class ModernPowerDisplay(QWidget):
         
         if fill_width > 0:
             status_gradient = QLinearGradient(15, status_y, 15 + fill_width, status_y)
-            status_gradient.setColorAt(0, value_color.darker(120))
+            status_gradient.setColorAt(0, res.darker(value_color, 120))
             status_gradient.setColorAt(1, value_color)
             
             painter.setBrush(status_gradient)
@@ -10127,6 +10358,17 @@ class ModbusConfigDialog(QDialog):
                     "device_id": device_id
                 })
         
+        # Keep register encoding (data type, byte/word order, scale) set for each parameter
+        for old_param, new_param in zip(self.config, new_config):
+            for key in TAG_FORMAT_KEYS:
+                if key in old_param:
+                    new_param.setdefault(key, old_param[key])
+        
+        candidate = load_encrypted_config("modbus_config.dat") or {}
+        candidate.setdefault("ElectricalParameters", {})[self.group_name] = new_config
+        if not confirm_address_conflicts(self, candidate, f"ElectricalParameters.{self.group_name}"):
+            return
+        
         self.config = new_config
         self.accept()
     
@@ -10510,6 +10752,15 @@ class ElectricalCurrentConfigDialog(QDialog):
 
 
 # ---------------- Electrical Power Configuration Dialog ----------------
+# Register layouts offered for power meter values: (label, byte order, word order)
+POWER_REGISTER_ORDERS = [
+    ("ABCD (big endian)", "big", "big"),
+    ("CDAB (word swap)", "big", "little"),
+    ("BADC (byte swap)", "little", "big"),
+    ("DCBA (little endian)", "little", "little"),
+]
+
+
 class ElectricalPowerConfigDialog(QDialog):
     """Configuration dialog for power parameters (Active Power and Reactive Power - individual configs)"""
     def __init__(self, parent=None):
@@ -10585,6 +10836,7 @@ class ElectricalPowerConfigDialog(QDialog):
         self.active_data_device_id_spin.setRange(1, 255)
         self.active_data_device_id_spin.setValue(self.config.get("active_data_device_id", 1))
         active_modbus_layout.addRow("Data Source Device ID:", self.active_data_device_id_spin)
+        self.add_format_rows(active_modbus_layout, "active")
         
         active_modbus_group.setLayout(active_modbus_layout)
         layout.addWidget(active_modbus_group)
@@ -10613,6 +10865,7 @@ class ElectricalPowerConfigDialog(QDialog):
         self.pf_data_device_id_spin.setRange(1, 255)
         self.pf_data_device_id_spin.setValue(self.config.get("pf_data_device_id", 1))
         pf_layout.addRow("Data Source Device ID:", self.pf_data_device_id_spin)
+        self.add_format_rows(pf_layout, "pf")
         
         pf_group.setLayout(pf_layout)
         layout.addWidget(pf_group)
@@ -10673,6 +10926,7 @@ class ElectricalPowerConfigDialog(QDialog):
         self.reactive_data_device_id_spin.setRange(1, 255)
         self.reactive_data_device_id_spin.setValue(self.config.get("reactive_data_device_id", 1))
         reactive_modbus_layout.addRow("Data Source Device ID:", self.reactive_data_device_id_spin)
+        self.add_format_rows(reactive_modbus_layout, "reactive")
         
         reactive_modbus_group.setLayout(reactive_modbus_layout)
         layout.addWidget(reactive_modbus_group)
@@ -10723,6 +10977,34 @@ class ElectricalPowerConfigDialog(QDialog):
         self.update_power_address_range("pf")
         self.update_power_address_range("reactive")
     
+    def add_format_rows(self, form_layout, prefix):
+        """Data type and byte/word order selectors for one power value"""
+        type_combo = QComboBox()
+        type_combo.addItems(list(DATA_TYPES))
+        type_combo.setCurrentText(self.config.get(f"{prefix}_data_type", "uint16"))
+        form_layout.addRow("Data Type:", type_combo)
+        
+        order_combo = QComboBox()
+        order_combo.addItems([label for label, _, _ in POWER_REGISTER_ORDERS])
+        orders = [(byte_order, word_order) for _, byte_order, word_order in POWER_REGISTER_ORDERS]
+        current = (self.config.get(f"{prefix}_byte_order", "big"), self.config.get(f"{prefix}_word_order", "big"))
+        order_combo.setCurrentIndex(orders.index(current) if current in orders else 0)
+        form_layout.addRow("Byte/Word Order:", order_combo)
+        
+        if not hasattr(self, "format_combos"):
+            self.format_combos = {}
+        self.format_combos[prefix] = (type_combo, order_combo)
+    
+    def format_config(self, prefix):
+        """Selected encoding of one power value as prefixed config keys"""
+        type_combo, order_combo = self.format_combos[prefix]
+        _, byte_order, word_order = POWER_REGISTER_ORDERS[order_combo.currentIndex()]
+        return {
+            f"{prefix}_data_type": type_combo.currentText(),
+            f"{prefix}_byte_order": byte_order,
+            f"{prefix}_word_order": word_order,
+        }
+    
     def update_power_address_range(self, power_type):
         """Update address range based on register type for specific power parameter"""
         if power_type == "active":
@@ -10786,7 +11068,10 @@ class ElectricalPowerConfigDialog(QDialog):
                 "reactive_address": self.reactive_address_spin.value(),
                 "reactive_data_device_id": self.reactive_data_device_id_spin.value(),
                 "device_id": self.device_id_spin.value(),
-                "alarm_delay": self.alarm_delay_spin.value()
+                "alarm_delay": self.alarm_delay_spin.value(),
+                **self.format_config("active"),
+                **self.format_config("pf"),
+                **self.format_config("reactive")
             }
             if save_encrypted_config(config_data, "modbus_config.dat"):
                 QMessageBox.information(self, "Success", "Power configuration saved!")
@@ -10798,6 +11083,11 @@ class ElectricalPowerConfigDialog(QDialog):
 
 
 # ---------------- Electrical Parameter Tab ----------------
+# Voltage drives regulation and its alarm coil; the other groups are display only
+ELECTRICAL_CONTROL_GROUPS = ("Voltage",)
+ELECTRICAL_DISPLAY_GROUPS = ("Current", "Power", "BusVoltage", "BusFrequency")
+
+
 class ElectricalParameterTab(QWidget):
     def __init__(self, parent=None):
         super().__init__()
@@ -10937,6 +11227,7 @@ class ElectricalParameterTab(QWidget):
         
         # Store modbus client reference
         self.modbus_client = None
+        self.relay_outputs = None
     
     def create_minimal_card(self, label, unit, type_color, group, index):
         """Create a minimal, professional card for displaying electrical parameter"""
@@ -11231,9 +11522,10 @@ class ElectricalParameterTab(QWidget):
                 "The new settings will be used on the next data read."
             )
     
-    def set_modbus_client(self, client):
-        """Set the Modbus client for this tab"""
+    def set_modbus_client(self, client, relay_outputs=None):
+        """Set the Modbus client and the relay output image for the voltage alarm coils"""
         self.modbus_client = client
+        self.relay_outputs = relay_outputs
     
     def clear_displays(self):
         """Clear all electrical parameter displays to zero and set disconnected state"""
@@ -11267,111 +11559,21 @@ class ElectricalParameterTab(QWidget):
             display.set_value(0)
             display.set_status('disconnected')
         
-    def calc_holding_offset(self, addr):
-        if addr >= 400001:
-            offset = addr - 400001
-        elif addr >= 40001:
-            offset = addr - 40001
-        else:
-            raise ValueError("invalid holding address")
-        if offset < 0 or offset > 65535:
-            raise ValueError("offset out of range")
-        return offset
-        
-    def read_modbus_value(self, param):
-        """Read a single Modbus value based on configuration"""
-        if not self.modbus_client:
-            return None
-        
-        try:
-            addr = param["address"]
-            reg_type = param["type"]
-            dev_id = param["device_id"]
-            
-            if reg_type == "input":
-                # Input registers: addresses 30001-39999 → offset = address - 30001
-                result = self.modbus_client.read_input_registers(
-                    address=addr - 30001, 
-                    count=1, 
-                    device_id=dev_id
-                )
-            elif reg_type == "holding":
-                offset = self.calc_holding_offset(addr)
-                result = self.modbus_client.read_holding_registers(
-                    address=offset, 
-                    count=1, 
-                    device_id=dev_id
-                )
-            elif reg_type == "coil":
-                # Coils: addresses 1-9999 → offset = address - 1
-                result = self.modbus_client.read_coils(
-                    address=addr - 1, 
-                    count=1, 
-                    device_id=dev_id
-                )
-            elif reg_type == "discrete":
-                # Discrete inputs: addresses 10001-19999 → offset = address - 10001
-                result = self.modbus_client.read_discrete_inputs(
-                    address=addr - 10001, 
-                    count=1, 
-                    device_id=dev_id
-                )
-            else:
-                return None
-            
-            if result and not result.isError():
-                if hasattr(result, "registers"):
-                    return result.registers[0]
-                elif hasattr(result, "bits"):
-                    return result.bits[0]
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error reading Modbus address {param['address']}: {e}")
-            return None
-    
-    def pulse_coil(self, coil_address, device_id):
-        """Send a single pulse to a coil (write ON, wait, write OFF)"""
-        if not self.modbus_client:
+    def pulse_coil(self, coil_address, device_id, interlock_coil=None):
+        """Send a 100 ms pulse to a coil (1-9999) through the shared pulse engine.
+
+        interlock_coil is the opposite raise/lower coil; it is switched off
+        first if still pulsing so both are never ON together.
+        """
+        if not self.modbus_client or not self.parent_window:
             return False
         
-        try:
-            # Coil addresses: 1-9999 → offset = address - 1
-            offset = coil_address - 1
-            
-            # Write ON (True)
-            result_on = self.modbus_client.write_coil(
-                address=offset,
-                value=True,
-                slave=device_id
-            )
-            
-            if result_on and not result_on.isError():
-                # Short delay for pulse duration
-                QTimer.singleShot(100, lambda: self._complete_pulse(offset, device_id))
-                return True
-            else:
-                print(f"Error pulsing coil {coil_address}: Failed to write ON")
-                return False
-                
-        except Exception as e:
-            print(f"Error pulsing coil {coil_address}: {e}")
+        # Coil addresses: 1-9999 → offset = address - 1
+        interlock = (device_id, interlock_coil - 1) if interlock_coil else None
+        if not self.parent_window.coil_pulses.pulse(device_id, coil_address - 1, 100, interlock):
+            print(f"Error pulsing coil {coil_address}: Failed to write ON")
             return False
-    
-    def _complete_pulse(self, offset, device_id):
-        """Complete the pulse by writing OFF"""
-        try:
-            # Write OFF (False)
-            result_off = self.modbus_client.write_coil(
-                address=offset,
-                value=False,
-                slave=device_id
-            )
-            if result_off and result_off.isError():
-                print(f"Error completing pulse at offset {offset}: Failed to write OFF")
-        except Exception as e:
-            print(f"Error completing pulse at offset {offset}: {e}")
+        return True
 
     def _update_data_source_addr_range(self, idx, spin):
         if idx == 1:
@@ -11418,23 +11620,14 @@ class ElectricalParameterTab(QWidget):
                 # Get previous alarm state
                 prev_alarm_state = self._alarm_states.get(voltage_key, False)
                 
-                # Only write to coil if state changed
-                if alarm_triggered != prev_alarm_state:
-                    try:
-                        offset = alarm_coil - 1
-                        result = self.modbus_client.write_coil(
-                            address=offset,
-                            value=alarm_triggered,
-                            slave=relay_device_id
-                        )
-                        if result and not result.isError():
-                            self._alarm_states[voltage_key] = alarm_triggered
-                            if alarm_triggered:
-                                print(f"ALARM: Voltage {voltage_index} = {current_val:.1f}V (Limits: {lower_limit:.1f}-{upper_limit:.1f}V) - Coil {alarm_coil} ON")
-                            else:
-                                print(f"CLEAR: Voltage {voltage_index} = {current_val:.1f}V back in range - Coil {alarm_coil} OFF")
-                    except Exception as e:
-                        print(f"Error writing alarm coil {alarm_coil}: {e}")
+                # Only update the relay output image if state changed (flushed by the poll cycle)
+                if alarm_triggered != prev_alarm_state and self.relay_outputs:
+                    self.relay_outputs.set(relay_device_id, alarm_coil - 1, alarm_triggered, (self, voltage_key))
+                    self._alarm_states[voltage_key] = alarm_triggered
+                    if alarm_triggered:
+                        print(f"ALARM: Voltage {voltage_index} = {current_val:.1f}V (Limits: {lower_limit:.1f}-{upper_limit:.1f}V) - Coil {alarm_coil} ON")
+                    else:
+                        print(f"CLEAR: Voltage {voltage_index} = {current_val:.1f}V back in range - Coil {alarm_coil} OFF")
             
             # Automatic regulation logic
             # Define tolerance (deadband) to avoid oscillation
@@ -11458,13 +11651,13 @@ class ElectricalParameterTab(QWidget):
             # Check if voltage is outside tolerance
             if current_val < (set_val - tolerance):
                 # Voltage too low - pulse increase coil
-                if self.pulse_coil(increase_coil, relay_device_id):
+                if self.pulse_coil(increase_coil, relay_device_id, decrease_coil):
                     print(f"Voltage {voltage_index}: {current_val:.1f}V < {set_val:.1f}V - Pulsing INCREASE coil {increase_coil}")
                     self._last_pulse_time[voltage_key] = current_time
             
             elif current_val > (set_val + tolerance):
                 # Voltage too high - pulse decrease coil
-                if self.pulse_coil(decrease_coil, relay_device_id):
+                if self.pulse_coil(decrease_coil, relay_device_id, increase_coil):
                     print(f"Voltage {voltage_index}: {current_val:.1f}V > {set_val:.1f}V - Pulsing DECREASE coil {decrease_coil}")
                     self._last_pulse_time[voltage_key] = current_time
             
@@ -11473,8 +11666,11 @@ class ElectricalParameterTab(QWidget):
         except (ValueError, TypeError) as e:
             print(f"Error in voltage regulation for index {voltage_index}: {e}")
     
-    def update_electrical_data(self, values=None):
-        """Update electrical parameter values with per-parameter thresholds and colors"""
+    def update_electrical_data(self, values=None, group_names=None):
+        """Update electrical parameter values with per-parameter thresholds and colors.
+        
+        group_names limits a configuration read to those parameter groups (None = all).
+        """
         def status_for_value(val, group):
             try:
                 v = float(val)
@@ -11533,25 +11729,39 @@ class ElectricalParameterTab(QWidget):
             'BusFrequency': (self.bus_frequency_displays, ep.get('BusFrequency', [])),
         }
         
+        # Read every configured parameter in one batch so the tag layer can coalesce requests
+        entries = []
         for group_name, (cards, cfg_list) in groups.items():
-            for idx, card in enumerate(cards):
-                if idx < len(cfg_list):
-                    val = self.read_modbus_value(cfg_list[idx])
-                    if val is None: 
-                        card.set_status('disconnected')
-                        continue
-                    card.set_value(val)
-                    # Use appropriate status function based on group
-                    if group_name == 'BusVoltage':
-                        card.set_status(status_for_value(val, 'Voltage'))
-                    elif group_name == 'BusFrequency':
-                        card.set_status('normal')  # Bus frequency typically just shows value
-                    else:
-                        card.set_status(status_for_value(val, group_name))
-                    
-                    # Voltage regulation: pulse coils to maintain set value (only for regular Voltage, not BusVoltage)
-                    if group_name == 'Voltage':
-                        self.regulate_voltage(cfg_list[idx], val, idx)
+            if group_names is not None and group_name not in group_names:
+                continue
+            for idx, card in enumerate(cards[:len(cfg_list)]):
+                try:
+                    tag = tag_from_param(cfg_list[idx], group_name)
+                except Exception as e:
+                    print(f"Error in {group_name} parameter {idx + 1} configuration: {e}")
+                    tag = None
+                entries.append((group_name, idx, card, cfg_list[idx], tag))
+        if self.modbus_client:
+            values = self.parent_window.tag_reader.read_many([entry[4] for entry in entries])
+        else:
+            values = [None] * len(entries)
+        
+        for (group_name, idx, card, cfg, tag), val in zip(entries, values):
+            if val is None: 
+                card.set_status('disconnected')
+                continue
+            card.set_value(val)
+            # Use appropriate status function based on group
+            if group_name == 'BusVoltage':
+                card.set_status(status_for_value(val, 'Voltage'))
+            elif group_name == 'BusFrequency':
+                card.set_status('normal')  # Bus frequency typically just shows value
+            else:
+                card.set_status(status_for_value(val, group_name))
+            
+            # Voltage regulation: pulse coils to maintain set value (only for regular Voltage, not BusVoltage)
+            if group_name == 'Voltage':
+                self.regulate_voltage(cfg, val, idx)
 
 
 # ---------------- History Tab ----------------
@@ -11993,12 +12203,12 @@ class ReportTab(QWidget):
         # Create compact digital boxes for cylinder temperatures
         for i in range(9):
             # Left cylinder
-            left_box = self.create_digital_box(f"L{i+1}", "0.0°C", "rgb(100, 100, 100)")
+            left_box = self.create_digital_box(f"L{i+1}", "0.0°C", REPORT_READOUT_STYLE)
             cylinder_grid.addWidget(left_box, i, 0)
             self.cylinder_left_labels.append(left_box.findChild(QLabel, "value"))
             
             # Right cylinder
-            right_box = self.create_digital_box(f"R{i+1}", "0.0°C", "rgb(100, 100, 100)")
+            right_box = self.create_digital_box(f"R{i+1}", "0.0°C", REPORT_READOUT_STYLE)
             cylinder_grid.addWidget(right_box, i, 1)
             self.cylinder_right_labels.append(right_box.findChild(QLabel, "value"))
         
@@ -12014,7 +12224,7 @@ class ReportTab(QWidget):
         
         self.bearing_labels = []
         for i in range(10):
-            bearing_box = self.create_digital_box(f"MB{i+1}", "0.0°C", "rgb(100, 100, 100)")
+            bearing_box = self.create_digital_box(f"MB{i+1}", "0.0°C", REPORT_READOUT_STYLE)
             # Fill first column completely (9 items), then second column (1 item)
             if i < 9:
                 bearing_grid.addWidget(bearing_box, i, 0)  # First column: MB1-MB9
@@ -12035,7 +12245,7 @@ class ReportTab(QWidget):
         
         self.pressure_labels = []
         for i, name in enumerate(pressure_names):
-            pressure_box = self.create_digital_box(name, "0.0 bar", "rgb(100, 100, 100)")
+            pressure_box = self.create_digital_box(name, "0.0 bar", REPORT_READOUT_STYLE)
             # Fill first column completely (8 items), then second column (0 items for 8 total)
             # Since we have 8 items, put 8 in first column, 0 in second
             pressure_grid.addWidget(pressure_box, i, 0)  # All 8 in first column
@@ -12054,7 +12264,7 @@ class ReportTab(QWidget):
         
         self.engine_temp_labels = []
         for i, name in enumerate(engine_temp_names):
-            temp_box = self.create_digital_box(name, "0.0°C", "rgb(100, 100, 100)")
+            temp_box = self.create_digital_box(name, "0.0°C", REPORT_READOUT_STYLE)
             # Fill first column completely (8 items), then second column (8 items)
             if i < 8:
                 engine_temp_grid.addWidget(temp_box, i, 0)  # First column: items 1-8
@@ -12074,11 +12284,18 @@ class ReportTab(QWidget):
         # Added L1-L2 Voltage and Frequency to match electrical tab configuration
         electrical_names = ["L1-L2 V", "L2-L3 V", "L3-L1 V", "L1 A", "L2 A", "L3 A", "Act Pwr", "PF", "React Pwr", "L1-L2 V", "Frequency"]
         electrical_units = ["V", "V", "V", "A", "A", "A", "kW", "", "kVAR", "V", "Hz"]
-        electrical_colors = ["rgb(100, 100, 100)"] * 11  # Gray for initial state
+        electrical_colors = [
+            "rgb(255, 200, 100)", "rgb(255, 200, 100)", "rgb(255, 200, 100)",
+            "rgb(100, 200, 255)", "rgb(100, 200, 255)", "rgb(100, 200, 255)",
+            "rgb(200, 255, 100)", "rgb(255, 255, 100)", "rgb(255, 150, 200)",
+            "rgb(255, 200, 100)", "rgb(255, 255, 100)"  # L1-L2 Voltage and Frequency colors
+        ]
         
         self.electrical_labels = []
         for i, (name, unit, color) in enumerate(zip(electrical_names, electrical_units, electrical_colors)):
-            elec_box = self.create_digital_box(name, f"0.0 {unit}", color)
+            # Gray until the first reading, then the parameter's own colour
+            elec_box = self.create_digital_box(name, f"0.0 {unit}",
+                                               state_style(REPORT_READOUT_BASE, {"live": f"color: {color};"}))
             # Fill first column completely (9 items), then second column (2 items for 11 total)
             if i < 9:
                 electrical_grid.addWidget(elec_box, i, 0)  # First 9 in first column
@@ -12095,12 +12312,15 @@ class ReportTab(QWidget):
         status_grid.setSpacing(3)
         
         # Connection status box
-        conn_box = self.create_digital_box("Connection", "DISCONNECTED", "rgb(255, 100, 100)")
+        conn_box = self.create_digital_box("Connection", "DISCONNECTED", REPORT_CONNECTION_STYLE)
         self.connection_status = conn_box.findChild(QLabel, "value")
+        set_style_state(self.connection_status, "disconnected")
         status_grid.addWidget(conn_box, 0, 0)
         
         # Last update box
-        update_box = self.create_digital_box("Last Update", "Never", "rgb(180, 200, 220)")
+        update_box = self.create_digital_box(
+            "Last Update", "Never",
+            "color: rgb(180, 200, 220); font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
         self.last_update = update_box.findChild(QLabel, "value")
         status_grid.addWidget(update_box, 1, 0)
         
@@ -12129,69 +12349,69 @@ class ReportTab(QWidget):
             print(f"Error loading config: {e}")
             return {}
     
-    def get_cylinder_head_color(self, temp):
-        """Get color for cylinder head temperature based on configuration"""
+    def get_cylinder_head_state(self, temp):
+        """Readout state (REPORT_READOUT_STYLE) for a cylinder head temperature based on configuration"""
         if temp <= 0:
-            return "rgb(100, 100, 100)"  # Gray for no data
+            return "nodata"  # Gray for no data
         
         config = self.config.get("CylinderHead", {})
         low_limit = config.get("low_limit", 250)
         high_limit = config.get("high_limit", 500)
         
         if temp < low_limit:
-            return "rgb(100, 255, 255)"  # Cyan for low
+            return "low"  # Cyan for low
         elif temp <= high_limit:
-            return "rgb(100, 255, 100)"  # Green for normal
+            return "normal"  # Green for normal
         else:
-            return "rgb(255, 100, 100)"  # Red for high
+            return "alarm"  # Red for high
     
-    def get_main_bearing_color(self, temp):
-        """Get color for main bearing temperature based on configuration"""
+    def get_main_bearing_state(self, temp):
+        """Readout state for a main bearing temperature based on configuration"""
         if temp <= 0:
-            return "rgb(100, 100, 100)"  # Gray for no data
+            return "nodata"  # Gray for no data
         
         config = self.config.get("MainBearing", {})
         low_limit = config.get("low_limit", 80)
         high_limit = config.get("high_limit", 150)
         
         if temp < low_limit:
-            return "rgb(100, 255, 255)"  # Cyan for low
+            return "low"  # Cyan for low
         elif temp <= high_limit:
-            return "rgb(100, 255, 100)"  # Green for normal
+            return "normal"  # Green for normal
         else:
-            return "rgb(255, 100, 100)"  # Red for high
+            return "alarm"  # Red for high
     
-    def get_pressure_color(self, pressure, index):
-        """Get color for pressure based on configuration"""
+    def get_pressure_state(self, pressure, index):
+        """Readout state for a pressure based on configuration"""
         if pressure <= 0:
-            return "rgb(100, 100, 100)"  # Gray for no data
+            return "nodata"  # Gray for no data
         
         pressure_config = self.config.get("PressureGauges", {}).get(str(index), {})
         low_limit = pressure_config.get("low_limit", 2.0)
         high_limit = pressure_config.get("high_limit", 8.0)
         
         if pressure < low_limit:
-            return "rgb(255, 100, 100)"  # Red for low pressure (dangerous)
+            return "alarm"  # Red for low pressure (dangerous)
         elif pressure <= high_limit:
-            return "rgb(100, 255, 100)"  # Green for normal
+            return "normal"  # Green for normal
         else:
-            return "rgb(255, 255, 100)"  # Yellow for high
+            return "warning"  # Yellow for high
     
-    def get_engine_temp_color(self, temp, index):
-        """Get color for engine temperature based on configuration"""
+    def get_engine_temp_state(self, temp, index):
+        """Readout state for an engine temperature based on configuration"""
         if temp <= 0:
-            return "rgb(100, 100, 100)"  # Gray for no data
+            return "nodata"  # Gray for no data
         
         temp_config = self.config.get("EngineTemperatures", {}).get(str(index), {})
         low_limit = temp_config.get("low_limit", 50)
         high_limit = temp_config.get("high_limit", 220)
         
         if temp < low_limit:
-            return "rgb(100, 255, 255)"  # Cyan for low
+            return "low"  # Cyan for low
         elif temp <= high_limit:
-            return "rgb(100, 255, 100)"  # Green for normal
+            return "normal"  # Green for normal
         else:
-            return "rgb(255, 100, 100)"  # Red for high
+            return "alarm"  # Red for high
     
     def create_data_group(self, title, station):
         """Create a professional SCADA-style data group"""
@@ -12219,8 +12439,8 @@ class ReportTab(QWidget):
         group.setTitle(title)
         return group
     
-    def create_digital_box(self, label_text, value_text, color):
-        """Create a professional digital display box"""
+    def create_digital_box(self, label_text, value_text, value_style):
+        """Create a professional digital display box (value_style: the value label's stylesheet)"""
         container = QWidget()
         container.setFixedHeight(55)  # Increased height for larger fonts
         container.setStyleSheet(f"""
@@ -12244,7 +12464,7 @@ class ReportTab(QWidget):
         # Value
         value = QLabel(value_text)
         value.setObjectName("value")  # For finding later
-        value.setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
+        value.setStyleSheet(value_style)
         value.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         
         layout.addWidget(label)
@@ -12285,16 +12505,14 @@ class ReportTab(QWidget):
             # Update left side (first 9)
             for i in range(9):
                 temp = actual_temps[i]
-                color = self.get_cylinder_head_color(temp)
                 self.cylinder_left_labels[i].setText(f"{temp:.1f} °C")
-                self.cylinder_left_labels[i].setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 15px; font-weight: bold;")
+                set_style_state(self.cylinder_left_labels[i], self.get_cylinder_head_state(temp))
             
             # Update right side (next 9)
             for i in range(9):
                 temp = actual_temps[i + 9]
-                color = self.get_cylinder_head_color(temp)
                 self.cylinder_right_labels[i].setText(f"{temp:.1f} °C")
-                self.cylinder_right_labels[i].setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 15px; font-weight: bold;")
+                set_style_state(self.cylinder_right_labels[i], self.get_cylinder_head_state(temp))
     
     def update_main_bearing_data(self, temps):
         """Update main bearing temperature values"""
@@ -12304,9 +12522,8 @@ class ReportTab(QWidget):
             self.main_bearing_temps = actual_temps
             for i in range(10):
                 temp = actual_temps[i]
-                color = self.get_main_bearing_color(temp)
                 self.bearing_labels[i].setText(f"{temp:.1f} °C")
-                self.bearing_labels[i].setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 15px; font-weight: bold;")
+                set_style_state(self.bearing_labels[i], self.get_main_bearing_state(temp))
     
     def update_pressure_data(self, pressures):
         """Update pressure values"""
@@ -12314,9 +12531,8 @@ class ReportTab(QWidget):
             self.pressure_values = pressures[:8]
             for i in range(8):
                 pressure = self.pressure_values[i]
-                color = self.get_pressure_color(pressure, i)
                 self.pressure_labels[i].setText(f"{pressure:.1f} bar")
-                self.pressure_labels[i].setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 15px; font-weight: bold;")
+                set_style_state(self.pressure_labels[i], self.get_pressure_state(pressure, i))
     
     def update_engine_temperatures(self, temps):
         """Update engine temperature values"""
@@ -12326,9 +12542,8 @@ class ReportTab(QWidget):
             self.engine_temps = actual_temps
             for i in range(16):
                 temp = actual_temps[i]
-                color = self.get_engine_temp_color(temp, i)
                 self.engine_temp_labels[i].setText(f"{temp:.1f} °C")
-                self.engine_temp_labels[i].setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 15px; font-weight: bold;")
+                set_style_state(self.engine_temp_labels[i], self.get_engine_temp_state(temp, i))
     
     def update_electrical_data(self, values):
         """Update electrical parameter values with L1-L2 Voltage and Frequency from electrical tab"""
@@ -12336,38 +12551,25 @@ class ReportTab(QWidget):
         config_data = load_encrypted_config("modbus_config.dat") or {}
         electrical_params = config_data.get("ElectricalParameters", {})
         
-        # Read L1-L2 Voltage from electrical tab configuration
-        l1_l2_voltage = 0.0
-        voltage_configs = electrical_params.get("Voltage", [])
-        if voltage_configs and len(voltage_configs) > 0:
-            # L1-L2 is the first voltage parameter
-            l1_l2_config = voltage_configs[0]
-            if hasattr(self, 'parent_window') and self.parent_window and hasattr(self.parent_window, 'modbus_client'):
-                l1_l2_voltage = self.read_electrical_param(l1_l2_config, self.parent_window.modbus_client) or 0.0
-        
-        # Read Frequency from electrical tab configuration
-        frequency = 0.0
-        frequency_configs = electrical_params.get("Frequency", [])
-        if frequency_configs and len(frequency_configs) > 0:
-            frequency_config = frequency_configs[0]
-            if hasattr(self, 'parent_window') and self.parent_window and hasattr(self.parent_window, 'modbus_client'):
-                frequency = self.read_electrical_param(frequency_config, self.parent_window.modbus_client) or 0.0
+        # L1-L2 is the first voltage parameter; frequency the first frequency parameter
+        tags = []
+        for group in ("Voltage", "Frequency"):
+            configs = electrical_params.get(group, [])
+            try:
+                tags.append(tag_from_param(configs[0], group) if configs else None)
+            except Exception as e:
+                print(f"Error in {group} parameter configuration: {e}")
+                tags.append(None)
+        l1_l2_voltage, frequency = [value or 0.0 for value in self.parent_window.tag_reader.read_many(tags)]
         
         if len(values) >= 9:
             # Electrical values should already be in proper engineering units
             self.electrical_values = values[:9]
             units = ["V", "V", "V", "A", "A", "A", "kW", "", "kVAR", "V", "Hz"]
-            colors = [
-                "rgb(255, 200, 100)", "rgb(255, 200, 100)", "rgb(255, 200, 100)",
-                "rgb(100, 200, 255)", "rgb(100, 200, 255)", "rgb(100, 200, 255)",
-                "rgb(200, 255, 100)", "rgb(255, 255, 100)", "rgb(255, 150, 200)",
-                "rgb(255, 200, 100)", "rgb(255, 255, 100)"  # L1-L2 Voltage and Frequency colors
-            ]
             
             for i in range(9):
                 value = self.electrical_values[i]
                 unit = units[i]
-                color = colors[i]
                 
                 if i == 7:  # Power Factor - special formatting (0.000 format)
                     pf_value = value / 1000.0 if value > 10 else value  # Convert if needed
@@ -12375,106 +12577,276 @@ class ReportTab(QWidget):
                 else:
                     self.electrical_labels[i].setText(f"{value:.1f} {unit}")
                 
-                self.electrical_labels[i].setStyleSheet(f"color: {color}; font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
+                set_style_state(self.electrical_labels[i], "live")
             
             # Update L1-L2 Voltage (index 9)
             if len(self.electrical_labels) > 9:
                 self.electrical_labels[9].setText(f"{l1_l2_voltage:.1f} V")
-                self.electrical_labels[9].setStyleSheet(f"color: {colors[9]}; font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
+                set_style_state(self.electrical_labels[9], "live")
             
             # Update Frequency (index 10)
             if len(self.electrical_labels) > 10:
                 self.electrical_labels[10].setText(f"{frequency:.1f} Hz")
-                self.electrical_labels[10].setStyleSheet(f"color: {colors[10]}; font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
-    
-    def read_electrical_param(self, param, modbus_client):
-        """Read electrical parameter from Modbus based on configuration"""
-        if not modbus_client or not param:
-            return None
-        
-        try:
-            addr = param.get("address")
-            reg_type = param.get("type")
-            dev_id = param.get("device_id")
-            
-            if reg_type == "input":
-                # Input registers: addresses 30001-39999 → offset = address - 30001
-                result = modbus_client.read_input_registers(addr - 30001, 1, slave=dev_id)
-            elif reg_type == "holding":
-                offset = self.calc_holding_offset(addr)
-                result = modbus_client.read_holding_registers(offset, 1, slave=dev_id)
-            elif reg_type == "coil":
-                # Coils: addresses 1-9999 → offset = address - 1
-                result = modbus_client.read_coils(addr - 1, 1, slave=dev_id)
-            elif reg_type == "discrete":
-                # Discrete inputs: addresses 10001-19999 → offset = address - 10001
-                result = modbus_client.read_discrete_inputs(addr - 10001, 1, slave=dev_id)
-            else:
-                return None
-            
-            if result and not result.isError():
-                if hasattr(result, "registers"):
-                    return float(result.registers[0]) / 10.0  # Assuming 0.1 scaling
-                elif hasattr(result, "bits"):
-                    return float(result.bits[0])
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error reading electrical parameter at address {param.get('address')}: {e}")
-            return None
+                set_style_state(self.electrical_labels[10], "live")
     
     def update_connection_status(self, connected):
         """Update connection status"""
         if connected:
             self.connection_status.setText("CONNECTED")
-            self.connection_status.setStyleSheet("color: rgb(100, 255, 100); font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
+            set_style_state(self.connection_status, "connected")
         else:
             self.connection_status.setText("DISCONNECTED")
-            self.connection_status.setStyleSheet("color: rgb(255, 100, 100); font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
+            set_style_state(self.connection_status, "disconnected")
         
         # Update timestamp
         import time
         current_time = time.strftime('%H:%M:%S')
         self.last_update.setText(current_time)
-        self.last_update.setStyleSheet("color: rgb(180, 200, 220); font-family: 'Courier New'; font-size: 20px; font-weight: bold;")
     
-    def get_temperature_color(self, temp):
-        """Get color based on temperature value"""
+    def get_temperature_state(self, temp):
+        """Readout state for a temperature value"""
         if temp <= 0:
-            return "rgb(100, 100, 100)"  # Gray for no data
+            return "nodata"  # Gray for no data
         elif temp < 200:
-            return "rgb(100, 255, 255)"  # Cyan for cool
+            return "low"  # Cyan for cool
         elif temp < 350:
-            return "rgb(100, 255, 100)"  # Green for normal
+            return "normal"  # Green for normal
         elif temp < 450:
-            return "rgb(255, 255, 100)"  # Yellow for warm
+            return "warning"  # Yellow for warm
         else:
-            return "rgb(255, 100, 100)"  # Red for hot
+            return "alarm"  # Red for hot
     
-    def get_pressure_color(self, pressure, index):
-        """Get color based on pressure value and gauge type"""
+    def get_pressure_state(self, pressure, index):
+        """Readout state for a pressure value and gauge type"""
         if pressure <= 0:
-            return "rgb(100, 100, 100)"  # Gray for no data
+            return "nodata"  # Gray for no data
         
         # Special handling for oil pressure (reverse logic)
         if index == 0:  # Lube Oil Pressure Inlet
             if pressure < 2:
-                return "rgb(255, 100, 100)"  # Red for low oil pressure (dangerous)
+                return "alarm"  # Red for low oil pressure (dangerous)
             elif pressure < 5:
-                return "rgb(255, 255, 100)"  # Yellow for warning
+                return "warning"  # Yellow for warning
             else:
-                return "rgb(100, 255, 100)"  # Green for good pressure
+                return "normal"  # Green for good pressure
         else:
             # Normal pressure logic
             if pressure < 2:
-                return "rgb(100, 255, 255)"  # Cyan for low
+                return "low"  # Cyan for low
             elif pressure < 7:
-                return "rgb(100, 255, 100)"  # Green for normal
+                return "normal"  # Green for normal
             elif pressure < 9:
-                return "rgb(255, 255, 100)"  # Yellow for high
+                return "warning"  # Yellow for high
             else:
-                return "rgb(255, 100, 100)"  # Red for very high
+                return "alarm"  # Red for very high
+
+
+# ---------------- Bus Monitor ----------------
+class BusMonitorModel(QAbstractTableModel):
+    """Table model over the monitor ring; the view only asks for the rows it shows"""
+    COLUMNS = ["#", "Time", "Device", "Function", "Address", "Count", "Request", "Response",
+               "Status", "Latency ms", "Points"]
+    STATUS_COLORS = {
+        STATUS_EXCEPTION: QColor(251, 191, 36),
+        STATUS_NO_RESPONSE: QColor(255, 100, 100),
+        STATUS_FRAME_ERROR: QColor(255, 100, 100),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = []
+        self.address_index = None
+        self._owners = {}      # (device, fc, address, count) -> "label, label"
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        if role == Qt.ForegroundRole:
+            return self.STATUS_COLORS.get(record.status)
+        if role != Qt.DisplayRole:
+            return None
+        column = index.column()
+        if column == 0:
+            return str(record.seq)
+        if column == 1:
+            return time.strftime("%H:%M:%S", time.localtime(record.wall_time)) + f".{int(record.wall_time * 1000) % 1000:03d}"
+        if column == 2:
+            return str(record.device_id)
+        if column == 3:
+            return FUNCTION_NAMES.get(record.function_code, f"FC {record.function_code}")
+        if column == 4:
+            return str(record.address)
+        if column == 5:
+            return str(record.count)
+        if column == 6:
+            return format_values(record.request, record.truncated)
+        if column == 7:
+            return format_values(record.response, record.truncated)
+        if column == 8:
+            text = STATUS_TEXT.get(record.status, "?")
+            return f"{text} {record.exception_code}" if record.status == STATUS_EXCEPTION else text
+        if column == 9:
+            return f"{record.latency * 1000:.1f}"
+        return self._points(record)
+
+    def _points(self, record):
+        key = (record.device_id, record.function_code, record.address, record.count)
+        text = self._owners.get(key)
+        if text is None:
+            text = ", ".join(entry.label or entry.owner for entry in record_owners(self.address_index, record))
+            self._owners[key] = text
+        return text
+
+    def set_address_index(self, index):
+        if index is not self.address_index:
+            self.address_index = index
+            self._owners.clear()
+
+    def clear(self):
+        self.beginResetModel()
+        self.records = []
+        self.endResetModel()
+
+    def update_from(self, ring):
+        """Drop records the ring has overwritten and append the new ones"""
+        oldest = ring.total - ring.capacity
+        stale = 0
+        while stale < len(self.records) and self.records[stale].seq < oldest:
+            stale += 1
+        if stale:
+            self.beginRemoveRows(QModelIndex(), 0, stale - 1)
+            del self.records[:stale]
+            self.endRemoveRows()
+
+        since = self.records[-1].seq + 1 if self.records else 0
+        new = ring.snapshot(since)
+        if new:
+            first = len(self.records)
+            self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self.records.extend(new)
+            self.endInsertRows()
+        return len(new)
+
+
+class BusMonitorTab(QWidget):
+    """Latest transactions on the bus, refreshed only while the page is visible"""
+    def __init__(self, parent=None):
+        super().__init__()
+        self.parent_window = parent
+        self.setStyleSheet(CYLINDER_HEAD_BG_STYLE)
+
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(25, 25, 25, 20)
+        main_layout.setSpacing(15)
+
+        header_layout = QHBoxLayout()
+        title = QLabel("BUS MONITOR")
+        title.setFont(QFont("Inter", 18, QFont.Bold))
+        title.setStyleSheet(TAB_HEADING_STYLE)
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+
+        self.summary_label = QLabel("0 transactions")
+        self.summary_label.setStyleSheet("color: rgb(180, 200, 220); font-size: 11px; font-weight: bold; padding: 5px;")
+        header_layout.addWidget(self.summary_label)
+
+        self.follow_check = QCheckBox("Follow")
+        self.follow_check.setChecked(True)
+        self.follow_check.setStyleSheet("color: rgb(180, 200, 220); font-size: 11px; font-weight: bold;")
+        header_layout.addWidget(self.follow_check)
+
+        self.pause_btn = QPushButton("PAUSE")
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.setCursor(Qt.PointingHandCursor)
+        self.pause_btn.setStyleSheet(MODE_BUTTON_STYLE)
+        header_layout.addWidget(self.pause_btn)
+
+        clear_btn = QPushButton("CLEAR")
+        clear_btn.setCursor(Qt.PointingHandCursor)
+        clear_btn.setStyleSheet(MODE_BUTTON_STYLE)
+        clear_btn.clicked.connect(self.clear)
+        header_layout.addWidget(clear_btn)
+        main_layout.addLayout(header_layout)
+
+        self.model = BusMonitorModel(self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.verticalHeader().setVisible(False)
+        # Fixed row height and no content-based column sizing keep the view from touching off-screen rows
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(22)
+        header = self.view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        for column, width in enumerate((70, 100, 60, 170, 70, 55, 170, 220, 90, 80)):
+            self.view.setColumnWidth(column, width)
+        self.view.setSelectionBehavior(QTableView.SelectRows)
+        self.view.setEditTriggers(QTableView.NoEditTriggers)
+        self.view.setWordWrap(False)
+        self.view.setStyleSheet("""
+            QTableView {
+                background: rgb(15, 22, 35);
+                color: rgb(160, 180, 200);
+                border: 2px solid rgb(50, 70, 90);
+                border-radius: 6px;
+                gridline-color: rgb(35, 50, 65);
+                font-family: Consolas, monospace;
+                font-size: 11px;
+                selection-background-color: rgb(0, 90, 160);
+            }
+            QHeaderView::section {
+                background: rgb(25, 35, 50);
+                color: rgb(147, 197, 253);
+                border: 1px solid rgb(50, 70, 90);
+                padding: 4px;
+                font-weight: bold;
+            }
+        """)
+        main_layout.addWidget(self.view)
+        self.setLayout(main_layout)
+
+        self.refresh_timer = QTimer()
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start(250)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh(self):
+        """Pull the transactions captured since the last refresh from the ring"""
+        ring = getattr(self.parent_window, "bus_monitor", None)
+        if ring is None or self.pause_btn.isChecked():
+            return
+        self.model.set_address_index(getattr(self.parent_window, "address_index", None))
+        scrollbar = self.view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        if self.model.update_from(ring) and self.follow_check.isChecked() and at_bottom:
+            self.view.scrollToBottom()
+        self.summary_label.setText(f"{len(self.model.records)} shown  |  {ring.total} since start")
+
+    def clear(self):
+        ring = getattr(self.parent_window, "bus_monitor", None)
+        if ring is not None:
+            ring.clear()
+        self.model.clear()
+        self.refresh()
 
 
 # ---------------- Startup Condition Configuration Dialog ----------------
@@ -13915,7 +14287,7 @@ class StartupTab(QWidget):
         self.start_config_btn = QPushButton()
         self.start_config_btn.setFixedSize(55, 55)  # Increased from 38
         self.start_config_btn.setCursor(Qt.PointingHandCursor)
-        self.start_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.start_config_btn.setIcon(icon("setting.png"))
         self.start_config_btn.setIconSize(QSize(26, 26))  # Increased from 18
         self.start_config_btn.setStyleSheet("""
             QPushButton {
@@ -13963,7 +14335,7 @@ class StartupTab(QWidget):
         self.stop_config_btn = QPushButton()
         self.stop_config_btn.setFixedSize(55, 55)  # Increased from 38
         self.stop_config_btn.setCursor(Qt.PointingHandCursor)
-        self.stop_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.stop_config_btn.setIcon(icon("setting.png"))
         self.stop_config_btn.setIconSize(QSize(26, 26))  # Increased from 18
         self.stop_config_btn.setStyleSheet("""
             QPushButton {
@@ -14007,7 +14379,7 @@ class StartupTab(QWidget):
         self.freq_inc_config_btn = QPushButton()
         self.freq_inc_config_btn.setFixedSize(55, 55)  # Increased from 38
         self.freq_inc_config_btn.setCursor(Qt.PointingHandCursor)
-        self.freq_inc_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.freq_inc_config_btn.setIcon(icon("setting.png"))
         self.freq_inc_config_btn.setIconSize(QSize(26, 26))  # Increased from 18
         self.freq_inc_config_btn.setStyleSheet("""
             QPushButton {
@@ -14051,7 +14423,7 @@ class StartupTab(QWidget):
         self.freq_dec_config_btn = QPushButton()
         self.freq_dec_config_btn.setFixedSize(55, 55)  # Increased from 38
         self.freq_dec_config_btn.setCursor(Qt.PointingHandCursor)
-        self.freq_dec_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.freq_dec_config_btn.setIcon(icon("setting.png"))
         self.freq_dec_config_btn.setIconSize(QSize(26, 26))  # Increased from 18
         self.freq_dec_config_btn.setStyleSheet("""
             QPushButton {
@@ -14095,7 +14467,7 @@ class StartupTab(QWidget):
         self.volt_inc_config_btn = QPushButton()
         self.volt_inc_config_btn.setFixedSize(55, 55)  # Increased from 38
         self.volt_inc_config_btn.setCursor(Qt.PointingHandCursor)
-        self.volt_inc_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.volt_inc_config_btn.setIcon(icon("setting.png"))
         self.volt_inc_config_btn.setIconSize(QSize(26, 26))  # Increased from 18
         self.volt_inc_config_btn.setStyleSheet("""
             QPushButton {
@@ -14139,7 +14511,7 @@ class StartupTab(QWidget):
         self.volt_dec_config_btn = QPushButton()
         self.volt_dec_config_btn.setFixedSize(55, 55)  # Increased from 38
         self.volt_dec_config_btn.setCursor(Qt.PointingHandCursor)
-        self.volt_dec_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.volt_dec_config_btn.setIcon(icon("setting.png"))
         self.volt_dec_config_btn.setIconSize(QSize(26, 26))  # Increased from 18
         self.volt_dec_config_btn.setStyleSheet("""
             QPushButton {
@@ -14212,7 +14584,7 @@ class StartupTab(QWidget):
         self.cb_config_btn = QPushButton()
         self.cb_config_btn.setFixedSize(55, 55)
         self.cb_config_btn.setCursor(Qt.PointingHandCursor)
-        self.cb_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        self.cb_config_btn.setIcon(icon("setting.png"))
         self.cb_config_btn.setIconSize(QSize(26, 26))
         self.cb_config_btn.setStyleSheet("""
             QPushButton {
@@ -14256,9 +14628,8 @@ class StartupTab(QWidget):
         
         # Timer for reading conditions and bus parameters
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_conditions)
-        self.update_timer.timeout.connect(self.update_bus_parameters)
-        self.update_timer.start(500)  # Update every 500ms
+        self.update_timer.timeout.connect(self.poll_startup_points)
+        self.update_timer.start(500)  # Update every 500ms while shown, as the poll scheduler allows otherwise
         
         # Load saved uptime from config (after UI is created)
         self.load_running_hours()
@@ -14403,7 +14774,7 @@ class StartupTab(QWidget):
         breaker_config_btn = QPushButton()
         breaker_config_btn.setFixedSize(24, 24)
         breaker_config_btn.setCursor(Qt.PointingHandCursor)
-        breaker_config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        breaker_config_btn.setIcon(icon("setting.png"))
         breaker_config_btn.setIconSize(QSize(16, 16))
         breaker_config_btn.setStyleSheet("""
             QPushButton {
@@ -14429,24 +14800,13 @@ class StartupTab(QWidget):
         # Status indicator circle
         status_indicator = QLabel()
         status_indicator.setFixedSize(40, 40)
-        status_indicator.setStyleSheet("""
-            background: rgb(200, 50, 50);
-            border: 2px solid rgb(220, 70, 70);
-            border-radius: 20px;
-        """)
+        status_indicator.setStyleSheet(BREAKER_INDICATOR_STYLE)
         status_indicator.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(status_indicator, 0)
         
         # Status text
         status_text = QLabel("NO SIGNAL")
-        status_text.setStyleSheet("""
-            color: rgb(200, 50, 50);
-            font-size: 24px;
-            font-weight: bold;
-            font-family: 'Segoe UI';
-            background: transparent;
-            border: none;
-        """)
+        status_text.setStyleSheet(BREAKER_TEXT_STYLE)
         status_text.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         status_layout.addWidget(status_text, 1)
         
@@ -14480,7 +14840,7 @@ class StartupTab(QWidget):
         # Status indicator - image based
         status_label = QLabel()
         status_label.setObjectName("status_indicator")
-        status_label.setPixmap(QPixmap(resource_path("imgs/red.png")).scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        status_label.setPixmap(icon_pixmap("red.png", 20, self.devicePixelRatioF()))
         status_label.setStyleSheet("background: transparent;")
         status_label.setFixedWidth(28)
         status_label.setAlignment(Qt.AlignCenter)
@@ -14504,7 +14864,7 @@ class StartupTab(QWidget):
         config_btn = QPushButton()
         config_btn.setFixedSize(24, 24)
         config_btn.setCursor(Qt.PointingHandCursor)
-        config_btn.setIcon(QIcon(resource_path("imgs/setting.png")))
+        config_btn.setIcon(icon("setting.png"))
         config_btn.setIconSize(QSize(16, 16))
         config_btn.setStyleSheet("""
             QPushButton {
@@ -14520,6 +14880,9 @@ class StartupTab(QWidget):
         row_layout.addWidget(config_btn)
         
         row_widget.setLayout(row_layout)
+        # Kept for update_condition_display: the lamp and the state it shows
+        row_widget.status_indicator = status_label
+        row_widget.condition_met = False
         return row_widget
     
     def configure_condition(self, condition_name):
@@ -14545,6 +14908,16 @@ class StartupTab(QWidget):
         dialog = EngineControlConfigDialog(self, control_type)
         dialog.exec_()
     
+    def poll_startup_points(self):
+        """Refresh conditions and bus parameters when the startup poll group is due"""
+        scheduler = getattr(self.parent_window, "poll_scheduler", None)
+        if not self.modbus_client or scheduler is None or not scheduler.due("startup"):
+            return
+        started = time.monotonic()
+        self.update_conditions()
+        self.update_bus_parameters()
+        scheduler.polled("startup", time.monotonic() - started)
+    
     def update_conditions(self):
         """Read and update all startup conditions"""
         if not self.modbus_client:
@@ -14555,8 +14928,19 @@ class StartupTab(QWidget):
         
         all_conditions_met = True
         
+        # Read all configured condition points in one batch
+        tags = []
         for condition_name in self.startup_conditions:
             condition_config = conditions_config.get(condition_name, {})
+            try:
+                tags.append(tag_from_condition(condition_config, condition_name) if condition_config else None)
+            except Exception as e:
+                print(f"Error in condition {condition_name} configuration: {e}")
+                tags.append(None)
+        condition_values = self.parent_window.tag_reader.read_many(tags)
+        
+        for condition_name, value in zip(self.startup_conditions, condition_values):
+            condition_config = conditions_config.get(condition_name, {})
             
             if not condition_config:
                 # No configuration, mark as not met
@@ -14566,16 +14950,9 @@ class StartupTab(QWidget):
                 continue
             
             try:
-                # Read the value from Modbus
-                device_id = condition_config.get("device_id", 1)
-                address = condition_config.get("address", 0)
-                reg_type = condition_config.get("register_type", "Input Register")
                 comparison = condition_config.get("comparison", ">")
                 threshold = condition_config.get("value", 0)
                 
-                # Read based on register type
-                value = self.read_modbus_value(device_id, address, reg_type)
-                
                 if value is None:
                     self.condition_states[condition_name] = False
                     all_conditions_met = False
@@ -14598,25 +14975,6 @@ class StartupTab(QWidget):
         self.engine_start_btn.setEnabled(all_conditions_met and not self.engine_running)
         self.engine_stop_btn.setEnabled(self.engine_running)
     
-    def read_modbus_value(self, device_id, address, reg_type):
-        """Read value from Modbus"""
-        try:
-            if reg_type == "Coil":
-                response = self.modbus_client.read_coils(address, 1, slave=device_id)
-                return int(response.bits[0]) if response and not response.isError() else None
-            elif reg_type == "Discrete Input":
-                response = self.modbus_client.read_discrete_inputs(address, 1, slave=device_id)
-                return int(response.bits[0]) if response and not response.isError() else None
-            elif reg_type == "Input Register":
-                response = self.modbus_client.read_input_registers(address, 1, slave=device_id)
-                return float(response.registers[0]) / 10.0 if response and not response.isError() else None
-            elif reg_type == "Holding Register":
-                response = self.modbus_client.read_holding_registers(address, 1, slave=device_id)
-                return float(response.registers[0]) / 10.0 if response and not response.isError() else None
-        except Exception as e:
-            print(f"Error reading Modbus: {e}")
-            return None
-    
     def evaluate_condition(self, value, comparison, threshold):
         """Evaluate if condition is met"""
         try:
@@ -14642,15 +15000,14 @@ class StartupTab(QWidget):
             return
         
         row_widget = self.condition_widgets[condition_name]
-        status_indicator = row_widget.findChild(QLabel, "status_indicator")
+        is_met = bool(is_met)
+        if row_widget.condition_met == is_met:
+            return  # Lamp already shows this state
+        row_widget.condition_met = is_met
         
-        if status_indicator:
-            if is_met:
-                # Green image - condition met
-                status_indicator.setPixmap(QPixmap(resource_path("imgs/green.png")).scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                # Red image - condition not met
-                status_indicator.setPixmap(QPixmap(resource_path("imgs/red.png")).scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        # Green image - condition met, red image - condition not met
+        row_widget.status_indicator.setPixmap(
+            icon_pixmap("green.png" if is_met else "red.png", 20, row_widget.devicePixelRatioF()))
     
     def start_engine(self):
         """Start the engine by writing to configured coil"""
@@ -14671,10 +15028,15 @@ class StartupTab(QWidget):
             coil_address = start_config.get("coil_address", 0)
             time_duration = start_config.get("time_duration", 0)
             
-            # Write coil ON
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            if time_duration > 0:
+                # Timed command: ON now, OFF from the pulse engine after time_duration
+                sent = self.pulse_control_coil(start_config, time_duration * 1000, engine_control.get("Stop"))
+            else:
+                # Latched command: write coil ON
+                response = self.modbus_client.write_coil(coil_address, True, device_id=device_id)
+                sent = response is not None and not response.isError()
             
-            if response and not response.isError():
+            if sent:
                 self.engine_running = True
                 
                 # Start uptime tracking
@@ -14682,9 +15044,8 @@ class StartupTab(QWidget):
                 self.uptime_start_time = time.time()
                 self.uptime_timer.start()
                 
-                # If time duration is set, schedule auto-off
+                # Auto-off (if time duration is set) is already scheduled
                 if time_duration > 0:
-                    QTimer.singleShot(time_duration * 1000, lambda: self._turn_off_coil(device_id, coil_address))
                     QMessageBox.information(self, "Success", f"Engine start command sent (will auto-stop after {time_duration} seconds)")
                 else:
                     QMessageBox.information(self, "Success", "Engine start command sent")
@@ -14712,10 +15073,15 @@ class StartupTab(QWidget):
             coil_address = stop_config.get("coil_address", 0)
             time_duration = stop_config.get("time_duration", 0)
             
-            # Write coil ON
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            if time_duration > 0:
+                # Timed command: ON now, OFF from the pulse engine after time_duration
+                sent = self.pulse_control_coil(stop_config, time_duration * 1000, engine_control.get("Start"))
+            else:
+                # Latched command: write coil ON
+                response = self.modbus_client.write_coil(coil_address, True, device_id=device_id)
+                sent = response is not None and not response.isError()
             
-            if response and not response.isError():
+            if sent:
                 self.engine_running = False
                 
                 # Stop uptime tracking (pause, don't reset)
@@ -14724,9 +15090,8 @@ class StartupTab(QWidget):
                 # Save current uptime to persist across sessions
                 self.save_running_hours()
                 
-                # If time duration is set, schedule auto-off
+                # Auto-off (if time duration is set) is already scheduled
                 if time_duration > 0:
-                    QTimer.singleShot(time_duration * 1000, lambda: self._turn_off_coil(device_id, coil_address))
                     QMessageBox.information(self, "Success", f"Engine stop command sent (will turn off after {time_duration} seconds)")
                 else:
                     QMessageBox.information(self, "Success", "Engine stop command sent")
@@ -14750,16 +15115,14 @@ class StartupTab(QWidget):
             return
         
         try:
-            device_id = increase_config.get("device_id", 1)
-            coil_address = increase_config.get("coil_address", 0)
             pulse_duration = increase_config.get("pulse_duration", 200)  # Default 200ms
             
-            # Write coil ON
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            if self.control_coil_busy(increase_config):
+                print("Frequency increase pulse still running - ignored")
+                return
             
-            if response and not response.isError():
-                # Schedule coil OFF after pulse duration
-                QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
+            # ON now, OFF from the pulse engine after pulse duration
+            if self.pulse_control_coil(increase_config, pulse_duration, freq_control.get("Decrease")):
                 print(f"Frequency increase pulse sent ({pulse_duration}ms)")
             else:
                 QMessageBox.critical(self, "Error", "Failed to send frequency increase pulse")
@@ -14781,30 +15144,38 @@ class StartupTab(QWidget):
             return
         
         try:
-            device_id = decrease_config.get("device_id", 1)
-            coil_address = decrease_config.get("coil_address", 0)
             pulse_duration = decrease_config.get("pulse_duration", 200)  # Default 200ms
             
-            # Write coil ON
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            if self.control_coil_busy(decrease_config):
+                print("Frequency decrease pulse still running - ignored")
+                return
             
-            if response and not response.isError():
-                # Schedule coil OFF after pulse duration
-                QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
+            # ON now, OFF from the pulse engine after pulse duration
+            if self.pulse_control_coil(decrease_config, pulse_duration, freq_control.get("Increase")):
                 print(f"Frequency decrease pulse sent ({pulse_duration}ms)")
             else:
                 QMessageBox.critical(self, "Error", "Failed to send frequency decrease pulse")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Frequency decrease failed: {e}")
     
-    def _turn_off_coil(self, device_id, coil_address):
-        """Turn off a coil (used for pulse completion)"""
-        try:
-            if self.modbus_client:
-                self.modbus_client.write_coil(coil_address, False, slave=device_id)
-                print(f"Pulse completed - coil {coil_address} turned OFF")
-        except Exception as e:
-            print(f"Error turning off coil: {e}")
+    def pulse_control_coil(self, control_config, duration_ms, partner_config=None):
+        """Pulse a configured control coil (zero-based address) through the shared pulse engine.
+
+        partner_config is the opposite command (increase/decrease, start/stop);
+        its coil is never left ON together with this one.
+        """
+        return self.parent_window.coil_pulses.pulse_many([self.control_pulse(control_config, duration_ms, partner_config)])[0]
+    
+    def control_pulse(self, control_config, duration_ms, partner_config=None):
+        """(device_id, address, duration_ms, interlock) request for CoilPulseEngine.pulse_many"""
+        interlock = None
+        if partner_config:
+            interlock = (partner_config.get("device_id", 1), partner_config.get("coil_address", 0))
+        return (control_config.get("device_id", 1), control_config.get("coil_address", 0), duration_ms, interlock)
+    
+    def control_coil_busy(self, control_config):
+        return self.parent_window.coil_pulses.is_active(control_config.get("device_id", 1),
+                                                        control_config.get("coil_address", 0))
     
     def configure_frequency_control(self, control_type):
         """Open configuration dialog for frequency control"""
@@ -14830,16 +15201,14 @@ class StartupTab(QWidget):
             return
         
         try:
-            device_id = increase_config.get("device_id", 1)
-            coil_address = increase_config.get("coil_address", 0)
             pulse_duration = increase_config.get("pulse_duration", 200)  # Default 200ms
             
-            # Write coil ON
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            if self.control_coil_busy(increase_config):
+                print("Voltage increase pulse still running - ignored")
+                return
             
-            if response and not response.isError():
-                # Schedule coil OFF after pulse duration
-                QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
+            # ON now, OFF from the pulse engine after pulse duration
+            if self.pulse_control_coil(increase_config, pulse_duration, volt_control.get("Decrease")):
                 print(f"Voltage increase pulse sent ({pulse_duration}ms)")
             else:
                 QMessageBox.critical(self, "Error", "Failed to send voltage increase pulse")
@@ -14861,16 +15230,14 @@ class StartupTab(QWidget):
             return
         
         try:
-            device_id = decrease_config.get("device_id", 1)
-            coil_address = decrease_config.get("coil_address", 0)
             pulse_duration = decrease_config.get("pulse_duration", 200)  # Default 200ms
             
-            # Write coil ON
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            if self.control_coil_busy(decrease_config):
+                print("Voltage decrease pulse still running - ignored")
+                return
             
-            if response and not response.isError():
-                # Schedule coil OFF after pulse duration
-                QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
+            # ON now, OFF from the pulse engine after pulse duration
+            if self.pulse_control_coil(decrease_config, pulse_duration, volt_control.get("Increase")):
                 print(f"Voltage decrease pulse sent ({pulse_duration}ms)")
             else:
                 QMessageBox.critical(self, "Error", "Failed to send voltage decrease pulse")
@@ -14904,152 +15271,71 @@ class StartupTab(QWidget):
         
         config_data = load_encrypted_config("modbus_config.dat") or {}
         electrical_params = config_data.get("ElectricalParameters", {})
-        
-        # Update Bus Voltage
-        bus_voltage_config = electrical_params.get("BusVoltage", [])
-        if bus_voltage_config and len(bus_voltage_config) > 0:
-            voltage_value = self.read_bus_parameter(bus_voltage_config[0])
-            if voltage_value is not None:
-                self.bus_voltage_display.value_label.setText(f"{voltage_value:.1f}")
-            else:
-                self.bus_voltage_display.value_label.setText("--")
-        else:
-            self.bus_voltage_display.value_label.setText("--")
-        
-        # Update Bus Frequency
-        bus_frequency_config = electrical_params.get("BusFrequency", [])
-        if bus_frequency_config and len(bus_frequency_config) > 0:
-            frequency_value = self.read_bus_parameter(bus_frequency_config[0])
-            if frequency_value is not None:
-                self.bus_frequency_display.value_label.setText(f"{frequency_value:.1f}")
-            else:
-                self.bus_frequency_display.value_label.setText("--")
-        else:
-            self.bus_frequency_display.value_label.setText("--")
-        
-        # Update L1-L2 Voltage (first voltage from Voltage config)
-        voltage_config = electrical_params.get("Voltage", [])
-        if voltage_config and len(voltage_config) > 0:
-            l1_l2_voltage_value = self.read_bus_parameter(voltage_config[0])
-            if l1_l2_voltage_value is not None:
-                self.l1_l2_voltage_display.value_label.setText(f"{l1_l2_voltage_value:.1f}")
-            else:
-                self.l1_l2_voltage_display.value_label.setText("--")
-        else:
-            self.l1_l2_voltage_display.value_label.setText("--")
-        
-        # Update Frequency (from Frequency config)
-        freq_config = electrical_params.get("Frequency", [])
-        if freq_config and len(freq_config) > 0:
-            freq_value = self.read_bus_parameter(freq_config[0])
-            if freq_value is not None:
-                self.frequency_display.value_label.setText(f"{freq_value:.1f}")
-            else:
-                self.frequency_display.value_label.setText("--")
-        else:
-            self.frequency_display.value_label.setText("--")
-        
-        # Update Active Power (from ElectricalPower config)
         power_config = config_data.get("ElectricalPower", {})
-        if power_config:
-            active_power_value = self.read_power_parameter(power_config, "active")
-            if active_power_value is not None:
-                self.active_power_display.value_label.setText(f"{active_power_value:.1f}")
-            else:
-                self.active_power_display.value_label.setText("--")
-        else:
-            self.active_power_display.value_label.setText("--")
         
-        # Update Power Factor (from ElectricalPower config)
-        if power_config:
-            power_factor_value = self.read_power_parameter(power_config, "pf")
-            if power_factor_value is not None:
-                self.power_factor_display.value_label.setText(f"{power_factor_value:.2f}")
-            else:
-                self.power_factor_display.value_label.setText("--")
-        else:
-            self.power_factor_display.value_label.setText("--")
+        # Bus Voltage, Bus Frequency, L1-L2 Voltage (first Voltage entry) and Frequency
+        displays = [
+            (self.bus_voltage_display, "BusVoltage", "{:.1f}"),
+            (self.bus_frequency_display, "BusFrequency", "{:.1f}"),
+            (self.l1_l2_voltage_display, "Voltage", "{:.1f}"),
+            (self.frequency_display, "Frequency", "{:.1f}"),
+        ]
+        tags = []
+        for _, group, _ in displays:
+            configs = electrical_params.get(group, [])
+            tags.append(self.bus_parameter_tag(configs[0], group) if configs else None)
+        
+        # Active Power and Power Factor (from ElectricalPower config)
+        displays.append((self.active_power_display, power_config, "{:.1f}"))
+        displays.append((self.power_factor_display, power_config, "{:.2f}"))
+        tags.append(self.power_parameter_tag(power_config, "active") if power_config else None)
+        tags.append(self.power_parameter_tag(power_config, "pf") if power_config else None)
+        
+        # One batched read for all six points
+        values = self.parent_window.tag_reader.read_many(tags)
+        for (display, _, fmt), value in zip(displays, values):
+            display.value_label.setText(fmt.format(value) if value is not None else "--")
         
         # Update Breaker Check status
         self.update_breaker_check_display()
     
-    def read_bus_parameter(self, param):
-        """Read a bus parameter value from Modbus based on configuration"""
-        if not self.modbus_client:
-            return None
-        
+    def bus_parameter_tag(self, param, group):
+        """Tag for a bus/generator electrical parameter of an ElectricalParameters group"""
         try:
-            addr = param.get("address")
-            reg_type = param.get("type")
-            dev_id = param.get("device_id")
-            
-            if reg_type == "input":
-                # Input registers: addresses 30001-39999 → offset = address - 30001
-                result = self.modbus_client.read_input_registers(addr - 30001, 1, slave=dev_id)
-            elif reg_type == "holding":
-                # Holding registers: addresses 40001-49999 → offset = address - 40001
-                result = self.modbus_client.read_holding_registers(addr - 40001, 1, slave=dev_id)
-            elif reg_type == "coil":
-                # Coils: addresses 1-9999 → offset = address - 1
-                result = self.modbus_client.read_coils(addr - 1, 1, slave=dev_id)
-            elif reg_type == "discrete":
-                # Discrete inputs: addresses 10001-19999 → offset = address - 10001
-                result = self.modbus_client.read_discrete_inputs(addr - 10001, 1, slave=dev_id)
-            else:
-                return None
-            
-            if result and not result.isError():
-                if hasattr(result, "registers"):
-                    return float(result.registers[0]) / 10.0  # Assuming 0.1 scaling
-                elif hasattr(result, "bits"):
-                    return float(result.bits[0])
-            
-            return None
-            
+            return tag_from_param(param, group)
         except Exception as e:
-            print(f"Error reading bus parameter at address {param.get('address')}: {e}")
+            print(f"Error in bus parameter configuration at address {param.get('address')}: {e}")
             return None
     
-    def read_power_parameter(self, power_config, power_type):
-        """Read power parameter value from Modbus based on configuration"""
-        if not self.modbus_client:
+    def read_bus_parameters(self, params):
+        """Read several (group, parameter) bus/generator electrical parameters in one batch"""
+        return self.parent_window.tag_reader.read_many([self.bus_parameter_tag(param, group) for group, param in params])
+    
+    def power_parameter_tag(self, power_config, power_type):
+        """Tag for active power or power factor (integer registers scaled per GROUP_SCALES)"""
+        if power_type == "active":
+            param = {
+                "address": power_config.get("active_address", 30007),
+                "type": power_config.get("active_register_type", "input"),
+                "device_id": power_config.get("active_data_device_id", 1),
+            }
+        elif power_type == "pf":
+            param = {
+                "address": power_config.get("pf_address", 30008),
+                "type": power_config.get("pf_register_type", "input"),
+                "device_id": power_config.get("pf_data_device_id", 1),
+            }
+        else:
             return None
         
-        try:
-            if power_type == "active":
-                addr = power_config.get("active_address", 30007)
-                reg_type = power_config.get("active_register_type", "input")
-                dev_id = power_config.get("active_data_device_id", 1)
-            elif power_type == "pf":
-                addr = power_config.get("pf_address", 30008)
-                reg_type = power_config.get("pf_register_type", "input")
-                dev_id = power_config.get("pf_data_device_id", 1)
-            else:
-                return None
-            
-            if reg_type == "input":
-                # Input registers: addresses 30001-39999 → offset = address - 30001
-                result = self.modbus_client.read_input_registers(addr - 30001, 1, slave=dev_id)
-            elif reg_type == "holding":
-                # Holding registers: addresses 40001-49999 → offset = address - 40001
-                result = self.modbus_client.read_holding_registers(addr - 40001, 1, slave=dev_id)
-            else:
-                return None
-            
-            if result and not result.isError():
-                if hasattr(result, "registers"):
-                    raw_value = result.registers[0]
-                    # Power Factor typically ranges 0-100 (representing 0.00-1.00)
-                    if power_type == "pf":
-                        return float(raw_value) / 100.0
-                    else:
-                        # Active Power in 0.1 kW units
-                        return float(raw_value) / 10.0
-            
+        if param["type"] not in ("input", "holding"):
             return None
-            
+        prefix = f"{power_type}_"
+        param.update({key: power_config[prefix + key] for key in TAG_FORMAT_KEYS if prefix + key in power_config})
+        try:
+            return tag_from_param(param, f"ElectricalPower.{power_type}")
         except Exception as e:
-            print(f"Error reading power parameter {power_type}: {e}")
+            print(f"Error in power parameter {power_type} configuration: {e}")
             return None
     
     def configure_power_parameters(self):
@@ -15067,20 +15353,7 @@ class StartupTab(QWidget):
         """Update breaker check status display based on Modbus reading"""
         if not self.modbus_client:
             # No Modbus connection - show red
-            self.breaker_check_display.status_indicator.setStyleSheet("""
-                background: rgb(200, 50, 50);
-                border: 2px solid rgb(220, 70, 70);
-                border-radius: 20px;
-            """)
-            self.breaker_check_display.status_text.setText("NO SIGNAL")
-            self.breaker_check_display.status_text.setStyleSheet("""
-                color: rgb(200, 50, 50);
-                font-size: 24px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                background: transparent;
-                border: none;
-            """)
+            self.show_breaker_check("NO SIGNAL")
             return
         
         try:
@@ -15089,111 +15362,34 @@ class StartupTab(QWidget):
             
             if not cb_config or not cb_config.get("breaker_check_address"):
                 # No configuration - show red
-                self.breaker_check_display.status_indicator.setStyleSheet("""
-                    background: rgb(200, 50, 50);
-                    border: 2px solid rgb(220, 70, 70);
-                    border-radius: 20px;
-                """)
-                self.breaker_check_display.status_text.setText("NOT CONFIGURED")
-                self.breaker_check_display.status_text.setStyleSheet("""
-                    color: rgb(200, 50, 50);
-                    font-size: 24px;
-                    font-weight: bold;
-                    font-family: 'Segoe UI';
-                    background: transparent;
-                    border: none;
-                """)
+                self.show_breaker_check("NOT CONFIGURED")
                 return
             
-            device_id = cb_config.get("breaker_check_device_id", 1)
-            address = cb_config.get("breaker_check_address", 0)
-            reg_type = cb_config.get("breaker_check_register_type", "coil")
-            
-            result = None
+            value = self.parent_window.tag_reader.read(self.breaker_check_tag(cb_config), max_age=0)
             
-            if reg_type == "coil":
-                result = self.modbus_client.read_coils(address, 1, slave=device_id)
-            elif reg_type == "discrete":
-                result = self.modbus_client.read_discrete_inputs(address, 1, slave=device_id)
-            elif reg_type == "input":
-                result = self.modbus_client.read_input_registers(address, 1, slave=device_id)
-            elif reg_type == "holding":
-                result = self.modbus_client.read_holding_registers(address, 1, slave=device_id)
-            
-            if result and not result.isError():
-                breaker_status = False
-                
-                if hasattr(result, "bits"):
-                    breaker_status = result.bits[0]
-                elif hasattr(result, "registers"):
-                    breaker_status = result.registers[0] == 1
-                
-                if breaker_status:
+            if value is not None:
+                if value == 1:
                     # Green - signal received
-                    self.breaker_check_display.status_indicator.setStyleSheet("""
-                        background: rgb(0, 180, 80);
-                        border: 2px solid rgb(0, 200, 100);
-                        border-radius: 20px;
-                    """)
-                    self.breaker_check_display.status_text.setText("SIGNAL ACTIVE")
-                    self.breaker_check_display.status_text.setStyleSheet("""
-                        color: rgb(0, 200, 100);
-                        font-size: 24px;
-                        font-weight: bold;
-                        font-family: 'Segoe UI';
-                        background: transparent;
-                        border: none;
-                    """)
+                    self.show_breaker_check("SIGNAL ACTIVE", active=True)
                 else:
                     # Red - no signal
-                    self.breaker_check_display.status_indicator.setStyleSheet("""
-                        background: rgb(200, 50, 50);
-                        border: 2px solid rgb(220, 70, 70);
-                        border-radius: 20px;
-                    """)
-                    self.breaker_check_display.status_text.setText("NO SIGNAL")
-                    self.breaker_check_display.status_text.setStyleSheet("""
-                        color: rgb(200, 50, 50);
-                        font-size: 24px;
-                        font-weight: bold;
-                        font-family: 'Segoe UI';
-                        background: transparent;
-                        border: none;
-                    """)
+                    self.show_breaker_check("NO SIGNAL")
             else:
                 # Error reading - show red
-                self.breaker_check_display.status_indicator.setStyleSheet("""
-                    background: rgb(200, 50, 50);
-                    border: 2px solid rgb(220, 70, 70);
-                    border-radius: 20px;
-                """)
-                self.breaker_check_display.status_text.setText("READ ERROR")
-                self.breaker_check_display.status_text.setStyleSheet("""
-                    color: rgb(200, 50, 50);
-                    font-size: 24px;
-                    font-weight: bold;
-                    font-family: 'Segoe UI';
-                    background: transparent;
-                    border: none;
-                """)
+                self.show_breaker_check("READ ERROR")
         
         except Exception as e:
             print(f"Error updating breaker check display: {e}")
             # Error - show red
-            self.breaker_check_display.status_indicator.setStyleSheet("""
-                background: rgb(200, 50, 50);
-                border: 2px solid rgb(220, 70, 70);
-                border-radius: 20px;
-            """)
-            self.breaker_check_display.status_text.setText("ERROR")
-            self.breaker_check_display.status_text.setStyleSheet("""
-                color: rgb(200, 50, 50);
-                font-size: 24px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                background: transparent;
-                border: none;
-            """)
+            self.show_breaker_check("ERROR")
+    
+    def show_breaker_check(self, text, active=False):
+        """Set the breaker check lamp and text; the style only changes when active flips"""
+        display = self.breaker_check_display
+        display.status_text.setText(text)
+        state = "active" if active else "fault"
+        set_style_state(display.status_indicator, state)
+        set_style_state(display.status_text, state)
     
     def load_running_hours(self):
         """Load saved running hours from config"""
@@ -15265,10 +15461,9 @@ class StartupTab(QWidget):
                 return
             
             # Read current values
-            bus_voltage = self.read_bus_parameter(bus_voltage_config[0])
-            bus_frequency = self.read_bus_parameter(bus_frequency_config[0])
-            gen_voltage = self.read_bus_parameter(voltage_config[0])  # L1-L2
-            gen_frequency = self.read_bus_parameter(freq_config[0])
+            bus_voltage, bus_frequency, gen_voltage, gen_frequency = self.read_bus_parameters(
+                [("BusVoltage", bus_voltage_config[0]), ("BusFrequency", bus_frequency_config[0]),
+                 ("Voltage", voltage_config[0]), ("Frequency", freq_config[0])])  # gen voltage is L1-L2
             
             if None in [bus_voltage, bus_frequency, gen_voltage, gen_frequency]:
                 print("Synchronization: Failed to read values")
@@ -15296,6 +15491,11 @@ class StartupTab(QWidget):
                 self.cb_enable_timer.start()
                 return
             
+            # Collect the correction pulses so voltage and frequency edges on the
+            # same relay device go out together
+            pulses = []
+            messages = []
+            
             # Adjust voltage if needed
             if not voltage_synchronized:
                 volt_control = config_data.get("VoltageControl", {})
@@ -15303,27 +15503,17 @@ class StartupTab(QWidget):
                     # Generator voltage too low - increase
                     increase_config = volt_control.get("Increase", {})
                     if increase_config:
-                        device_id = increase_config.get("device_id", 1)
-                        coil_address = increase_config.get("coil_address", 0)
-                        pulse_duration = increase_config.get("pulse_duration", 200)
-                        
-                        response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
-                        if response and not response.isError():
-                            QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
-                            print(f"↑ Voltage increase pulse sent (diff: {voltage_diff:.1f}V)")
+                        pulses.append(self.control_pulse(increase_config, increase_config.get("pulse_duration", 200),
+                                                         volt_control.get("Decrease")))
+                        messages.append(f"↑ Voltage increase pulse sent (diff: {voltage_diff:.1f}V)")
                 
                 elif voltage_diff > voltage_tolerance:
                     # Generator voltage too high - decrease
                     decrease_config = volt_control.get("Decrease", {})
                     if decrease_config:
-                        device_id = decrease_config.get("device_id", 1)
-                        coil_address = decrease_config.get("coil_address", 0)
-                        pulse_duration = decrease_config.get("pulse_duration", 200)
-                        
-                        response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
-                        if response and not response.isError():
-                            QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
-                            print(f"↓ Voltage decrease pulse sent (diff: {voltage_diff:.1f}V)")
+                        pulses.append(self.control_pulse(decrease_config, decrease_config.get("pulse_duration", 200),
+                                                         volt_control.get("Increase")))
+                        messages.append(f"↓ Voltage decrease pulse sent (diff: {voltage_diff:.1f}V)")
             
             # Adjust frequency if needed
             if not frequency_synchronized:
@@ -15332,27 +15522,22 @@ class StartupTab(QWidget):
                     # Generator frequency too low - increase
                     increase_config = freq_control.get("Increase", {})
                     if increase_config:
-                        device_id = increase_config.get("device_id", 1)
-                        coil_address = increase_config.get("coil_address", 0)
-                        pulse_duration = increase_config.get("pulse_duration", 200)
-                        
-                        response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
-                        if response and not response.isError():
-                            QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
-                            print(f"↑ Frequency increase pulse sent (diff: {frequency_diff:.2f}Hz)")
+                        pulses.append(self.control_pulse(increase_config, increase_config.get("pulse_duration", 200),
+                                                         freq_control.get("Decrease")))
+                        messages.append(f"↑ Frequency increase pulse sent (diff: {frequency_diff:.2f}Hz)")
                 
                 elif frequency_diff > frequency_tolerance:
                     # Generator frequency too high - decrease
                     decrease_config = freq_control.get("Decrease", {})
                     if decrease_config:
-                        device_id = decrease_config.get("device_id", 1)
-                        coil_address = decrease_config.get("coil_address", 0)
-                        pulse_duration = decrease_config.get("pulse_duration", 200)
-                        
-                        response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
-                        if response and not response.isError():
-                            QTimer.singleShot(pulse_duration, lambda: self._turn_off_coil(device_id, coil_address))
-                            print(f"↓ Frequency decrease pulse sent (diff: {frequency_diff:.2f}Hz)")
+                        pulses.append(self.control_pulse(decrease_config, decrease_config.get("pulse_duration", 200),
+                                                         freq_control.get("Increase")))
+                        messages.append(f"↓ Frequency decrease pulse sent (diff: {frequency_diff:.2f}Hz)")
+            
+            if pulses:
+                for sent, message in zip(self.parent_window.coil_pulses.pulse_many(pulses), messages):
+                    if sent:
+                        print(message)
         
         except Exception as e:
             print(f"Synchronization error: {e}")
@@ -15380,18 +15565,12 @@ class StartupTab(QWidget):
         bus_voltage_config = electrical_params.get("BusVoltage", [])
         bus_frequency_config = electrical_params.get("BusFrequency", [])
         
-        bus_voltage_available = False
-        bus_frequency_available = False
-        
-        if bus_voltage_config and len(bus_voltage_config) > 0:
-            bus_voltage_value = self.read_bus_parameter(bus_voltage_config[0])
-            if bus_voltage_value is not None and bus_voltage_value > 0:
-                bus_voltage_available = True
-        
-        if bus_frequency_config and len(bus_frequency_config) > 0:
-            bus_frequency_value = self.read_bus_parameter(bus_frequency_config[0])
-            if bus_frequency_value is not None and bus_frequency_value > 0:
-                bus_frequency_available = True
+        bus_voltage_value, bus_frequency_value = self.parent_window.tag_reader.read_many([
+            self.bus_parameter_tag(bus_voltage_config[0], "BusVoltage") if bus_voltage_config else None,
+            self.bus_parameter_tag(bus_frequency_config[0], "BusFrequency") if bus_frequency_config else None,
+        ])
+        bus_voltage_available = bus_voltage_value is not None and bus_voltage_value > 0
+        bus_frequency_available = bus_frequency_value is not None and bus_frequency_value > 0
         
         # Start CB enable process
         self.cb_enable_active = True
@@ -15442,7 +15621,7 @@ class StartupTab(QWidget):
             coil_address = cb_config.get("cb_enable_coil_address", 0)
             
             # Write coil ON continuously
-            response = self.modbus_client.write_coil(coil_address, True, slave=device_id)
+            response = self.modbus_client.write_coil(coil_address, True, device_id=device_id)
             
             if response and response.isError():
                 print(f"Error writing CB enable coil: {response}")
@@ -15450,6 +15629,12 @@ class StartupTab(QWidget):
         except Exception as e:
             print(f"CB enable write error: {e}")
     
+    def breaker_check_tag(self, cb_config):
+        """Tag for the breaker check signal (zero-based address, raw value)"""
+        return Tag(cb_config.get("breaker_check_device_id", 1),
+                   cb_config.get("breaker_check_register_type", "coil"),
+                   cb_config.get("breaker_check_address", 0))
+    
     def check_breaker_status(self):
         """Check breaker status - stop when breaker check becomes TRUE"""
         if not self.modbus_client or not self.cb_enable_active:
@@ -15459,28 +15644,10 @@ class StartupTab(QWidget):
             config_data = load_encrypted_config("modbus_config.dat") or {}
             cb_config = config_data.get("CBControl", {})
             
-            device_id = cb_config.get("breaker_check_device_id", 1)
-            address = cb_config.get("breaker_check_address", 0)
-            reg_type = cb_config.get("breaker_check_register_type", "coil")
-            
-            result = None
+            value = self.parent_window.tag_reader.read(self.breaker_check_tag(cb_config), max_age=0)
             
-            if reg_type == "coil":
-                result = self.modbus_client.read_coils(address, 1, slave=device_id)
-            elif reg_type == "discrete":
-                result = self.modbus_client.read_discrete_inputs(address, 1, slave=device_id)
-            elif reg_type == "input":
-                result = self.modbus_client.read_input_registers(address, 1, slave=device_id)
-            elif reg_type == "holding":
-                result = self.modbus_client.read_holding_registers(address, 1, slave=device_id)
-            
-            if result and not result.isError():
-                breaker_closed = False
-                
-                if hasattr(result, "bits"):
-                    breaker_closed = result.bits[0]
-                elif hasattr(result, "registers"):
-                    breaker_closed = result.registers[0] == 1
+            if value is not None:
+                breaker_closed = value == 1
                 
                 # If breaker check is TRUE, stop CB enable automatically
                 if breaker_closed:
@@ -15630,7 +15797,41 @@ class HMIWindow(QWidget):
         self.connect_btn.clicked.connect(self.connect_modbus)
 
         self.status_label = QLabel("DISCONNECTED")
-        self.status_label.setStyleSheet(STATUS_DISCONNECTED_STYLE)
+        self.status_label.setStyleSheet(STATUS_LABEL_STYLE)
+        set_style_state(self.status_label, "disconnected")
+        
+        # Serial transport: own RTU framer (spec timing, exact-length reads) or the pymodbus client
+        self.fast_rtu_check = QCheckBox("FAST RTU")
+        self.fast_rtu_check.setToolTip("Use the low-latency RTU framer for the serial port (applies on connect)")
+        self.fast_rtu_check.setStyleSheet("color: rgb(156, 163, 175); font-size: 12px; font-weight: 600;")
+        
+        # Listen-only: another master owns the line - mirror its traffic, never transmit
+        self.listen_only_check = QCheckBox("LISTEN ONLY")
+        self.listen_only_check.setToolTip("Never transmit: take values from another master's traffic "
+                                          "on the line (applies on connect; outputs are disabled)")
+        self.listen_only_check.setStyleSheet("color: rgb(156, 163, 175); font-size: 12px; font-weight: 600;")
+        
+        # Render policy: frame-rate cap and easing of the animated widgets, throttled when unfocused or idle
+        self.render_governor = RenderGovernor(
+            animation_clock(), policy_from_config(load_encrypted_config("modbus_config.dat")), self)
+        self.fps_box = QComboBox()
+        self.fps_box.setMinimumHeight(36)
+        self.fps_box.setMaximumHeight(36)
+        self.fps_box.setStyleSheet(COMBOBOX_STYLE)
+        self.fps_box.setToolTip("Animation frame rate while the panel is in use")
+        for fps in FPS_CHOICES:
+            self.fps_box.addItem(f"{fps} FPS", fps)
+        fps_index = self.fps_box.findData(self.render_governor.policy["fps"])
+        self.fps_box.setCurrentIndex(fps_index if fps_index >= 0 else 0)
+        self.fps_box.currentIndexChanged.connect(self.save_render_policy)
+        self.snap_check = QCheckBox("NO EASING")
+        self.snap_check.setToolTip("Show each new reading at once instead of animating towards it")
+        self.snap_check.setStyleSheet("color: rgb(156, 163, 175); font-size: 12px; font-weight: 600;")
+        self.snap_check.setChecked(bool(self.render_governor.policy["snap"]))
+        self.snap_check.toggled.connect(self.save_render_policy)
+        # Paint instrumentation: repaint rate, repainted share of the widget and paint time
+        self.render_stats_label = QLabel("")
+        self.render_stats_label.setStyleSheet("color: rgb(156, 163, 175); font-size: 12px;")
         
         # Test Mode Button - Elite Professional Design
         self.test_mode_btn = QPushButton("TEST MODE")
@@ -15779,6 +15980,19 @@ class HMIWindow(QWidget):
         self.config_btn.clicked.connect(self.show_configuration_dialog)
         self.config_btn.setVisible(False)  # Initially hidden, only visible in developer mode
 
+        # Bus capture / replay buttons
+        self.record_btn = QPushButton("● RECORD")
+        self.record_btn.setMinimumHeight(40)
+        self.record_btn.setCursor(Qt.PointingHandCursor)
+        self.record_btn.setStyleSheet(MODE_BUTTON_STYLE)
+        self.record_btn.clicked.connect(self.toggle_bus_capture)
+
+        self.replay_btn = QPushButton("▶ REPLAY")
+        self.replay_btn.setMinimumHeight(40)
+        self.replay_btn.setCursor(Qt.PointingHandCursor)
+        self.replay_btn.setStyleSheet(MODE_BUTTON_STYLE)
+        self.replay_btn.clicked.connect(self.toggle_replay)
+
         # NOW create the control bar and only add company name
         control_bar_container = QWidget()
         control_bar_container.setStyleSheet(TOPBAR_STYLE)
@@ -15839,6 +16053,9 @@ class HMIWindow(QWidget):
         self.settings_tab = self.create_settings_tab()
         self.content_stack.addWidget(self.settings_tab)
         
+        self.bus_monitor_tab = BusMonitorTab(parent=self)
+        self.content_stack.addWidget(self.bus_monitor_tab)
+        
         # Create navigation bar container - matching sample-ui.py blueprint
         nav_bar_container = QWidget()
         nav_bar_container.setObjectName("NavBar")
@@ -15873,7 +16090,8 @@ class HMIWindow(QWidget):
             ("Electrical", 5),
             ("History", 6),
             ("Report", 7),
-            ("Settings", 8)
+            ("Settings", 8),
+            ("Bus Monitor", 9)
         ]
         
         for label, index in nav_items:
@@ -15895,129 +16113,87 @@ class HMIWindow(QWidget):
         # Apply blueprint styling to navigation buttons
         self.apply_nav_button_blueprint_styles()
         
-        self.main_layout.addWidget(control_bar_container, 0)  # Fixed size (no stretch)
-        self.main_layout.addWidget(self.content_stack, 1)     # Takes remaining space
-        self.main_layout.addWidget(nav_bar_container, 0)      # Fixed size (no stretch)
-        self.setLayout(self.main_layout)
-
-        # Modbus setup
-        self.client = None
-        self.timer = QTimer()
+        # Shown while the link is down: the pages keep their last values until the supervisor reconnects
+        self.stale_banner = QLabel()
+        self.stale_banner.setAlignment(Qt.AlignCenter)
+        self.stale_banner.setStyleSheet("""
+            QLabel {
+                color: rgb(251, 191, 36);
+                background: rgba(245, 158, 11, 0.12);
+                border: 1px solid rgba(245, 158, 11, 0.35);
+                font-size: 12px;
+                font-weight: 600;
+                padding: 4px;
+            }
+        """)
+        self.stale_banner.hide()
+        
+        self.main_layout.addWidget(control_bar_container, 0)  # Fixed size (no stretch)
+        self.main_layout.addWidget(self.stale_banner, 0)
+        self.main_layout.addWidget(self.content_stack, 1)     # Takes remaining space
+        self.main_layout.addWidget(nav_bar_container, 0)      # Fixed size (no stretch)
+        self.setLayout(self.main_layout)
+
+        # Modbus setup
+        self.client = None
+        self.timer = QTimer()
         self.timer.timeout.connect(self.read_data)
         
+        # Shared tag access for configured points (electrical, startup, report)
+        self.tag_reader = TagReader()
+        
+        # Momentary coil outputs (raise/lower, start/stop) - timed off the GUI thread
+        self.coil_pulses = CoilPulseEngine()
+        
+        # Alarm relay coils - set by the gauges, flushed once per poll cycle
+        self.relay_outputs = RelayOutputs()
+        
+        # Which configured points own each device address (reverse lookup for diagnostics)
+        self.address_index = index_from_config({})
+        
         # Connection monitoring
         self.failed_attempts = 0
         self.max_failed_attempts = 3
         self.reconnect_attempts = 0
-        self.max_reconnect_attempts = 3
         self.is_connected = False
-        
-        # Test mode
+        self.last_good_update = None
+        
+        # Connection supervisor - opens and reopens the port off the GUI thread, with backoff
+        self.link_watch = LinkWatch()
+        # Which client to open, captured on the GUI thread for the supervisor (see connection_settings)
+        self.connection = {"port": None, "fast_rtu": False, "listen_only": False,
+                           "test_mode": False, "replay_path": None, "replay_speed": 1.0}
+        self.connection_events = ConnectionEvents()
+        self.connection_events.event.connect(self.on_connection_event)
+        self.supervisor = ConnectionSupervisor(self.open_bus_client, self.probe_stations,
+                                               self.connection_events.event.emit)
+        
+        # Test mode - served by the local Modbus simulator so the real I/O path runs
         self.test_mode = False
+        self.simulator = None
         self.test_timer = QTimer()
         self.test_timer.timeout.connect(self.generate_test_data)
         
-        # Test data storage for smooth animation
-        # Initialize with realistic starting values across all ranges (raw register format)
-        
-        # Cylinder Head Temperatures: Mix of normal, warning, and critical values
-        # Normal: <400°C (4000), Warning: 400-600°C (4000-6000), Critical: >600°C (6000+)
-        self.test_cylinder_temps = []
-        for i in range(18):
-            rand = random.random()
-            if rand < 0.6:  # 60% normal range
-                self.test_cylinder_temps.append(random.randint(2800, 3900))  # 280-390°C
-            elif rand < 0.85:  # 25% warning range
-                self.test_cylinder_temps.append(random.randint(4100, 5800))  # 410-580°C
-            else:  # 15% critical range
-                self.test_cylinder_temps.append(random.randint(6100, 7000))  # 610-700°C
-        
-        # Main Bearing Temperatures: Mix of normal, warning, and critical values
-        # Normal: <150°C (1500), Warning: 150-250°C (1500-2500), Critical: >250°C (2500+)
-        self.test_bearing_temps = []
-        for i in range(10):
-            rand = random.random()
-            if rand < 0.7:  # 70% normal range
-                self.test_bearing_temps.append(random.randint(700, 1400))   # 70-140°C
-            elif rand < 0.9:  # 20% warning range
-                self.test_bearing_temps.append(random.randint(1600, 2400))  # 160-240°C
-            else:  # 10% critical range
-                self.test_bearing_temps.append(random.randint(2600, 3000))  # 260-300°C
-        
-        # Test engine temperatures: Mix of normal, warning, and critical values
-        # Range: 50-250°C (stored as register values * 10)
-        self.test_engine_temps = []
-        for i in range(16):
-            rand = random.random()
-            if rand < 0.65:  # 65% normal range (50-180°C)
-                self.test_engine_temps.append(random.randint(500, 1800))   # 50-180°C
-            elif rand < 0.85:  # 20% warning range (180-220°C)
-                self.test_engine_temps.append(random.randint(1800, 2200))  # 180-220°C
-            else:  # 15% critical range (220-250°C)
-                self.test_engine_temps.append(random.randint(2200, 2500))  # 220-250°C
-        
-        # Test electrical parameters with realistic warning/critical distributions
-        self.test_electrical_params = []
-        electrical_configs = [
-            # [normal_range, warning_range, critical_range] for each parameter
-            ([385, 415], [375, 384, 416, 425], [350, 374, 426, 450]),  # Voltage L1-L2
-            ([385, 415], [375, 384, 416, 425], [350, 374, 426, 450]),  # Voltage L2-L3
-            ([385, 415], [375, 384, 416, 425], [350, 374, 426, 450]),  # Voltage L3-L1
-            ([20, 60], [61, 80], [81, 100]),                           # Current L1
-            ([20, 60], [61, 80], [81, 100]),                           # Current L2
-            ([20, 60], [61, 80], [81, 100]),                           # Current L3
-            ([200, 600], [601, 800], [801, 1000]),                     # Active Power (kW)
-            ([920, 990], [880, 919], [800, 879]),                      # Power Factor (0.80-0.99)
-            ([50, 200], [201, 350], [351, 500])                        # Reactive Power (kVAR)
-        ]
+        # Bus capture / replay - poll_interval is scaled when replaying faster than recorded
+        self.poll_interval = 1000
+        self.bus_capture = None
+        self.replay_path = None
+        self.replay_speed = 1.0
         
-        for i, config in enumerate(electrical_configs):
-            rand = random.random()
-            if rand < 0.65:  # 65% normal range
-                normal_range = config[0]
-                self.test_electrical_params.append(random.randint(normal_range[0], normal_range[1]))
-            elif rand < 0.85:  # 20% warning range
-                warning_range = config[1]
-                if len(warning_range) == 4:  # Voltage has two warning ranges (low and high)
-                    if random.random() < 0.5:
-                        self.test_electrical_params.append(random.randint(warning_range[0], warning_range[1]))
-                    else:
-                        self.test_electrical_params.append(random.randint(warning_range[2], warning_range[3]))
-                else:
-                    self.test_electrical_params.append(random.randint(warning_range[0], warning_range[1]))
-            else:  # 15% critical range
-                critical_range = config[2]
-                if len(critical_range) == 4:  # Voltage has two critical ranges (low and high)
-                    if random.random() < 0.5:
-                        self.test_electrical_params.append(random.randint(critical_range[0], critical_range[1]))
-                    else:
-                        self.test_electrical_params.append(random.randint(critical_range[2], critical_range[3]))
-                else:
-                    self.test_electrical_params.append(random.randint(critical_range[0], critical_range[1]))
-        
-        # Test pressures with realistic warning/critical distributions
-        # Values in register format (multiply actual bar values by 10)
-        self.test_pressures = []
-        pressure_configs = [
-            # [normal_range, warning_range, critical_range, is_reverse, max_range]
-            ([20, 80], [90, 110], [120, 150], False, 15),   # Fuel Oil Pressure Inlet (0-15 bar)
-            ([40, 80], [25, 35], [10, 20], True, 10),       # Lube Oil Pressure Inlet (0-10 bar, reverse)
-            ([20, 60], [70, 80], [90, 100], False, 10),     # LT Water Pressure (0-10 bar)
-            ([20, 60], [70, 80], [90, 100], False, 10),     # HT Water Pressure (0-10 bar)
-            ([20, 60], [70, 80], [90, 100], False, 10),     # Charge Air Pressure (0-10 bar)
-            ([80, 200], [210, 240], [250, 300], False, 30), # Starting Air Pressure (0-30 bar)
-            ([20, 60], [70, 80], [90, 100], False, 10),     # Lube Oil Differential Pressure (0-10 bar)
-            ([10, 30], [35, 40], [45, 50], False, 5)        # Crank Case Pressure (0-5 bar)
-        ]
+        # View-driven polling - the current page's points poll fast, off-screen display-only points back off
+        self.poll_scheduler = PollScheduler(self.poll_interval / 1000.0)
+        self.register_poll_groups()
+        self.station_ok = {station: False for station in range(1, 6)}
+        self.station_data = {2: None, 3: None}
         
-        for i, (normal, warning, critical, is_reverse, max_range) in enumerate(pressure_configs):
-            rand = random.random()
-            if rand < 0.6:  # 60% normal range
-                self.test_pressures.append(random.randint(normal[0], normal[1]))
-            elif rand < 0.8:  # 20% warning range
-                self.test_pressures.append(random.randint(warning[0], warning[1]))
-            else:  # 20% critical range
-                self.test_pressures.append(random.randint(critical[0], critical[1]))
+        # Bus statistics - every client is wrapped so counters cover live, test and replay traffic
+        self.bus_stats = BusStats(baudrate=9600)
+        self.bus_stats_timer = QTimer()
+        self.bus_stats_timer.timeout.connect(self.update_bus_diagnostics)
+        self.bus_stats_timer.start(1000)
+        
+        # Bus monitor - last transactions in a fixed ring, shown on the Bus Monitor page
+        self.bus_monitor = FrameRing()
         
         # Load initial configuration
         self.load_initial_configuration()
@@ -16114,6 +16290,8 @@ class HMIWindow(QWidget):
         conn_layout.addWidget(self.port_box)
         
         # Connect button and status
+        conn_layout.addWidget(self.fast_rtu_check)
+        conn_layout.addWidget(self.listen_only_check)
         conn_layout.addWidget(self.connect_btn)
         conn_layout.addWidget(self.status_label)
         conn_layout.addStretch()
@@ -16145,8 +16323,13 @@ class HMIWindow(QWidget):
         modes_layout = QHBoxLayout()
         modes_layout.setSpacing(20)
         modes_layout.addWidget(self.test_mode_btn)
+        modes_layout.addWidget(self.record_btn)
+        modes_layout.addWidget(self.replay_btn)
         modes_layout.addWidget(self.dev_mode_btn)
         modes_layout.addWidget(self.config_btn)
+        modes_layout.addWidget(self.fps_box)
+        modes_layout.addWidget(self.snap_check)
+        modes_layout.addWidget(self.render_stats_label)
         modes_layout.addStretch()
         modes_group.setLayout(modes_layout)
         main_layout.addWidget(modes_group)
@@ -16178,6 +16361,70 @@ class HMIWindow(QWidget):
         admin_group.setLayout(admin_layout)
         main_layout.addWidget(admin_group)
         
+        # Bus Diagnostics Section
+        diagnostics_group = QGroupBox("BUS DIAGNOSTICS")
+        diagnostics_group.setStyleSheet("""
+            QGroupBox {
+                background: rgba(31, 41, 55, 0.4);
+                border: 2px solid rgba(75, 85, 99, 0.5);
+                border-radius: 0px;
+                margin-top: 20px;
+                padding-top: 30px;
+                font-size: 14px;
+                font-weight: 600;
+                color: rgb(156, 163, 175);
+                letter-spacing: 0.05em;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                subcontrol-position: top left;
+                padding: 8px 16px;
+                color: rgb(147, 197, 253);
+            }
+        """)
+        diagnostics_layout = QVBoxLayout()
+        
+        diagnostics_header = QHBoxLayout()
+        self.bus_summary_label = QLabel("No bus traffic")
+        self.bus_summary_label.setStyleSheet("color: rgb(180, 200, 220); font-size: 12px; font-weight: bold;")
+        diagnostics_header.addWidget(self.bus_summary_label)
+        diagnostics_header.addStretch()
+        bus_stats_reset_btn = QPushButton("RESET")
+        bus_stats_reset_btn.setCursor(Qt.PointingHandCursor)
+        bus_stats_reset_btn.setStyleSheet(MODE_BUTTON_STYLE)
+        bus_stats_reset_btn.clicked.connect(lambda: (self.bus_stats.reset(), self.update_bus_diagnostics()))
+        diagnostics_header.addWidget(bus_stats_reset_btn)
+        diagnostics_layout.addLayout(diagnostics_header)
+        
+        self.bus_stats_table = QTableWidget()
+        self.bus_stats_table.setColumnCount(10)
+        self.bus_stats_table.setHorizontalHeaderLabels(
+            ["Device", "Function", "Transactions", "Bytes Tx/Rx", "p50 ms", "p95 ms", "p99 ms",
+             "Timeouts", "Exceptions", "Frame Errors"])
+        self.bus_stats_table.verticalHeader().setVisible(False)
+        self.bus_stats_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.bus_stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.bus_stats_table.setMinimumHeight(180)
+        self.bus_stats_table.setStyleSheet("""
+            QTableWidget {
+                background: rgb(15, 22, 35);
+                color: rgb(160, 180, 200);
+                border: 1px solid rgb(50, 70, 90);
+                gridline-color: rgb(35, 50, 65);
+                font-size: 11px;
+            }
+            QHeaderView::section {
+                background: rgb(25, 35, 50);
+                color: rgb(147, 197, 253);
+                border: 1px solid rgb(50, 70, 90);
+                padding: 4px;
+                font-weight: bold;
+            }
+        """)
+        diagnostics_layout.addWidget(self.bus_stats_table)
+        diagnostics_group.setLayout(diagnostics_layout)
+        main_layout.addWidget(diagnostics_group)
+        
         # Info section
         info_label = QLabel("⚠ These settings control system connections and access. Please use with caution.")
         info_label.setWordWrap(True)
@@ -16332,14 +16579,55 @@ class HMIWindow(QWidget):
             self.port_box.addItem("No Ports Found")
 
     # -------- Modbus Connect --------
-    def connect_modbus(self):
-        port = self.port_box.currentText()
-        if "No" in port:
-            QMessageBox.warning(self, "Connection Error", "No COM port available.")
-            return
-
-        try:
-            self.client = ModbusSerialClient(
+    def connection_settings(self, port=None):
+        """Everything that decides which client to open, read from the widgets and modes (GUI thread only)"""
+        return {
+            "port": port,
+            "fast_rtu": self.fast_rtu_check.isChecked(),
+            "listen_only": self.listen_only_check.isChecked(),
+            "test_mode": self.test_mode,
+            "replay_path": self.replay_path,
+            "replay_speed": self.replay_speed,
+        }
+    
+    def create_modbus_client(self, settings):
+        """Create the bus client for connection_settings(): a capture replay, the local simulator in
+        test mode, or the serial port (through the fast RTU framer or the listen-only sniffer when enabled).
+        Touches no widgets, so the supervisor thread may call it."""
+        port = settings["port"]
+        fast_rtu = settings["fast_rtu"]
+        listen_only = settings["listen_only"]
+        if settings["replay_path"]:
+            return self.wrap_modbus_client(ReplayClient(settings["replay_path"], speed=settings["replay_speed"]),
+                                           replay=True)
+        if settings["test_mode"]:
+            client = ModbusTcpClient(
+                SIMULATOR_HOST,
+                port=SIMULATOR_TCP_PORT,
+                timeout=0.2
+            )
+        elif listen_only:
+            # Statistics and the bus monitor are fed with the traffic the sniffer hears
+            client = SnifferClient(
+                port,
+                baudrate=9600,
+                bytesize=8,
+                parity='N',
+                stopbits=1,
+                stats=self.bus_stats,
+                ring=self.bus_monitor
+            )
+        elif fast_rtu:
+            client = RtuClient(
+                port,
+                baudrate=9600,
+                bytesize=8,
+                parity='N',
+                stopbits=1,
+                timeout=0.2
+            )
+        else:
+            client = ModbusSerialClient(
                 port=port,
                 baudrate=9600,
                 bytesize=8,
@@ -16347,51 +16635,199 @@ class HMIWindow(QWidget):
                 stopbits=1,
                 timeout=0.2  # 200ms timeout - prevents UI freezing when stations don't respond
             )
-            if self.client.connect():
-                self.is_connected = True
-                self.failed_attempts = 0
-                self.reconnect_attempts = 0
+        return self.wrap_modbus_client(client)
+    
+    def wrap_modbus_client(self, client, replay=False):
+        """Layer traffic capture, link watch, bus statistics, the bus monitor and the bus lock over a bare client"""
+        if not replay:
+            # Always in the chain - RECORD only hands it a writer
+            client = CaptureClient(client, self.bus_capture)
+        client = LinkWatchClient(client, self.link_watch)
+        if getattr(base_client(client), "listen_only", False):
+            # Lookups in the sniffer's process image are not bus traffic - it records what it hears itself
+            return SerializedClient(client)
+        # Serialized outermost: the pulse worker thread shares the client with the GUI poll,
+        # and the monitor ring relies on a single writer
+        return SerializedClient(MonitorClient(BusStatsClient(client, self.bus_stats), self.bus_monitor))
+    
+    def open_bus_client(self, port):
+        """Client factory for the connection supervisor (runs on its worker thread).
+
+        Uses only the settings connect_modbus/toggle_test_mode captured; `port` is
+        the supervisor's stable name for the same port (None in test mode).
+        """
+        return self.create_modbus_client(dict(self.connection, port=port))
+    
+    def probe_stations(self, client):
+        """Names of the stations that answer a test read; empty when none do (supervisor thread)"""
+        working = []
+        for name, device_id, count in (("Pressures", 1, 8), ("Cylinder Head", 2, 16), ("Main Bearing", 3, 12)):
+            # Test each station independently - exceptions from one won't affect others
+            try:
+                result = client.read_input_registers(address=0, count=count, device_id=device_id)
+                ok = result and not result.isError()
+                print(f"Connection test Station {device_id}: {'OK' if ok else 'FAILED'}")
+            except Exception as e:
+                ok = False
+                print(f"Connection test Station {device_id} EXCEPTION: {e}")
+            if ok:
+                working.append(name)
+        return working
+    
+    def refresh_address_index(self):
+        """Rebuild the address-space index from the saved configuration and report conflicts"""
+        try:
+            self.address_index = index_from_config(load_encrypted_config("modbus_config.dat") or {})
+        except Exception as e:
+            print(f"Address index rebuild failed: {e}")
+            return
+        for a, b in self.address_index.conflicts():
+            print(f"⚠️ Address conflict: {a.describe()} overlaps {b.describe()}")
+    
+    def attach_modbus_client(self, client):
+        """Start polling with a connected client and hand it to the tabs that write coils"""
+        self.client = client
+        self.is_connected = True
+        self.failed_attempts = 0
+        self.reconnect_attempts = 0
+        self.station_ok = {station: False for station in range(1, 6)}
+        self.station_data = {2: None, 3: None}
+        # A replay must issue the recorded requests in order, so it polls every group every cycle
+        self.poll_scheduler.set_rate(self.poll_interval / 1000.0, adaptive=not self.replay_path)
+        self.poll_scheduler.reset()
+        self.timer.start(int(self.poll_scheduler.tick_interval() * 1000))
+        # Set modbus client for tabs that need coil writing
+        self.cylinder_tab.set_modbus_client(self.client, self.relay_outputs)
+        self.bearing_tab.set_modbus_client(self.client, self.relay_outputs)
+        self.pressures_tab.set_modbus_client(self.client, self.relay_outputs)
+        self.engine_temps_tab.set_modbus_client(self.client, self.relay_outputs)
+        self.electrical_tab.set_modbus_client(self.client, self.relay_outputs)
+        self.startup_tab.modbus_client = self.client
+        self.tag_reader.set_client(self.client)
+        # The recording may have started or stopped while this client was being opened
+        capture = capture_layer(self.client)
+        if capture:
+            capture.set_writer(self.bus_capture)
+        # Listen-only never transmits: alarm relays and command pulses stay local
+        writer = None if getattr(base_client(client), "listen_only", False) else self.client
+        self.coil_pulses.set_client(writer)
+        self.relay_outputs.set_client(writer)
+        self.refresh_address_index()
+    
+    def detach_modbus_client(self, clear_displays=True):
+        """Stop polling, close the client and (unless the link was lost) clear all data shown from the bus"""
+        self.timer.stop()
+        self.supervisor.stop()
+        # Drop any pulse still holding a coil before the line goes away
+        self.coil_pulses.set_client(None)
+        self.relay_outputs.set_client(None)
+        if self.client:
+            self.client.close()
+        self.client = None
+        self.is_connected = False
+        self.failed_attempts = 0
+        self.reconnect_attempts = 0
+        # Disconnect modbus clients
+        self.cylinder_tab.set_modbus_client(None)
+        self.bearing_tab.set_modbus_client(None)
+        self.pressures_tab.set_modbus_client(None)
+        self.engine_temps_tab.set_modbus_client(None)
+        self.electrical_tab.set_modbus_client(None)
+        self.startup_tab.modbus_client = None
+        self.tag_reader.set_client(None)
+        if not clear_displays:
+            return
+        # Clear all data shown from the bus
+        self.set_data_stale(False)
+        self.cylinder_tab.update_temps([0] * 18)
+        self.bearing_tab.update_temps([0] * 10)
+        self.pressures_tab.update_pressures([0] * 8)
+        self.engine_temps_tab.update_temperatures([0] * 16)
+        self.electrical_tab.clear_displays()
+        self.report_tab.update_cylinder_head_data([0] * 18)
+        self.report_tab.update_main_bearing_data([0] * 10)
+        self.report_tab.update_pressure_data([0] * 8)
+        self.report_tab.update_engine_temperatures([0] * 16)
+        self.report_tab.update_electrical_data([0] * 9)
+    
+    def connect_modbus(self):
+        port = self.port_box.currentText()
+        if "No" in port:
+            QMessageBox.warning(self, "Connection Error", "No COM port available.")
+            return
+
+        # The supervisor opens the port and probes the stations in the background, retrying until they answer
+        self.connection = self.connection_settings(port)
+        self.reconnect_attempts = 0
+        self.supervisor.start(port)
+        self.update_status("reconnecting")
+        self.connect_btn.setText("Disconnect")
+        self.connect_btn.setStyleSheet("""
+            QPushButton {
+                background: rgb(200, 50, 50);
+                color: white;
+                border: 1px solid rgb(220, 70, 70);
+                font-size: 13px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background: rgb(220, 70, 70);
+            }
+            QPushButton:pressed {
+                background: rgb(180, 40, 40);
+            }
+        """)
+        self.connect_btn.clicked.disconnect()
+        self.connect_btn.clicked.connect(self.disconnect_modbus)
+    
+    def on_connection_event(self, kind, data):
+        """Connection supervisor progress, delivered on the GUI thread"""
+        if kind == "connected":
+            client, working_stations, session = data
+            if not self.supervisor.current(session):
+                # Disconnected (or restarted) while this attempt was running
+                client.close()
+                return
+            self.attach_modbus_client(client)
+            self.set_data_stale(False)
+            if len(working_stations) == 3:
                 self.update_status("connected")
-                self.timer.start(1000)
-                self.connect_btn.setText("Disconnect")
-                self.connect_btn.setStyleSheet("""
-                    QPushButton {
-                        background: rgb(200, 50, 50);
-                        color: white;
-                        border: 1px solid rgb(220, 70, 70);
-                        font-size: 13px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background: rgb(220, 70, 70);
-                    }
-                    QPushButton:pressed {
-                        background: rgb(180, 40, 40);
-                    }
-                """)
-                self.connect_btn.clicked.disconnect()
-                self.connect_btn.clicked.connect(self.disconnect_modbus)
-                # Set modbus client for tabs that need coil writing
-                self.cylinder_tab.set_modbus_client(self.client)
-                self.bearing_tab.set_modbus_client(self.client)
-                self.pressures_tab.set_modbus_client(self.client)
-                self.engine_temps_tab.set_modbus_client(self.client)
-                self.electrical_tab.set_modbus_client(self.client)
-                self.startup_tab.modbus_client = self.client
             else:
-                QMessageBox.critical(self, "Error", "Failed to connect to Modbus device.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+                # Partial connection - show which systems are working
+                self.show_partial_status(working_stations)
+        elif kind == "retry":
+            if self.supervisor.state == STATE_IDLE:
+                return
+            attempt, delay, reason = data
+            self.reconnect_attempts = attempt
+            self.update_status("reconnecting")
+            self.status_label.setToolTip(f"{reason} - next attempt in {delay:.1f} s")
+    
+    def connection_lost(self):
+        """Hand the port back to the supervisor; the pages keep their last values, marked stale"""
+        print("Link lost - reconnecting in the background")
+        self.detach_modbus_client(clear_displays=False)
+        self.report_tab.update_connection_status(False)
+        self.update_status("reconnecting")
+        self.supervisor.start(self.connection["port"])
+    
+    def set_data_stale(self, stale):
+        """Show or hide the stale-data banner over the pages"""
+        if stale:
+            since = self.last_good_update.strftime("%H:%M:%S") if self.last_good_update else "--:--:--"
+            self.stale_banner.setText(f"⚠ STALE DATA - last good update {since} - values are not live")
+            self.stale_banner.show()
+        else:
+            self.stale_banner.hide()
     
     # -------- Modbus Disconnect --------
     def disconnect_modbus(self):
-        if self.client:
-            self.timer.stop()
-            self.client.close()
-            self.client = None
-            self.is_connected = False
-            self.failed_attempts = 0
-            self.reconnect_attempts = 0
+        connecting = self.supervisor.state != STATE_IDLE
+        self.supervisor.stop()
+        if self.client or connecting:
+            if self.client:
+                self.detach_modbus_client()
+            self.set_data_stale(False)
             self.update_status("disconnected")
             self.report_tab.update_connection_status(False)
             self.connect_btn.setText("Connect")
@@ -16412,149 +16848,28 @@ class HMIWindow(QWidget):
             """)
             self.connect_btn.clicked.disconnect()
             self.connect_btn.clicked.connect(self.connect_modbus)
-            # Clear all data and disconnect modbus clients
-            self.cylinder_tab.set_modbus_client(None)
-            self.cylinder_tab.update_temps([0] * 18)
-            self.bearing_tab.set_modbus_client(None)
-            self.bearing_tab.update_temps([0] * 10)
-            self.pressures_tab.set_modbus_client(None)
-            self.pressures_tab.update_pressures([0] * 8)
-            self.engine_temps_tab.set_modbus_client(None)
-            self.engine_temps_tab.update_temperatures([0] * 16)
-            self.electrical_tab.set_modbus_client(None)
-            self.electrical_tab.clear_displays()
-            self.startup_tab.modbus_client = None
-            # Clear report tab data
-            self.report_tab.update_cylinder_head_data([0] * 18)
-            self.report_tab.update_main_bearing_data([0] * 10)
-            self.report_tab.update_pressure_data([0] * 8)
-            self.report_tab.update_engine_temperatures([0] * 16)
-            self.report_tab.update_electrical_data([0] * 9)
     
     # -------- Update Status Display --------
     def update_status(self, status):
+        self.status_label.setToolTip("")
         if status == "connected":
             self.status_label.setText("CONNECTED")
-            self.status_label.setStyleSheet(STATUS_CONNECTED_STYLE)
+            set_style_state(self.status_label, "connected")
         elif status == "reconnecting":
-            self.status_label.setText(f"RECONNECTING {self.reconnect_attempts}/{self.max_reconnect_attempts}")
-            self.status_label.setStyleSheet(STATUS_RECONNECTING_STYLE)
+            self.status_label.setText(f"RECONNECTING ({self.reconnect_attempts})" if self.reconnect_attempts
+                                      else "CONNECTING")
+            set_style_state(self.status_label, "reconnecting")
         elif status == "error":
             self.status_label.setText(f"ERROR {self.failed_attempts}/{self.max_failed_attempts}")
-            self.status_label.setStyleSheet(STATUS_ERROR_STYLE)
+            set_style_state(self.status_label, "error")
         else:  # disconnected
             self.status_label.setText("DISCONNECTED")
-            self.status_label.setStyleSheet(STATUS_DISCONNECTED_STYLE)
+            set_style_state(self.status_label, "disconnected")
     
-    # -------- Attempt Reconnection --------
-    def attempt_reconnection(self):
-        if self.reconnect_attempts >= self.max_reconnect_attempts:
-            self.disconnect_modbus()
-            QMessageBox.critical(self, "Connection Lost", 
-                f"No response from device after {self.max_reconnect_attempts} attempts.\n\n"
-                f"Possible causes:\n"
-                f"• Wrong COM port is selected\n"
-                f"• Device is disconnected or powered off\n"
-                f"• Communication cable issue\n"
-                f"• Device is not responding\n\n"
-                f"Please check the device and reconnect manually.")
-            return
-        
-        self.reconnect_attempts += 1
-        self.update_status("reconnecting")
-        
-        try:
-            if self.client:
-                self.client.close()
-            
-            port = self.port_box.currentText()
-            self.client = ModbusSerialClient(
-                port=port,
-                baudrate=9600,
-                bytesize=8,
-                parity='N',
-                stopbits=1,
-                timeout=0.2  # 200ms timeout - prevents UI freezing when stations don't respond
-            )
-            
-            if self.client.connect():
-                # Test each station independently - exceptions from one won't affect others
-                station1_ok = False
-                station2_ok = False
-                station3_ok = False
-                
-                # Test Station 1 independently
-                try:
-                    test_station1 = self.client.read_input_registers(address=0, count=8, device_id=1)
-                    station1_ok = test_station1 and not test_station1.isError()
-                    print(f"Connection test Station 1: {'OK' if station1_ok else 'FAILED'}")
-                except Exception as e:
-                    print(f"Connection test Station 1 EXCEPTION: {e}")
-                
-                # Test Station 2 independently
-                try:
-                    test_station2 = self.client.read_input_registers(address=0, count=16, device_id=2)
-                    station2_ok = test_station2 and not test_station2.isError()
-                    print(f"Connection test Station 2: {'OK' if station2_ok else 'FAILED'}")
-                except Exception as e:
-                    print(f"Connection test Station 2 EXCEPTION: {e}")
-                
-                # Test Station 3 independently
-                try:
-                    test_station3 = self.client.read_input_registers(address=0, count=12, device_id=3)
-                    station3_ok = test_station3 and not test_station3.isError()
-                    print(f"Connection test Station 3: {'OK' if station3_ok else 'FAILED'}")
-                except Exception as e:
-                    print(f"Connection test Station 3 EXCEPTION: {e}")
-                
-                if station1_ok or station2_ok or station3_ok:
-                    # At least one station is working - connection successful
-                    self.is_connected = True
-                    self.failed_attempts = 0
-                    self.reconnect_attempts = 0
-                    
-                    # Update status with partial connection info if needed
-                    working_stations = []
-                    if station1_ok: working_stations.append("Pressures")
-                    if station2_ok: working_stations.append("Cylinder Head")
-                    if station3_ok: working_stations.append("Main Bearing")
-                    # Note: Engine Temps and Electrical Parameters status not shown (can use various device IDs)
-                    
-                    if len(working_stations) == 3:
-                        self.update_status("connected")
-                    else:
-                        # Partial connection - show which systems are working
-                        status_text = f"● PARTIAL: {', '.join(working_stations)}"
-                        self.status_label.setText(status_text)
-                        self.status_label.setStyleSheet("""
-                            QLabel {
-                                color: rgb(255, 180, 0);
-                                font-size: 13px;
-                                font-weight: 600;
-                                letter-spacing: 0.5px;
-                                padding: 8px 16px;
-                                background: rgba(255, 180, 0, 0.1);
-                                border: 1px solid rgba(255, 180, 0, 0.3);
-                                border-radius: 6px;
-                            }
-                        """)
-                    
-                    self.timer.start(1000)
-                else:
-                    # Connected but no response - try again
-                    self.client.close()
-                    QTimer.singleShot(1000, self.attempt_reconnection)
-            else:
-                # Connection failed - try again
-                QTimer.singleShot(1000, self.attempt_reconnection)
-        except Exception:
-            # Exception occurred - try again
-            if self.client:
-                try:
-                    self.client.close()
-                except:
-                    pass
-            QTimer.singleShot(1000, self.attempt_reconnection)
+    def show_partial_status(self, working_stations):
+        status_text = f"● PARTIAL: {', '.join(working_stations)}"
+        self.status_label.setText(status_text)
+        set_style_state(self.status_label, "notice")
 
     # -------- Toggle Test Mode --------
     def toggle_test_mode(self):
@@ -16584,8 +16899,8 @@ class HMIWindow(QWidget):
                 }
             """)
             
-            # Disable modbus connection if active
-            if self.is_connected:
+            # Disable modbus connection if active (or still being established)
+            if self.is_connected or self.supervisor.state != STATE_IDLE:
                 self.disconnect_modbus()
             
             # Disable connection controls
@@ -16594,23 +16909,35 @@ class HMIWindow(QWidget):
             
             # Update status
             self.status_label.setText("● TEST MODE ACTIVE")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: rgb(255, 180, 0);
-                    font-size: 13px;
-                    font-weight: 600;
-                    letter-spacing: 0.5px;
-                    padding: 8px 16px;
-                    background: rgba(255, 180, 0, 0.1);
-                    border: 1px solid rgba(255, 180, 0, 0.3);
-                    border-radius: 6px;
-                }
-            """)
+            set_style_state(self.status_label, "notice")
+            
+            # Serve simulated stations 1-5 on localhost and poll them like real hardware
+            # (a lost link is re-established by the supervisor through the test-mode factory)
+            self.connection = self.connection_settings()
+            self.simulator = ModbusSimulator(tcp_port=SIMULATOR_TCP_PORT)
+            error = None
+            if not self.simulator.start():
+                error = f"The Modbus simulator could not start on port {SIMULATOR_TCP_PORT}: {self.simulator.error}"
+            else:
+                try:
+                    client = self.create_modbus_client(self.connection)
+                    if client.connect():
+                        self.attach_modbus_client(client)
+                    else:
+                        error = f"Could not connect to the Modbus simulator on {SIMULATOR_HOST}:{SIMULATOR_TCP_PORT}"
+                except Exception as e:
+                    error = f"Could not connect to the Modbus simulator: {e}"
+            if error:
+                print(f"⚠️ Test mode: {error}")
+                # Back out: button, connection controls, status and simulator as before
+                self.toggle_test_mode()
+                QMessageBox.warning(self, "Test Mode", f"Test mode could not be started.\n\n{error}")
+                return
             
-            # Start test data generation timer
+            # Start test alarm history generation timer
             self.test_timer.start(1000)  # Update every 1 second
             
-            print("✅ Test mode activated - Generating simulated data")
+            print("✅ Test mode activated - Polling Modbus simulator")
         else:
             self.test_mode_btn.setText("TEST MODE")
             self.test_mode_btn.setStyleSheet("""
@@ -16638,27 +16965,180 @@ class HMIWindow(QWidget):
             self.port_box.setEnabled(True)
             self.connect_btn.setEnabled(True)
             
-            # Stop test data generation
+            # Stop test data generation, reset displays to zero and shut the simulator down
             self.test_timer.stop()
-            
-            # Reset displays to zero
-            self.cylinder_tab.update_temps([0] * 18)
-            self.bearing_tab.update_temps([0] * 10)
-            self.pressures_tab.update_pressures([0] * 8)
-            self.engine_temps_tab.update_temperatures([0] * 16)
-            self.electrical_tab.update_electrical_data([0] * 9)
-            
-            # Clear report tab data
-            self.report_tab.update_cylinder_head_data([0] * 18)
-            self.report_tab.update_main_bearing_data([0] * 10)
-            self.report_tab.update_pressure_data([0] * 8)
-            self.report_tab.update_engine_temperatures([0] * 16)
-            self.report_tab.update_electrical_data([0] * 9)
+            self.detach_modbus_client()
+            if self.simulator:
+                self.simulator.stop()
+                self.simulator = None
             
             # Update status
             self.update_status("disconnected")
             self.report_tab.update_connection_status(False)
     
+    # -------- Bus Diagnostics --------
+    def save_render_policy(self, *args):
+        """Apply the frame rate / easing chosen on the settings page and keep it in the config"""
+        policy = dict(self.render_governor.policy, fps=self.fps_box.currentData(), snap=self.snap_check.isChecked())
+        self.render_governor.apply(policy)
+        config_data = load_encrypted_config("modbus_config.dat")
+        if config_data is not None:
+            config_data["RenderPolicy"] = policy
+            save_encrypted_config(config_data, "modbus_config.dat")
+        print(f"Render policy: {self.render_governor.summary()}")
+    
+    def update_bus_diagnostics(self):
+        """Refresh the bus statistics table (only while the Settings page is shown)"""
+        if self.content_stack.currentWidget() is not self.settings_tab:
+            return
+        # Paints since the last refresh - the first one covers the time spent on the other pages
+        self.render_stats_label.setText(
+            f"{self.render_governor.summary()}  |  {PaintStats.summary(paint_stats().snapshot())}")
+        snapshot = self.bus_stats.snapshot()
+        total = snapshot["total"]
+        if not total["transactions"]:
+            self.bus_summary_label.setText("No bus traffic")
+        else:
+            self.bus_summary_label.setText(
+                f"Line utilization {snapshot['utilization'] * 100:.1f}%  |  "
+                f"Bus occupancy {snapshot['occupancy'] * 100:.1f}%  |  "
+                f"{total['transactions']} transactions @ {snapshot['baudrate']} baud  |  "
+                f"p95 {total['latency_p95'] * 1000:.1f} ms")
+            # Read planner: estimated vs. measured time of the last cycle's tag reads
+            plan = self.tag_reader.last_cycle
+            if plan["requests"]:
+                self.bus_summary_label.setText(
+                    self.bus_summary_label.text() +
+                    f"  |  Tag reads {plan['requests']} req, "
+                    f"est {plan['estimate'] * 1000:.1f} ms / actual {plan['actual'] * 1000:.1f} ms")
+            # View-driven polling: current fast interval and how the groups are tiered
+            scheduler = self.poll_scheduler
+            if scheduler.adaptive:
+                tiers = scheduler.tiers()
+                self.bus_summary_label.setText(
+                    self.bus_summary_label.text() +
+                    f"  |  Visible poll {scheduler.fast_interval * 1000:.0f} ms "
+                    f"({len(tiers[TIER_VISIBLE])} fast, {len(tiers[TIER_IDLE])} backed off)")
+            # Listen-only: how much of the configured tag map the other master's traffic covers
+            sniffer = base_client(self.client) if self.client else None
+            if getattr(sniffer, "listen_only", False):
+                seen, points = sniffer.image.coverage(self.address_index, (ROLE_MEASUREMENT, ROLE_CONDITION))
+                self.bus_summary_label.setText(
+                    self.bus_summary_label.text() +
+                    f"  |  Listen-only: {seen}/{points} configured points heard, "
+                    f"{sniffer.framer.frame_errors} framing errors")
+        
+        links = snapshot["links"]
+        self.bus_stats_table.setRowCount(len(links))
+        for row, (device_id, function_code, counters) in enumerate(links):
+            cells = [
+                str(device_id),
+                FUNCTION_NAMES.get(function_code, f"FC {function_code}"),
+                str(counters["transactions"]),
+                f"{counters['request_bytes']} / {counters['response_bytes']}",
+                f"{counters['latency_p50'] * 1000:.1f}",
+                f"{counters['latency_p95'] * 1000:.1f}",
+                f"{counters['latency_p99'] * 1000:.1f}",
+                str(counters["timeouts"]),
+                str(counters["exceptions"]),
+                str(counters["frame_errors"]),
+            ]
+            for col, text in enumerate(cells):
+                item = self.bus_stats_table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    self.bus_stats_table.setItem(row, col, item)
+                item.setText(text)
+    
+    # -------- Bus Capture / Replay --------
+    def toggle_bus_capture(self):
+        """Start or stop recording all bus traffic to a capture file"""
+        if self.bus_capture:
+            writer = self.bus_capture
+            self.bus_capture = None
+            capture = capture_layer(self.client)
+            if capture:
+                capture.set_writer(None)
+            writer.close()
+            self.tag_reader.thaw_plans()
+            self.record_btn.setText("● RECORD")
+            print(f"✅ Bus capture stopped - {writer.record_count} transactions in {writer.path}")
+            return
+        
+        default_name = datetime.now().strftime("bus_%Y%m%d_%H%M%S") + CAPTURE_EXTENSION
+        path, _ = QFileDialog.getSaveFileName(self, "Record Bus Traffic", default_name,
+                                              f"Bus capture (*{CAPTURE_EXTENSION})")
+        if not path:
+            return
+        try:
+            # The read plans stay fixed while recording and the model goes into the file for the replay
+            self.bus_capture = BusCaptureWriter(path, self.tag_reader.freeze_plans())
+        except OSError as e:
+            self.tag_reader.thaw_plans()
+            QMessageBox.critical(self, "Error", f"Cannot create capture file:\n{e}")
+            return
+        # Recording starts on the running client without touching the rest of the chain
+        capture = capture_layer(self.client)
+        if capture:
+            capture.set_writer(self.bus_capture)
+        self.record_btn.setText("■ STOP REC")
+        print(f"✅ Bus capture started - {path}")
+    
+    def toggle_replay(self):
+        """Start replaying a capture file in place of the bus, or stop the running replay"""
+        if self.replay_path:
+            self.stop_replay()
+            return
+        
+        path, _ = QFileDialog.getOpenFileName(self, "Replay Bus Capture", "",
+                                              f"Bus capture (*{CAPTURE_EXTENSION})")
+        if not path:
+            return
+        speed, ok = QInputDialog.getDouble(self, "Replay Speed",
+                                           "Speed factor (1 = recorded timing, 0 = as fast as possible):",
+                                           1.0, 0.0, 100.0, 1)
+        if not ok:
+            return
+        
+        # Replay owns the data path - leave recording and live/test sources first
+        if self.bus_capture:
+            self.toggle_bus_capture()
+        if self.test_mode:
+            self.toggle_test_mode()
+        if self.is_connected:
+            self.disconnect_modbus()
+        
+        self.replay_path = path
+        self.replay_speed = speed
+        self.poll_interval = max(int(MIN_REPLAY_INTERVAL * 1000), int(1000 / speed) if speed > 0 else 0)
+        client = self.create_modbus_client(self.connection_settings())
+        if not client.connect():
+            self.replay_path = None
+            self.poll_interval = 1000
+            QMessageBox.critical(self, "Error", "Cannot open bus capture file.")
+            return
+        self.attach_modbus_client(client)
+        
+        self.port_box.setEnabled(False)
+        self.connect_btn.setEnabled(False)
+        self.test_mode_btn.setEnabled(False)
+        self.replay_btn.setText("■ STOP REPLAY")
+        self.status_label.setText(f"▶ REPLAY x{speed:g}" if speed > 0 else "▶ REPLAY MAX")
+        set_style_state(self.status_label, "connected")
+        print(f"✅ Replaying {len(client.records)} transactions from {path}")
+    
+    def stop_replay(self):
+        """End the replay and return the HMI to the disconnected state"""
+        self.detach_modbus_client()
+        self.replay_path = None
+        self.poll_interval = 1000
+        self.port_box.setEnabled(True)
+        self.connect_btn.setEnabled(True)
+        self.test_mode_btn.setEnabled(True)
+        self.replay_btn.setText("▶ REPLAY")
+        self.update_status("disconnected")
+        self.report_tab.update_connection_status(False)
+    
     # -------- Admin Login System --------
     def toggle_admin_login(self):
         """Toggle admin login/logout"""
@@ -16843,152 +17323,11 @@ class HMIWindow(QWidget):
     
     # -------- Generate Test Data --------
     def generate_test_data(self):
-        # Generate smooth random variations while maintaining realistic range distributions
-        
-        # Cylinder Head Temperatures: Maintain range distribution with small variations
-        for i in range(18):
-            current_temp = self.test_cylinder_temps[i]
-            change = random.randint(-15, 15)  # Smaller changes for smoother variation
-            new_temp = current_temp + change
-            
-            # Apply range-specific bounds to maintain distribution
-            if current_temp < 4000:  # Normal range
-                self.test_cylinder_temps[i] = max(2500, min(4200, new_temp))
-            elif current_temp < 6000:  # Warning range
-                self.test_cylinder_temps[i] = max(3800, min(6200, new_temp))
-            else:  # Critical range
-                self.test_cylinder_temps[i] = max(5800, min(7200, new_temp))
-        
-        # Main Bearing Temperatures: Maintain range distribution
-        for i in range(10):
-            current_temp = self.test_bearing_temps[i]
-            change = random.randint(-8, 8)  # Smaller changes
-            new_temp = current_temp + change
-            
-            # Apply range-specific bounds
-            if current_temp < 1500:  # Normal range
-                self.test_bearing_temps[i] = max(600, min(1600, new_temp))
-            elif current_temp < 2500:  # Warning range
-                self.test_bearing_temps[i] = max(1400, min(2600, new_temp))
-            else:  # Critical range
-                self.test_bearing_temps[i] = max(2400, min(3200, new_temp))
-        
-        # Engine Temperatures: Maintain range distribution
-        for i in range(16):
-            current_temp = self.test_engine_temps[i]
-            change = random.randint(-8, 8)  # Smaller changes
-            new_temp = current_temp + change
-            
-            # Apply range-specific bounds
-            if current_temp < 1800:  # Normal range
-                self.test_engine_temps[i] = max(400, min(1900, new_temp))
-            elif current_temp < 2200:  # Warning range
-                self.test_engine_temps[i] = max(1700, min(2300, new_temp))
-            else:  # Critical range
-                self.test_engine_temps[i] = max(2100, min(2600, new_temp))
-        
-        # Pressures: Maintain realistic distributions with proper bounds
-        # Values in register format (actual bar values * 10)
-        pressure_bounds = [
-            # [normal_min, normal_max, warning_min, warning_max, critical_min, critical_max]
-            [15, 85, 85, 115, 115, 150],     # Fuel Oil Pressure Inlet (0-15 bar)
-            [35, 85, 20, 40, 5, 25],         # Lube Oil Pressure Inlet (0-10 bar, reverse)
-            [15, 65, 65, 85, 85, 100],       # LT Water Pressure (0-10 bar)
-            [15, 65, 65, 85, 85, 100],       # HT Water Pressure (0-10 bar)
-            [15, 65, 65, 85, 85, 100],       # Charge Air Pressure (0-10 bar)
-            [70, 210, 210, 250, 250, 300],   # Starting Air Pressure (0-30 bar)
-            [15, 65, 65, 85, 85, 100],       # Lube Oil Differential Pressure (0-10 bar)
-            [8, 32, 32, 42, 42, 50]          # Crank Case Pressure (0-5 bar)
-        ]
-        
-        for i in range(8):
-            current_pressure = self.test_pressures[i]
-            change = random.randint(-4, 4)  # Smaller changes
-            new_pressure = current_pressure + change
-            bounds = pressure_bounds[i]
-            
-            # Determine current range and apply appropriate bounds
-            if i == 1:  # Lube Oil Pressure (reverse logic)
-                if current_pressure >= bounds[0]:  # Normal range (high pressure is good)
-                    self.test_pressures[i] = max(bounds[0], min(bounds[1], new_pressure))
-                elif current_pressure >= bounds[2]:  # Warning range
-                    self.test_pressures[i] = max(bounds[2], min(bounds[3], new_pressure))
-                else:  # Critical range (low pressure is bad)
-                    self.test_pressures[i] = max(bounds[4], min(bounds[5], new_pressure))
-            else:  # Normal pressure logic
-                if current_pressure <= bounds[1]:  # Normal range
-                    self.test_pressures[i] = max(bounds[0], min(bounds[1], new_pressure))
-                elif current_pressure <= bounds[3]:  # Warning range
-                    self.test_pressures[i] = max(bounds[2], min(bounds[3], new_pressure))
-                else:  # Critical range
-                    self.test_pressures[i] = max(bounds[4], min(bounds[5], new_pressure))
-        
-        # Electrical Parameters: Maintain realistic distributions
-        electrical_bounds = [
-            # [normal_min, normal_max, warning_low_min, warning_low_max, warning_high_min, warning_high_max, critical_low_min, critical_low_max, critical_high_min, critical_high_max]
-            [380, 420, 370, 384, 416, 430, 340, 374, 426, 460],  # Voltage L1-L2
-            [380, 420, 370, 384, 416, 430, 340, 374, 426, 460],  # Voltage L2-L3
-            [380, 420, 370, 384, 416, 430, 340, 374, 426, 460],  # Voltage L3-L1
-            [15, 65, 65, 85, 85, 105],                            # Current L1
-            [15, 65, 65, 85, 85, 105],                            # Current L2
-            [15, 65, 65, 85, 85, 105],                            # Current L3
-            [150, 650, 650, 850, 850, 1050],                     # Active Power (kW)
-            [910, 1000, 870, 920, 790, 880],                     # Power Factor (reverse - lower is worse)
-            [30, 220, 220, 370, 370, 520]                        # Reactive Power (kVAR)
-        ]
-        
-        for i in range(9):
-            current_value = self.test_electrical_params[i]
-            change = random.randint(-8, 8)  # Moderate changes
-            new_value = current_value + change
-            bounds = electrical_bounds[i]
-            
-            # Handle voltage parameters (have both low and high warning/critical ranges)
-            if i < 3:  # Voltages
-                if bounds[0] <= current_value <= bounds[1]:  # Normal range
-                    self.test_electrical_params[i] = max(bounds[0], min(bounds[1], new_value))
-                elif bounds[2] <= current_value <= bounds[3] or bounds[4] <= current_value <= bounds[5]:  # Warning ranges
-                    if current_value <= bounds[3]:  # Low warning
-                        self.test_electrical_params[i] = max(bounds[2], min(bounds[3], new_value))
-                    else:  # High warning
-                        self.test_electrical_params[i] = max(bounds[4], min(bounds[5], new_value))
-                else:  # Critical ranges
-                    if current_value <= bounds[7]:  # Low critical
-                        self.test_electrical_params[i] = max(bounds[6], min(bounds[7], new_value))
-                    else:  # High critical
-                        self.test_electrical_params[i] = max(bounds[8], min(bounds[9], new_value))
-            elif i == 7:  # Power Factor (reverse logic - lower is worse)
-                if bounds[0] <= current_value <= bounds[1]:  # Normal range (high values)
-                    self.test_electrical_params[i] = max(bounds[0], min(bounds[1], new_value))
-                elif bounds[2] <= current_value <= bounds[3]:  # Warning range
-                    self.test_electrical_params[i] = max(bounds[2], min(bounds[3], new_value))
-                else:  # Critical range (low values)
-                    self.test_electrical_params[i] = max(bounds[4], min(bounds[5], new_value))
-            else:  # Current and Power parameters (normal logic)
-                if current_value <= bounds[1]:  # Normal range
-                    self.test_electrical_params[i] = max(bounds[0], min(bounds[1], new_value))
-                elif current_value <= bounds[3]:  # Warning range
-                    self.test_electrical_params[i] = max(bounds[2], min(bounds[3], new_value))
-                else:  # Critical range
-                    self.test_electrical_params[i] = max(bounds[4], min(bounds[5], new_value))
-        
-        # Update displays with test data
-        self.cylinder_tab.update_temps(self.test_cylinder_temps)
-        self.bearing_tab.update_temps(self.test_bearing_temps)
-        self.pressures_tab.update_pressures(self.test_pressures, is_test_mode=True)
-        self.engine_temps_tab.update_temperatures(self.test_engine_temps)
-        self.electrical_tab.update_electrical_data(self.test_electrical_params)
-        
-        # Update report tab with test data
-        self.report_tab.update_cylinder_head_data(self.test_cylinder_temps)
-        self.report_tab.update_main_bearing_data(self.test_bearing_temps)
-        # Convert test pressures to actual values (divide by 10 to get bar values)
-        actual_test_pressures = [val / 10.0 for val in self.test_pressures]
-        self.report_tab.update_pressure_data(actual_test_pressures)
-        self.report_tab.update_engine_temperatures(self.test_engine_temps)
-        self.report_tab.update_electrical_data(self.test_electrical_params)
-        self.report_tab.update_connection_status(True)
-        
+        """Synthesize alarm history entries while in test mode.
+
+        Process values come from the Modbus simulator through read_data, so
+        only the history demo entries are generated here.
+        """
         # Randomly generate test alarms for history (10% chance per cycle)
         if random.random() < 0.1:
             self.history_tab.generate_test_alarm()
@@ -17324,109 +17663,198 @@ Last Modified: {os.path.getmtime('modbus_config.dat') if os.path.exists('modbus_
             print(f"Error getting electrical values for report: {e}")
             return [0.0] * 9
 
+    # -------- Poll Groups --------
+    def page_visible(self, *pages):
+        """Whether one of `pages` is the page on screen"""
+        return not self.isMinimized() and self.content_stack.currentWidget() in pages
+    
+    def register_poll_groups(self):
+        """Poll groups for the scheduler: visible when their page is shown, guarded while they drive alarms or outputs"""
+        scheduler = self.poll_scheduler
+        scheduler.add("station1",
+                      visible=lambda: self.page_visible(self.pressures_tab, self.report_tab),
+                      guard=lambda: any(getattr(g, "enable_alarm", False) for g in self.pressures_tab.gauges))
+        scheduler.add("station2",
+                      visible=lambda: self.page_visible(self.cylinder_tab, self.report_tab),
+                      guard=lambda: self.cylinder_tab.enable_alarm)
+        scheduler.add("station3",
+                      visible=lambda: self.page_visible(self.cylinder_tab, self.bearing_tab, self.report_tab),
+                      guard=lambda: self.cylinder_tab.enable_alarm or self.bearing_tab.enable_alarm)
+        scheduler.add("station4",
+                      visible=lambda: self.page_visible(self.engine_temps_tab, self.report_tab),
+                      guard=lambda: any(getattr(g, "enable_alarm", False)
+                                        for section in self.engine_temps_tab.temp_gauges for g in section))
+        # Generator voltage feeds regulation and its alarm coil - never slower than the base rate
+        scheduler.add("electrical_control",
+                      visible=lambda: self.page_visible(self.electrical_tab, self.report_tab),
+                      guard=lambda: True)
+        scheduler.add("electrical_display",
+                      visible=lambda: self.page_visible(self.electrical_tab, self.report_tab))
+        scheduler.add("startup",
+                      visible=lambda: self.page_visible(self.startup_tab),
+                      base_interval=0.5)
+    
+    def read_electrical(self, control_due, display_due):
+        """Read the due electrical parameter groups and charge the bus time to their poll groups"""
+        names = (list(ELECTRICAL_CONTROL_GROUPS) if control_due else []) + \
+                (list(ELECTRICAL_DISPLAY_GROUPS) if display_due else [])
+        started = time.monotonic()
+        self.electrical_tab.update_electrical_data(group_names=names)
+        elapsed = time.monotonic() - started
+        # One batch for both so the tag layer can still coalesce; split its time by point count
+        params = (self.electrical_tab.config or {}).get("ElectricalParameters", {})
+        control_points = sum(len(params.get(name, [])) for name in ELECTRICAL_CONTROL_GROUPS) if control_due else 0
+        display_points = sum(len(params.get(name, [])) for name in ELECTRICAL_DISPLAY_GROUPS) if display_due else 0
+        total_points = max(1, control_points + display_points)
+        if control_due:
+            self.poll_scheduler.polled("electrical_control", elapsed * control_points / total_points)
+        if display_due:
+            self.poll_scheduler.polled("electrical_display", elapsed * display_points / total_points)
+    
     # -------- Read Data from Modbus --------
     def read_data(self):
         if not self.client or not self.is_connected:
             return
-        
-        # Skip modbus reading if in test mode
-        if self.test_mode:
+        if self.replay_path and self.client.finished:
+            print("✅ Replay finished - end of bus capture")
+            self.stop_replay()
             return
+        if self.replay_path and self.client.due_in() > 0:
+            # Recorded timing: wait for the next transaction on a later tick
+            return
+        
+        # A failed station's displays are cleared at the end of the cycle, and only if something on
+        # the line answered - when nothing did, the link is down and the last values stay up as stale
+        link_mark = self.link_watch.mark()
+        pending_clears = []
         
-        # Track which stations are working
-        station1_working = False
-        station2_working = False
-        station3_working = False
-        station4_working = False
-        station5_working = False
-        station2_data = None
-        station3_data = None
-        station4_data = None
+        # Each station is read only when its poll group is due; a skipped station keeps its last status
+        scheduler = self.poll_scheduler
+        scheduler.begin_cycle()
+        polled = set()
         
         # Read Station 1 (Engine Pressures) - 8 pressure values - COMPLETELY INDEPENDENT
-        try:
-            result_station1 = self.client.read_input_registers(address=0, count=8, device_id=1)
-            if result_station1 and not result_station1.isError():
-                pressure_values = result_station1.registers[:8]
-                # Convert register values to actual pressure values (divide by 10)
-                actual_pressures = [val / 10.0 for val in pressure_values]
-                self.pressures_tab.update_pressures(pressure_values)
-                self.report_tab.update_pressure_data(actual_pressures)
-                station1_working = True
-                print(f"Station 1 (Pressures): SUCCESS - {pressure_values}")
-            else:
-                # Station 1 failed - immediately clear pressure data (industrial standard)
-                self.pressures_tab.update_pressures([0] * 8)
-                self.report_tab.update_pressure_data([0] * 8)
-                print("Station 1 (Pressures): FAILED - Data cleared")
-        except Exception as e:
-            # Station 1 exception - immediately clear pressure data
-            self.pressures_tab.update_pressures([0] * 8)
-            self.report_tab.update_pressure_data([0] * 8)
-            print(f"Station 1 (Pressures): EXCEPTION - Data cleared - {e}")
+        if scheduler.due("station1"):
+            polled.add(1)
+            started = time.monotonic()
+            try:
+                result_station1 = self.client.read_input_registers(address=0, count=8, device_id=1)
+                scheduler.polled("station1", time.monotonic() - started)
+                if result_station1 and not result_station1.isError():
+                    pressure_values = result_station1.registers[:8]
+                    # Convert register values to actual pressure values (divide by 10)
+                    actual_pressures = [val / 10.0 for val in pressure_values]
+                    self.pressures_tab.update_pressures(pressure_values)
+                    self.report_tab.update_pressure_data(actual_pressures)
+                    self.station_ok[1] = True
+                    print(f"Station 1 (Pressures): SUCCESS - {pressure_values}")
+                else:
+                    # Station 1 failed - clear pressure data this cycle (industrial standard)
+                    self.station_ok[1] = False
+                    pending_clears.append(lambda: (self.pressures_tab.update_pressures([0] * 8),
+                                                   self.report_tab.update_pressure_data([0] * 8)))
+                    print("Station 1 (Pressures): FAILED")
+            except Exception as e:
+                # Station 1 exception - clear pressure data this cycle
+                scheduler.polled("station1", time.monotonic() - started)
+                self.station_ok[1] = False
+                pending_clears.append(lambda: (self.pressures_tab.update_pressures([0] * 8),
+                                               self.report_tab.update_pressure_data([0] * 8)))
+                print(f"Station 1 (Pressures): EXCEPTION - {e}")
         
         # Read Station 2 (Cylinder Head partial) - 16 registers - COMPLETELY INDEPENDENT
-        try:
-            result_station2 = self.client.read_input_registers(address=0, count=16, device_id=2)
-            if result_station2 and not result_station2.isError():
-                station2_working = True
-                station2_data = result_station2.registers
-                print(f"Station 2 (Cylinder Head): SUCCESS - {len(station2_data)} values")
-            else:
-                print("Station 2 (Cylinder Head): FAILED - No response or error")
-        except Exception as e:
-            print(f"Station 2 (Cylinder Head): EXCEPTION - {e}")
+        if scheduler.due("station2"):
+            polled.add(2)
+            started = time.monotonic()
+            self.station_ok[2] = False
+            self.station_data[2] = None
+            try:
+                result_station2 = self.client.read_input_registers(address=0, count=16, device_id=2)
+                if result_station2 and not result_station2.isError():
+                    self.station_ok[2] = True
+                    self.station_data[2] = result_station2.registers
+                    print(f"Station 2 (Cylinder Head): SUCCESS - {len(self.station_data[2])} values")
+                else:
+                    print("Station 2 (Cylinder Head): FAILED - No response or error")
+            except Exception as e:
+                print(f"Station 2 (Cylinder Head): EXCEPTION - {e}")
+            scheduler.polled("station2", time.monotonic() - started)
         
         # Read Station 3 (Cylinder Head partial + Main Bearing) - 12 registers - COMPLETELY INDEPENDENT
-        try:
-            result_station3 = self.client.read_input_registers(address=0, count=12, device_id=3)
-            if result_station3 and not result_station3.isError():
-                station3_working = True
-                station3_data = result_station3.registers
-                print(f"Station 3 (Main Bearing): SUCCESS - {len(station3_data)} values")
-            else:
-                print("Station 3 (Main Bearing): FAILED - No response or error")
-        except Exception as e:
-            print(f"Station 3 (Main Bearing): EXCEPTION - {e}")
+        if scheduler.due("station3"):
+            polled.add(3)
+            started = time.monotonic()
+            self.station_ok[3] = False
+            self.station_data[3] = None
+            try:
+                result_station3 = self.client.read_input_registers(address=0, count=12, device_id=3)
+                if result_station3 and not result_station3.isError():
+                    self.station_ok[3] = True
+                    self.station_data[3] = result_station3.registers
+                    print(f"Station 3 (Main Bearing): SUCCESS - {len(self.station_data[3])} values")
+                else:
+                    print("Station 3 (Main Bearing): FAILED - No response or error")
+            except Exception as e:
+                print(f"Station 3 (Main Bearing): EXCEPTION - {e}")
+            scheduler.polled("station3", time.monotonic() - started)
         
         # Read Station 4 (Engine Temperatures) - 16 temperature values - HOLDING REGISTERS
-        try:
-            result_station4 = self.client.read_holding_registers(address=0, count=16, device_id=4)
-            if result_station4 and not result_station4.isError():
-                station4_working = True
-                station4_data = result_station4.registers
-                self.engine_temps_tab.update_temperatures(station4_data)
-                self.report_tab.update_engine_temperatures(station4_data)
-                print(f"Station 4 (Engine Temperatures): SUCCESS - {len(station4_data)} values")
-            else:
-                # Station 4 failed - immediately clear temperature data (industrial standard)
-                self.engine_temps_tab.update_temperatures([0] * 16)
-                self.report_tab.update_engine_temperatures([0] * 16)
-                print("Station 4 (Engine Temperatures): FAILED - Data cleared")
-        except Exception as e:
-            # Station 4 exception - immediately clear temperature data
-            self.engine_temps_tab.update_temperatures([0] * 16)
-            self.report_tab.update_engine_temperatures([0] * 16)
-            print(f"Station 4 (Engine Temperatures): EXCEPTION - Data cleared - {e}")
+        if scheduler.due("station4"):
+            polled.add(4)
+            started = time.monotonic()
+            try:
+                result_station4 = self.client.read_holding_registers(address=0, count=16, device_id=4)
+                scheduler.polled("station4", time.monotonic() - started)
+                if result_station4 and not result_station4.isError():
+                    self.station_ok[4] = True
+                    station4_data = result_station4.registers
+                    self.engine_temps_tab.update_temperatures(station4_data)
+                    self.report_tab.update_engine_temperatures(station4_data)
+                    print(f"Station 4 (Engine Temperatures): SUCCESS - {len(station4_data)} values")
+                else:
+                    # Station 4 failed - clear temperature data this cycle (industrial standard)
+                    self.station_ok[4] = False
+                    pending_clears.append(lambda: (self.engine_temps_tab.update_temperatures([0] * 16),
+                                                   self.report_tab.update_engine_temperatures([0] * 16)))
+                    print("Station 4 (Engine Temperatures): FAILED")
+            except Exception as e:
+                # Station 4 exception - clear temperature data this cycle
+                scheduler.polled("station4", time.monotonic() - started)
+                self.station_ok[4] = False
+                pending_clears.append(lambda: (self.engine_temps_tab.update_temperatures([0] * 16),
+                                               self.report_tab.update_engine_temperatures([0] * 16)))
+                print(f"Station 4 (Engine Temperatures): EXCEPTION - {e}")
         
         # Read Station 5 (Electrical Parameters) - Now uses configuration-based reading
-        try:
-            # Call configuration-based update (reads from JSON config)
-            self.electrical_tab.update_electrical_data()
-            # Get current electrical values for report
-            electrical_values = self.get_electrical_values_for_report()
-            self.report_tab.update_electrical_data(electrical_values)
-            station5_working = True
-            print(f"Station 5 (Electrical Parameters): Configuration-based read attempted")
-        except Exception as e:
-            # Station 5 exception - immediately clear electrical data
-            self.electrical_tab.update_electrical_data([0] * 9)
-            self.report_tab.update_electrical_data([0] * 9)
-            print(f"Station 5 (Electrical Parameters): EXCEPTION - Data cleared - {e}")
+        control_due = scheduler.due("electrical_control")
+        display_due = scheduler.due("electrical_display")
+        if control_due or display_due:
+            polled.add(5)
+            # Configured tags are cached for one electrical cycle (the startup page reads through the same cache)
+            self.tag_reader.invalidate()
+            try:
+                # Call configuration-based update (reads from JSON config) for the due parameter groups
+                self.read_electrical(control_due, display_due)
+                # Get current electrical values for report
+                electrical_values = self.get_electrical_values_for_report()
+                self.report_tab.update_electrical_data(electrical_values)
+                self.station_ok[5] = True
+                print(f"Station 5 (Electrical Parameters): Configuration-based read attempted")
+            except Exception as e:
+                # Station 5 exception - immediately clear electrical data
+                self.station_ok[5] = False
+                self.electrical_tab.update_electrical_data([0] * 9)
+                self.report_tab.update_electrical_data([0] * 9)
+                print(f"Station 5 (Electrical Parameters): EXCEPTION - Data cleared - {e}")
+        
+        station2_data = self.station_data[2]
+        station3_data = self.station_data[3]
         
         # Update Cylinder Head temperatures - INDEPENDENT OF OTHER STATIONS
         try:
-            if station2_data is not None and station3_data is not None:
+            if not polled & {2, 3}:
+                pass                # neither station was due - displays keep their values
+            elif station2_data is not None and station3_data is not None:
                 # Combine data: Left (9 from station 2) + Right (7 from station 2 + 2 from station 3)
                 combined_temps = station2_data[:9] + station2_data[9:16] + station3_data[:2]
                 self.cylinder_tab.update_temps(combined_temps)
@@ -17439,64 +17867,83 @@ Last Modified: {os.path.getmtime('modbus_config.dat') if os.path.exists('modbus_
                 self.report_tab.update_cylinder_head_data(partial_temps)
                 print("Cylinder Head: Updated with partial data (Station 2 only, Station 3 cleared)")
             else:
-                # Both stations failed - immediately clear all cylinder head data (industrial standard)
-                self.cylinder_tab.update_temps([0] * 18)
-                self.report_tab.update_cylinder_head_data([0] * 18)
-                print("Cylinder Head: Both stations failed - Data cleared")
+                # Both stations failed - clear all cylinder head data this cycle (industrial standard)
+                pending_clears.append(lambda: (self.cylinder_tab.update_temps([0] * 18),
+                                               self.report_tab.update_cylinder_head_data([0] * 18)))
+                print("Cylinder Head: Both stations failed")
         except Exception as e:
             print(f"Cylinder Head update EXCEPTION: {e}")
         
         # Update Main Bearing temperatures - INDEPENDENT OF OTHER STATIONS
         try:
-            if station3_data is not None:
+            if 3 not in polled:
+                pass                # station 3 was not due - displays keep their values
+            elif station3_data is not None:
                 # Main bearing temps: 10 temps from station 3 starting at index 2
                 bearing_temps = station3_data[2:12]
                 self.bearing_tab.update_temps(bearing_temps)
                 self.report_tab.update_main_bearing_data(bearing_temps)
                 print("Main Bearing: Updated with data")
             else:
-                # Station 3 failed - immediately clear main bearing data (industrial standard)
-                self.bearing_tab.update_temps([0] * 10)
-                self.report_tab.update_main_bearing_data([0] * 10)
-                print("Main Bearing: Station 3 failed - Data cleared")
+                # Station 3 failed - clear main bearing data this cycle (industrial standard)
+                pending_clears.append(lambda: (self.bearing_tab.update_temps([0] * 10),
+                                               self.report_tab.update_main_bearing_data([0] * 10)))
+                print("Main Bearing: Station 3 failed")
         except Exception as e:
             print(f"Main Bearing update EXCEPTION: {e}")
         
+        line_silent = self.link_watch.silent_since(link_mark)
+        if not line_silent:
+            for clear in pending_clears:
+                try:
+                    clear()
+                except Exception as e:
+                    print(f"Display clear EXCEPTION: {e}")
+            if pending_clears:
+                print(f"{len(pending_clears)} failed station display(s) cleared")
+        
+        # Flush alarm relay outputs - changed coils as one FC15 block per run, then read back
+        try:
+            unconfirmed = self.relay_outputs.flush()
+            if unconfirmed:
+                print(f"Relay outputs: {unconfirmed} coil(s) not confirmed, retrying next cycle")
+        except Exception as e:
+            print(f"Relay output flush EXCEPTION: {e}")
+        
+        # Nothing was due this tick - no new evidence about the stations or the link
+        if not polled:
+            return
+        
         # Update connection status based on working stations - INDEPENDENT
         try:
             working_stations = []
-            if station1_working: working_stations.append("Pressures")
-            if station2_working: working_stations.append("Cylinder Head")
-            if station3_working: working_stations.append("Main Bearing")
-            if station4_working: working_stations.append("Engine Temperatures")
-            if station5_working: working_stations.append("Electrical Parameters")
+            if self.station_ok[1]: working_stations.append("Pressures")
+            if self.station_ok[2]: working_stations.append("Cylinder Head")
+            if self.station_ok[3]: working_stations.append("Main Bearing")
+            if self.station_ok[4]: working_stations.append("Engine Temperatures")
+            if self.station_ok[5]: working_stations.append("Electrical Parameters")
             
             print(f"Working stations: {working_stations}")
             
-            if len(working_stations) == 5:
+            if line_silent:
+                # Nothing on the line answered - the link is down, not a station
+                print("No answer on the line - keeping last values as stale")
+                self.handle_read_failure()
+            elif len(working_stations) == 5:
                 # All stations working
                 self.failed_attempts = 0
                 self.reconnect_attempts = 0
+                self.last_good_update = datetime.now()
+                self.set_data_stale(False)
                 if self.status_label.text() != "● CONNECTED":
                     self.update_status("connected")
                 self.report_tab.update_connection_status(True)
             elif len(working_stations) > 0:
                 # Partial connection - some stations working
                 self.failed_attempts = 0  # Reset since we have some data
-                status_text = f"● PARTIAL: {', '.join(working_stations)}"
-                self.status_label.setText(status_text)
-                self.status_label.setStyleSheet("""
-                    QLabel {
-                        color: rgb(255, 180, 0);
-                        font-size: 13px;
-                        font-weight: 600;
-                        letter-spacing: 0.5px;
-                        padding: 8px 16px;
-                        background: rgba(255, 180, 0, 0.1);
-                        border: 1px solid rgba(255, 180, 0, 0.3);
-                        border-radius: 6px;
-                    }
-                """)
+                self.last_good_update = datetime.now()
+                self.set_data_stale(False)
+                self.show_partial_status(working_stations)
                 self.report_tab.update_connection_status(True)
             else:
                 # No stations working - handle as complete failure
@@ -17510,21 +17957,12 @@ Last Modified: {os.path.getmtime('modbus_config.dat') if os.path.exists('modbus_
         self.failed_attempts += 1
         self.update_status("error")
         
-        # Only zero out data if we've had multiple consecutive failures
-        # This prevents brief network hiccups from clearing all displays
-        if self.failed_attempts >= 3:
-            self.cylinder_tab.update_temps([0] * 18)
-            self.bearing_tab.update_temps([0] * 10)
-            self.pressures_tab.update_pressures([0] * 8)
-            self.engine_temps_tab.update_temperatures([0] * 16)
+        # Displays keep their last values, flagged stale, rather than dropping to zero
+        self.set_data_stale(True)
         
-        if self.failed_attempts >= self.max_failed_attempts:
-            # Too many failures - attempt reconnection
-            self.timer.stop()
-            self.is_connected = False
-            
-            # Try to reconnect after 1 second
-            QTimer.singleShot(1000, self.attempt_reconnection)
+        if self.failed_attempts >= self.max_failed_attempts and not self.replay_path:
+            # Too many failures - hand the port to the supervisor (a replay keeps playing the recorded outage)
+            self.connection_lost()
     
     # -------- Update Configuration Thresholds --------
     def update_thresholds_from_modbus_config(self, modbus_config):
@@ -17572,6 +18010,7 @@ Last Modified: {os.path.getmtime('modbus_config.dat') if os.path.exists('modbus_
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(resource_path("icon.png")))
+    preload_icons()
     
     # Check if this is first run (no config file exists)
     config_file_path = "modbus_config.dat"